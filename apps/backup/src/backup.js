@@ -1,10 +1,45 @@
 // backup.js - MongoDB 백업 실행
-import { execSync } from 'child_process';
-import { existsSync, mkdirSync, readdirSync, statSync, unlinkSync } from 'fs';
+import { execSync, spawn } from 'child_process';
+import { createWriteStream, existsSync, mkdirSync, readdirSync, statSync, unlinkSync } from 'fs';
+import { rename, unlink } from 'fs/promises';
 import { join, basename } from 'path';
+import { Transform } from 'stream';
+import mongoose from 'mongoose';
 
 const MONGODB_URI = process.env.MONGODB_URI || 'mongodb://localhost:27017/nanumpay';
 
+// 백업 파일 형식: tar 모드(.tar.gz), 스트리밍 모드(.archive.gz)
+const BACKUP_FILE_PATTERN = /^nanumpay-backup-.+\.(tar|archive)\.gz$/;
+
+// 진행 상황 출력 간격 (ms)
+const PROGRESS_INTERVAL = 5000;
+
+function isBackupFile(fileName) {
+  return BACKUP_FILE_PATTERN.test(fileName);
+}
+
+function formatMB(bytes) {
+  return (bytes / (1024 * 1024)).toFixed(2);
+}
+
+// URI에서 DB 이름 제거 (mongorestore는 --nsFrom/--nsTo로 DB 지정)
+function getServerUri() {
+  return MONGODB_URI.replace(/^(mongodb(?:\+srv)?:\/\/[^/?]+)\/?[^?]*/, '$1/');
+}
+
+function waitForExit(child, command) {
+  return new Promise((resolve, reject) => {
+    child.on('error', reject);
+    child.on('close', (code) => {
+      if (code === 0) {
+        resolve();
+      } else {
+        reject(new Error(`${command} 종료 코드: ${code}`));
+      }
+    });
+  });
+}
+
 export function createBackup(config) {
   try {
     const timestamp = new Date().toISOString().replace(/[:.]/g, '-').slice(0, 19);
@@ -45,6 +80,168 @@ export function createBackup(config) {
   }
 }
 
+/**
+ * 스트리밍 백업 (mongodump --archive --gzip)
+ * - 임시 디렉토리/tar 단계 없이 mongodump 출력을 로컬 파일과 원격 저장소로 동시 전송
+ * - pipe 배압: 가장 느린 대상에 맞춰 mongodump 출력을 읽음
+ *
+ * @param {Object} config - 백업 설정
+ * @param {Function} [openRemoteTargets] - (fileName) => [{ name, stream, done, abort }]
+ * @returns {Promise<{ file: string, bytes: number, durationMs: number, remote: Array<{ name: string, success: boolean }> }>}
+ */
+export async function createStreamingBackup(config, openRemoteTargets = null) {
+  const startedAt = Date.now();
+  const timestamp = new Date().toISOString().replace(/[:.]/g, '-').slice(0, 19);
+  const backupName = `nanumpay-backup-${timestamp}`;
+  const backupPath = config.backupPath || '/opt/nanumpay/backups';
+  const archiveFile = join(backupPath, `${backupName}.archive.gz`);
+  const partialFile = `${archiveFile}.partial`;
+
+  console.log(`📦 스트리밍 백업 시작: ${backupName}`);
+
+  // 백업 디렉토리 생성
+  if (!existsSync(backupPath)) {
+    mkdirSync(backupPath, { recursive: true });
+    console.log(`✅ 백업 디렉토리 생성: ${backupPath}`);
+  }
+
+  // 원격 저장소 스트림 (S3/FTP)
+  const remoteTargets = openRemoteTargets ? openRemoteTargets(basename(archiveFile)) : [];
+
+  console.log('🗄️  mongodump --archive --gzip 실행 중...');
+  const dump = spawn('mongodump', [`--uri=${MONGODB_URI}`, '--archive', '--gzip'], {
+    stdio: ['ignore', 'pipe', 'pipe']
+  });
+  dump.stderr.pipe(process.stderr);
+
+  // 전송량 집계 + 진행 상황 출력
+  let bytes = 0;
+  let lastReport = startedAt;
+  const progress = new Transform({
+    transform(chunk, encoding, callback) {
+      bytes += chunk.length;
+      const now = Date.now();
+      if (now - lastReport >= PROGRESS_INTERVAL) {
+        lastReport = now;
+        const seconds = (now - startedAt) / 1000;
+        console.log(`⏳ 진행: ${formatMB(bytes)} MB (${formatMB(bytes / seconds)} MB/s)`);
+      }
+      callback(null, chunk);
+    }
+  });
+
+  const fileStream = createWriteStream(partialFile);
+  const fileDone = new Promise((resolve, reject) => {
+    fileStream.on('finish', resolve);
+    fileStream.on('error', reject);
+  });
+
+  dump.stdout.pipe(progress);
+  progress.pipe(fileStream);
+  for (const target of remoteTargets) {
+    progress.pipe(target.stream);
+  }
+
+  try {
+    await Promise.all([waitForExit(dump, 'mongodump'), fileDone]);
+  } catch (error) {
+    console.error('❌ 스트리밍 백업 실패:', error.message);
+    dump.kill();
+    fileStream.destroy();
+    for (const target of remoteTargets) {
+      target.abort();
+    }
+    await Promise.all(remoteTargets.map(t => t.done));
+    await unlink(partialFile).catch(() => {});
+    throw error;
+  }
+
+  await rename(partialFile, archiveFile);
+  console.log(`✅ 압축 완료: ${basename(archiveFile)}`);
+
+  // 원격 업로드 완료 대기
+  const remote = [];
+  for (const target of remoteTargets) {
+    remote.push({ name: target.name, success: await target.done });
+  }
+
+  const durationMs = Date.now() - startedAt;
+  const seconds = durationMs / 1000;
+  console.log(`⏱️  소요 시간: ${seconds.toFixed(1)}초, 크기: ${formatMB(bytes)} MB, 평균 ${formatMB(bytes / Math.max(seconds, 0.001))} MB/s`);
+
+  return { file: archiveFile, bytes, durationMs, remote };
+}
+
+/**
+ * 백업 검증 (임시 DB로 복원 후 컬렉션별 문서 수 비교)
+ * - mongorestore --nsFrom/--nsTo로 원본 DB와 분리된 임시 DB에 복원
+ * - 검증 후 임시 DB 삭제
+ *
+ * @param {string} archiveFile - .archive.gz 백업 파일
+ * @returns {Promise<boolean>} 검증 성공 여부
+ */
+export async function verifyBackup(archiveFile) {
+  const client = mongoose.connection.getClient();
+  const sourceName = mongoose.connection.db.databaseName;
+  const verifyName = `${sourceName}_verify_${Date.now()}`;
+  const startedAt = Date.now();
+
+  console.log(`🔍 백업 검증 시작: ${basename(archiveFile)} → ${verifyName}`);
+
+  try {
+    const restore = spawn('mongorestore', [
+      `--uri=${getServerUri()}`,
+      `--archive=${archiveFile}`,
+      '--gzip',
+      `--nsInclude=${sourceName}.*`,
+      `--nsFrom=${sourceName}.*`,
+      `--nsTo=${verifyName}.*`
+    ], {
+      stdio: ['ignore', 'ignore', 'pipe']
+    });
+    restore.stderr.pipe(process.stderr);
+    await waitForExit(restore, 'mongorestore');
+
+    // 컬렉션별 문서 수 비교 (백업 중 변경된 데이터는 차이로 표시될 수 있음)
+    const sourceDb = client.db(sourceName);
+    const verifyDb = client.db(verifyName);
+    const collections = await sourceDb.listCollections({ type: 'collection' }).toArray();
+
+    let mismatches = 0;
+    for (const { name } of collections) {
+      if (name.startsWith('system.')) continue;
+
+      const [sourceCount, restoredCount] = await Promise.all([
+        sourceDb.collection(name).countDocuments(),
+        verifyDb.collection(name).countDocuments()
+      ]);
+
+      if (sourceCount !== restoredCount) {
+        console.warn(`  ⚠️  ${name}: 원본 ${sourceCount}건 / 복원 ${restoredCount}건`);
+        mismatches++;
+      }
+    }
+
+    const seconds = ((Date.now() - startedAt) / 1000).toFixed(1);
+    if (mismatches > 0) {
+      console.error(`❌ 백업 검증 실패: ${mismatches}/${collections.length}개 컬렉션 불일치 (${seconds}초)`);
+      return false;
+    }
+
+    console.log(`✅ 백업 검증 완료: ${collections.length}개 컬렉션 일치 (${seconds}초)`);
+    return true;
+  } catch (error) {
+    console.error('❌ 백업 검증 실패:', error.message);
+    return false;
+  } finally {
+    try {
+      await client.db(verifyName).dropDatabase();
+    } catch (error) {
+      console.warn(`⚠️  임시 DB 삭제 실패 (${verifyName}):`, error.message);
+    }
+  }
+}
+
 export function cleanupOldBackups(config) {
   try {
     const backupPath = config.backupPath || '/opt/nanumpay/backups';
@@ -56,9 +253,9 @@ export function cleanupOldBackups(config) {
 
     console.log('🧹 오래된 백업 정리 중...');
 
-    // 백업 파일 목록 가져오기 (.tar.gz 파일만)
+    // 백업 파일 목록 가져오기 (.tar.gz, .archive.gz 파일만)
     const files = readdirSync(backupPath)
-      .filter(f => f.startsWith('nanumpay-backup-') && f.endsWith('.tar.gz'))
+      .filter(isBackupFile)
       .map(f => ({
         name: f,
         path: join(backupPath, f),
@@ -88,7 +285,7 @@ export function cleanupOldBackups(config) {
       cutoffDate.setDate(cutoffDate.getDate() - config.retentionDays);
 
       const remainingFiles = readdirSync(backupPath)
-        .filter(f => f.startsWith('nanumpay-backup-') && f.endsWith('.tar.gz'))
+        .filter(isBackupFile)
         .map(f => ({
           name: f,
           path: join(backupPath, f),
@@ -111,7 +308,7 @@ export function cleanupOldBackups(config) {
 
     // 남은 파일 수 확인
     const remainingCount = readdirSync(backupPath)
-      .filter(f => f.startsWith('nanumpay-backup-') && f.endsWith('.tar.gz'))
+      .filter(isBackupFile)
       .length;
     console.log(`📊 남은 백업 파일 수: ${remainingCount}개`);
 
@@ -82,6 +82,10 @@ export async function getBackupConfig() {
       backupPath: process.env.BACKUP_PATH || '/opt/nanumpay/backups',
       retentionDays: backup.retention?.days || 30,
       retentionCount: backup.retention?.count || 7,
+      // 백업 방식: 'tar' (mongodump 디렉토리 → tar.gz), 'stream' (mongodump --archive --gzip 스트리밍)
+      mode: process.env.BACKUP_MODE === 'stream' ? 'stream' : 'tar',
+      // 임시 DB 복원 검증 (스트리밍 모드 전용)
+      verify: process.env.BACKUP_VERIFY === 'true',
       s3: null,
       ftp: null
     };
@@ -1,9 +1,9 @@
 #!/usr/bin/env node
 // index.js - 백업 시스템 메인 진입점
 import { connectDB, getBackupConfig, disconnectDB } from './config.js';
-import { createBackup, cleanupOldBackups } from './backup.js';
-import { uploadToS3 } from './storage/s3.js';
-import { uploadToFTP } from './storage/ftp.js';
+import { createBackup, createStreamingBackup, verifyBackup, cleanupOldBackups } from './backup.js';
+import { uploadToS3, createS3UploadStream } from './storage/s3.js';
+import { uploadToFTP, createFTPUploadStream } from './storage/ftp.js';
 
 async function main() {
   console.log('🚀 NanumPay 백업 시스템 시작');
@@ -33,37 +33,72 @@ async function main() {
     console.log(`   백업 경로: ${config.backupPath}`);
     console.log(`   보관 기간: ${config.retentionDays}일`);
     console.log(`   보관 개수: ${config.retentionCount}개`);
+    console.log(`   백업 방식: ${config.mode === 'stream' ? '스트리밍' : 'tar'}`);
+    if (config.mode === 'stream') {
+      console.log(`   복원 검증: ${config.verify ? '활성화' : '비활성화'}`);
+    }
     console.log(`   S3 업로드: ${config.s3?.enabled ? '활성화' : '비활성화'}`);
     console.log(`   FTP 업로드: ${config.ftp?.enabled ? '활성화' : '비활성화'}`);
     console.log('');
 
-    // 3. 백업 생성
-    const backupFile = createBackup(config);
-    console.log('');
-
-    // 4. 원격 저장소 업로드
-    if (config.s3?.enabled || config.ftp?.enabled) {
-      console.log('📤 원격 저장소 업로드 시작...');
+    if (config.mode === 'stream') {
+      // 3. 스트리밍 백업 (로컬 + 원격 저장소 동시 전송)
+      const result = await createStreamingBackup(config, (fileName) => {
+        const targets = [];
+        if (config.s3?.enabled) {
+          targets.push(createS3UploadStream(fileName, config));
+        }
+        if (config.ftp?.enabled) {
+          targets.push(createFTPUploadStream(fileName, config));
+        }
+        return targets;
+      });
 
-      // S3 업로드
-      if (config.s3?.enabled) {
-        const s3Success = await uploadToS3(backupFile, config);
-        if (!s3Success) {
-          console.error('⚠️  S3 업로드 실패 (백업은 로컬에 저장됨)');
+      for (const target of result.remote) {
+        if (!target.success) {
+          console.error(`⚠️  ${target.name} 업로드 실패 (백업은 로컬에 저장됨)`);
           exitCode = 1;
         }
       }
+      console.log('');
 
-      // FTP 업로드
-      if (config.ftp?.enabled) {
-        const ftpSuccess = await uploadToFTP(backupFile, config);
-        if (!ftpSuccess) {
-          console.error('⚠️  FTP 업로드 실패 (백업은 로컬에 저장됨)');
+      // 4. 복원 검증
+      if (config.verify) {
+        const verified = await verifyBackup(result.file);
+        if (!verified) {
           exitCode = 1;
         }
+        console.log('');
       }
-
+    } else {
+      // 3. 백업 생성
+      const backupFile = createBackup(config);
       console.log('');
+
+      // 4. 원격 저장소 업로드
+      if (config.s3?.enabled || config.ftp?.enabled) {
+        console.log('📤 원격 저장소 업로드 시작...');
+
+        // S3 업로드
+        if (config.s3?.enabled) {
+          const s3Success = await uploadToS3(backupFile, config);
+          if (!s3Success) {
+            console.error('⚠️  S3 업로드 실패 (백업은 로컬에 저장됨)');
+            exitCode = 1;
+          }
+        }
+
+        // FTP 업로드
+        if (config.ftp?.enabled) {
+          const ftpSuccess = await uploadToFTP(backupFile, config);
+          if (!ftpSuccess) {
+            console.error('⚠️  FTP 업로드 실패 (백업은 로컬에 저장됨)');
+            exitCode = 1;
+          }
+        }
+
+        console.log('');
+      }
     }
 
     // 5. 오래된 백업 정리
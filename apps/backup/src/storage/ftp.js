@@ -2,6 +2,82 @@
 import FTP from 'ftp';
 import { createReadStream, statSync } from 'fs';
 import { basename, join } from 'path';
+import { PassThrough } from 'stream';
+
+/**
+ * FTP 스트리밍 업로드 대상 생성 (스트리밍 백업용)
+ * - 연결 후 stream 내용을 그대로 put (연결 전 데이터는 stream 버퍼에서 대기)
+ * - 실패 시 stream을 비워서 백업 파이프라인이 멈추지 않도록 함
+ *
+ * @returns {{ name: string, stream: PassThrough, done: Promise<boolean>, abort: Function }}
+ */
+export function createFTPUploadStream(fileName, config) {
+  const client = new FTP();
+  const stream = new PassThrough();
+  const remoteDir = config.ftp.remotePath || '/backups';
+  const remotePath = join(remoteDir, fileName);
+
+  let resolveDone;
+  const done = new Promise((resolve) => {
+    resolveDone = resolve;
+  });
+
+  let settled = false;
+  const finish = (success) => {
+    if (settled) return;
+    settled = true;
+    if (!success) {
+      stream.resume();
+    }
+    client.end();
+    resolveDone(success);
+  };
+
+  console.log(`📡 FTP 스트리밍 업로드 시작: ${remotePath}`);
+
+  client.on('ready', () => {
+    console.log('✅ FTP 연결 성공');
+
+    client.mkdir(remoteDir, true, (mkdirErr) => {
+      if (mkdirErr && mkdirErr.code !== 550) { // 550 = 디렉토리 이미 존재
+        console.warn(`⚠️  디렉토리 생성 실패 (무시): ${mkdirErr.message}`);
+      }
+
+      client.put(stream, remotePath, (err) => {
+        if (err) {
+          console.error('❌ FTP 업로드 실패:', err.message);
+          finish(false);
+          return;
+        }
+
+        console.log(`✅ FTP 업로드 완료: ${remotePath}`);
+        finish(true);
+      });
+    });
+  });
+
+  client.on('error', (err) => {
+    console.error('❌ FTP 연결 실패:', err.message);
+    finish(false);
+  });
+
+  client.connect({
+    host: config.ftp.host,
+    port: config.ftp.port || 21,
+    user: config.ftp.user,
+    password: config.ftp.password
+  });
+
+  return {
+    name: 'FTP',
+    stream,
+    done,
+    abort: () => {
+      client.destroy();
+      finish(false);
+    }
+  };
+}
 
 export async function uploadToFTP(filePath, config) {
   if (!config.ftp || !config.ftp.enabled) {
@@ -1,7 +1,51 @@
 // storage/s3.js - AWS S3 업로드
 import AWS from 'aws-sdk';
-import { readFileSync, statSync } from 'fs';
+import { createReadStream, statSync } from 'fs';
 import { basename } from 'path';
+import { PassThrough } from 'stream';
+
+function createS3Client(config) {
+  return new AWS.S3({
+    accessKeyId: config.s3.accessKeyId,
+    secretAccessKey: config.s3.secretAccessKey,
+    region: config.s3.region || 'us-east-1'
+  });
+}
+
+/**
+ * S3 스트리밍 업로드 대상 생성 (스트리밍 백업용)
+ * - stream에 쓰는 데이터를 멀티파트로 바로 업로드 (로컬 파일 재읽기 없음)
+ * - 실패 시 stream을 비워서 백업 파이프라인이 멈추지 않도록 함
+ *
+ * @returns {{ name: string, stream: PassThrough, done: Promise<boolean>, abort: Function }}
+ */
+export function createS3UploadStream(fileName, config) {
+  const s3 = createS3Client(config);
+  const s3Key = (config.s3.prefix || 'backups/') + fileName;
+  const stream = new PassThrough();
+
+  console.log(`☁️  S3 스트리밍 업로드 시작: s3://${config.s3.bucket}/${s3Key}`);
+
+  const upload = s3.upload({
+    Bucket: config.s3.bucket,
+    Key: s3Key,
+    Body: stream,
+    ContentType: 'application/gzip'
+  });
+
+  const done = upload.promise()
+    .then(() => {
+      console.log(`✅ S3 업로드 완료: s3://${config.s3.bucket}/${s3Key}`);
+      return true;
+    })
+    .catch((error) => {
+      console.error('❌ S3 업로드 실패:', error.message);
+      stream.resume();
+      return false;
+    });
+
+  return { name: 'S3', stream, done, abort: () => upload.abort() };
+}
 
 export async function uploadToS3(filePath, config) {
   if (!config.s3 || !config.s3.enabled) {
@@ -13,14 +57,10 @@ export async function uploadToS3(filePath, config) {
     console.log('☁️  S3 업로드 시작...');
 
     // S3 클라이언트 설정
-    const s3 = new AWS.S3({
-      accessKeyId: config.s3.accessKeyId,
-      secretAccessKey: config.s3.secretAccessKey,
-      region: config.s3.region || 'us-east-1'
-    });
+    const s3 = createS3Client(config);
 
-    // 파일 읽기
-    const fileContent = readFileSync(filePath);
+    // 파일 스트림 (전체 파일을 메모리에 올리지 않음)
+    const fileContent = createReadStream(filePath);
     const fileName = basename(filePath);
     const s3Key = (config.s3.prefix || 'backups/') + fileName;
 
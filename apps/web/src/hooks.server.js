@@ -1,12 +1,38 @@
 import jwt from 'jsonwebtoken';
 import { JWT_SECRET, JWT_EXPIRES } from '$env/static/private';
 import { redirect } from '@sveltejs/kit';
-import { Admin } from '$lib/server/models/Admin.js';
 import { connectDB } from '$lib/server/db.js';
 import logger from '$lib/server/logger.js';
+import { observeRequest } from '$lib/server/metrics.js';
+import { verifyToken, getMaintenanceMode } from '$lib/server/authCache.js';
 
-/** @type {import('@sveltejs/kit').Handle} */
+/**
+ * ⭐ v9.7: 전체 요청 응답 시간 기록 (라우트별 히스토그램, /api/admin/metrics)
+ * @type {import('@sveltejs/kit').Handle}
+ */
 export async function handle({ event, resolve }) {
+	const startTime = performance.now();
+	let status = 500;
+
+	try {
+		const response = await handleRequest({ event, resolve });
+		status = response.status;
+		return response;
+	} catch (error) {
+		// redirect/error는 status 보유
+		status = error?.status || 500;
+		throw error;
+	} finally {
+		observeRequest({
+			method: event.request.method,
+			route: event.route?.id,
+			status,
+			durationMs: performance.now() - startTime
+		});
+	}
+}
+
+async function handleRequest({ event, resolve }) {
 	const startTime = Date.now();
 	const { pathname } = event.url;
 	const method = event.request.method;
@@ -40,13 +66,15 @@ export async function handle({ event, resolve }) {
 		event.locals.user = null;
 	}
 
-	// JWT 인증 처리
+	// JWT 인증 처리 (⭐ v9.7: 검증된 토큰은 authCache에서 재사용)
 	const token = event.cookies.get('token');
 	const refreshToken = event.cookies.get('refreshToken');
 
 	if (token) {
 		try {
-			const user = jwt.verify(token, JWT_SECRET);
+			// 암호 변경으로 무효화된 토큰 확인에 DB 사용
+			await connectDB();
+			const user = await verifyToken(token, JWT_SECRET);
 			// Admin 여부를 명확히 표시
 			event.locals.user = {
 				...user,
@@ -58,7 +86,7 @@ export async function handle({ event, resolve }) {
 			if (err.name === 'TokenExpiredError' && refreshToken) {
 				try {
 					// 리프레시 토큰 검증
-					const decoded = jwt.verify(refreshToken, JWT_SECRET);
+					const decoded = await verifyToken(refreshToken, JWT_SECRET);
 
 					// 새 액세스 토큰 생성
 					const newToken = jwt.sign(
@@ -81,7 +109,7 @@ export async function handle({ event, resolve }) {
 						// maxAge 제거 → 세션 쿠키
 					});
 
-					const verifiedUser = jwt.verify(newToken, JWT_SECRET);
+					const verifiedUser = await verifyToken(newToken, JWT_SECRET);
 					event.locals.user = {
 						...verifiedUser,
 						isAdmin: verifiedUser.type === 'admin',
@@ -109,8 +137,7 @@ export async function handle({ event, resolve }) {
 	    event.url.pathname !== '/login') {
 		try {
 			await connectDB();
-			const admin = await Admin.findOne().select('systemSettings.maintenanceMode');
-			const isMaintenanceMode = admin?.systemSettings?.maintenanceMode || false;
+			const isMaintenanceMode = await getMaintenanceMode();
 
 			if (isMaintenanceMode) {
 				// 로그인한 비관리자만 유지보수 페이지로 리다이렉트
@@ -0,0 +1,242 @@
+/**
+ * 인증 캐시 (hooks.server.js 요청별 인증 비용 절감)
+ *
+ * - 검증된 JWT: 토큰 해시(sha256) → payload, 짧은 TTL(60초, 토큰 만료 시각 이내)
+ *   → 자주 쓰이는 토큰은 jwt.verify 없이 Map 조회로 처리
+ * - 로그아웃: 토큰 폐기 (만료 시각까지 거부)
+ * - 암호 변경: 계정별 tokensValidAfter(초)를 Counter에 저장 → 그 이전에 발급된(iat) 토큰은 거부
+ *   (캐시 적중 경로도 확인, 다른 서버 프로세스는 최대 60초 안에 반영)
+ * - 유지보수 모드: Admin 조회 결과를 짧은 TTL(10초)로 캐시, 설정 변경 시 즉시 무효화
+ * - 적중/미적중/제거 횟수는 /api/admin/metrics에 노출
+ */
+
+import crypto from 'crypto';
+import jwt from 'jsonwebtoken';
+import { Admin } from './models/Admin.js';
+import Counter from './models/Counter.js';
+import { registerCounter } from './metrics.js';
+
+const TOKEN_TTL_MS = 60 * 1000;
+const MAX_CACHED_TOKENS = 5000;
+const SYSTEM_STATUS_TTL_MS = 10 * 1000;
+// Counter _id 접두사: tokensValidAfter:<계정 _id>, value = 초 (JWT iat와 같은 단위)
+const VALID_AFTER_PREFIX = 'tokensValidAfter:';
+
+const tokenCounter = registerCounter(
+	'nanumpay_auth_token_cache_total',
+	'Verified JWT cache lookups and removals',
+	['result']
+);
+const statusCounter = registerCounter(
+	'nanumpay_auth_status_cache_total',
+	'Maintenance status cache lookups',
+	['result']
+);
+
+// tokenHash -> { payload, expiresAt }
+const tokenCache = new Map();
+// tokenHash -> 토큰 만료 시각 (ms)
+const revokedTokens = new Map();
+// accountId -> { validAfter (초), expiresAt }
+const accountValidAfter = new Map();
+// { maintenanceMode, expiresAt }
+let systemStatus = null;
+
+function hashToken(token) {
+	return crypto.createHash('sha256').update(token).digest('hex');
+}
+
+/**
+ * 만료된 폐기 목록 정리
+ */
+function pruneRevoked(now) {
+	for (const [hash, expiresAt] of revokedTokens) {
+		if (expiresAt <= now) revokedTokens.delete(hash);
+	}
+}
+
+/**
+ * 계정의 토큰 유효 시작 시각 (초, 없으면 0)
+ */
+async function getTokensValidAfter(accountId, now) {
+	const cached = accountValidAfter.get(accountId);
+	if (cached && cached.expiresAt > now) return cached.validAfter;
+
+	const counter = await Counter.findById(VALID_AFTER_PREFIX + accountId).lean();
+	const validAfter = counter?.value || 0;
+
+	if (accountValidAfter.size >= MAX_CACHED_TOKENS) {
+		accountValidAfter.delete(accountValidAfter.keys().next().value);
+	}
+	accountValidAfter.set(accountId, { validAfter, expiresAt: now + TOKEN_TTL_MS });
+	return validAfter;
+}
+
+/**
+ * JWT 검증 (캐시 사용)
+ * - 실패 시 jwt.verify와 동일한 오류를 던짐 (TokenExpiredError 등 → 리프레시 처리 유지)
+ * - 암호 변경 이전에 발급된 토큰은 'token revoked' 오류 (리프레시 토큰도 동일)
+ *
+ * @param {string} token
+ * @param {string} secret
+ * @returns {Promise<Object>} payload
+ */
+export async function verifyToken(token, secret) {
+	const hash = hashToken(token);
+	const now = Date.now();
+
+	if (revokedTokens.has(hash)) {
+		if (revokedTokens.get(hash) > now) {
+			throw new jwt.JsonWebTokenError('token revoked');
+		}
+		revokedTokens.delete(hash);
+	}
+
+	let payload;
+	const cached = tokenCache.get(hash);
+	if (cached && cached.expiresAt > now) {
+		tokenCounter.inc(['hit']);
+		payload = cached.payload;
+	} else {
+		tokenCounter.inc(['miss']);
+		if (cached) tokenCache.delete(hash);
+
+		payload = jwt.verify(token, secret);
+
+		// 용량 초과 시 가장 오래된 항목부터 제거 (Map 삽입 순서)
+		while (tokenCache.size >= MAX_CACHED_TOKENS) {
+			tokenCache.delete(tokenCache.keys().next().value);
+			tokenCounter.inc(['evicted']);
+		}
+
+		const tokenExpiresAt = payload.exp ? payload.exp * 1000 : Infinity;
+		tokenCache.set(hash, {
+			payload,
+			expiresAt: Math.min(now + TOKEN_TTL_MS, tokenExpiresAt)
+		});
+	}
+
+	if (payload.id) {
+		const validAfter = await getTokensValidAfter(payload.id, now);
+		if (validAfter && (payload.iat || 0) < validAfter) {
+			tokenCache.delete(hash);
+			tokenCounter.inc(['invalidated']);
+			throw new jwt.JsonWebTokenError('token revoked');
+		}
+	}
+
+	return payload;
+}
+
+/**
+ * 토큰 폐기 (로그아웃)
+ * - 만료 시각까지 verifyToken에서 거부
+ */
+export function revokeToken(token) {
+	if (!token) return;
+
+	const hash = hashToken(token);
+	const decoded = jwt.decode(token);
+	const now = Date.now();
+
+	tokenCache.delete(hash);
+	tokenCounter.inc(['revoked']);
+
+	if (decoded?.exp && decoded.exp * 1000 > now) {
+		if (revokedTokens.size >= MAX_CACHED_TOKENS) pruneRevoked(now);
+		revokedTokens.set(hash, decoded.exp * 1000);
+	}
+}
+
+/**
+ * 계정의 기존 토큰 모두 무효화 (암호 변경 등)
+ * - 지금 이전에 발급된 액세스/리프레시 토큰은 verifyToken에서 거부
+ * - 같은 초에 새로 발급한 토큰(reissueSessionTokens)은 유효 (iat 초 단위)
+ * @param {string} accountId - 토큰 payload의 id (Admin / UserAccount / PlannerAccount _id)
+ */
+export async function invalidateAccountTokens(accountId) {
+	if (!accountId) return;
+
+	const id = accountId.toString();
+	const validAfter = Math.floor(Date.now() / 1000);
+
+	await Counter.updateOne(
+		{ _id: VALID_AFTER_PREFIX + id },
+		{ $max: { value: validAfter } },
+		{ upsert: true }
+	);
+	accountValidAfter.set(id, { validAfter, expiresAt: Date.now() + TOKEN_TTL_MS });
+
+	for (const [hash, entry] of tokenCache) {
+		if (entry.payload.id === id) {
+			tokenCache.delete(hash);
+			tokenCounter.inc(['invalidated']);
+		}
+	}
+}
+
+/**
+ * 현재 세션 토큰 재발급 (본인 암호 변경 후 로그인 유지)
+ * - invalidateAccountTokens 이후 호출 → 새 토큰만 유효
+ * - payload/쿠키 형식은 /api/auth/login과 동일
+ *
+ * @param {Object} cookies - SvelteKit cookies
+ * @param {Object} user - locals.user (검증된 토큰 payload)
+ * @param {string} secret
+ * @param {{ expiresIn?: string, refreshExpiresIn?: string }} [options]
+ */
+export function reissueSessionTokens(cookies, user, secret, { expiresIn, refreshExpiresIn } = {}) {
+	const payload = {
+		id: user.id,
+		loginId: user.loginId,
+		name: user.name,
+		type: user.type
+	};
+	if (user.primaryUserId) {
+		payload.primaryUserId = user.primaryUserId;
+		payload.primaryUserName = user.primaryUserName;
+	}
+
+	const accessToken = jwt.sign(payload, secret, { expiresIn: expiresIn || '1h' });
+	const refreshToken = jwt.sign(
+		{ id: user.id, type: user.type },
+		secret,
+		{ expiresIn: refreshExpiresIn || '7d' }
+	);
+
+	const cookieOptions = {
+		httpOnly: true,
+		secure: process.env.NODE_ENV === 'production',
+		sameSite: 'strict',
+		path: '/'
+	};
+	cookies.set('token', accessToken, cookieOptions);
+	cookies.set('refreshToken', refreshToken, cookieOptions);
+}
+
+/**
+ * 유지보수 모드 여부 (캐시 사용)
+ * @returns {Promise<boolean>}
+ */
+export async function getMaintenanceMode() {
+	const now = Date.now();
+	if (systemStatus && systemStatus.expiresAt > now) {
+		statusCounter.inc(['hit']);
+		return systemStatus.maintenanceMode;
+	}
+
+	statusCounter.inc(['miss']);
+	const admin = await Admin.findOne().select('systemSettings.maintenanceMode').lean();
+	systemStatus = {
+		maintenanceMode: admin?.systemSettings?.maintenanceMode || false,
+		expiresAt: now + SYSTEM_STATUS_TTL_MS
+	};
+	return systemStatus.maintenanceMode;
+}
+
+/**
+ * 유지보수 모드 캐시 무효화 (시스템 설정 변경 시)
+ */
+export function invalidateSystemStatus() {
+	systemStatus = null;
+}
@@ -1,4 +1,5 @@
 import mongoose from 'mongoose';
+import { instrumentMongoClient } from './metrics.js';
 
 // Node.js 스크립트와 SvelteKit 앱 둘 다 지원
 let MONGODB_URI;
@@ -28,10 +29,12 @@ export async function db() {
 
 	if (!cached.promise) {
 		const opts = {
-			bufferCommands: false
+			bufferCommands: false,
+			monitorCommands: true // ⭐ v9.7: 컬렉션별 명령 지표 / 느린 쿼리 로그
 		};
 
 		cached.promise = mongoose.connect(MONGODB_URI, opts).then((mongoose) => {
+			instrumentMongoClient(mongoose.connection.getClient());
 			return mongoose;
 		});
 	}
@@ -53,7 +56,8 @@ export async function connectDB() {
 			: 'mongodb://localhost:27017/nanumpay';
 
 	if (mongoose.connection.readyState === 0) {
-		await mongoose.connect(mongoUri, { bufferCommands: false });
+		await mongoose.connect(mongoUri, { bufferCommands: false, monitorCommands: true });
+		instrumentMongoClient(mongoose.connection.getClient());
 		console.log('Connected to MongoDB');
 	}
 	return mongoose.connection;
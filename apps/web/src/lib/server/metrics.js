@@ -0,0 +1,272 @@
+/**
+ * 서버 지표 수집 (Prometheus 텍스트 형식)
+ *
+ * - HTTP: 라우트(route.id)별 응답 시간 히스토그램
+ * - MongoDB: 드라이버 command monitoring으로 컬렉션/명령별 횟수·소요 시간·오류
+ * - 느린 쿼리: 기준(SLOW_QUERY_MS, 기본 200ms) 초과 시 쿼리 형태(값 제거)를 로그로 기록
+ * - 조회: /api/admin/metrics (관리자 전용)
+ */
+
+import logger from './logger.js';
+
+const SLOW_QUERY_MS = parseInt(process.env.SLOW_QUERY_MS) || 200;
+
+// 초 단위 버킷
+const HTTP_BUCKETS = [0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30];
+const MONGO_BUCKETS = [0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5];
+
+// 지표 대상이 아닌 내부 명령
+const IGNORED_COMMANDS = new Set([
+	'hello',
+	'ismaster',
+	'isMaster',
+	'ping',
+	'buildInfo',
+	'saslStart',
+	'saslContinue',
+	'endSessions',
+	'killCursors'
+]);
+
+function escapeLabel(value) {
+	return String(value).replace(/\\/g, '\\\\').replace(/"/g, '\\"').replace(/\n/g, '\\n');
+}
+
+function formatLabels(labelNames, values, extra = '') {
+	const pairs = labelNames.map((name, i) => `${name}="${escapeLabel(values[i])}"`);
+	if (extra) pairs.push(extra);
+	return pairs.length > 0 ? `{${pairs.join(',')}}` : '';
+}
+
+class Counter {
+	constructor(name, help, labelNames = []) {
+		this.name = name;
+		this.help = help;
+		this.labelNames = labelNames;
+		this.values = new Map(); // labelKey -> { labels, value }
+	}
+
+	inc(labels = [], amount = 1) {
+		const key = labels.join('\u0000');
+		const entry = this.values.get(key);
+		if (entry) {
+			entry.value += amount;
+		} else {
+			this.values.set(key, { labels, value: amount });
+		}
+	}
+
+	render() {
+		const lines = [`# HELP ${this.name} ${this.help}`, `# TYPE ${this.name} counter`];
+		for (const { labels, value } of this.values.values()) {
+			lines.push(`${this.name}${formatLabels(this.labelNames, labels)} ${value}`);
+		}
+		return lines.join('\n');
+	}
+}
+
+class Histogram {
+	constructor(name, help, labelNames = [], buckets = HTTP_BUCKETS) {
+		this.name = name;
+		this.help = help;
+		this.labelNames = labelNames;
+		this.buckets = buckets;
+		this.values = new Map(); // labelKey -> { labels, counts, sum, count }
+	}
+
+	observe(labels, seconds) {
+		const key = labels.join('\u0000');
+		let entry = this.values.get(key);
+		if (!entry) {
+			entry = { labels, counts: new Array(this.buckets.length).fill(0), sum: 0, count: 0 };
+			this.values.set(key, entry);
+		}
+
+		for (let i = 0; i < this.buckets.length; i++) {
+			if (seconds <= this.buckets[i]) {
+				entry.counts[i]++;
+				break;
+			}
+		}
+		entry.sum += seconds;
+		entry.count++;
+	}
+
+	render() {
+		const lines = [`# HELP ${this.name} ${this.help}`, `# TYPE ${this.name} histogram`];
+		for (const { labels, counts, sum, count } of this.values.values()) {
+			// 버킷은 누적값으로 출력
+			let cumulative = 0;
+			this.buckets.forEach((bucket, i) => {
+				cumulative += counts[i];
+				lines.push(`${this.name}_bucket${formatLabels(this.labelNames, labels, `le="${bucket}"`)} ${cumulative}`);
+			});
+			lines.push(`${this.name}_bucket${formatLabels(this.labelNames, labels, 'le="+Inf"')} ${count}`);
+			lines.push(`${this.name}_sum${formatLabels(this.labelNames, labels)} ${sum}`);
+			lines.push(`${this.name}_count${formatLabels(this.labelNames, labels)} ${count}`);
+		}
+		return lines.join('\n');
+	}
+}
+
+// HMR/중복 import 시에도 같은 지표 공유
+let registry = global.nanumpayMetrics;
+
+if (!registry) {
+	registry = global.nanumpayMetrics = {
+		httpDuration: new Histogram(
+			'nanumpay_http_request_duration_seconds',
+			'HTTP request duration by route',
+			['method', 'route', 'status']
+		),
+		mongoDuration: new Histogram(
+			'nanumpay_mongo_command_duration_seconds',
+			'MongoDB command duration by collection',
+			['collection', 'command'],
+			MONGO_BUCKETS
+		),
+		mongoErrors: new Counter(
+			'nanumpay_mongo_command_errors_total',
+			'Failed MongoDB commands by collection',
+			['collection', 'command']
+		),
+		mongoSlow: new Counter(
+			'nanumpay_mongo_slow_commands_total',
+			`MongoDB commands slower than ${SLOW_QUERY_MS}ms`,
+			['collection', 'command']
+		),
+		instrumentedClients: new WeakSet(),
+		counters: new Map() // registerCounter()로 등록한 모듈별 카운터
+	};
+}
+
+/**
+ * 모듈별 카운터 등록 (같은 이름은 기존 카운터 반환)
+ * @param {string} name
+ * @param {string} help
+ * @param {Array<string>} labelNames
+ * @returns {{ inc: (labels?: Array<string>, amount?: number) => void }}
+ */
+export function registerCounter(name, help, labelNames = []) {
+	if (!registry.counters.has(name)) {
+		registry.counters.set(name, new Counter(name, help, labelNames));
+	}
+	return registry.counters.get(name);
+}
+
+/**
+ * HTTP 요청 기록
+ * @param {Object} params
+ * @param {string} params.method
+ * @param {string|null} params.route - SvelteKit route.id (없으면 unmatched)
+ * @param {number} params.status
+ * @param {number} params.durationMs
+ */
+export function observeRequest({ method, route, status, durationMs }) {
+	registry.httpDuration.observe([method, route || 'unmatched', String(status)], durationMs / 1000);
+}
+
+/**
+ * 쿼리 형태 (값 → '?', 구조만 유지)
+ */
+function toQueryShape(value, depth = 0) {
+	if (value === null || typeof value !== 'object' || value instanceof Date || value._bsontype) {
+		return '?';
+	}
+	if (depth > 6) {
+		return '…';
+	}
+	if (Array.isArray(value)) {
+		// 파이프라인/$or 등 객체 배열은 구조 유지, 값 배열($in 등)은 축약
+		const objects = value.filter((item) => item !== null && typeof item === 'object' && !item._bsontype && !(item instanceof Date));
+		return objects.length > 0 ? objects.slice(0, 20).map((item) => toQueryShape(item, depth + 1)) : ['?'];
+	}
+	return Object.fromEntries(
+		Object.entries(value).map(([key, child]) => [key, toQueryShape(child, depth + 1)])
+	);
+}
+
+function describeCommand(command) {
+	if (!command) return null;
+	const shape = {};
+	for (const field of ['filter', 'query', 'pipeline', 'sort', 'key']) {
+		if (command[field] !== undefined) shape[field] = toQueryShape(command[field]);
+	}
+	if (command.updates?.[0]) shape.q = toQueryShape(command.updates[0].q);
+	if (command.deletes?.[0]) shape.q = toQueryShape(command.deletes[0].q);
+	return shape;
+}
+
+/**
+ * MongoClient command monitoring 연결 (monitorCommands: true로 연결된 클라이언트)
+ * @param {import('mongodb').MongoClient} client
+ */
+export function instrumentMongoClient(client) {
+	if (!client || registry.instrumentedClients.has(client)) return;
+	registry.instrumentedClients.add(client);
+
+	// requestId -> { collection, command } (느린 쿼리 형태 계산을 위해 원본 명령 참조만 보관)
+	const pending = new Map();
+
+	client.on('commandStarted', (event) => {
+		if (IGNORED_COMMANDS.has(event.commandName)) return;
+		const target = event.command?.[event.commandName];
+		const collection = typeof target === 'string' ? target : event.command?.collection;
+		if (typeof collection !== 'string') return;
+		pending.set(event.requestId, { collection, command: event.command });
+	});
+
+	client.on('commandSucceeded', (event) => {
+		const started = pending.get(event.requestId);
+		if (!started) return;
+		pending.delete(event.requestId);
+
+		const labels = [started.collection, event.commandName];
+		registry.mongoDuration.observe(labels, event.duration / 1000);
+
+		if (event.duration >= SLOW_QUERY_MS) {
+			registry.mongoSlow.inc(labels);
+			logger.warn(
+				`[SlowQuery] ${started.collection}.${event.commandName} ${event.duration}ms ${JSON.stringify(describeCommand(started.command))}`
+			);
+		}
+	});
+
+	client.on('commandFailed', (event) => {
+		const started = pending.get(event.requestId);
+		if (!started) return;
+		pending.delete(event.requestId);
+
+		const labels = [started.collection, event.commandName];
+		registry.mongoDuration.observe(labels, event.duration / 1000);
+		registry.mongoErrors.inc(labels);
+	});
+}
+
+/**
+ * Prometheus 텍스트 출력
+ * @returns {string}
+ */
+export function renderMetrics() {
+	const memory = process.memoryUsage();
+	const processLines = [
+		'# HELP nanumpay_process_uptime_seconds Process uptime',
+		'# TYPE nanumpay_process_uptime_seconds gauge',
+		`nanumpay_process_uptime_seconds ${process.uptime()}`,
+		'# HELP nanumpay_process_resident_memory_bytes Resident memory size',
+		'# TYPE nanumpay_process_resident_memory_bytes gauge',
+		`nanumpay_process_resident_memory_bytes ${memory.rss}`,
+		'# HELP nanumpay_process_heap_used_bytes V8 heap used',
+		'# TYPE nanumpay_process_heap_used_bytes gauge',
+		`nanumpay_process_heap_used_bytes ${memory.heapUsed}`
+	];
+
+	return [
+		registry.httpDuration.render(),
+		registry.mongoDuration.render(),
+		registry.mongoErrors.render(),
+		registry.mongoSlow.render(),
+		...Array.from(registry.counters.values(), (counter) => counter.render()),
+		processLines.join('\n')
+	].join('\n\n') + '\n';
+}
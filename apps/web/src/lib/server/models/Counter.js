@@ -0,0 +1,22 @@
+import mongoose from 'mongoose';
+
+/**
+ * 번호 발급 카운터 컬렉션
+ * - _id: 카운터 이름 (예: userSequence)
+ * - value: 마지막으로 발급된 번호
+ * - 블록 단위 발급은 sequenceService 참고 (findOneAndUpdate 1회로 원자적 예약)
+ * - 상태 표시/기준 시각도 같은 형태로 저장 (예: plannerRollups, paymentWeekBuckets, additionalPaymentWatermark, tokensValidAfter:<계정 _id>)
+ */
+const counterSchema = new mongoose.Schema(
+	{
+		_id: { type: String, required: true },
+		value: { type: Number, default: 0 }
+	},
+	{
+		versionKey: false
+	}
+);
+
+const Counter = mongoose.models.Counter || mongoose.model('Counter', counterSchema);
+
+export default Counter;
@@ -0,0 +1,58 @@
+import mongoose from 'mongoose';
+
+/**
+ * 등급별 지급 정보 스냅샷 모델 (관리자 대시보드용)
+ *
+ * 역할:
+ * - 월별 신규 가입자 수, 매출, 등급별 인원, 등급별 지급 대상 인원을 월당 1건으로 저장
+ * - 등급 정보 API(/api/admin/grade-info)는 기간 내 스냅샷만 조회
+ * - gradeInfoSnapshotService.refreshGradeInfoSnapshot()로 생성 (월 등록 처리 완료, 매출 조정 시)
+ */
+const gradeCountSchema = {
+	F1: { type: Number, default: 0 },
+	F2: { type: Number, default: 0 },
+	F3: { type: Number, default: 0 },
+	F4: { type: Number, default: 0 },
+	F5: { type: Number, default: 0 },
+	F6: { type: Number, default: 0 },
+	F7: { type: Number, default: 0 },
+	F8: { type: Number, default: 0 }
+};
+
+const gradeInfoSnapshotSchema = new mongoose.Schema(
+	{
+		// 월 키 (YYYY-MM)
+		monthKey: {
+			type: String,
+			required: true,
+			unique: true
+		},
+		year: { type: Number, required: true },
+		month: { type: Number, required: true },
+
+		newUsers: { type: Number, default: 0 },
+		// 월 매출 (등록 데이터가 없으면 신규 가입자 × 100만원)
+		totalRevenue: { type: Number, default: 0 },
+
+		// 등급별 전체 인원 / 지급 대상 인원 (스냅샷 생성 시점 기준)
+		gradeCounts: gradeCountSchema,
+		eligibleCounts: gradeCountSchema,
+
+		computedAt: {
+			type: Date,
+			default: Date.now
+		}
+	},
+	{
+		collection: 'gradeinfosnapshots'
+	}
+);
+
+// ⭐ 기존 모델 삭제 후 재생성 (HMR 대응)
+if (mongoose.models.GradeInfoSnapshot) {
+	delete mongoose.models.GradeInfoSnapshot;
+}
+
+const GradeInfoSnapshot = mongoose.model('GradeInfoSnapshot', gradeInfoSnapshotSchema);
+
+export default GradeInfoSnapshot;
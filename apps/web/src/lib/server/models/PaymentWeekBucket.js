@@ -0,0 +1,99 @@
+import mongoose from 'mongoose';
+import { getISOWeek } from '../utils/planStorage.js';
+import Counter from './Counter.js';
+
+/**
+ * 주차별 지급 회차 인덱스 (ISO 주차 → 계획/회차)
+ * - "W주차에 지급할 회차" 조회 시 WeeklyPaymentPlans 전체 $unwind 대신 해당 주차 버킷만 조회
+ * - 계획 생성(save/create/insertMany)·삭제(deleteMany/deleteOne) 시 WeeklyPaymentPlans 미들웨어에서 동기화
+ * - 회차 위치만 저장 (상태/금액은 계획 문서에서 읽음) → 종료/skip/금액 변경 시 갱신 불필요
+ * - 전체 재구성: paymentWeekBucketService.rebuildPaymentWeekBuckets()
+ * - 동기화 실패 시 Counter 재구성 표시(paymentWeekBuckets)를 지워 다음 조회에서 전체 재구성
+ *   (재구성 완료 전 조회는 계획 컬렉션 기준)
+ */
+
+// Counter _id: 재구성 완료 표시 (value = 버킷 버전, 0 = 재구성 필요, 음수 = 재구성 중 (-시작 시각 ms))
+export const BUCKET_MARKER = 'paymentWeekBuckets';
+
+const paymentWeekBucketSchema = new mongoose.Schema(
+	{
+		weekNumber: { type: String, required: true }, // ISO 주차 (예: 2025-W41)
+		planId: { type: mongoose.Schema.Types.ObjectId, required: true },
+		week: { type: Number, required: true }, // 계획 내 회차 (1~10)
+		scheduledDate: { type: Date, required: true },
+		userId: { type: String, required: true }
+	},
+	{
+		versionKey: false
+	}
+);
+
+paymentWeekBucketSchema.index({ weekNumber: 1, planId: 1, week: 1 }, { unique: true });
+paymentWeekBucketSchema.index({ planId: 1 });
+paymentWeekBucketSchema.index({ scheduledDate: 1 });
+
+/**
+ * 계획 목록의 회차를 버킷에 반영 (upsert, 중복 실행 안전)
+ * @param {Array<Object>} plans - _id, userId, installments 포함
+ */
+paymentWeekBucketSchema.statics.addPlans = async function(plans) {
+	const ops = [];
+	for (const plan of plans) {
+		for (const inst of plan.installments || []) {
+			if (!inst.scheduledDate) continue;
+			const weekNumber = inst.weekNumber || getISOWeek(inst.scheduledDate);
+			ops.push({
+				updateOne: {
+					filter: { weekNumber, planId: plan._id, week: inst.week },
+					update: { $set: { scheduledDate: inst.scheduledDate, userId: plan.userId } },
+					upsert: true
+				}
+			});
+		}
+	}
+
+	if (ops.length > 0) {
+		await this.bulkWrite(ops, { ordered: false });
+	}
+};
+
+/**
+ * 삭제된 계획의 회차 제거
+ * @param {Array<ObjectId>|null} planIds - null이면 전체 삭제
+ */
+paymentWeekBucketSchema.statics.removePlans = async function(planIds) {
+	if (planIds === null) {
+		await this.deleteMany({});
+	} else if (planIds.length > 0) {
+		await this.deleteMany({ planId: { $in: planIds } });
+	}
+};
+
+/**
+ * 버킷 재구성 필요 표시 (동기화 실패 등)
+ * - 재구성 중이면 완료 표시가 덮어쓰지 않도록 값을 0으로 설정 (rebuild는 자신의 재구성 중 표시일 때만 완료 처리)
+ */
+paymentWeekBucketSchema.statics.markStale = async function() {
+	await Counter.updateOne({ _id: BUCKET_MARKER }, { $set: { value: 0 } }, { upsert: true });
+};
+
+/**
+ * 계획 저장/삭제에 따른 버킷 동기화
+ * - 실패해도 계획 쓰기는 유지하고 재구성 필요 표시 → 다음 조회에서 계획 기준으로 재구성
+ * @param {Promise} task - addPlans / removePlans
+ */
+paymentWeekBucketSchema.statics.syncOrMarkStale = async function(task) {
+	try {
+		await task;
+	} catch (error) {
+		console.error('[PaymentWeekBucket] 동기화 실패 → 재구성 필요 표시:', error.message);
+		await this.markStale().catch((markError) => {
+			console.error('[PaymentWeekBucket] 재구성 표시 실패:', markError.message);
+		});
+	}
+};
+
+const PaymentWeekBucket =
+	mongoose.models.PaymentWeekBucket || mongoose.model('PaymentWeekBucket', paymentWeekBucketSchema);
+
+export default PaymentWeekBucket;
@@ -0,0 +1,88 @@
+import mongoose from 'mongoose';
+
+/**
+ * 설계사 지급 집계 모델 (Rollup)
+ *
+ * 역할:
+ * - 설계사별 기간(월/주) 용역비 + 수당 사전 집계
+ * - 설계사 지급명부/설계사 요약 화면은 이 컬렉션만 조회
+ * - plannerRollupService.recomputePlannerRollups()로 설계사/월 단위 재계산
+ *
+ * 기간 키:
+ * - month: YYYY-MM (periodStart = 해당 월 1일 UTC)
+ * - week:  YYYY-MM-WN (금요일 기준 주차, periodStart = 해당 금요일)
+ */
+const plannerCommissionRollupSchema = new mongoose.Schema(
+	{
+		plannerAccountId: {
+			type: mongoose.Schema.Types.ObjectId,
+			ref: 'PlannerAccount',
+			required: true
+		},
+		plannerName: {
+			type: String
+		},
+
+		periodType: {
+			type: String,
+			enum: ['month', 'week'],
+			required: true
+		},
+		period: {
+			type: String,
+			required: true
+		},
+		periodStart: {
+			type: Date,
+			required: true
+		},
+
+		// 용역비 (담당 용역자 installments, skipped/terminated 제외)
+		serviceAmount: { type: Number, default: 0 },
+		serviceTax: { type: Number, default: 0 },
+		serviceNet: { type: Number, default: 0 },
+		serviceInstallments: { type: Number, default: 0 },
+		userCount: { type: Number, default: 0 },
+
+		// 설계사 수당 (PlannerCommissionPlan, paid/pending) - 관리자 지급명부
+		commissionAmount: { type: Number, default: 0 },
+		commissionRevenue: { type: Number, default: 0 },
+		commissionCount: { type: Number, default: 0 },
+
+		// 설계사 수당 (전체 상태) - 설계사 수당 요약
+		commissionAmountAll: { type: Number, default: 0 },
+		commissionRevenueAll: { type: Number, default: 0 },
+		commissionCountAll: { type: Number, default: 0 },
+
+		// 지급 상태 (집계 시점 기준, 지급일이 지난 금액 = 지급 완료)
+		paidServiceAmount: { type: Number, default: 0 },
+		paidCommissionAmount: { type: Number, default: 0 },
+
+		computedAt: {
+			type: Date,
+			default: Date.now
+		}
+	},
+	{
+		collection: 'plannercommissionrollups'
+	}
+);
+
+plannerCommissionRollupSchema.index(
+	{ periodType: 1, period: 1, plannerAccountId: 1 },
+	{ unique: true }
+);
+plannerCommissionRollupSchema.index({ plannerAccountId: 1, periodType: 1, periodStart: 1 });
+plannerCommissionRollupSchema.index({ computedAt: 1 });
+
+// ⭐ 기존 모델 삭제 후 재생성 (HMR 대응)
+if (mongoose.models.PlannerCommissionRollup) {
+	delete mongoose.models.PlannerCommissionRollup;
+}
+
+const PlannerCommissionRollup = mongoose.model(
+	'PlannerCommissionRollup',
+	plannerCommissionRollupSchema
+);
+
+export default PlannerCommissionRollup;
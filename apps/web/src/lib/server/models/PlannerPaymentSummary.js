@@ -0,0 +1,52 @@
+import mongoose from 'mongoose';
+
+/**
+ * 설계사 지급 요약 모델 (설계사 홈 화면용)
+ *
+ * 역할:
+ * - 설계사별 담당 용역자 지급액을 이번 주 / 지급 완료 / 지급 예정 3구간으로 사전 집계
+ * - weekStart(이번 주 일요일) 기준, 주가 바뀌면 plannerRollupService에서 이월 재계산
+ */
+const amountSchema = {
+	amount: { type: Number, default: 0 },
+	tax: { type: Number, default: 0 },
+	net: { type: Number, default: 0 }
+};
+
+const plannerPaymentSummarySchema = new mongoose.Schema(
+	{
+		plannerAccountId: {
+			type: mongoose.Schema.Types.ObjectId,
+			ref: 'PlannerAccount',
+			required: true,
+			unique: true
+		},
+
+		// 기준 주 (일요일 00:00 ~ 토요일 23:59, 로컬 시간)
+		weekStart: { type: Date, required: true },
+		thisWeekFriday: { type: Date },
+
+		thisWeek: amountSchema,
+		totalPaid: amountSchema,
+		upcoming: amountSchema,
+
+		computedAt: {
+			type: Date,
+			default: Date.now
+		}
+	},
+	{
+		collection: 'plannerpaymentsummaries'
+	}
+);
+
+plannerPaymentSummarySchema.index({ computedAt: 1 });
+
+// ⭐ 기존 모델 삭제 후 재생성 (HMR 대응)
+if (mongoose.models.PlannerPaymentSummary) {
+	delete mongoose.models.PlannerPaymentSummary;
+}
+
+const PlannerPaymentSummary = mongoose.model('PlannerPaymentSummary', plannerPaymentSummarySchema);
+
+export default PlannerPaymentSummary;
@@ -0,0 +1,85 @@
+import mongoose from 'mongoose';
+
+/**
+ * 용역자 일괄 등록 작업 큐 컬렉션
+ * - 엑셀 업로드(/api/admin/users/bulk)는 작업만 등록하고 즉시 응답, 처리는 백그라운드 워커가 수행
+ * - 실행 중(running) 작업은 전체에서 1개만 허용 (부분 unique 인덱스)
+ * - 단계별 진행 상황은 steps/progress에 기록, 상태 조회 API에서 폴링
+ */
+const stepSchema = new mongoose.Schema(
+	{
+		name: { type: String, required: true },
+		label: { type: String },
+		status: {
+			type: String,
+			enum: ['pending', 'running', 'completed', 'failed'],
+			default: 'pending'
+		},
+		startedAt: { type: Date },
+		finishedAt: { type: Date },
+		durationMs: { type: Number }
+	},
+	{ _id: false }
+);
+
+const registrationJobSchema = new mongoose.Schema(
+	{
+		status: {
+			type: String,
+			enum: ['queued', 'running', 'completed', 'failed'],
+			default: 'queued'
+		},
+
+		source: { type: String, default: 'bulk' },
+		fileName: { type: String },
+		userCount: { type: Number, default: 0 },
+
+		// 등록 데이터 (완료 후 삭제)
+		users: { type: [mongoose.Schema.Types.Mixed], default: undefined },
+
+		requestedBy: {
+			userId: { type: mongoose.Schema.Types.ObjectId },
+			userName: { type: String }
+		},
+
+		// 진행 상황
+		steps: { type: [stepSchema], default: [] },
+		currentStep: { type: String, default: null },
+		progress: {
+			current: { type: Number, default: 0 },
+			total: { type: Number, default: 0 },
+			message: { type: String, default: '' }
+		},
+
+		// 결과
+		result: { type: mongoose.Schema.Types.Mixed },
+		error: {
+			message: { type: String },
+			details: { type: mongoose.Schema.Types.Mixed }
+		},
+
+		queuedAt: { type: Date, default: Date.now },
+		startedAt: { type: Date },
+		finishedAt: { type: Date },
+		durationMs: { type: Number },
+
+		// 실행 중인 프로세스 / 생존 신호 (중단된 작업 판별)
+		workerId: { type: String },
+		heartbeatAt: { type: Date }
+	},
+	{
+		timestamps: true
+	}
+);
+
+registrationJobSchema.index({ status: 1, queuedAt: 1 });
+registrationJobSchema.index({ createdAt: -1 });
+// 실행 중 작업 1개 제한
+registrationJobSchema.index(
+	{ status: 1 },
+	{ unique: true, partialFilterExpression: { status: 'running' }, name: 'single_running_job' }
+);
+
+const RegistrationJob = mongoose.models.RegistrationJob || mongoose.model('RegistrationJob', registrationJobSchema);
+
+export default RegistrationJob;
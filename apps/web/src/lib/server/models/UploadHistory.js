@@ -4,6 +4,8 @@ import mongoose from 'mongoose';
  * 엑셀 업로드 히스토리 컬렉션
  * - 업로드된 엑셀 파일 정보 및 DB 저장 (gzip 압축)
  * - v8.1: DB 저장 방식으로 변경 (파일 시스템 사용 안 함)
+ * - ⭐ v9.7: 파일 내용은 GridFS(uploadFiles)에 내용 해시로 저장 (utils/uploadFileStore.js)
+ *   → 문서에는 fileHash만 보관, 같은 파일 재업로드 시 1번만 저장
  */
 const uploadHistorySchema = new mongoose.Schema(
 	{
@@ -20,7 +22,13 @@ const uploadHistorySchema = new mongoose.Schema(
 			unique: true
 		},
 
-		// ⭐ v8.1: 파일 데이터 (gzip 압축된 Buffer)
+		// ⭐ v9.7: 파일 내용 해시 (sha256, GridFS uploadFiles의 filename)
+		fileHash: {
+			type: String,
+			required: false  // 기존 레코드 호환성
+		},
+
+		// ⭐ v8.1: 파일 데이터 (gzip 압축된 Buffer) - 레거시, v9.7부터 사용 안 함
 		fileData: {
 			type: Buffer,
 			required: false  // 기존 레코드 호환성
@@ -57,6 +65,13 @@ const uploadHistorySchema = new mongoose.Schema(
 			total: { type: Number, default: 0 }
 		},
 
+		// ⭐ v9.7: 등록 작업(RegistrationJob) 처리 시간
+		registrationJobs: {
+			jobIds: [{ type: mongoose.Schema.Types.ObjectId, ref: 'RegistrationJob' }],
+			queuedMs: { type: Number, default: 0 }, // 대기 시간 합계
+			durationMs: { type: Number, default: 0 } // 처리 시간 합계
+		},
+
 		// 해당 월 키 (YYYY-MM)
 		monthKey: {
 			type: String,
@@ -89,6 +104,7 @@ const uploadHistorySchema = new mongoose.Schema(
 uploadHistorySchema.index({ uploadedAt: -1 });
 uploadHistorySchema.index({ monthKey: 1 });
 uploadHistorySchema.index({ savedFileName: 1 });
+uploadHistorySchema.index({ fileHash: 1 });
 
 const UploadHistory = mongoose.models.UploadHistory || mongoose.model('UploadHistory', uploadHistorySchema);
 
@@ -145,6 +145,16 @@ const userSchema = new mongoose.Schema({
 		type: Number,
 		default: 0
 	},
+	// ⭐ v9.7: 지급 완료 회차 합계 (userProgressService에서 유지, 회원 목록 표시용)
+	completedInstallments: {
+		type: Number,
+		default: 0
+	},
+	// ⭐ v9.7: 자동완성 검색 키 (이름/초성 접미사, 아이디, 연락처) - userSearchService에서 유지
+	searchKeys: {
+		type: [String],
+		default: undefined
+	},
 	joinedAt: {
 		type: Date,
 		default: Date.now
@@ -160,7 +170,12 @@ const userSchema = new mongoose.Schema({
 // 복합 인덱스 최적화
 userSchema.index({ parentId: 1, position: 1 });
 userSchema.index({ status: 1, createdAt: -1 });
-userSchema.index({ createdAt: 1 });
+userSchema.index({ createdAt: 1, _id: 1 });
+// ⭐ v9.7: 회원 목록 커서 페이지네이션 (정렬 키 + _id)
+userSchema.index({ sequence: 1, _id: 1 });
+userSchema.index({ name: 1, _id: 1 });
+// ⭐ v9.7: 자동완성 접두사 검색 (multikey)
+userSchema.index({ searchKeys: 1 });
 // v8.0: FK 인덱스
 userSchema.index({ userAccountId: 1, registrationNumber: 1 });
 userSchema.index({ plannerAccountId: 1 });
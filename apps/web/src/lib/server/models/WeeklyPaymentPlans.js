@@ -1,4 +1,6 @@
 import mongoose from 'mongoose';
+import { getISOWeek, expandInstallments, injectExpandStage } from '../utils/planStorage.js';
+import PaymentWeekBucket from './PaymentWeekBucket.js';
 
 /**
  * 개별 지급 계획
@@ -150,6 +152,36 @@ const weeklyPaymentPlansSchema = new mongoose.Schema(
       default: false  // 승계 여부 (true면 graceDeadline=null, insuranceRequired=이전 등급 기준)
     },
 
+    // ⭐ v9.7: 추가지급 생성 보류 (시작일 미도래/매출 미확정)
+    // - checkAndCreateAdditionalPaymentsV8가 워터마크와 무관하게 다음 실행에서 다시 확인
+    additionalPaymentDeferred: {
+      type: Boolean,
+      default: undefined
+    },
+
+    // ⭐ v9.7: 압축 저장 모드 (scripts/migrate-plan-storage.js로 전환)
+    // - compact: installments 대신 schedule(회차 공통값) + exceptions(기본값과 다른 회차) 저장
+    // - 조회 시 installments 자동 복원 (find/findOne/aggregate), 저장 시 full로 전환
+    storageMode: {
+      type: String,
+      enum: ['full', 'compact'],
+      default: 'full'
+    },
+    schedule: {
+      type: new mongoose.Schema({
+        revenueMonth: String,
+        baseAmount: Number,
+        installmentAmount: Number,
+        withholdingTax: Number,
+        netAmount: Number
+      }, { _id: false }),
+      default: undefined
+    },
+    exceptions: {
+      type: [mongoose.Schema.Types.Mixed],  // { week, ...변경 필드 }
+      default: undefined
+    },
+
     // 메타데이터
     createdAt: { type: Date, default: Date.now },
     updatedAt: { type: Date, default: Date.now }
@@ -170,15 +202,95 @@ weeklyPaymentPlansSchema.index({ parentPlanId: 1 });  // v6.0 추가
 weeklyPaymentPlansSchema.index({ createdBy: 1 });  // v6.0 추가
 weeklyPaymentPlansSchema.index({ 추가지급단계: 1 });  // v7.0 추가
 weeklyPaymentPlansSchema.index({ userId: 1, 추가지급단계: 1 });  // v7.0 추가
+weeklyPaymentPlansSchema.index({ userId: 1, updatedAt: 1 });  // v9.7: 내 지급 내역 ETag (계정별 최종 수정 시각)
+weeklyPaymentPlansSchema.index(
+  { storageMode: 1 },
+  { partialFilterExpression: { storageMode: 'compact' } }
+);  // v9.7 추가 (압축 문서만)
+weeklyPaymentPlansSchema.index(
+  { additionalPaymentDeferred: 1 },
+  { partialFilterExpression: { additionalPaymentDeferred: true } }
+);  // v9.7 추가 (추가지급 보류 계획만)
+
+// ⭐ v9.7: 압축 저장 읽기 어댑터
+// Document 조회: installments 복원 (변경 후 save 시 full 모드로 저장)
+weeklyPaymentPlansSchema.post('init', function() {
+  if (this.storageMode !== 'compact') return;
+
+  const installments = expandInstallments({
+    startDate: this.startDate,
+    totalInstallments: this.totalInstallments,
+    schedule: this.schedule,
+    exceptions: this.exceptions
+  });
+  if (installments) {
+    this.set('installments', installments);
+  }
+});
+
+// lean 조회: plain object에 installments 복원
+weeklyPaymentPlansSchema.post(['find', 'findOne'], function(result) {
+  if (!this.mongooseOptions().lean || !result) return;
+
+  for (const plan of Array.isArray(result) ? result : [result]) {
+    if (plan.storageMode !== 'compact') continue;
+    const installments = expandInstallments(plan);
+    if (installments) {
+      plan.installments = installments;
+    }
+  }
+});
+
+// aggregate: installments 참조 단계 앞에 복원 단계 삽입
+weeklyPaymentPlansSchema.pre('aggregate', function() {
+  injectExpandStage(this.pipeline());
+});
+
+// 저장: 압축 문서가 변경되면 full 모드로 전환 (installments는 init에서 복원됨)
+weeklyPaymentPlansSchema.pre('save', function() {
+  if (this.storageMode === 'compact') {
+    this.storageMode = 'full';
+    this.schedule = undefined;
+    this.exceptions = undefined;
+  }
+});
+
+// ⭐ v9.7: 주차 버킷 인덱스 동기화 (PaymentWeekBucket)
+// - 실패해도 계획 저장/삭제는 유지, 재구성 표시를 지워 다음 버킷 조회에서 전체 재구성
+function syncWeekBuckets(task) {
+  return PaymentWeekBucket.syncOrMarkStale(task);
+}
+
+weeklyPaymentPlansSchema.pre('save', function() {
+  this.$locals.wasNew = this.isNew;
+});
+
+weeklyPaymentPlansSchema.post('save', async function(doc) {
+  if (doc.$locals.wasNew) {
+    await syncWeekBuckets(PaymentWeekBucket.addPlans([doc]));
+  }
+});
+
+weeklyPaymentPlansSchema.post('insertMany', async function(docs) {
+  await syncWeekBuckets(PaymentWeekBucket.addPlans(docs));
+});
+
+// 삭제: 대상 계획 _id를 먼저 조회 (조건 없는 전체 삭제는 버킷도 전체 삭제)
+weeklyPaymentPlansSchema.pre(['deleteMany', 'deleteOne'], { document: false, query: true }, async function() {
+  const filter = this.getFilter();
+  this._weekBucketPlanIds = Object.keys(filter).length === 0
+    ? null
+    : await this.model.distinct('_id', filter);
+});
+
+weeklyPaymentPlansSchema.post(['deleteMany', 'deleteOne'], { document: false, query: true }, async function() {
+  if (this._weekBucketPlanIds === undefined) return;
+  await syncWeekBuckets(PaymentWeekBucket.removePlans(this._weekBucketPlanIds));
+});
 
 // 헬퍼 메소드: ISO 주차 계산
 weeklyPaymentPlansSchema.statics.getISOWeek = function(date) {
-  const d = new Date(date);
-  d.setHours(0, 0, 0, 0);
-  d.setDate(d.getDate() + 4 - (d.getDay() || 7));
-  const yearStart = new Date(d.getFullYear(), 0, 1);
-  const weekNo = Math.ceil((((d - yearStart) / 86400000) + 1) / 7);
-  return `${d.getFullYear()}-W${String(weekNo).padStart(2, '0')}`;
+  return getISOWeek(date);
 };
 
 // 헬퍼 메소드: 다음 금요일 계산 (오늘이 금요일이면 오늘 반환)
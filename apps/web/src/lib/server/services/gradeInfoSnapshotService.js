@@ -0,0 +1,195 @@
+/**
+ * 등급별 지급 정보 스냅샷 서비스
+ *
+ * 역할:
+ * - 월별 신규 가입자 / 매출 / 등급별 인원 / 지급 대상 인원을 GradeInfoSnapshot에 사전 저장
+ * - 등급 정보 API는 요청마다 사용자 전체를 집계하지 않고 기간 내 스냅샷 N건만 조회
+ *
+ * 생성 시점:
+ * - 월 등록 처리 완료 (processUserRegistration, 재처리 포함)
+ * - 매출 조정 (adjustRevenue)
+ * - 스냅샷이 없는 월은 조회 시 계산 (등록 데이터가 있는 월만 저장)
+ */
+
+import User from '../models/User.js';
+import MonthlyRegistrations from '../models/MonthlyRegistrations.js';
+import GradeInfoSnapshot from '../models/GradeInfoSnapshot.js';
+
+export const GRADES = ['F1', 'F2', 'F3', 'F4', 'F5', 'F6', 'F7', 'F8'];
+
+function emptyGradeCount() {
+	return Object.fromEntries(GRADES.map((grade) => [grade, 0]));
+}
+
+function toGradeCount(rows) {
+	const counts = emptyGradeCount();
+	for (const row of rows) {
+		if (row._id) counts[row._id] = row.count;
+	}
+	return counts;
+}
+
+/**
+ * 월 키 생성 (YYYY-MM)
+ */
+export function toMonthKey(year, month) {
+	return `${year}-${String(month).padStart(2, '0')}`;
+}
+
+/**
+ * 등급별 전체 인원 + 지급 대상 인원 (월과 무관, 현재 사용자 상태 기준)
+ * 지급 제한 조건:
+ * 1. F1, F2: 연속 4주 이상 같은 등급 유지 시 제외
+ * 2. F4 이상: 보험 미유지 시 제외 (⭐ v8.0: F3 보험 불필요)
+ */
+async function countGrades() {
+	const [result] = await User.aggregate([
+		{ $match: { type: 'user' } },
+		{
+			$facet: {
+				total: [{ $group: { _id: '$grade', count: { $sum: 1 } } }],
+				eligible: [
+					{
+						$match: {
+							$or: [
+								// F1, F2: 연속 4주 미만 유지
+								{
+									grade: { $in: ['F1', 'F2'] },
+									$or: [
+										{ consecutiveGradeWeeks: { $lt: 4 } },
+										{ consecutiveGradeWeeks: { $exists: false } }
+									]
+								},
+								// F3: 보험 불필요 (⭐ v8.0 변경)
+								{ grade: 'F3' },
+								// F4 이상: 보험 유지 조건 충족 (⭐ v8.0 금액 변경)
+								{
+									grade: { $in: ['F4', 'F5', 'F6', 'F7', 'F8'] },
+									insuranceActive: true,
+									$or: [
+										{ grade: { $in: ['F4', 'F5'] }, insuranceAmount: { $gte: 70000 } },
+										{ grade: { $in: ['F6', 'F7'] }, insuranceAmount: { $gte: 90000 } },
+										{ grade: 'F8', insuranceAmount: { $gte: 110000 } }
+									]
+								}
+							]
+						}
+					},
+					{ $group: { _id: '$grade', count: { $sum: 1 } } }
+				]
+			}
+		}
+	]);
+
+	return {
+		gradeCounts: toGradeCount(result?.total || []),
+		eligibleCounts: toGradeCount(result?.eligible || [])
+	};
+}
+
+/**
+ * 월 스냅샷 계산 (저장하지 않음)
+ *
+ * @param {number} year
+ * @param {number} month
+ * @param {Object} grades - countGrades() 결과 (여러 월 계산 시 공유)
+ * @param {Object|null} monthlyReg - 해당 월 MonthlyRegistrations (lean)
+ */
+async function computeSnapshot(year, month, grades, monthlyReg) {
+	const firstDayOfMonth = new Date(year, month - 1, 1);
+	const lastDayOfMonth = new Date(year, month, 0, 23, 59, 59, 999);
+
+	const newUsers = await User.countDocuments({
+		createdAt: { $gte: firstDayOfMonth, $lte: lastDayOfMonth }
+	});
+
+	return {
+		monthKey: toMonthKey(year, month),
+		year,
+		month,
+		newUsers,
+		totalRevenue: monthlyReg?.totalRevenue || (newUsers * 1000000),
+		gradeCounts: grades.gradeCounts,
+		eligibleCounts: grades.eligibleCounts,
+		computedAt: new Date()
+	};
+}
+
+/**
+ * 월 스냅샷 재생성 (실패해도 호출한 처리는 계속)
+ *
+ * @param {string} monthKey - YYYY-MM
+ */
+export async function refreshGradeInfoSnapshot(monthKey) {
+	try {
+		const [year, month] = monthKey.split('-').map(Number);
+		const [grades, monthlyReg] = await Promise.all([
+			countGrades(),
+			MonthlyRegistrations.findOne({ monthKey }).select('totalRevenue').lean()
+		]);
+
+		const snapshot = await computeSnapshot(year, month, grades, monthlyReg);
+		await GradeInfoSnapshot.updateOne({ monthKey }, { $set: snapshot }, { upsert: true });
+		return snapshot;
+	} catch (error) {
+		console.error(`[등급 정보 스냅샷] ${monthKey} 생성 실패:`, error);
+		return null;
+	}
+}
+
+/**
+ * 기간 스냅샷 조회
+ * - 없는 월은 계산 (등급 인원 집계는 1회만), 등록 데이터가 있는 월은 저장
+ *
+ * @param {Array<{year: number, month: number}>} months
+ * @returns {Promise<Array<Object>>} months 순서대로
+ */
+export async function getGradeInfoSnapshots(months) {
+	const monthKeys = months.map(({ year, month }) => toMonthKey(year, month));
+	const snapshots = await GradeInfoSnapshot.find({ monthKey: { $in: monthKeys } }).lean();
+	const byMonth = new Map(snapshots.map((s) => [s.monthKey, s]));
+
+	const missing = months.filter(({ year, month }) => !byMonth.has(toMonthKey(year, month)));
+	if (missing.length > 0) {
+		const missingKeys = missing.map(({ year, month }) => toMonthKey(year, month));
+		const [grades, registrations] = await Promise.all([
+			countGrades(),
+			MonthlyRegistrations.find({ monthKey: { $in: missingKeys } }).select('monthKey totalRevenue').lean()
+		]);
+		const regByMonth = new Map(registrations.map((r) => [r.monthKey, r]));
+
+		const computed = await Promise.all(
+			missing.map(({ year, month }) =>
+				computeSnapshot(year, month, grades, regByMonth.get(toMonthKey(year, month)) || null)
+			)
+		);
+
+		const ops = [];
+		for (const snapshot of computed) {
+			byMonth.set(snapshot.monthKey, snapshot);
+			if (regByMonth.has(snapshot.monthKey)) {
+				ops.push({
+					updateOne: {
+						filter: { monthKey: snapshot.monthKey },
+						update: { $set: snapshot },
+						upsert: true
+					}
+				});
+			}
+		}
+		if (ops.length > 0) {
+			await GradeInfoSnapshot.bulkWrite(ops, { ordered: false });
+		}
+	}
+
+	return monthKeys.map((key) => byMonth.get(key));
+}
+
+/**
+ * 스냅샷 삭제 (월 데이터 삭제/초기화 시)
+ *
+ * @param {string|null} monthKey - null이면 전체
+ */
+export async function removeGradeInfoSnapshots(monthKey = null) {
+	await GradeInfoSnapshot.deleteMany(monthKey ? { monthKey } : {});
+}
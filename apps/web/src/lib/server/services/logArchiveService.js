@@ -0,0 +1,162 @@
+/**
+ * 로그 아카이브 서비스
+ * - 로그 디렉토리 날짜 인덱스 (디렉토리 mtime 변경 시에만 재생성)
+ * - 로그 파일 zip 스트리밍 (엔트리 순차 추가 → 파일 1개씩만 열림)
+ * - 레벨 / 문자열 필터 (스트리밍 중 적용, .gz는 해제하며 필터)
+ */
+
+import archiver from 'archiver';
+import fs from 'fs';
+import path from 'path';
+import zlib from 'zlib';
+import { Transform } from 'stream';
+
+// 로그 디렉토리 (개발/배포 환경 모두 지원)
+// 개발: apps/web/logs/, 배포: /opt/nanumpay/logs/
+export const logDir = path.resolve(path.join(process.cwd(), 'logs'));
+
+// 2025-12-09.log, 2025-12-09.log.gz, 2025-12-09.log.1, 2025-12-09.log.1.gz
+const LOG_FILE_PATTERN = /^(\d{4}-\d{2}-\d{2}).*\.(log|gz|log\.\d+)$/;
+
+// 로그 엔트리 시작 줄: [YYYY-MM-DD HH:mm:ss] LEVEL: message
+const ENTRY_HEADER_PATTERN = /^\[\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}\] ([A-Z]+):/;
+
+// 날짜 인덱스 캐시
+let indexCache = { mtimeMs: null, entries: [] };
+
+/**
+ * 날짜 → 파일 인덱스 조회
+ * @returns {Promise<Array<{ date: string, file: string }>>} 날짜순 정렬
+ */
+export async function getLogIndex() {
+	const dirStat = await fs.promises.stat(logDir);
+
+	if (indexCache.mtimeMs !== dirStat.mtimeMs) {
+		const files = await fs.promises.readdir(logDir);
+		const entries = [];
+		for (const file of files) {
+			const match = file.match(LOG_FILE_PATTERN);
+			if (match) {
+				entries.push({ date: match[1], file });
+			}
+		}
+		entries.sort((a, b) => a.date.localeCompare(b.date) || a.file.localeCompare(b.file));
+		indexCache = { mtimeMs: dirStat.mtimeMs, entries };
+	}
+
+	return indexCache.entries;
+}
+
+/**
+ * 기간 내 로그 파일 목록
+ * @param {string|null} startDateKey - YYYY-MM-DD (null이면 전체)
+ */
+export async function getLogFiles(startDateKey) {
+	const entries = await getLogIndex();
+	if (!startDateKey) {
+		return entries.map((e) => e.file);
+	}
+	return entries.filter((e) => e.date >= startDateKey).map((e) => e.file);
+}
+
+/**
+ * 로그 엔트리 필터 Transform
+ * - 여러 줄 엔트리(스택 트레이스 등)는 헤더 줄 기준으로 묶어서 판단
+ *
+ * @param {Object} filter
+ * @param {Set<string>|null} filter.levels - 대문자 레벨 (ERROR, WARN, INFO, DEBUG)
+ * @param {string|null} filter.contains - 포함 문자열 (경로 등)
+ */
+export function createLogFilter({ levels = null, contains = null }) {
+	let remainder = '';
+	let entry = [];
+	let entryLevel = null;
+
+	const matches = () => {
+		if (entry.length === 0) return false;
+		if (levels && !levels.has(entryLevel)) return false;
+		if (contains && !entry.some((line) => line.includes(contains))) return false;
+		return true;
+	};
+
+	const flushEntry = (stream) => {
+		if (matches()) {
+			stream.push(entry.join('\n') + '\n');
+		}
+		entry = [];
+		entryLevel = null;
+	};
+
+	return new Transform({
+		transform(chunk, encoding, callback) {
+			const lines = (remainder + chunk.toString('utf8')).split('\n');
+			remainder = lines.pop();
+
+			for (const line of lines) {
+				const header = line.match(ENTRY_HEADER_PATTERN);
+				if (header) {
+					flushEntry(this);
+					entryLevel = header[1];
+				}
+				entry.push(line);
+			}
+			callback();
+		},
+		flush(callback) {
+			if (remainder) {
+				const header = remainder.match(ENTRY_HEADER_PATTERN);
+				if (header) {
+					flushEntry(this);
+					entryLevel = header[1];
+				}
+				entry.push(remainder);
+			}
+			flushEntry(this);
+			callback();
+		}
+	});
+}
+
+/**
+ * 로그 zip 아카이브 스트림 생성
+ * - 엔트리는 이전 엔트리 완료('entry' 이벤트) 후 순차 추가
+ * - 필터가 있으면 .gz는 해제 후 필터링하여 평문으로 저장
+ *
+ * @param {Array<string>} files - 로그 파일명 목록
+ * @param {Object} filter - createLogFilter 옵션 (levels, contains)
+ * @returns {import('archiver').Archiver} Node Readable (zip)
+ */
+export function createLogArchive(files, filter = {}) {
+	const filtered = !!(filter.levels || filter.contains);
+	const archive = archiver('zip', { zlib: { level: 6 } });
+
+	let index = 0;
+	const appendNext = () => {
+		if (index >= files.length) {
+			archive.finalize();
+			return;
+		}
+
+		const file = files[index++];
+		const filePath = path.join(logDir, file);
+
+		if (!filtered) {
+			archive.file(filePath, { name: file });
+			return;
+		}
+
+		let source = fs.createReadStream(filePath);
+		if (file.endsWith('.gz')) {
+			source = source.pipe(zlib.createGunzip());
+		}
+		const logFilter = createLogFilter(filter);
+		source.on('error', (err) => logFilter.destroy(err));
+
+		archive.append(source.pipe(logFilter), { name: file.replace(/\.gz$/, '') });
+	};
+
+	archive.on('entry', appendNext);
+	appendNext();
+
+	return archive;
+}
@@ -17,6 +17,7 @@ import MonthlyRegistrations from '../models/MonthlyRegistrations.js';
 import WeeklyPaymentPlans from '../models/WeeklyPaymentPlans.js';
 import PlannerCommissionPlan from '../models/PlannerCommissionPlan.js';
 import { processUserRegistration } from './registrationService.js';
+import { syncUserPaymentProgress } from './userProgressService.js';
 
 /**
  * 월별 지급 계획 재처리 (DB 기반)
@@ -115,7 +116,10 @@ export async function reprocessMonthPayments(monthKey) {
 		}
 
 		// 5. 해당 월 플랜 삭제
+		// ⭐ v9.7: 삭제 대상 용역자의 지급 진행률 갱신
+		const planUserIds = await WeeklyPaymentPlans.distinct('userId', { revenueMonth: monthKey });
 		const deletedPlans = await WeeklyPaymentPlans.deleteMany({ revenueMonth: monthKey });
+		await syncUserPaymentProgress(planUserIds);
 
 		// ⭐ 해당 월 설계사 수당 플랜도 삭제 (설계사 변경 시 재생성을 위해)
 		const deletedCommissionPlans = await PlannerCommissionPlan.deleteMany({ revenueMonth: monthKey });
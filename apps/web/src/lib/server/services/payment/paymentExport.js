@@ -0,0 +1,214 @@
+import WeeklyPaymentPlans from '$lib/server/models/WeeklyPaymentPlans.js';
+import User from '$lib/server/models/User.js';
+import PlannerAccount from '$lib/server/models/PlannerAccount.js';
+import { buildSearchFilter, generateGradeInfo, getMaxGradePipelineStages } from './utils.js';
+
+/**
+ * 용역비 지급명부 스트리밍 내보내기
+ *
+ * - 용역자는 커서로 BATCH_SIZE명씩 읽고, 배치별로 기간 내 지급액을 1회 집계하여 행 단위로 기록
+ * - 메모리 사용량은 (배치 크기 × 주차 수)로 제한 (전체 결과를 모으지 않음)
+ * - 행 구성: 순번 / 성명 / 설계사 / 은행 / 계좌번호 / 주차별(등급(회수), 지급액, 원천징수, 실지급액) / 기간 합계
+ */
+
+const BATCH_SIZE = 500;
+
+function escapeRegex(text) {
+	return text.replace(/[.*+?^${}()|[\]\\]/g, '\\$&');
+}
+
+function formatLocalDate(date) {
+	return `${date.getFullYear()}-${String(date.getMonth() + 1).padStart(2, '0')}-${String(date.getDate()).padStart(2, '0')}`;
+}
+
+/**
+ * 내보내기 대상 용역자 조건 (검색/설계사 필터)
+ */
+async function buildUserQuery(search, searchCategory, plannerAccountId) {
+	const searchFilter = buildSearchFilter(search, searchCategory);
+	const query = { isAdmin: { $ne: true } };
+
+	if (plannerAccountId) {
+		query.plannerAccountId = plannerAccountId;
+	}
+	if (searchFilter.userName) {
+		query.name = { $regex: escapeRegex(search), $options: 'i' };
+	}
+	if (searchFilter.needPlannerSearch) {
+		const planners = await PlannerAccount.find({
+			name: { $regex: escapeRegex(searchFilter.plannerSearch), $options: 'i' }
+		}).select('_id').lean();
+		const plannerIds = planners.map(p => p._id.toString());
+		query.plannerAccountId = plannerAccountId
+			? (plannerIds.includes(plannerAccountId.toString()) ? plannerAccountId : { $in: [] })
+			: { $in: plannerIds };
+	}
+
+	return { query, gradeFilter: searchFilter.baseGrade || null };
+}
+
+/**
+ * 배치 용역자의 주차별 지급 집계
+ * @returns {Map<string, Object>} key: `${userId}_${weekNumber}`
+ */
+async function aggregateBatch(userIds, weekNumbers) {
+	const rows = await WeeklyPaymentPlans.aggregate([
+		{ $match: { userId: { $in: userIds }, 'installments.weekNumber': { $in: weekNumbers } } },
+		{ $unwind: '$installments' },
+		{
+			$match: {
+				'installments.weekNumber': { $in: weekNumbers },
+				'installments.status': { $nin: ['skipped', 'terminated'] }
+			}
+		},
+		{
+			$group: {
+				_id: { userId: '$userId', weekNumber: '$installments.weekNumber' },
+				grades: { $push: '$baseGrade' },
+				installmentAmount: { $sum: '$installments.installmentAmount' },
+				withholdingTax: { $sum: '$installments.withholdingTax' },
+				netAmount: { $sum: '$installments.netAmount' },
+				payments: {
+					$push: {
+						baseGrade: '$baseGrade',
+						week: '$installments.week',
+						추가지급단계: '$추가지급단계',
+						revenueMonth: '$installments.revenueMonth'
+					}
+				}
+			}
+		},
+		...getMaxGradePipelineStages()
+	]);
+
+	return new Map(rows.map(r => [`${r._id.userId}_${r._id.weekNumber}`, r]));
+}
+
+/**
+ * 지급명부 스트리밍 내보내기
+ *
+ * @param {Object} writer - createSheetWriter() 결과
+ * @param {Object} options
+ * @param {Array} options.fridays - getFridaysInMonth 항목 배열 (내보낼 주차)
+ * @param {string} options.search - 검색어
+ * @param {string} options.searchCategory - name | planner | grade
+ * @param {string|null} options.plannerAccountId - 설계사 필터
+ * @param {boolean} options.sortByName - 이름순(true) / 등록순(false)
+ * @param {boolean} options.showGradeInfoColumn - 등급(회수) 컬럼
+ * @param {boolean} options.showTaxColumn - 원천징수 컬럼
+ * @param {boolean} options.showNetColumn - 실지급액 컬럼
+ * @returns {Promise<{ rowCount: number }>}
+ */
+export async function streamPaymentExport(writer, {
+	fridays,
+	search = '',
+	searchCategory = 'name',
+	plannerAccountId = null,
+	sortByName = true,
+	showGradeInfoColumn = true,
+	showTaxColumn = true,
+	showNetColumn = true
+}) {
+	const weeks = fridays.map(({ friday }) => ({
+		date: formatLocalDate(friday),
+		weekNumber: WeeklyPaymentPlans.getISOWeek(friday)
+	}));
+	const weekNumbers = weeks.map(w => w.weekNumber);
+
+	// 금액 컬럼 구성 (지급액 / 원천징수 / 실지급액)
+	const amountColumns = [
+		{ label: '지급액', field: 'installmentAmount', total: 'amount' },
+		...(showTaxColumn ? [{ label: '원천징수', field: 'withholdingTax', total: 'tax' }] : []),
+		...(showNetColumn ? [{ label: '실지급액', field: 'netAmount', total: 'net' }] : [])
+	];
+
+	// 헤더
+	const header = ['순번', '성명', '설계사', '은행', '계좌번호'];
+	for (const week of weeks) {
+		if (showGradeInfoColumn) header.push(`${week.date} 등급(회수)`);
+		for (const column of amountColumns) header.push(`${week.date} ${column.label}`);
+	}
+	for (const column of amountColumns) header.push(`기간 ${column.label}`);
+	await writer.addRow(header, { bold: true });
+
+	const { query, gradeFilter } = await buildUserQuery(search, searchCategory, plannerAccountId);
+	const cursor = User.find(query)
+		.select('name grade plannerAccountId userAccountId')
+		.populate('plannerAccountId', 'name')
+		.populate('userAccountId', 'bank accountNumber')
+		.sort(sortByName ? { name: 1, _id: 1 } : { sequence: 1, _id: 1 })
+		.lean()
+		.cursor({ batchSize: BATCH_SIZE });
+
+	const weekTotals = weeks.map(() => ({ amount: 0, tax: 0, net: 0 }));
+	let rowCount = 0;
+
+	const writeBatch = async (users) => {
+		const paymentMap = await aggregateBatch(users.map(u => u._id.toString()), weekNumbers);
+
+		for (const user of users) {
+			const userId = user._id.toString();
+			const row = [
+				rowCount + 1,
+				user.name,
+				user.plannerAccountId?.name || '',
+				user.userAccountId?.bank || '',
+				user.userAccountId?.accountNumber || ''
+			];
+			const periodTotal = { amount: 0, tax: 0, net: 0 };
+			let matched = !gradeFilter;
+
+			weeks.forEach((week, index) => {
+				let payment = paymentMap.get(`${userId}_${week.weekNumber}`);
+				// 등급 검색: 해당 주차 최고 등급이 일치하는 지급만 표시
+				if (payment && gradeFilter && payment.maxGrade !== gradeFilter) {
+					payment = null;
+				}
+				if (payment) matched = true;
+
+				if (showGradeInfoColumn) {
+					row.push(payment ? generateGradeInfo(payment.payments) : '-');
+				}
+				for (const column of amountColumns) {
+					const value = payment?.[column.field] || 0;
+					row.push(value);
+					periodTotal[column.total] += value;
+					weekTotals[index][column.total] += value;
+				}
+			});
+
+			if (!matched) continue;
+
+			for (const column of amountColumns) row.push(periodTotal[column.total]);
+			await writer.addRow(row);
+			rowCount++;
+		}
+	};
+
+	let batch = [];
+	for await (const user of cursor) {
+		batch.push(user);
+		if (batch.length >= BATCH_SIZE) {
+			await writeBatch(batch);
+			batch = [];
+		}
+	}
+	if (batch.length > 0) {
+		await writeBatch(batch);
+	}
+
+	// 합계 행
+	const totalRow = ['합계', '', '', '', ''];
+	const grandTotal = { amount: 0, tax: 0, net: 0 };
+	weekTotals.forEach((total) => {
+		if (showGradeInfoColumn) totalRow.push('');
+		for (const column of amountColumns) {
+			totalRow.push(total[column.total]);
+			grandTotal[column.total] += total[column.total];
+		}
+	});
+	for (const column of amountColumns) totalRow.push(grandTotal[column.total]);
+	await writer.addRow(totalRow, { bold: true });
+
+	return { rowCount };
+}
@@ -2,8 +2,7 @@ import WeeklyPaymentPlans from '$lib/server/models/WeeklyPaymentPlans.js';
 import User from '$lib/server/models/User.js';
 import UserAccount from '$lib/server/models/UserAccount.js';
 import PlannerAccount from '$lib/server/models/PlannerAccount.js';
-import { getFridaysInMonth } from '$lib/utils/fridayWeekCalculator.js';
-import { buildSearchFilter, generateGradeInfo, calculatePeriodGrade } from './utils.js';
+import { buildSearchFilter, generateGradeInfo, calculatePeriodGrade, getFridaysInRange } from './utils.js';
 import mongoose from 'mongoose';
 
 /**
@@ -49,36 +48,8 @@ async function getCumulativeTotals(userIds, upToDate = new Date()) {
  * @param {string} endDate - 종료 날짜 (YYYY-MM-DD) ⭐ 선택적
  */
 export async function getRangePayments(startYear, startMonth, endYear, endMonth, page, limit, search, searchCategory, plannerAccountId = null, sortByName = true, startDate = null, endDate = null) {
-	// 1. 기간 내 모든 금요일 날짜 수집
-	let allFridays = [];
-	let currentYear = startYear;
-	let currentMonth = startMonth;
-
-	while (currentYear < endYear || (currentYear === endYear && currentMonth <= endMonth)) {
-		const fridays = getFridaysInMonth(currentYear, currentMonth);
-		allFridays.push(...fridays);
-
-		currentMonth++;
-		if (currentMonth > 12) {
-			currentMonth = 1;
-			currentYear++;
-		}
-	}
-
-	// ⭐ 날짜 범위로 금요일 필터링 (startDate, endDate가 제공된 경우)
-	// 타임존 문제 방지를 위해 날짜 부분만 비교 (YYYYMMDD 숫자로 변환)
-	if (startDate && endDate) {
-		const [startY, startM, startD] = startDate.split('-').map(Number);
-		const [endY, endM, endD] = endDate.split('-').map(Number);
-		const startNum = startY * 10000 + startM * 100 + startD;
-		const endNum = endY * 10000 + endM * 100 + endD;
-
-		allFridays = allFridays.filter(fridayInfo => {
-			const friday = fridayInfo.friday;
-			const fridayNum = friday.getFullYear() * 10000 + (friday.getMonth() + 1) * 100 + friday.getDate();
-			return fridayNum >= startNum && fridayNum <= endNum;
-		});
-	}
+	// 1. 기간 내 모든 금요일 날짜 수집 (startDate, endDate가 제공되면 날짜 범위로 필터링)
+	const allFridays = getFridaysInRange(startYear, startMonth, endYear, endMonth, startDate, endDate);
 
 	// 2. 검색 조건 구성
 	const searchFilter = buildSearchFilter(search, searchCategory);
@@ -380,36 +351,8 @@ export async function getRangePayments(startYear, startMonth, endYear, endMonth,
  * @param {string} endDate - 종료 날짜 (YYYY-MM-DD) ⭐ 선택적
  */
 export async function getRangePaymentsByGrade(startYear, startMonth, endYear, endMonth, page, limit, gradeFilter, plannerAccountId = null, sortByName = true, startDate = null, endDate = null) {
-	// 1. 기간 내 모든 금요일 날짜 수집
-	let allFridays = [];
-	let currentYear = startYear;
-	let currentMonth = startMonth;
-
-	while (currentYear < endYear || (currentYear === endYear && currentMonth <= endMonth)) {
-		const fridays = getFridaysInMonth(currentYear, currentMonth);
-		allFridays.push(...fridays);
-
-		currentMonth++;
-		if (currentMonth > 12) {
-			currentMonth = 1;
-			currentYear++;
-		}
-	}
-
-	// ⭐ 날짜 범위로 금요일 필터링 (startDate, endDate가 제공된 경우)
-	// 타임존 문제 방지를 위해 날짜 부분만 비교 (YYYYMMDD 숫자로 변환)
-	if (startDate && endDate) {
-		const [startY, startM, startD] = startDate.split('-').map(Number);
-		const [endY, endM, endD] = endDate.split('-').map(Number);
-		const startNum = startY * 10000 + startM * 100 + startD;
-		const endNum = endY * 10000 + endM * 100 + endD;
-
-		allFridays = allFridays.filter(fridayInfo => {
-			const friday = fridayInfo.friday;
-			const fridayNum = friday.getFullYear() * 10000 + (friday.getMonth() + 1) * 100 + friday.getDate();
-			return fridayNum >= startNum && fridayNum <= endNum;
-		});
-	}
+	// 1. 기간 내 모든 금요일 날짜 수집 (startDate, endDate가 제공되면 날짜 범위로 필터링)
+	const allFridays = getFridaysInRange(startYear, startMonth, endYear, endMonth, startDate, endDate);
 
 	// 2. 기간 내 모든 고유 userId를 baseGrade와 함께 수집
 	const weekNumbers = allFridays.map(f => WeeklyPaymentPlans.getISOWeek(f.friday));
@@ -7,6 +7,8 @@
  * - API 조회 시에는 DB 금액 그대로 표시 (status='skipped'는 aggregation에서 제외됨)
  */
 
+import { getFridaysInMonth } from '$lib/utils/fridayWeekCalculator.js';
+
 /**
  * 검색 필터 구성
  */
@@ -117,3 +119,43 @@ export function getMaxGradePipelineStages() {
 		}
 	];
 }
+
+/**
+ * 기간 내 모든 금요일 수집
+ * @param {string} startDate - 시작 날짜 (YYYY-MM-DD) ⭐ 선택적
+ * @param {string} endDate - 종료 날짜 (YYYY-MM-DD) ⭐ 선택적
+ * @returns {Array} - getFridaysInMonth 항목 배열 ({ friday, weekNumber, ... })
+ */
+export function getFridaysInRange(startYear, startMonth, endYear, endMonth, startDate = null, endDate = null) {
+	let allFridays = [];
+	let currentYear = startYear;
+	let currentMonth = startMonth;
+
+	while (currentYear < endYear || (currentYear === endYear && currentMonth <= endMonth)) {
+		const fridays = getFridaysInMonth(currentYear, currentMonth);
+		allFridays.push(...fridays);
+
+		currentMonth++;
+		if (currentMonth > 12) {
+			currentMonth = 1;
+			currentYear++;
+		}
+	}
+
+	// ⭐ 날짜 범위로 금요일 필터링 (startDate, endDate가 제공된 경우)
+	// 타임존 문제 방지를 위해 날짜 부분만 비교 (YYYYMMDD 숫자로 변환)
+	if (startDate && endDate) {
+		const [startY, startM, startD] = startDate.split('-').map(Number);
+		const [endY, endM, endD] = endDate.split('-').map(Number);
+		const startNum = startY * 10000 + startM * 100 + startD;
+		const endNum = endY * 10000 + endM * 100 + endD;
+
+		allFridays = allFridays.filter(fridayInfo => {
+			const friday = fridayInfo.friday;
+			const fridayNum = friday.getFullYear() * 10000 + (friday.getMonth() + 1) * 100 + friday.getDate();
+			return fridayNum >= startNum && fridayNum <= endNum;
+		});
+	}
+
+	return allFridays;
+}
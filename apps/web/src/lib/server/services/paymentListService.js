@@ -6,6 +6,7 @@
  * - utils.js: 공통 유틸리티 함수
  * - singleWeekPayments.js: 단일 주차 조회
  * - rangePayments.js: 기간 조회
+ * - paymentExport.js: 스트리밍 내보내기 (xlsx/csv)
  */
 
 // 단일 주차 조회
@@ -14,5 +15,8 @@ export { getSingleWeekPayments, getSingleWeekPaymentsByGrade } from './payment/s
 // 기간 조회
 export { getRangePayments, getRangePaymentsByGrade } from './payment/rangePayments.js';
 
+// 스트리밍 내보내기
+export { streamPaymentExport } from './payment/paymentExport.js';
+
 // 유틸리티 함수 (외부 사용을 위해)
-export { buildSearchFilter, generateGradeInfo, calculatePeriodGrade } from './payment/utils.js';
+export { buildSearchFilter, generateGradeInfo, calculatePeriodGrade, getFridaysInRange } from './payment/utils.js';
@@ -12,6 +12,7 @@ import mongoose from 'mongoose';
 import WeeklyPaymentPlans from '../models/WeeklyPaymentPlans.js';
 import MonthlyRegistrations from '../models/MonthlyRegistrations.js';
 import User from '../models/User.js';
+import Counter from '../models/Counter.js';
 import {
 	GRADE_LIMITS,
 	GRADE_ORDER,
@@ -19,16 +20,40 @@ import {
 	calculateGraceDeadline,
 	getInsuranceRequired
 } from '../utils/constants.js';
+import { markPlannerRollupsStale } from './plannerRollupService.js';
+import { skipInsuranceOp, restoreInsuranceOp, applyPlanMutations } from './planMutationService.js';
 
 // 등급별 최대 수령 횟수 정의 (GRADE_LIMITS에서 가져옴)
 const MAX_INSTALLMENTS = Object.fromEntries(
 	Object.entries(GRADE_LIMITS).map(([grade, limits]) => [grade, limits.maxInstallments])
 );
 
+// ⭐ v9.7: 추가지급 증분 처리 워터마크 (Counter 문서, value = 시각 ms)
+const ADDITIONAL_PAYMENT_WATERMARK = 'additionalPaymentWatermark';
+const WATERMARK_SKEW_MS = 60 * 1000;
+
 /**
  * Initial 지급 계획 생성 (등록 시)
  */
 export async function createInitialPaymentPlan(userId, userName, grade, registrationDate) {
+	const planData = await buildInitialPaymentPlan(userId, userName, grade, registrationDate);
+	return await WeeklyPaymentPlans.create(planData);
+}
+
+/**
+ * Initial 지급 계획 데이터 구성 (DB 저장 없음)
+ * - createInitialPaymentPlan 및 dry-run 미리보기에서 공통 사용
+ *
+ * @param {Object} monthlyRegData - 전달되면 DB 조회 대신 사용 (미리보기용 메모리 문서)
+ * @returns {Promise<Object>} WeeklyPaymentPlans 생성용 plain object
+ */
+export async function buildInitialPaymentPlan(
+	userId,
+	userName,
+	grade,
+	registrationDate,
+	monthlyRegData = null
+) {
 	try {
 		// ⭐ v8.0: ratio는 매출 계산 시 적용됨 (step2), 지급액에는 적용 안 함
 
@@ -42,7 +67,8 @@ export async function createInitialPaymentPlan(userId, userName, grade, registra
 		const totalInstallments = 10;
 
 		// 등급별 지급액 계산 (미리 계산)
-		const monthlyReg = await MonthlyRegistrations.findOne({ monthKey: revenueMonth });
+		const monthlyReg =
+			monthlyRegData || (await MonthlyRegistrations.findOne({ monthKey: revenueMonth }));
 		let baseAmount = 0;
 		let installmentAmount = 0;
 		let withholdingTax = 0;
@@ -104,8 +130,8 @@ export async function createInitialPaymentPlan(userId, userName, grade, registra
 			installments.slice(0, 3).forEach((inst, idx) => {});
 		}
 
-		// 계획 생성 (v8.0: additionalPaymentBaseDate 추가)
-		const plan = await WeeklyPaymentPlans.create({
+		// 계획 데이터 (v8.0: additionalPaymentBaseDate 추가)
+		return {
 			userId,
 			userName,
 			planType: 'initial',
@@ -121,11 +147,7 @@ export async function createInitialPaymentPlan(userId, userName, grade, registra
 			installments,
 			planStatus: 'active',
 			createdBy: 'registration' // v6.0: 등록에 의한 생성
-		});
-
-		// 주차별 총계 업데이트 (미래 예측)
-
-		return plan;
+		};
 	} catch (error) {
 		throw error;
 	}
@@ -141,6 +163,31 @@ export async function createPromotionPaymentPlan(
 	newGrade,
 	promotionDate,
 	monthlyRegData = null
+) {
+	const planData = await buildPromotionPaymentPlan(
+		userId,
+		userName,
+		newGrade,
+		promotionDate,
+		monthlyRegData
+	);
+	return await WeeklyPaymentPlans.create(planData);
+}
+
+/**
+ * Promotion 지급 계획 데이터 구성 (DB 저장 없음)
+ * - 보험 승계/현재 보험 금액은 조회만 수행
+ *
+ * @param {Object} prefetched - { user, plans } 전달 시 사용자/계획 DB 조회 생략 (Step 4 일괄 처리)
+ * @returns {Promise<Object>} WeeklyPaymentPlans 생성용 plain object
+ */
+export async function buildPromotionPaymentPlan(
+	userId,
+	userName,
+	newGrade,
+	promotionDate,
+	monthlyRegData = null,
+	prefetched = null
 ) {
 	try {
 		// ⭐ v8.0: ratio는 매출 계산 시 적용됨 (step2), 지급액에는 적용 안 함
@@ -156,7 +203,7 @@ export async function createPromotionPaymentPlan(
 		const currentInsuranceRequired = getInsuranceRequired(newGrade);
 		if (currentInsuranceRequired !== null) {
 			// F4+ 등급: 승계 조건 체크
-			const inheritanceCheck = await checkInsuranceInheritance(userId, newGrade);
+			const inheritanceCheck = await checkInsuranceInheritance(userId, newGrade, prefetched?.plans);
 
 			if (inheritanceCheck.canInherit) {
 				// ⭐ v9.4 FIX: 승계 인정 시에도 유예기간은 새로 적용
@@ -220,7 +267,7 @@ export async function createPromotionPaymentPlan(
 
 	// ⭐ v8.1: User의 현재 보험 금액 조회 (installments status 결정용)
 	const User = mongoose.model('User');
-	const user = await User.findById(userId);
+	const user = prefetched ? prefetched.user : await User.findById(userId);
 	const currentInsuranceAmount = user?.insuranceAmount || 0;
 
 	// ⭐ v8.1: 보험 조건 체크 (installments status 결정)
@@ -297,8 +344,8 @@ export async function createPromotionPaymentPlan(
 		// ⭐ v8.0: 추가지급 중단은 terminateAdditionalPlansOnPromotion에서 처리
 		// (승급 지급 시작일부터만 중단하는 로직)
 
-		// 계획 생성 (v8.0: additionalPaymentBaseDate 추가, v8.1: 유지보험 필드 추가)
-		const plan = await WeeklyPaymentPlans.create({
+		// 계획 데이터 (v8.0: additionalPaymentBaseDate 추가, v8.1: 유지보험 필드 추가)
+		return {
 			userId,
 			userName,
 			planType: 'promotion',
@@ -318,11 +365,7 @@ export async function createPromotionPaymentPlan(
 			graceDeadline,
 			insuranceRequired,
 			insuranceInherited
-		});
-
-		// 주차별 총계 업데이트
-
-		return plan;
+		};
 	} catch (error) {
 		throw error;
 	}
@@ -762,183 +805,163 @@ function getNextFridayOnOrAfter(date) {
 }
 
 /**
- * v8.0: 추가지급 계획 생성 (날짜 기반)
- * 매주 금요일 지급 후 추가지급 시작일이 도래했는지 확인하여 생성
+ * v8.0: 추가지급 계획 문서 생성 (DB 조회 없음)
+ * ⭐ v9.7: 단건(createAdditionalPaymentPlanV8)과 일괄(checkAndCreateAdditionalPaymentsV8) 공통
  *
  * @param {Object} previousPlan - 이전 완료된 계획
- * @returns {Object|null} 생성된 계획 또는 null
+ * @param {Object} context
+ * @param {Object|null} context.user - { grade, insuranceAmount }
+ * @param {number} context.totalCount - 같은 등급의 계획 회차 합계
+ * @param {string|null} context.maxPromotionGrade - 이미 시작된 승급 지급의 최고 등급
+ * @param {Function} context.getMonthlyReg - (monthKey) => MonthlyRegistrations 문서 | null
+ * @param {Date} context.now
+ * @returns {{ doc: Object } | { reason: string, retry: boolean }}
+ *   - retry: 나중에 조건이 충족될 수 있음 (시작일 미도래, 매출 미확정)
  */
-export async function createAdditionalPaymentPlanV8(previousPlan) {
-	try {
-		const User = mongoose.model('User');
-		const user = await User.findOne({ loginId: previousPlan.userId }).populate(
-			'userAccountId',
-			'insuranceAmount'
-		);
+function buildAdditionalPaymentPlanV8(previousPlan, { user, totalCount, maxPromotionGrade, getMonthlyReg, now }) {
+	if (!user) {
+		return { reason: '사용자 없음', retry: false };
+	}
 
-		if (!user) {
-			console.log(`[createAdditionalPaymentPlanV8] 사용자 없음: ${previousPlan.userId}`);
-			return null;
-		}
+	const baseGrade = previousPlan.baseGrade;
+	const next추가지급단계 = previousPlan.추가지급단계 + 1;
 
-		const baseGrade = previousPlan.baseGrade;
-		const next추가지급단계 = previousPlan.추가지급단계 + 1;
+	// 1. 최대 횟수 확인
+	if (totalCount >= MAX_INSTALLMENTS[baseGrade]) {
+		return { reason: `${baseGrade} 최대 횟수 도달: ${totalCount}/${MAX_INSTALLMENTS[baseGrade]}`, retry: false };
+	}
 
-		// 1. 최대 횟수 확인
-		const totalPlanned = await WeeklyPaymentPlans.aggregate([
-			{ $match: { userId: previousPlan.userId, baseGrade } },
-			{ $group: { _id: null, total: { $sum: '$totalInstallments' } } }
-		]);
-		const totalCount = totalPlanned[0]?.total || 0;
+	// 2. 현재 등급 확인 (하락 시 생성 안 함)
+	if (user.grade < baseGrade) {
+		return { reason: `등급 하락: ${baseGrade} → ${user.grade}`, retry: false };
+	}
 
-		if (totalCount >= MAX_INSTALLMENTS[baseGrade]) {
-			console.log(`[createAdditionalPaymentPlanV8] ${previousPlan.userId} ${baseGrade} 최대 횟수 도달: ${totalCount}/${MAX_INSTALLMENTS[baseGrade]}`);
-			return null;
-		}
+	// ⭐ v8.1: 보험 조건 확인 (미충족이어도 계획 생성, status로 관리)
+	const insuranceAmount = user.insuranceAmount || 0;
+	let isInsuranceMet = true;
+	let insuranceCheckReason = null;
 
-		// 2. 현재 등급 확인 (하락 시 생성 안 함)
-		if (user.grade < baseGrade) {
-			console.log(`[createAdditionalPaymentPlanV8] ${previousPlan.userId} 등급 하락: ${baseGrade} → ${user.grade}`);
-			return null;
-		}
+	// 이전 계획의 보험 필드 승계
+	const inheritedInsuranceRequired = previousPlan.insuranceRequired;
+	const inheritedGraceDeadline = previousPlan.graceDeadline;
+	const inheritedInsuranceInherited = previousPlan.insuranceInherited;
 
-		// ⭐ v8.1: 보험 조건 확인 (미충족이어도 계획 생성, status로 관리)
-		const insuranceAmount = user.insuranceAmount || 0;
-		let isInsuranceMet = true;
-		let insuranceCheckReason = null;
-
-		// 이전 계획의 보험 필드 승계
-		const inheritedInsuranceRequired = previousPlan.insuranceRequired;
-		const inheritedGraceDeadline = previousPlan.graceDeadline;
-		const inheritedInsuranceInherited = previousPlan.insuranceInherited;
-
-		if (inheritedInsuranceRequired !== null && inheritedInsuranceRequired !== undefined) {
-			if (insuranceAmount < inheritedInsuranceRequired) {
-				isInsuranceMet = false;
-				insuranceCheckReason = `insufficient_insurance_amount: ${insuranceAmount} < ${inheritedInsuranceRequired}`;
-				console.log(`[createAdditionalPaymentPlanV8] ${previousPlan.userId} 보험 미충족: ${insuranceAmount} < ${inheritedInsuranceRequired} (계획은 생성, status='skipped')`);
-			}
+	if (inheritedInsuranceRequired !== null && inheritedInsuranceRequired !== undefined) {
+		if (insuranceAmount < inheritedInsuranceRequired) {
+			isInsuranceMet = false;
+			insuranceCheckReason = `insufficient_insurance_amount: ${insuranceAmount} < ${inheritedInsuranceRequired}`;
 		}
+	}
 
-		// 4. 승급 여부 확인 - 승급 지급이 이미 시작되었으면 생성 안 함
-		const promotionPlan = await WeeklyPaymentPlans.findOne({
-			userId: previousPlan.userId,
-			planType: 'promotion',
-			baseGrade: { $gt: baseGrade },
-			startDate: { $lte: new Date() }
-		});
+	// 4. 승급 여부 확인 - 승급 지급이 이미 시작되었으면 생성 안 함
+	if (maxPromotionGrade && maxPromotionGrade > baseGrade) {
+		return { reason: '승급으로 인한 생성 안 함', retry: false };
+	}
 
-		if (promotionPlan) {
-			console.log(`[createAdditionalPaymentPlanV8] ${previousPlan.userId} 승급으로 인한 생성 안 함`);
-			return null;
-		}
+	// 5. 추가지급 시작일 계산
+	let baseDate;
+	if (previousPlan.추가지급단계 === 0) {
+		// 기본→추가1차: 등록/승급일 + 2개월
+		baseDate = previousPlan.additionalPaymentBaseDate;
+	} else {
+		// 추가N차→추가(N+1)차: 이전 추가지급 시작일 + 1개월
+		baseDate = previousPlan.startDate;
+	}
 
-		// 5. 추가지급 시작일 계산
-		let baseDate;
-		if (previousPlan.추가지급단계 === 0) {
-			// 기본→추가1차: 등록/승급일 + 2개월
-			baseDate = previousPlan.additionalPaymentBaseDate;
-		} else {
-			// 추가N차→추가(N+1)차: 이전 추가지급 시작일 + 1개월
-			baseDate = previousPlan.startDate;
-		}
+	const startDate = calculateAdditionalPaymentStartDate(baseDate, previousPlan.추가지급단계);
 
-		const startDate = calculateAdditionalPaymentStartDate(baseDate, previousPlan.추가지급단계);
+	// 아직 시작일이 안 됐으면 생성 안 함
+	if (startDate > now) {
+		return { reason: `시작일 미도래: ${startDate}`, retry: true };
+	}
 
-		// 아직 시작일이 안 됐으면 생성 안 함
-		if (startDate > new Date()) {
-			console.log(`[createAdditionalPaymentPlanV8] ${previousPlan.userId} 시작일 미도래: ${startDate}`);
-			return null;
-		}
+	// 6. 매출월 결정 (시작일 기준 이전 월)
+	const revenueDate = new Date(startDate);
+	revenueDate.setMonth(revenueDate.getMonth() - 1);
+	const revenueMonth = MonthlyRegistrations.generateMonthKey(revenueDate);
 
-		// 6. 매출월 결정 (시작일 기준 이전 월)
-		const revenueDate = new Date(startDate);
-		revenueDate.setMonth(revenueDate.getMonth() - 1);
-		const revenueMonth = MonthlyRegistrations.generateMonthKey(revenueDate);
+	// 7. 금액 계산
+	const monthlyReg = getMonthlyReg(revenueMonth);
+	if (!monthlyReg) {
+		return { reason: `매출 정보 없음: ${revenueMonth}`, retry: true };
+	}
 
-		// 7. 금액 계산
-		const monthlyReg = await MonthlyRegistrations.findOne({ monthKey: revenueMonth });
-		if (!monthlyReg) {
-			console.log(`[createAdditionalPaymentPlanV8] ${previousPlan.userId} 매출 정보 없음: ${revenueMonth}`);
-			return null;
-		}
+	let baseAmount = 0;
+	if (monthlyReg.adjustedGradePayments?.[baseGrade]?.totalAmount) {
+		baseAmount = monthlyReg.adjustedGradePayments[baseGrade].totalAmount;
+	} else {
+		const revenue = monthlyReg.getEffectiveRevenue();
+		const gradePayments = calculateGradePayments(revenue, monthlyReg.gradeDistribution);
+		baseAmount = gradePayments[baseGrade] || 0;
+	}
 
-		let baseAmount = 0;
-		if (monthlyReg.adjustedGradePayments?.[baseGrade]?.totalAmount) {
-			baseAmount = monthlyReg.adjustedGradePayments[baseGrade].totalAmount;
-		} else {
-			const revenue = monthlyReg.getEffectiveRevenue();
-			const gradePayments = calculateGradePayments(revenue, monthlyReg.gradeDistribution);
-			baseAmount = gradePayments[baseGrade] || 0;
-		}
+	if (baseAmount === 0) {
+		return { reason: '금액 0원', retry: true };
+	}
 
-		if (baseAmount === 0) {
-			console.log(`[createAdditionalPaymentPlanV8] ${previousPlan.userId} 금액 0원`);
-			return null;
-		}
+	const installmentAmount = Math.floor(baseAmount / 10 / 100) * 100;
+	const withholdingTax = Math.round(installmentAmount * 0.033);
+	const netAmount = installmentAmount - withholdingTax;
 
-		const installmentAmount = Math.floor(baseAmount / 10 / 100) * 100;
-		const withholdingTax = Math.round(installmentAmount * 0.033);
-		const netAmount = installmentAmount - withholdingTax;
+	// ⭐ v8.1: 유예기간 금요일 정렬 (weeklyPaymentService.js와 동일)
+	let graceWeekFriday = null;
+	if (inheritedGraceDeadline) {
+		const graceDL = new Date(inheritedGraceDeadline);
+		const graceDayOfWeek = graceDL.getUTCDay();
+		const daysToFriday = graceDayOfWeek === 5 ? 0 : (5 - graceDayOfWeek + 7) % 7;
+		graceWeekFriday = new Date(Date.UTC(
+			graceDL.getUTCFullYear(),
+			graceDL.getUTCMonth(),
+			graceDL.getUTCDate() + daysToFriday
+		));
+		graceWeekFriday.setUTCHours(0, 0, 0, 0);
+	}
 
-		// ⭐ v8.1: 유예기간 금요일 정렬 (weeklyPaymentService.js와 동일)
-		let graceWeekFriday = null;
-		if (inheritedGraceDeadline) {
-			const graceDL = new Date(inheritedGraceDeadline);
-			const graceDayOfWeek = graceDL.getUTCDay();
-			const daysToFriday = graceDayOfWeek === 5 ? 0 : (5 - graceDayOfWeek + 7) % 7;
-			graceWeekFriday = new Date(Date.UTC(
-				graceDL.getUTCFullYear(),
-				graceDL.getUTCMonth(),
-				graceDL.getUTCDate() + daysToFriday
-			));
-			graceWeekFriday.setUTCHours(0, 0, 0, 0);
-		}
+	// 8. 10회 할부 생성 (보험 조건에 따라 status 설정)
+	const installments = [];
+	for (let i = 1; i <= 10; i++) {
+		const scheduledDate = new Date(startDate);
+		scheduledDate.setUTCDate(scheduledDate.getUTCDate() + (i - 1) * 7);
+		const normalizedScheduledDate = new Date(scheduledDate);
+		normalizedScheduledDate.setUTCHours(0, 0, 0, 0);
 
-		// 8. 10회 할부 생성 (보험 조건에 따라 status 설정)
-		const installments = [];
-		for (let i = 1; i <= 10; i++) {
-			const scheduledDate = new Date(startDate);
-			scheduledDate.setUTCDate(scheduledDate.getUTCDate() + (i - 1) * 7);
-			const normalizedScheduledDate = new Date(scheduledDate);
-			normalizedScheduledDate.setUTCHours(0, 0, 0, 0);
-
-			// ⭐ v8.1: 보험 조건 + 유예기간 체크로 status 결정
-			let installmentStatus = 'pending';
-			let skipReason = null;
-			let insuranceSkipped = false;
-
-			if (!isInsuranceMet) {
-				// 보험 미충족
-				const isAfterGracePeriod = graceWeekFriday === null || normalizedScheduledDate > graceWeekFriday;
-
-				if (isAfterGracePeriod) {
-					// 유예기간 외 → skipped
-					installmentStatus = 'skipped';
-					skipReason = insuranceCheckReason;
-					insuranceSkipped = true;
-				}
-				// 유예기간 내 → pending (정상 지급)
-			}
+		// ⭐ v8.1: 보험 조건 + 유예기간 체크로 status 결정
+		let installmentStatus = 'pending';
+		let skipReason = null;
+		let insuranceSkipped = false;
 
-			installments.push({
-				week: i,
-				weekNumber: WeeklyPaymentPlans.getISOWeek(scheduledDate),
-				scheduledDate,
-				revenueMonth,
-				gradeAtPayment: null,
-				baseAmount,
-				installmentAmount,
-				withholdingTax,
-				netAmount,
-				status: installmentStatus,
-				skipReason,
-				insuranceSkipped
-			});
+		if (!isInsuranceMet) {
+			// 보험 미충족
+			const isAfterGracePeriod = graceWeekFriday === null || normalizedScheduledDate > graceWeekFriday;
+
+			if (isAfterGracePeriod) {
+				// 유예기간 외 → skipped
+				installmentStatus = 'skipped';
+				skipReason = insuranceCheckReason;
+				insuranceSkipped = true;
+			}
+			// 유예기간 내 → pending (정상 지급)
 		}
 
-		// 9. DB 저장 (보험 필드 승계 ⭐ v8.1)
-		const newPlan = await WeeklyPaymentPlans.create({
+		installments.push({
+			week: i,
+			weekNumber: WeeklyPaymentPlans.getISOWeek(scheduledDate),
+			scheduledDate,
+			revenueMonth,
+			gradeAtPayment: null,
+			baseAmount,
+			installmentAmount,
+			withholdingTax,
+			netAmount,
+			status: installmentStatus,
+			skipReason,
+			insuranceSkipped
+		});
+	}
+
+	// 9. 계획 문서 (보험 필드 승계 ⭐ v8.1)
+	return {
+		doc: {
 			userId: previousPlan.userId,
 			userName: previousPlan.userName,
 			planType: previousPlan.planType,
@@ -959,19 +982,98 @@ export async function createAdditionalPaymentPlanV8(previousPlan) {
 			graceDeadline: inheritedGraceDeadline,
 			insuranceRequired: inheritedInsuranceRequired,
 			insuranceInherited: inheritedInsuranceInherited
-		});
+		}
+	};
+}
 
-		// 10. 주차별 총계 업데이트
-		await updateWeeklyProjections(newPlan, 'add');
+/**
+ * ⭐ v9.7: 추가지급 판단에 필요한 데이터 일괄 조회
+ * - 사용자(등급/보험금액), 등급별 회차 합계, 시작된 승급 지급의 최고 등급, 매출월 문서
+ *
+ * @param {Array<Object>} plans - 이전 완료된 계획 목록
+ * @param {Date} now
+ */
+async function loadAdditionalPaymentContext(plans, now) {
+	const userIds = [...new Set(plans.map((plan) => plan.userId))];
+	const validUserIds = userIds.filter((id) => mongoose.isValidObjectId(id));
+
+	const [users, totals, promotions] = await Promise.all([
+		User.find({ _id: { $in: validUserIds } }).select('grade insuranceAmount').lean(),
+		WeeklyPaymentPlans.aggregate([
+			{ $match: { userId: { $in: userIds } } },
+			{
+				$group: {
+					_id: { userId: '$userId', baseGrade: '$baseGrade' },
+					total: { $sum: '$totalInstallments' }
+				}
+			}
+		]),
+		WeeklyPaymentPlans.aggregate([
+			{ $match: { userId: { $in: userIds }, planType: 'promotion', startDate: { $lte: now } } },
+			{ $group: { _id: '$userId', maxGrade: { $max: '$baseGrade' } } }
+		])
+	]);
+
+	const monthlyRegs = new Map();
+
+	return {
+		usersById: new Map(users.map((user) => [user._id.toString(), user])),
+		totals: new Map(totals.map((t) => [`${t._id.userId}:${t._id.baseGrade}`, t.total])),
+		maxPromotionGrades: new Map(promotions.map((p) => [p._id, p.maxGrade])),
+		monthlyRegs,
+		// 매출월 문서는 필요한 월만 조회 (월 수는 적으므로 지연 조회 후 캐시)
+		async preloadMonths(monthKeys) {
+			const missing = monthKeys.filter((key) => !monthlyRegs.has(key));
+			if (missing.length === 0) return;
+			const docs = await MonthlyRegistrations.find({ monthKey: { $in: missing } });
+			for (const key of missing) monthlyRegs.set(key, null);
+			for (const doc of docs) monthlyRegs.set(doc.monthKey, doc);
+		}
+	};
+}
 
-		// ⭐ v8.1: 스킵된 건수 로그
-		const skippedCount = installments.filter(i => i.status === 'skipped').length;
-		if (skippedCount > 0) {
-			console.log(`[createAdditionalPaymentPlanV8] ${previousPlan.userId} 추가지급 생성: ${baseGrade} ${next추가지급단계}단계, ${revenueMonth} 매출분, 시작일: ${startDate} (보험 미충족으로 ${skippedCount}건 skipped)`);
-		} else {
-			console.log(`[createAdditionalPaymentPlanV8] ${previousPlan.userId} 추가지급 생성: ${baseGrade} ${next추가지급단계}단계, ${revenueMonth} 매출분, 시작일: ${startDate}`);
+/**
+ * 계획별 매출월 후보 (시작일 기준 이전 월)
+ */
+function getAdditionalRevenueMonth(previousPlan) {
+	const baseDate = previousPlan.추가지급단계 === 0
+		? previousPlan.additionalPaymentBaseDate
+		: previousPlan.startDate;
+	const revenueDate = calculateAdditionalPaymentStartDate(baseDate, previousPlan.추가지급단계);
+	revenueDate.setMonth(revenueDate.getMonth() - 1);
+	return MonthlyRegistrations.generateMonthKey(revenueDate);
+}
+
+/**
+ * v8.0: 추가지급 계획 생성 (날짜 기반)
+ * 매주 금요일 지급 후 추가지급 시작일이 도래했는지 확인하여 생성
+ *
+ * @param {Object} previousPlan - 이전 완료된 계획
+ * @returns {Object|null} 생성된 계획 또는 null
+ */
+export async function createAdditionalPaymentPlanV8(previousPlan) {
+	try {
+		const now = new Date();
+		const context = await loadAdditionalPaymentContext([previousPlan], now);
+		await context.preloadMonths([getAdditionalRevenueMonth(previousPlan)]);
+
+		const result = buildAdditionalPaymentPlanV8(previousPlan, {
+			user: context.usersById.get(previousPlan.userId) || null,
+			totalCount: context.totals.get(`${previousPlan.userId}:${previousPlan.baseGrade}`) || 0,
+			maxPromotionGrade: context.maxPromotionGrades.get(previousPlan.userId) || null,
+			getMonthlyReg: (monthKey) => context.monthlyRegs.get(monthKey) || null,
+			now
+		});
+
+		if (!result.doc) {
+			console.log(`[createAdditionalPaymentPlanV8] ${previousPlan.userId} ${result.reason}`);
+			return null;
 		}
 
+		const newPlan = await WeeklyPaymentPlans.create(result.doc);
+		markPlannerRollupsStale();
+
+		console.log(`[createAdditionalPaymentPlanV8] ${previousPlan.userId} 추가지급 생성: ${newPlan.baseGrade} ${newPlan.추가지급단계}단계, ${newPlan.revenueMonth} 매출분, 시작일: ${newPlan.startDate}`);
 		return newPlan;
 	} catch (error) {
 		console.error('[createAdditionalPaymentPlanV8] 오류:', error);
@@ -982,44 +1084,137 @@ export async function createAdditionalPaymentPlanV8(previousPlan) {
 /**
  * v8.0: 매주 금요일 추가지급 생성 체크
  * 완료된 계획 중 추가지급 시작일이 도래한 것들을 확인하여 생성
+ *
+ * ⭐ v9.7: 증분 처리
+ * - 워터마크(Counter 컬렉션, 시각 ms) 이후 완료/수정된 계획 + 이전 실행에서 보류된 계획만 조회
+ * - 다음 단계가 이미 있는 계획은 parentPlanId $in 조회 1회로 제외 (계획별 findOne 없음)
+ * - 사용자/회차 합계/승급/매출월은 일괄 조회, 새 계획은 insertMany
+ * - 시작일 미도래·매출 미확정·저장 실패는 additionalPaymentDeferred로 표시해 다음 실행에서 재확인
+ *   (워터마크는 항상 이번 실행 시각까지 진행)
  */
 export async function checkAndCreateAdditionalPaymentsV8() {
 	try {
-		const today = new Date();
-		console.log(`[checkAndCreateAdditionalPaymentsV8] 시작: ${today}`);
+		const now = new Date();
+		console.log(`[checkAndCreateAdditionalPaymentsV8] 시작: ${now}`);
+
+		const watermarkDoc = await Counter.findById(ADDITIONAL_PAYMENT_WATERMARK).lean();
+		const watermark = new Date(watermarkDoc?.value || 0);
 
-		// 완료된 계획 중 다음 단계가 없는 것들 조회
-		const completedPlans = await WeeklyPaymentPlans.find({
+		// 1. 워터마크 이후 완료된 계획 + 보류된 계획
+		const candidates = await WeeklyPaymentPlans.find({
 			planStatus: 'completed',
-			installmentType: { $in: ['basic', 'additional'] }
+			installmentType: { $in: ['basic', 'additional'] },
+			$or: [
+				{ updatedAt: { $gt: watermark } },
+				{ additionalPaymentDeferred: true }
+			]
+		})
+			.select('userId userName planType generation 추가지급단계 baseGrade additionalPaymentBaseDate startDate graceDeadline insuranceRequired insuranceInherited additionalPaymentDeferred')
+			.sort({ updatedAt: 1 })
+			.lean();
+
+		// 2. 다음 단계가 이미 있는 계획 제외 ($in 조회 1회)
+		const parentIds = await WeeklyPaymentPlans.distinct('parentPlanId', {
+			parentPlanId: { $in: candidates.map((plan) => plan._id) }
 		});
+		const hasNext = new Set(parentIds.map((id) => id.toString()));
+		const completedPlans = candidates.filter((plan) => !hasNext.has(plan._id.toString()));
 
 		let createdCount = 0;
 		let skippedCount = 0;
+		const deferredIds = [];
+
+		if (completedPlans.length > 0) {
+			// 3. 판단 데이터 일괄 조회
+			const context = await loadAdditionalPaymentContext(completedPlans, now);
+			await context.preloadMonths([...new Set(completedPlans.map(getAdditionalRevenueMonth))]);
+
+			// 4. 계획 문서 생성 (메모리)
+			const newDocs = [];
+			const sourcePlans = [];
+			for (const plan of completedPlans) {
+				const totalKey = `${plan.userId}:${plan.baseGrade}`;
+				const result = buildAdditionalPaymentPlanV8(plan, {
+					user: context.usersById.get(plan.userId) || null,
+					totalCount: context.totals.get(totalKey) || 0,
+					maxPromotionGrade: context.maxPromotionGrades.get(plan.userId) || null,
+					getMonthlyReg: (monthKey) => context.monthlyRegs.get(monthKey) || null,
+					now
+				});
+
+				if (!result.doc) {
+					skippedCount++;
+					if (result.retry) {
+						deferredIds.push(plan._id);
+					}
+					continue;
+				}
 
-		for (const plan of completedPlans) {
-			// 이미 다음 단계 추가지급이 있는지 확인
-			const nextPlan = await WeeklyPaymentPlans.findOne({
-				parentPlanId: plan._id
-			});
-
-			if (nextPlan) {
-				continue;
+				// 같은 실행 내 같은 등급 계획이 여러 건이면 회차 합계 누적
+				context.totals.set(totalKey, (context.totals.get(totalKey) || 0) + result.doc.totalInstallments);
+				newDocs.push(result.doc);
+				sourcePlans.push(plan);
 			}
 
-			// 추가지급 생성 시도
-			const newPlan = await createAdditionalPaymentPlanV8(plan);
+			// 5. 일괄 저장
+			if (newDocs.length > 0) {
+				try {
+					const inserted = await WeeklyPaymentPlans.insertMany(newDocs, { ordered: false });
+					createdCount = inserted.length;
+				} catch (error) {
+					// ordered: false → 성공한 문서는 저장됨, 실패한 계획은 보류로 표시해 다음 실행에서 재시도
+					createdCount = error.insertedDocs?.length ?? 0;
+					for (const writeError of error.writeErrors || []) {
+						const plan = sourcePlans[writeError.index];
+						if (plan) {
+							deferredIds.push(plan._id);
+						}
+					}
+					skippedCount += newDocs.length - createdCount;
+					console.error('[checkAndCreateAdditionalPaymentsV8] 일부 저장 실패:', error.message);
+				}
 
-			if (newPlan) {
-				createdCount++;
-			} else {
-				skippedCount++;
+				if (createdCount > 0) {
+					markPlannerRollupsStale();
+				}
 			}
 		}
 
-		console.log(`[checkAndCreateAdditionalPaymentsV8] 완료: 생성 ${createdCount}건, 제외 ${skippedCount}건`);
+		// 6. 보류 표시 갱신 (수정 시각은 유지 → 워터마크 조회에 다시 걸리지 않음)
+		const deferredSet = new Set(deferredIds.map((id) => id.toString()));
+		const resolvedIds = candidates
+			.filter((plan) => plan.additionalPaymentDeferred && !deferredSet.has(plan._id.toString()))
+			.map((plan) => plan._id);
+		const newlyDeferredIds = candidates
+			.filter((plan) => !plan.additionalPaymentDeferred && deferredSet.has(plan._id.toString()))
+			.map((plan) => plan._id);
+
+		await Promise.all([
+			newlyDeferredIds.length > 0 && WeeklyPaymentPlans.updateMany(
+				{ _id: { $in: newlyDeferredIds } },
+				{ $set: { additionalPaymentDeferred: true } },
+				{ timestamps: false }
+			),
+			resolvedIds.length > 0 && WeeklyPaymentPlans.updateMany(
+				{ _id: { $in: resolvedIds } },
+				{ $unset: { additionalPaymentDeferred: 1 } },
+				{ timestamps: false }
+			)
+		]);
+
+		// 7. 워터마크 갱신 (동시 수정 대비 여유 시간)
+		const nextWatermark = new Date(now.getTime() - WATERMARK_SKEW_MS);
+		if (nextWatermark > watermark) {
+			await Counter.updateOne(
+				{ _id: ADDITIONAL_PAYMENT_WATERMARK },
+				{ $set: { value: nextWatermark.getTime() } },
+				{ upsert: true }
+			);
+		}
+
+		console.log(`[checkAndCreateAdditionalPaymentsV8] 완료: 대상 ${completedPlans.length}건, 생성 ${createdCount}건, 제외 ${skippedCount}건 (보류 ${deferredSet.size}건)`);
 
-		return { created: createdCount, skipped: skippedCount };
+		return { created: createdCount, skipped: skippedCount, deferred: deferredSet.size };
 	} catch (error) {
 		console.error('[checkAndCreateAdditionalPaymentsV8] 오류:', error);
 		return { created: 0, skipped: 0, error: error.message };
@@ -1035,9 +1230,10 @@ export async function checkAndCreateAdditionalPaymentsV8() {
  *
  * @param {string} userId - 사용자 ID
  * @param {string} newGrade - 새 등급
+ * @param {Array} plans - 사용자의 계획 목록 (전달 시 DB 조회 생략)
  * @returns {Object} { canInherit, previousGrade, previousInsuranceRequired }
  */
-async function checkInsuranceInheritance(userId, newGrade) {
+async function checkInsuranceInheritance(userId, newGrade, plans = null) {
 	try {
 		// 새 등급의 인덱스
 		const newGradeIndex = GRADE_ORDER.indexOf(newGrade);
@@ -1062,11 +1258,13 @@ async function checkInsuranceInheritance(userId, newGrade) {
 		}
 
 		// 이전 등급의 active 계획이 존재하는지 확인
-		const activePreviousPlans = await WeeklyPaymentPlans.find({
-			userId,
-			baseGrade: previousGrade,
-			planStatus: 'active'
-		});
+		const activePreviousPlans = plans
+			? plans.filter((p) => p.baseGrade === previousGrade && p.planStatus === 'active')
+			: await WeeklyPaymentPlans.find({
+					userId,
+					baseGrade: previousGrade,
+					planStatus: 'active'
+				});
 
 		if (activePreviousPlans.length === 0) {
 			// 이전 등급 계획 모두 완료 → 승계 불가
@@ -1093,80 +1291,88 @@ async function checkInsuranceInheritance(userId, newGrade) {
  *
  * @param {string} userId - 사용자 ID
  * @param {number} newInsuranceAmount - 새 보험 금액
+ * @param {Date} today - 기준 시각 (기본: 현재, 검증 스크립트에서 고정)
  * @returns {Object} { updated, skipped, restored }
  */
-export async function updateInstallmentsOnInsuranceChange(userId, newInsuranceAmount) {
+export async function updateInstallmentsOnInsuranceChange(userId, newInsuranceAmount, today = new Date()) {
 	try {
-		const today = new Date();
-		let skippedCount = 0;
-		let restoredCount = 0;
+		// 과거 지급은 건드리지 않음 (scheduledDate 자정 기준 >= 현재 시각 → 다음 자정(UTC) 이후)
+		const fromDate = new Date(today);
+		if (fromDate.getUTCHours() || fromDate.getUTCMinutes() || fromDate.getUTCSeconds() || fromDate.getUTCMilliseconds()) {
+			fromDate.setUTCHours(24, 0, 0, 0);
+		}
 
 		// 해당 사용자의 active 계획 조회 (F4+ 보험 조건 있는 것만)
-		const activePlans = await WeeklyPaymentPlans.find({
-			userId,
-			planStatus: 'active',
-			insuranceRequired: { $ne: null }  // 보험 조건이 있는 계획만
-		});
-
-		for (const plan of activePlans) {
-			let planModified = false;
-
-			// ⭐ v8.1: 유예기간 금요일 정렬 (weeklyPaymentService.js와 동일)
-			let graceWeekFriday = null;
-			if (plan.graceDeadline) {
-				const graceDL = new Date(plan.graceDeadline);
-				const graceDayOfWeek = graceDL.getUTCDay();
-				const daysToFriday = graceDayOfWeek === 5 ? 0 : (5 - graceDayOfWeek + 7) % 7;
-				graceWeekFriday = new Date(Date.UTC(
-					graceDL.getUTCFullYear(),
-					graceDL.getUTCMonth(),
-					graceDL.getUTCDate() + daysToFriday
-				));
-				graceWeekFriday.setUTCHours(0, 0, 0, 0);
+		// ⭐ v9.6: 변경 건수/유예기간 계산에 필요한 필드만 조회, 변경은 arrayFilters 업데이트
+		const activePlans = await WeeklyPaymentPlans.find(
+			{
+				userId,
+				planStatus: 'active',
+				insuranceRequired: { $ne: null } // 보험 조건이 있는 계획만
+			},
+			{
+				insuranceRequired: 1,
+				graceDeadline: 1,
+				'installments.status': 1,
+				'installments.scheduledDate': 1,
+				'installments.insuranceSkipped': 1
 			}
+		).lean();
 
-			for (const installment of plan.installments) {
-				const scheduledDate = new Date(installment.scheduledDate);
-				scheduledDate.setUTCHours(0, 0, 0, 0);
-
-				// 과거 지급은 건드리지 않음
-				if (scheduledDate < today) {
-					continue;
-				}
+		let skippedCount = 0;
+		let restoredCount = 0;
+		const ops = [];
 
-				// ⭐ v8.1: 유예기간 체크 (금요일 기준)
-				const isAfterGracePeriod = graceWeekFriday === null || scheduledDate > graceWeekFriday;
-
-				if (newInsuranceAmount < plan.insuranceRequired) {
-					// 보험 미충족
-					if (isAfterGracePeriod && installment.status === 'pending') {
-						// 유예기간 지남 + pending → skipped
-						installment.status = 'skipped';
-						installment.skipReason = 'insurance_not_maintained';
-						installment.insuranceSkipped = true;
-						skippedCount++;
-						planModified = true;
-					}
-				} else {
-					// 보험 충족
-					if (installment.status === 'skipped' && installment.insuranceSkipped) {
-						// 보험 미유지로 skipped된 것 복구
-						installment.status = 'pending';
-						installment.skipReason = null;
-						installment.insuranceSkipped = false;
-						restoredCount++;
-						planModified = true;
+		for (const plan of activePlans) {
+			if (newInsuranceAmount < plan.insuranceRequired) {
+				// 보험 미충족: 유예기간 지남 + pending → skipped
+				// ⭐ v8.1: 유예기간 금요일 정렬 (weeklyPaymentService.js와 동일)
+				let skipFrom = fromDate;
+				if (plan.graceDeadline) {
+					const graceDL = new Date(plan.graceDeadline);
+					const graceDayOfWeek = graceDL.getUTCDay();
+					const daysToFriday = graceDayOfWeek === 5 ? 0 : (5 - graceDayOfWeek + 7) % 7;
+					// 유예기간 금요일 다음 날부터 skip
+					const afterGrace = new Date(Date.UTC(
+						graceDL.getUTCFullYear(),
+						graceDL.getUTCMonth(),
+						graceDL.getUTCDate() + daysToFriday + 1
+					));
+					if (afterGrace > skipFrom) {
+						skipFrom = afterGrace;
 					}
 				}
-			}
 
-			if (planModified) {
-				await plan.save();
+				const count = plan.installments.filter(
+					(inst) => inst.status === 'pending' && new Date(inst.scheduledDate) >= skipFrom
+				).length;
+				if (count > 0) {
+					skippedCount += count;
+					ops.push(skipInsuranceOp({ _id: plan._id }, skipFrom));
+				}
+			} else {
+				// 보험 충족: 보험 미유지로 skipped된 것 복구
+				const count = plan.installments.filter(
+					(inst) =>
+						inst.status === 'skipped' &&
+						inst.insuranceSkipped &&
+						new Date(inst.scheduledDate) >= fromDate
+				).length;
+				if (count > 0) {
+					restoredCount += count;
+					ops.push(restoreInsuranceOp({ _id: plan._id }, fromDate));
+				}
 			}
 		}
 
+		await applyPlanMutations(ops);
+
 		console.log(`[updateInstallmentsOnInsuranceChange] ${userId}: skipped=${skippedCount}, restored=${restoredCount}`);
 
+		if (skippedCount + restoredCount > 0) {
+			await markPlannerRollupsStale({ userIds: [userId] });
+		}
+
 		return {
 			updated: skippedCount + restoredCount > 0,
 			skipped: skippedCount,
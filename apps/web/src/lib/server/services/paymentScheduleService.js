@@ -0,0 +1,80 @@
+/**
+ * 내 지급 내역 데이터 조회 (용역자 계정)
+ * ⭐ v9.7
+ *
+ * - /api/user/payments(서버 집계)와 /api/user/payments/sync(로컬 캐시 동기화)가 공유
+ * - 화면 집계 규칙은 $lib/utils/paymentScheduleView.js 한 곳에서 관리
+ */
+
+import User from '../models/User.js';
+
+// 압축 저장 계획은 lean find 미들웨어가 installments 복원 (storageMode ~ totalInstallments 필요)
+export const SCHEDULE_PLAN_FIELDS =
+	'userId baseGrade createdAt updatedAt installments storageMode schedule exceptions startDate totalInstallments';
+
+/**
+ * 대표 용역자 + 같은 계정의 모든 용역자 조회
+ * @param {string} primaryUserId - JWT의 primaryUserId
+ * @returns {Promise<{ primaryUser: Object, allUsers: Array<Object> } | null>}
+ */
+export async function findScheduleAccount(primaryUserId) {
+	const primaryUser = await User.findById(primaryUserId)
+		.populate('userAccountId', 'canViewSubordinates')
+		.select('name grade insuranceActive userAccountId registrationNumber')
+		.lean();
+
+	if (!primaryUser) return null;
+
+	const allUsers = await User.find({ userAccountId: primaryUser.userAccountId })
+		.select('_id name grade registrationNumber createdAt insuranceActive gradeHistory')
+		.sort({ registrationNumber: 1 })
+		.lean();
+
+	return { primaryUser, allUsers };
+}
+
+/**
+ * 응답용 계정 정보 (user, allRegistrations)
+ */
+export function toScheduleAccount(primaryUser, allUsers) {
+	return {
+		user: {
+			id: primaryUser._id.toString(),
+			name: primaryUser.name,
+			grade: primaryUser.grade,
+			insuranceActive: primaryUser.insuranceActive,
+			registrationNumber: primaryUser.registrationNumber,
+			canViewSubordinates: primaryUser.userAccountId?.canViewSubordinates || false
+		},
+		allRegistrations: allUsers.map(reg => ({
+			id: reg._id.toString(),
+			name: reg.name,
+			grade: reg.grade,
+			registrationNumber: reg.registrationNumber,
+			createdAt: reg.createdAt,
+			insuranceActive: reg.insuranceActive || false,
+			gradeHistory: reg.gradeHistory || []
+		}))
+	};
+}
+
+/**
+ * 응답/집계용 계획 (화면 계산에 필요한 회차 필드만)
+ */
+export function toSchedulePlan(plan) {
+	return {
+		id: plan._id.toString(),
+		userId: plan.userId,
+		baseGrade: plan.baseGrade,
+		createdAt: plan.createdAt,
+		installments: (plan.installments || []).map(inst => ({
+			week: inst.week,
+			weekNumber: inst.weekNumber,
+			scheduledDate: inst.scheduledDate,
+			status: inst.status,
+			installmentAmount: inst.installmentAmount || 0,
+			withholdingTax: inst.withholdingTax || 0,
+			netAmount: inst.netAmount || 0
+		}))
+	};
+}
@@ -0,0 +1,211 @@
+/**
+ * 주차별 지급 회차 조회 서비스 (PaymentWeekBucket)
+ *
+ * - 주차 버킷(ISO 주차 → 계획/회차)으로 대상 계획만 _id 조회
+ *   → 지급 스케줄, 이번 주 지급 정보, 주간 지급 처리에서 전체 $unwind 제거
+ * - 버킷은 WeeklyPaymentPlans 미들웨어가 생성/삭제 시 유지
+ * - 최초 사용 시 버킷이 구성되지 않은 DB(도입 이전 데이터)는 전체 재구성
+ *   (재구성 완료 표시는 Counter 컬렉션 paymentWeekBuckets 문서)
+ * - 재구성은 백그라운드로 진행, 완료 표시 전(미구성/재구성 중/재구성 필요)에는
+ *   계획 컬렉션 조회로 같은 결과 반환 → 재구성 도중 빈 버킷을 읽지 않음
+ * - 버킷 동기화 실패 시 완료 표시가 지워짐 → 표시는 짧은 주기(10초)로 다시 확인해
+ *   다른 서버 프로세스의 실패도 재구성으로 이어짐
+ */
+
+import mongoose from 'mongoose';
+import PaymentWeekBucket, { BUCKET_MARKER } from '../models/PaymentWeekBucket.js';
+import WeeklyPaymentPlans from '../models/WeeklyPaymentPlans.js';
+import Counter from '../models/Counter.js';
+
+const BUCKET_VERSION = 1;
+const MARKER_CHECK_MS = 10 * 1000;
+const BUILD_TIMEOUT_MS = 10 * 60 * 1000; // 재구성 중 표시가 이보다 오래되면 중단된 것으로 보고 다시 재구성
+
+// 프로세스 내 상태
+const state = {
+	checkedAt: 0, // 마지막으로 완료 표시를 확인한 시각 (0 = 확인 필요)
+	ready: false, // 마지막 확인 시 완료 표시 여부
+	building: null // 이 프로세스에서 진행 중인 재구성 Promise
+};
+
+// 재구성 대상 회차 (버킷 항목 1건 = 회차 1건)
+function bucketSourceStages(planMatch) {
+	return [
+		{ $match: planMatch },
+		{ $project: { userId: 1, installments: 1 } },
+		{ $unwind: '$installments' },
+		{ $match: { 'installments.scheduledDate': { $ne: null } } }
+	];
+}
+
+/**
+ * 버킷 전체 재구성 (계획 컬렉션 기준)
+ * - 재구성 중 표시는 -시작 시각(ms), 완료 시 버전 번호
+ * - 재구성 시작 이전에 생성된 계획 기준으로 버킷/회차 건수를 비교해 같을 때만 완료 표시
+ *   (도중 생성된 계획은 미들웨어가 버킷에 반영하므로 비교에서 제외)
+ * @returns {Promise<number>} 버킷 항목 수
+ */
+export async function rebuildPaymentWeekBuckets() {
+	const started = Date.now();
+	const buildingMarker = -started;
+	const boundary = mongoose.Types.ObjectId.createFromTime(Math.floor(started / 1000));
+
+	// 재구성 중 표시 → 도중에 동기화 실패(markStale)가 있으면 완료 표시를 남기지 않음
+	await Counter.updateOne({ _id: BUCKET_MARKER }, { $set: { value: buildingMarker } }, { upsert: true });
+
+	await PaymentWeekBucket.init(); // $merge 대상 unique 인덱스 보장
+	await PaymentWeekBucket.deleteMany({});
+
+	// 압축 저장 계획은 aggregate 미들웨어가 installments 복원
+	await WeeklyPaymentPlans.aggregate([
+		...bucketSourceStages({}),
+		{
+			$project: {
+				_id: 0,
+				weekNumber: '$installments.weekNumber',
+				planId: '$_id',
+				week: '$installments.week',
+				scheduledDate: '$installments.scheduledDate',
+				userId: 1
+			}
+		},
+		{
+			$merge: {
+				into: PaymentWeekBucket.collection.name,
+				on: ['weekNumber', 'planId', 'week'],
+				whenMatched: 'replace',
+				whenNotMatched: 'insert'
+			}
+		}
+	]);
+
+	// 정합성 확인: 재구성 시작 이전 계획의 회차 수 = 버킷 항목 수
+	const [[expected], count] = await Promise.all([
+		WeeklyPaymentPlans.aggregate([
+			...bucketSourceStages({ _id: { $lt: boundary } }),
+			{ $count: 'total' }
+		]),
+		PaymentWeekBucket.countDocuments({ planId: { $lt: boundary } })
+	]);
+	const expectedCount = expected?.total ?? 0;
+
+	if (count !== expectedCount) {
+		await Counter.updateOne({ _id: BUCKET_MARKER, value: buildingMarker }, { $set: { value: 0 } });
+		console.warn(`[PaymentWeekBucket] 재구성 결과 불일치: 버킷 ${count}건 ≠ 회차 ${expectedCount}건 → 재구성 필요 표시`);
+		return count;
+	}
+
+	await Counter.updateOne(
+		{ _id: BUCKET_MARKER, value: buildingMarker },
+		{ $set: { value: BUCKET_VERSION } }
+	);
+	console.log(`[PaymentWeekBucket] 재구성 완료: ${count}건 (${Date.now() - started}ms)`);
+	return count;
+}
+
+/**
+ * 버킷 사용 가능 여부 확인 (미구성 또는 재구성 필요 표시 시 백그라운드 재구성 시작)
+ * @returns {Promise<boolean>} 완료 표시가 있으면 true (false면 계획 컬렉션으로 조회)
+ */
+export async function ensurePaymentWeekBuckets() {
+	if (Date.now() - state.checkedAt < MARKER_CHECK_MS) return state.ready;
+
+	const marker = await Counter.findById(BUCKET_MARKER).lean();
+	const value = marker?.value ?? 0;
+	state.checkedAt = Date.now();
+	state.ready = value === BUCKET_VERSION;
+	if (state.ready) return true;
+
+	// 다른 프로세스가 재구성 중이면 기다리지 않고 계획 컬렉션으로 조회
+	const buildingElsewhere = value < 0 && Date.now() + value < BUILD_TIMEOUT_MS;
+	if (!buildingElsewhere && !state.building) {
+		state.building = rebuildPaymentWeekBuckets()
+			.catch((error) => {
+				console.error('[PaymentWeekBucket] 재구성 실패:', error.message);
+			})
+			.finally(() => {
+				state.building = null;
+				state.checkedAt = 0;
+			});
+	}
+	return false;
+}
+
+/**
+ * 버킷 재구성 필요 표시 (조회 결과가 계획 컬렉션과 다를 때)
+ * - 다음 findWeekInstallments에서 재구성 시작 (완료 전까지 계획 컬렉션 조회)
+ */
+export async function invalidatePaymentWeekBuckets() {
+	await PaymentWeekBucket.markStale();
+	state.checkedAt = 0;
+	state.ready = false;
+}
+
+/**
+ * 주차의 지급 회차 조회
+ *
+ * @param {string} weekNumber - ISO 주차 (예: 2025-W41)
+ * @param {Object} options
+ * @param {Object} options.planFilter - 계획 추가 조건 (예: { planStatus: 'active' })
+ * @param {Date} options.from - scheduledDate 하한 (포함)
+ * @param {Date} options.to - scheduledDate 상한 (미포함)
+ * @param {boolean} options.lean - false면 Mongoose 문서 반환 (기본 true)
+ * @returns {Promise<Array<{ plan: Object, installment: Object }>>}
+ */
+export async function findWeekInstallments(weekNumber, { planFilter = {}, from = null, to = null, lean = true } = {}) {
+	if (!(await ensurePaymentWeekBuckets())) {
+		return findWeekInstallmentsFromPlans(weekNumber, { planFilter, from, to, lean });
+	}
+
+	const bucketFilter = { weekNumber };
+	if (from || to) {
+		bucketFilter.scheduledDate = {
+			...(from && { $gte: from }),
+			...(to && { $lt: to })
+		};
+	}
+
+	const entries = await PaymentWeekBucket.find(bucketFilter).select('planId week').lean();
+	if (entries.length === 0) return [];
+
+	const planIds = [...new Set(entries.map(entry => entry.planId.toString()))];
+	const query = WeeklyPaymentPlans.find({ ...planFilter, _id: { $in: planIds } });
+	const plans = lean ? await query.lean() : await query;
+	const plansById = new Map(plans.map(plan => [plan._id.toString(), plan]));
+
+	const results = [];
+	for (const entry of entries) {
+		const plan = plansById.get(entry.planId.toString());
+		const installment = plan?.installments?.find(inst => inst.week === entry.week);
+		if (installment) {
+			results.push({ plan, installment });
+		}
+	}
+	return results;
+}
+
+/**
+ * 버킷 완료 전 조회: 계획 컬렉션에서 같은 조건의 회차 조회
+ * - 압축 저장 계획도 선택되도록 aggregate(installments 복원)로 _id를 고른 뒤 find
+ */
+async function findWeekInstallmentsFromPlans(weekNumber, { planFilter, from, to, lean }) {
+	const matched = await WeeklyPaymentPlans.aggregate([
+		{ $match: { ...planFilter, 'installments.weekNumber': weekNumber } },
+		{ $project: { _id: 1 } }
+	]);
+	if (matched.length === 0) return [];
+
+	const query = WeeklyPaymentPlans.find({ _id: { $in: matched.map(plan => plan._id) } });
+	const plans = lean ? await query.lean() : await query;
+
+	const results = [];
+	for (const plan of plans) {
+		for (const installment of plan.installments || []) {
+			if (installment.weekNumber !== weekNumber || !installment.scheduledDate) continue;
+			if (from && installment.scheduledDate < from) continue;
+			if (to && installment.scheduledDate >= to) continue;
+			results.push({ plan, installment });
+		}
+	}
+	return results;
+}
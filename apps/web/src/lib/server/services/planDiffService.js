@@ -0,0 +1,127 @@
+/**
+ * 지급 계획 Diff 서비스
+ * - dry-run 미리보기에서 "현재 계획"과 "변경 후 계획"을 비교
+ * - 사용자별 총액 / 주차별 지급액 변화만 간결하게 반환
+ */
+
+// 실제 지급 대상이 아닌 installment 상태
+const EXCLUDED_STATUSES = new Set(['skipped', 'terminated', 'canceled']);
+
+/**
+ * 날짜 → YYYY-MM-DD (UTC)
+ */
+function toDateKey(date) {
+	return new Date(date).toISOString().split('T')[0];
+}
+
+/**
+ * 지급 계획 목록 요약
+ * - 사용자별 총 지급액, 주차(지급일)별 지급액/건수
+ *
+ * @param {Array} plans - WeeklyPaymentPlans 문서 또는 plain object 배열
+ * @returns {{ users: Map, weeks: Map, totalAmount: number, planCount: number }}
+ */
+export function summarizePlans(plans) {
+	const users = new Map();
+	const weeks = new Map();
+	let totalAmount = 0;
+
+	for (const plan of plans) {
+		const userId = plan.userId?.toString();
+		if (!users.has(userId)) {
+			users.set(userId, { userName: plan.userName, amount: 0, installments: 0 });
+		}
+		const userEntry = users.get(userId);
+
+		for (const inst of plan.installments || []) {
+			if (EXCLUDED_STATUSES.has(inst.status)) continue;
+
+			const amount = inst.installmentAmount || 0;
+			const dateKey = toDateKey(inst.scheduledDate);
+
+			userEntry.amount += amount;
+			userEntry.installments++;
+
+			if (!weeks.has(dateKey)) {
+				weeks.set(dateKey, { weekNumber: inst.weekNumber, amount: 0, count: 0 });
+			}
+			const weekEntry = weeks.get(dateKey);
+			weekEntry.amount += amount;
+			weekEntry.count++;
+
+			totalAmount += amount;
+		}
+	}
+
+	return { users, weeks, totalAmount, planCount: plans.length };
+}
+
+/**
+ * 두 요약 비교 → 변경된 항목만 반환
+ *
+ * @param {Object} before - summarizePlans 결과 (현재)
+ * @param {Object} after - summarizePlans 결과 (변경 후)
+ * @returns {Object} { totals, users[], weeks[] }
+ */
+export function diffPlanSummaries(before, after) {
+	const users = [];
+	const userIds = new Set([...before.users.keys(), ...after.users.keys()]);
+	for (const userId of userIds) {
+		const prev = before.users.get(userId);
+		const next = after.users.get(userId);
+		const beforeAmount = prev?.amount || 0;
+		const afterAmount = next?.amount || 0;
+
+		if (beforeAmount !== afterAmount || (prev?.installments || 0) !== (next?.installments || 0)) {
+			users.push({
+				userId,
+				userName: next?.userName || prev?.userName,
+				before: beforeAmount,
+				after: afterAmount,
+				delta: afterAmount - beforeAmount
+			});
+		}
+	}
+	users.sort((a, b) => Math.abs(b.delta) - Math.abs(a.delta));
+
+	const weeks = [];
+	const dateKeys = new Set([...before.weeks.keys(), ...after.weeks.keys()]);
+	for (const date of dateKeys) {
+		const prev = before.weeks.get(date);
+		const next = after.weeks.get(date);
+		const beforeAmount = prev?.amount || 0;
+		const afterAmount = next?.amount || 0;
+
+		if (beforeAmount !== afterAmount || (prev?.count || 0) !== (next?.count || 0)) {
+			weeks.push({
+				date,
+				weekNumber: next?.weekNumber || prev?.weekNumber,
+				before: beforeAmount,
+				after: afterAmount,
+				delta: afterAmount - beforeAmount,
+				countBefore: prev?.count || 0,
+				countAfter: next?.count || 0
+			});
+		}
+	}
+	weeks.sort((a, b) => a.date.localeCompare(b.date));
+
+	return {
+		totals: {
+			planCountBefore: before.planCount,
+			planCountAfter: after.planCount,
+			before: before.totalAmount,
+			after: after.totalAmount,
+			delta: after.totalAmount - before.totalAmount
+		},
+		users,
+		weeks
+	};
+}
+
+/**
+ * 계획 목록 두 개를 바로 비교
+ */
+export function diffPlans(beforePlans, afterPlans) {
+	return diffPlanSummaries(summarizePlans(beforePlans), summarizePlans(afterPlans));
+}
@@ -0,0 +1,172 @@
+/**
+ * 지급 계획 변경(Mutation) 서비스
+ *
+ * 역할:
+ * - installment 단위 변경을 arrayFilters 기반 업데이트로 표현 (installments 배열 전체 $set 금지)
+ * - 조건에 맞는 installment만 서버에서 변경 → 문서 왕복/oplog 증가/동시 수정 유실 방지
+ * - 각 함수는 bulkWrite 작업(op)을 반환, applyPlanMutations()로 일괄 실행
+ *
+ * 주의:
+ * - terminatedReason, terminatedByRevenueMonth는 스키마 외 필드 → 드라이버로 직접 저장 (strict 우회)
+ * - op의 filter 값은 저장 타입 그대로 사용 (_id: ObjectId, userId: String)
+ */
+
+import WeeklyPaymentPlans from '../models/WeeklyPaymentPlans.js';
+
+/**
+ * 특정 날짜 이후 pending installment 종료 (승급)
+ * - 조건: status=pending AND scheduledDate >= fromDate
+ * - 해당 installment가 1개 이상인 계획만 planStatus=terminated
+ *
+ * @param {Object} filter - 계획 조건 (예: { _id }, { userId, planStatus: 'active' })
+ * @param {Date} fromDate - 종료 시작일 (새 플랜 첫 지급일)
+ * @param {Object} options
+ * @param {string} options.terminatedByRevenueMonth - 종료를 발생시킨 매출월 (재처리 시 복원 기준)
+ * @param {Date} options.terminatedAt - 종료 시각
+ */
+export function terminateFromDateOp(filter, fromDate, { terminatedByRevenueMonth = null, terminatedAt = new Date() } = {}) {
+	const match = { status: 'pending', scheduledDate: { $gte: fromDate } };
+
+	return {
+		updateMany: {
+			filter: { ...filter, installments: { $elemMatch: match } },
+			update: {
+				$set: {
+					'installments.$[inst].status': 'terminated',
+					'installments.$[inst].terminatedReason': 'promotion',
+					planStatus: 'terminated',
+					terminatedAt,
+					terminationReason: 'promotion',
+					terminatedBy: 'promotion_additional_stop',
+					...(terminatedByRevenueMonth && { terminatedByRevenueMonth })
+				}
+			},
+			arrayFilters: [{ 'inst.status': 'pending', 'inst.scheduledDate': { $gte: fromDate } }]
+		}
+	};
+}
+
+/**
+ * 보험 미충족 installment skip
+ * - 조건: status=pending AND scheduledDate >= fromDate
+ *
+ * @param {Object} filter - 계획 조건
+ * @param {Date} fromDate - skip 시작일 (오늘/유예기간 이후 중 늦은 날)
+ * @param {string} reason - skipReason
+ */
+export function skipInsuranceOp(filter, fromDate, reason = 'insurance_not_maintained') {
+	return {
+		updateMany: {
+			filter: {
+				...filter,
+				installments: { $elemMatch: { status: 'pending', scheduledDate: { $gte: fromDate } } }
+			},
+			update: {
+				$set: {
+					'installments.$[inst].status': 'skipped',
+					'installments.$[inst].skipReason': reason,
+					'installments.$[inst].insuranceSkipped': true
+				}
+			},
+			arrayFilters: [{ 'inst.status': 'pending', 'inst.scheduledDate': { $gte: fromDate } }]
+		}
+	};
+}
+
+/**
+ * 보험 미유지로 skip된 installment 복구
+ * - 조건: status=skipped AND insuranceSkipped=true AND scheduledDate >= fromDate
+ *
+ * @param {Object} filter - 계획 조건
+ * @param {Date} fromDate - 복구 시작일 (오늘)
+ */
+export function restoreInsuranceOp(filter, fromDate) {
+	const match = { status: 'skipped', insuranceSkipped: true, scheduledDate: { $gte: fromDate } };
+
+	return {
+		updateMany: {
+			filter: { ...filter, installments: { $elemMatch: match } },
+			update: {
+				$set: {
+					'installments.$[inst].status': 'pending',
+					'installments.$[inst].skipReason': null,
+					'installments.$[inst].insuranceSkipped': false
+				}
+			},
+			arrayFilters: [
+				{ 'inst.status': 'skipped', 'inst.insuranceSkipped': true, 'inst.scheduledDate': { $gte: fromDate } }
+			]
+		}
+	};
+}
+
+/**
+ * ⭐ v9.7: pending installment 금액 일괄 변경 (매출 조정)
+ * - 조건: status=pending (fromDate 지정 시 scheduledDate >= fromDate)
+ * - 같은 등급 계획 전체를 updateMany 1회로 처리
+ *
+ * @param {Object} filter - 계획 조건 (예: { revenueMonth, baseGrade, planStatus: 'active' })
+ * @param {Object} amounts - { baseAmount, installmentAmount, withholdingTax, netAmount }
+ * @param {Date|null} fromDate - null이면 지난 회차(지급 완료 간주)도 변경
+ */
+export function setInstallmentAmountsOp(filter, amounts, fromDate = null) {
+	const match = { status: 'pending', ...(fromDate && { scheduledDate: { $gte: fromDate } }) };
+	const $set = {};
+	for (const [key, value] of Object.entries(amounts)) {
+		$set[`installments.$[inst].${key}`] = value;
+	}
+
+	return {
+		updateMany: {
+			filter: { ...filter, installments: { $elemMatch: match } },
+			update: { $set },
+			arrayFilters: [
+				{ 'inst.status': 'pending', ...(fromDate && { 'inst.scheduledDate': { $gte: fromDate } }) }
+			]
+		}
+	};
+}
+
+/**
+ * 단일 installment 필드 변경 (회차 기준) + 계획 필드 변경
+ *
+ * @param {ObjectId} planId
+ * @param {number} week - installment 회차 (계획 내 고유)
+ * @param {Object} fields - installment 필드 (예: { status: 'skipped', skipReason })
+ * @param {Object} planUpdate - 계획 단위 연산자 (예: { $inc: { completedInstallments: 1 }, $set: { planStatus } })
+ */
+export function installmentUpdateOp(planId, week, fields, planUpdate = {}) {
+	const $set = { ...(planUpdate.$set || {}) };
+	for (const [key, value] of Object.entries(fields)) {
+		$set[`installments.$[inst].${key}`] = value;
+	}
+
+	return {
+		updateOne: {
+			filter: { _id: planId },
+			update: { ...planUpdate, $set },
+			arrayFilters: [{ 'inst.week': week }]
+		}
+	};
+}
+
+/**
+ * 변경 작업 일괄 실행 (updatedAt 갱신 포함)
+ *
+ * @param {Array} ops - 위 함수들이 반환한 bulkWrite 작업
+ * @returns {Promise<{ matched: number, modified: number }>}
+ */
+export async function applyPlanMutations(ops) {
+	if (ops.length === 0) {
+		return { matched: 0, modified: 0 };
+	}
+
+	const now = new Date();
+	for (const op of ops) {
+		const body = op.updateOne || op.updateMany;
+		body.update.$set = { ...(body.update.$set || {}), updatedAt: now };
+	}
+
+	const result = await WeeklyPaymentPlans.collection.bulkWrite(ops, { ordered: false });
+	return { matched: result.matchedCount, modified: result.modifiedCount };
+}
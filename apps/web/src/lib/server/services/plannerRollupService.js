@@ -0,0 +1,728 @@
+/**
+ * 설계사 지급 집계(Rollup) 서비스
+ *
+ * 역할:
+ * - WeeklyPaymentPlans(용역비) + PlannerCommissionPlan(수당)을 설계사별 월/주 단위로 사전 집계
+ * - 계획 변경 시 markPlannerRollupsStale({ userIds | plannerAccountIds })로 해당 설계사만 재집계
+ * - 조회 API는 ensurePlannerRollups() 후 PlannerCommissionRollup만 조회
+ * - 설계사 홈 요약(이번 주/지급 완료/지급 예정)은 PlannerPaymentSummary로 설계사당 1건 유지
+ *
+ * 재집계 범위 (상태는 Counter 컬렉션에 저장 → 여러 프로세스가 공유):
+ * - 설계사 단위: 변경된 설계사 표시(plannerRollupDirty:<id>) → 해당 설계사 계획만 재집계
+ * - 월 단위: 마지막 집계 이후 금요일(지급일)이 지난 경우 → 그 사이 월만 재집계 (지급 완료 금액 이월)
+ * - 전체: 최초 1회, 범위를 알 수 없는 변경(초기화, 월별 삭제, 매출 조정 등)
+ *
+ * 조회 시 대기:
+ * - 최초 집계, 변경된 설계사 재집계만 대기
+ * - 전체/월 단위 재집계는 백그라운드 실행 (기존 집계로 응답)
+ */
+
+import mongoose from 'mongoose';
+import WeeklyPaymentPlans from '../models/WeeklyPaymentPlans.js';
+import PlannerCommissionPlan from '../models/PlannerCommissionPlan.js';
+import PlannerCommissionRollup from '../models/PlannerCommissionRollup.js';
+import PlannerAccount from '../models/PlannerAccount.js';
+import PlannerPaymentSummary from '../models/PlannerPaymentSummary.js';
+import User from '../models/User.js';
+import Counter from '../models/Counter.js';
+import { getWeekOfMonthByFriday, getAllWeeksInPeriod } from '$lib/utils/fridayWeekCalculator.js';
+
+const REBUILD_DEBOUNCE_MS = 2000;
+
+// Counter 마커
+// - plannerRollups: 마지막 전체/월 단위 집계 시각(ms), 0 = 전체 재집계 필요, 없음 = 최초 집계 전
+// - plannerRollupDirty:<plannerAccountId>: 변경 표시 시각(ms)
+const ROLLUP_MARKER = 'plannerRollups';
+const DIRTY_PREFIX = 'plannerRollupDirty:';
+
+// 수당 지급명부 집계 대상 상태 (관리자 지급명부 기준)
+const PAYABLE_COMMISSION_STATUSES = ['paid', 'pending'];
+
+// 프로세스 내 실행 상태 (중복 실행 방지용)
+const state = {
+	running: null, // 진행 중인 재집계 Promise
+	runningGlobal: false, // 진행 중인 작업이 전체/월 단위 재집계인지
+	timer: null,
+	summaryWeekStart: null // 지급 요약 기준 주 (일요일)
+};
+
+/**
+ * 주차 키 생성 (YYYY-MM-WN, 금요일 기준)
+ */
+export function getWeekKey(year, month, week) {
+	return `${year}-${String(month).padStart(2, '0')}-W${week}`;
+}
+
+/**
+ * 조회 기간 키 목록 (정렬됨)
+ * - weekly: 금요일 기준 주차 키 (YYYY-MM-WN)
+ * - monthly: 월 키 (YYYY-MM)
+ *
+ * @param {'monthly'|'weekly'} viewMode
+ * @param {Object} range - paymentMonth(YYYY-MM) 또는 startYear/startMonth/endYear/endMonth
+ */
+export function getRollupPeriods(viewMode, { paymentMonth, startYear, startMonth, endYear, endMonth }) {
+	const periodsSet = new Set();
+
+	if (viewMode === 'weekly') {
+		let weeks = [];
+		if (paymentMonth) {
+			// 단일 월의 모든 주차
+			const [year, month] = paymentMonth.split('-').map(Number);
+			weeks = getAllWeeksInPeriod(year, month, year, month);
+		} else if (startYear && startMonth && endYear && endMonth) {
+			// 기간 내 모든 주차
+			weeks = getAllWeeksInPeriod(
+				parseInt(startYear),
+				parseInt(startMonth),
+				parseInt(endYear),
+				parseInt(endMonth)
+			);
+		}
+		weeks.forEach(({ year, month, week }) => periodsSet.add(getWeekKey(year, month, week)));
+	} else if (paymentMonth) {
+		periodsSet.add(paymentMonth);
+	} else if (startYear && startMonth && endYear && endMonth) {
+		const start = new Date(parseInt(startYear), parseInt(startMonth) - 1);
+		const end = new Date(parseInt(endYear), parseInt(endMonth) - 1);
+
+		for (let d = new Date(start); d <= end; d.setMonth(d.getMonth() + 1)) {
+			periodsSet.add(`${d.getFullYear()}-${String(d.getMonth() + 1).padStart(2, '0')}`);
+		}
+	}
+
+	return Array.from(periodsSet).sort();
+}
+
+/**
+ * 가장 최근 지난 금요일 00:00 (UTC)
+ */
+function getLastFriday(now = new Date()) {
+	const d = new Date(Date.UTC(now.getUTCFullYear(), now.getUTCMonth(), now.getUTCDate()));
+	const diff = (d.getUTCDay() - 5 + 7) % 7;
+	d.setUTCDate(d.getUTCDate() - diff);
+	return d;
+}
+
+/**
+ * 설계사 홈 기준 주 계산 (로컬 시간, 일요일 ~ 토요일)
+ * ⭐ 토요일만 "금요일 지급 완료"로 처리 → 다음 주 기준 (일요일은 새 주의 시작)
+ */
+export function getSummaryWeek(now = new Date()) {
+	const dayOfWeek = now.getDay();
+	const weekOffset = dayOfWeek === 6 ? 7 : 0;
+
+	const weekStart = new Date(now);
+	weekStart.setDate(now.getDate() - dayOfWeek + weekOffset);
+	weekStart.setHours(0, 0, 0, 0);
+
+	const weekEnd = new Date(weekStart);
+	weekEnd.setDate(weekStart.getDate() + 6);
+	weekEnd.setHours(23, 59, 59, 999);
+
+	const friday = new Date(weekStart);
+	friday.setDate(weekStart.getDate() + 5);
+
+	return { weekStart, weekEnd, friday };
+}
+
+/**
+ * 집계 버킷 가져오기 (없으면 생성)
+ */
+function getBucket(buckets, plannerId, periodType, period, periodStart) {
+	const key = `${periodType}|${period}|${plannerId}`;
+	if (!buckets.has(key)) {
+		buckets.set(key, {
+			plannerAccountId: plannerId,
+			periodType,
+			period,
+			periodStart,
+			serviceAmount: 0,
+			serviceTax: 0,
+			serviceNet: 0,
+			serviceInstallments: 0,
+			userIds: new Set(),
+			commissionAmount: 0,
+			commissionRevenue: 0,
+			commissionCount: 0,
+			commissionAmountAll: 0,
+			commissionRevenueAll: 0,
+			commissionCountAll: 0,
+			paidServiceAmount: 0,
+			paidCommissionAmount: 0
+		});
+	}
+	return buckets.get(key);
+}
+
+/**
+ * 지급일(YYYY-MM-DD) → 월/주 버킷 키
+ */
+function getPeriodKeys(dayKey) {
+	const day = new Date(`${dayKey}T00:00:00.000Z`);
+	const monthKey = dayKey.slice(0, 7);
+	const monthStart = new Date(`${monthKey}-01T00:00:00.000Z`);
+
+	const weekInfo = getWeekOfMonthByFriday(day);
+	const weekKey = weekInfo ? getWeekKey(weekInfo.year, weekInfo.month, weekInfo.week) : null;
+
+	return { day, monthKey, monthStart, weekKey };
+}
+
+/**
+ * 두 시각 사이의 월 키 목록 (UTC, YYYY-MM)
+ */
+function getMonthKeysBetween(from, to) {
+	const months = [];
+	const cursor = new Date(Date.UTC(from.getUTCFullYear(), from.getUTCMonth(), 1));
+	while (cursor <= to) {
+		months.push(`${cursor.getUTCFullYear()}-${String(cursor.getUTCMonth() + 1).padStart(2, '0')}`);
+		cursor.setUTCMonth(cursor.getUTCMonth() + 1);
+	}
+	return months;
+}
+
+function toObjectIds(ids) {
+	return ids.map((id) => new mongoose.Types.ObjectId(String(id)));
+}
+
+/**
+ * 설계사 지급 집계 재계산
+ * - 범위 미지정 시 전체, plannerIds/months 지정 시 해당 설계사/월만 재계산 후 교체
+ * - 집계 2회 (용역비 / 수당) + bulkWrite 1회
+ *
+ * @param {Object} scope
+ * @param {Array<string|ObjectId>|null} scope.plannerIds - 대상 설계사
+ * @param {Array<string>|null} scope.months - 대상 월 (YYYY-MM)
+ * @returns {Promise<{ rollups: number, planners: number }>}
+ */
+export async function recomputePlannerRollups({ plannerIds = null, months = null } = {}) {
+	const startedAt = new Date();
+	const plannerObjectIds = plannerIds ? toObjectIds(plannerIds) : null;
+	const monthSet = months ? new Set(months) : null;
+
+	if (plannerObjectIds?.length === 0 || monthSet?.size === 0) {
+		return { rollups: 0, planners: 0 };
+	}
+
+	// 주 집계(YYYY-MM-WN)는 금요일이 속한 월 기준 → 앞뒤 1주 여유를 두고 조회, 대상 월 버킷만 기록
+	let dateRange = null;
+	if (monthSet) {
+		const sorted = [...monthSet].sort();
+		const from = new Date(`${sorted[0]}-01T00:00:00.000Z`);
+		from.setUTCDate(from.getUTCDate() - 7);
+		const [lastYear, lastMonth] = sorted[sorted.length - 1].split('-').map(Number);
+		const to = new Date(Date.UTC(lastYear, lastMonth, 1));
+		to.setUTCDate(to.getUTCDate() + 7);
+		dateRange = { $gte: from, $lt: to };
+	}
+
+	// 1. 용역비: 설계사 × 지급일 단위 집계
+	const servicePipeline = [];
+	if (plannerObjectIds) {
+		const userIds = await User.distinct('_id', { plannerAccountId: { $in: plannerObjectIds } });
+		servicePipeline.push({ $match: { userId: { $in: userIds.map(String) } } });
+	}
+	if (dateRange) {
+		servicePipeline.push({ $match: { 'installments.scheduledDate': dateRange } });
+	}
+	servicePipeline.push(
+		{ $unwind: '$installments' },
+		{
+			$match: {
+				'installments.status': { $nin: ['skipped', 'terminated'] },
+				...(dateRange && { 'installments.scheduledDate': dateRange })
+			}
+		},
+		{
+			$group: {
+				_id: {
+					userId: '$userId',
+					day: { $dateToString: { format: '%Y-%m-%d', date: '$installments.scheduledDate' } }
+				},
+				amount: { $sum: '$installments.installmentAmount' },
+				tax: { $sum: '$installments.withholdingTax' },
+				net: { $sum: '$installments.netAmount' },
+				count: { $sum: 1 }
+			}
+		},
+		{ $addFields: { userObjectId: { $toObjectId: '$_id.userId' } } },
+		{
+			$lookup: {
+				from: 'users',
+				localField: 'userObjectId',
+				foreignField: '_id',
+				as: 'user'
+			}
+		},
+		{ $unwind: '$user' },
+		{ $match: { 'user.plannerAccountId': plannerObjectIds ? { $in: plannerObjectIds } : { $ne: null } } },
+		{
+			$group: {
+				_id: { plannerId: '$user.plannerAccountId', day: '$_id.day' },
+				amount: { $sum: '$amount' },
+				tax: { $sum: '$tax' },
+				net: { $sum: '$net' },
+				count: { $sum: '$count' },
+				userIds: { $addToSet: '$_id.userId' }
+			}
+		}
+	);
+	const serviceRows = await WeeklyPaymentPlans.aggregate(servicePipeline);
+
+	// 2. 수당: 설계사 × 지급일 단위 집계
+	// - commission*: paid/pending (관리자 지급명부)
+	// - commission*All: 전체 상태 (설계사 수당 요약)
+	const commissionMatch = {};
+	if (plannerObjectIds) commissionMatch.plannerAccountId = { $in: plannerObjectIds };
+	if (dateRange) commissionMatch.paymentDate = dateRange;
+
+	const isPayable = { $in: ['$paymentStatus', PAYABLE_COMMISSION_STATUSES] };
+	const commissionRows = await PlannerCommissionPlan.aggregate([
+		{ $match: commissionMatch },
+		{
+			$group: {
+				_id: {
+					plannerId: '$plannerAccountId',
+					day: { $dateToString: { format: '%Y-%m-%d', date: '$paymentDate' } }
+				},
+				amount: { $sum: { $cond: [isPayable, '$commissionAmount', 0] } },
+				revenue: { $sum: { $cond: [isPayable, '$revenue', 0] } },
+				count: { $sum: { $cond: [isPayable, 1, 0] } },
+				paidAmount: {
+					$sum: { $cond: [{ $eq: ['$paymentStatus', 'paid'] }, '$commissionAmount', 0] }
+				},
+				amountAll: { $sum: '$commissionAmount' },
+				revenueAll: { $sum: '$revenue' },
+				countAll: { $sum: 1 }
+			}
+		}
+	]);
+
+	// 3. 월/주 버킷으로 접기
+	const buckets = new Map();
+
+	for (const row of serviceRows) {
+		const plannerId = row._id.plannerId.toString();
+		const { day, monthKey, monthStart, weekKey } = getPeriodKeys(row._id.day);
+		// ⭐ 과거 날짜의 pending = 지급 완료로 간주 (checkPaymentStatus와 동일)
+		const paid = day < startedAt ? row.amount : 0;
+
+		const targets = [getBucket(buckets, plannerId, 'month', monthKey, monthStart)];
+		if (weekKey) targets.push(getBucket(buckets, plannerId, 'week', weekKey, day));
+
+		for (const bucket of targets) {
+			bucket.serviceAmount += row.amount;
+			bucket.serviceTax += row.tax;
+			bucket.serviceNet += row.net;
+			bucket.serviceInstallments += row.count;
+			bucket.paidServiceAmount += paid;
+			row.userIds.forEach((id) => bucket.userIds.add(id));
+		}
+	}
+
+	for (const row of commissionRows) {
+		const plannerId = row._id.plannerId.toString();
+		const { day, monthKey, monthStart, weekKey } = getPeriodKeys(row._id.day);
+		const paid = day < startedAt ? row.amount : row.paidAmount;
+
+		const targets = [getBucket(buckets, plannerId, 'month', monthKey, monthStart)];
+		if (weekKey) targets.push(getBucket(buckets, plannerId, 'week', weekKey, day));
+
+		for (const bucket of targets) {
+			bucket.commissionAmount += row.amount;
+			bucket.commissionRevenue += row.revenue;
+			bucket.commissionCount += row.count;
+			bucket.paidCommissionAmount += paid;
+			bucket.commissionAmountAll += row.amountAll;
+			bucket.commissionRevenueAll += row.revenueAll;
+			bucket.commissionCountAll += row.countAll;
+		}
+	}
+
+	// 월 범위 재계산: 여유 구간에서 만든 다른 월 버킷은 제외
+	const results = [...buckets.values()].filter(
+		(bucket) => !monthSet || monthSet.has(bucket.period.slice(0, 7))
+	);
+
+	// 4. 설계사 이름 (정렬/검색용)
+	const resultPlannerIds = [...new Set(results.map((b) => b.plannerAccountId))];
+	const planners = await PlannerAccount.find({ _id: { $in: resultPlannerIds } })
+		.select('name')
+		.lean();
+	const plannerNames = new Map(planners.map((p) => [p._id.toString(), p.name]));
+
+	// 5. upsert + 범위 내 이전 집계 삭제
+	const operations = results.map((bucket) => {
+		const { userIds, ...fields } = bucket;
+		return {
+			updateOne: {
+				filter: {
+					periodType: bucket.periodType,
+					period: bucket.period,
+					plannerAccountId: bucket.plannerAccountId
+				},
+				update: {
+					$set: {
+						...fields,
+						plannerName: plannerNames.get(bucket.plannerAccountId) || '',
+						userCount: userIds.size,
+						computedAt: startedAt
+					}
+				},
+				upsert: true
+			}
+		};
+	});
+
+	if (operations.length > 0) {
+		await PlannerCommissionRollup.bulkWrite(operations, { ordered: false });
+	}
+
+	const staleFilter = { computedAt: { $lt: startedAt } };
+	if (plannerObjectIds) {
+		staleFilter.plannerAccountId = { $in: plannerObjectIds };
+	}
+	if (monthSet) {
+		staleFilter.$or = [
+			{ periodType: 'month', period: { $in: [...monthSet] } },
+			{ periodType: 'week', period: { $regex: `^(${[...monthSet].join('|')})-W` } }
+		];
+	}
+	await PlannerCommissionRollup.deleteMany(staleFilter);
+
+	await rebuildPlannerPaymentSummaries(plannerObjectIds);
+
+	const scopeLabel = [
+		plannerObjectIds ? `설계사 ${plannerObjectIds.length}명` : '전체 설계사',
+		monthSet ? `${[...monthSet].join(', ')}` : '전체 기간'
+	].join(', ');
+	console.log(`[PlannerRollup] 재집계 완료: ${operations.length}건 (${scopeLabel})`);
+
+	return { rollups: operations.length, planners: resultPlannerIds.length };
+}
+
+/**
+ * 설계사 지급 집계 전체 재생성
+ */
+export async function rebuildPlannerRollups() {
+	return recomputePlannerRollups();
+}
+
+/**
+ * 설계사 지급 요약 재계산 (주 단위 집계 → 이번 주/지급 완료/지급 예정)
+ *
+ * @param {Array<ObjectId>|null} plannerIds - 대상 설계사 (없으면 전체)
+ */
+export async function rebuildPlannerPaymentSummaries(plannerIds = null) {
+	const computedAt = new Date();
+	const { weekStart, weekEnd, friday } = getSummaryWeek(computedAt);
+
+	const scopeFilter = plannerIds ? { plannerAccountId: { $in: plannerIds } } : {};
+	const rollups = await PlannerCommissionRollup.find({ ...scopeFilter, periodType: 'week' })
+		.select('plannerAccountId periodStart serviceAmount serviceTax serviceNet')
+		.lean();
+
+	const summaries = new Map();
+	for (const rollup of rollups) {
+		const key = rollup.plannerAccountId.toString();
+		if (!summaries.has(key)) {
+			summaries.set(key, {
+				thisWeek: { amount: 0, tax: 0, net: 0 },
+				totalPaid: { amount: 0, tax: 0, net: 0 },
+				upcoming: { amount: 0, tax: 0, net: 0 }
+			});
+		}
+
+		const summary = summaries.get(key);
+		const date = rollup.periodStart;
+		const bucket =
+			date < weekStart ? summary.totalPaid : date > weekEnd ? summary.upcoming : summary.thisWeek;
+
+		bucket.amount += rollup.serviceAmount || 0;
+		bucket.tax += rollup.serviceTax || 0;
+		bucket.net += rollup.serviceNet || 0;
+	}
+
+	const operations = [...summaries.entries()].map(([plannerAccountId, summary]) => ({
+		updateOne: {
+			filter: { plannerAccountId },
+			update: {
+				$set: { ...summary, weekStart, thisWeekFriday: friday, computedAt }
+			},
+			upsert: true
+		}
+	}));
+
+	if (operations.length > 0) {
+		await PlannerPaymentSummary.bulkWrite(operations, { ordered: false });
+	}
+	await PlannerPaymentSummary.deleteMany({ ...scopeFilter, computedAt: { $lt: computedAt } });
+
+	if (!plannerIds) {
+		state.summaryWeekStart = weekStart.getTime();
+	}
+	console.log(`[PlannerRollup] 지급 요약 재계산: 설계사 ${operations.length}명`);
+}
+
+/**
+ * 설계사 지급 요약 최신화
+ * - 집계 최신화 후, 기준 주가 바뀌었으면 이월 재계산 (주 단위 집계만 조회)
+ */
+export async function ensurePlannerPaymentSummaries() {
+	await ensurePlannerRollups();
+
+	const { weekStart } = getSummaryWeek();
+	if (state.summaryWeekStart !== weekStart.getTime()) {
+		const outdated = await PlannerPaymentSummary.exists({ weekStart: { $ne: weekStart } });
+		if (outdated) {
+			await rebuildPlannerPaymentSummaries();
+		}
+		state.summaryWeekStart = weekStart.getTime();
+	}
+}
+
+/**
+ * 변경 표시된 설계사 재집계
+ */
+async function processDirtyPlanners() {
+	const dirty = await Counter.find({ _id: { $regex: `^${DIRTY_PREFIX}` } }).lean();
+	if (dirty.length === 0) return;
+
+	const plannerIds = dirty.map((marker) => marker._id.slice(DIRTY_PREFIX.length));
+	await recomputePlannerRollups({ plannerIds });
+
+	// 재집계 중 다시 표시된 설계사는 남김 (표시 시각이 그대로인 것만 삭제)
+	await Counter.deleteMany({ $or: dirty.map((marker) => ({ _id: marker._id, value: marker.value })) });
+}
+
+/**
+ * 재집계 실행
+ * @param {boolean} includeGlobal - 전체/월 단위 재집계 포함 여부
+ */
+async function processPlannerRollups(includeGlobal) {
+	const marker = await Counter.findById(ROLLUP_MARKER).lean();
+
+	if (!marker || marker.value === 0) {
+		if (!includeGlobal) return;
+
+		const startedAt = Date.now();
+		await recomputePlannerRollups();
+		await Counter.updateOne({ _id: ROLLUP_MARKER }, { $set: { value: startedAt } }, { upsert: true });
+		// 전체 재집계 시작 전 표시된 설계사는 반영 완료
+		await Counter.deleteMany({ _id: { $regex: `^${DIRTY_PREFIX}` }, value: { $lte: startedAt } });
+		return;
+	}
+
+	await processDirtyPlanners();
+
+	if (includeGlobal && marker.value < getLastFriday().getTime()) {
+		// 금요일 이월: 마지막 집계 이후 지급일이 포함된 월만 재집계
+		const startedAt = Date.now();
+		await recomputePlannerRollups({ months: getMonthKeysBetween(new Date(marker.value), new Date(startedAt)) });
+		await Counter.updateOne({ _id: ROLLUP_MARKER, value: marker.value }, { $set: { value: startedAt } });
+	}
+}
+
+/**
+ * 재집계 실행 (프로세스 내 1개씩)
+ * - 전체/월 단위 재집계가 진행 중이면 조회는 기다리지 않음
+ */
+async function runRollupTask(includeGlobal) {
+	while (state.running) {
+		if (state.runningGlobal && !includeGlobal) return;
+		await state.running.catch(() => {});
+	}
+
+	state.runningGlobal = includeGlobal;
+	state.running = processPlannerRollups(includeGlobal).finally(() => {
+		state.running = null;
+		state.runningGlobal = false;
+	});
+	return state.running;
+}
+
+function scheduleRollupTask(delay) {
+	if (state.timer) {
+		clearTimeout(state.timer);
+	}
+	state.timer = setTimeout(() => {
+		state.timer = null;
+		runRollupTask(true).catch((error) => {
+			console.error('[PlannerRollup] 재집계 실패:', error);
+		});
+	}, delay);
+}
+
+/**
+ * 재집계 표시 (계획 변경 후 호출)
+ * - scope 지정 시 해당 설계사만, 미지정 시 전체 재집계
+ * - 표시는 DB에 저장 (다른 프로세스의 조회에도 반영), 재집계는 debounce 후 백그라운드 실행
+ *
+ * @param {Object|null} scope
+ * @param {Array<string|ObjectId>} scope.userIds - 변경된 용역자 (담당 설계사로 변환)
+ * @param {Array<string|ObjectId>} scope.plannerAccountIds - 변경된 설계사
+ * @returns {Promise<void>} 실패해도 reject하지 않음
+ */
+export async function markPlannerRollupsStale(scope = null) {
+	try {
+		if (!scope) {
+			// 최초 집계 전(마커 없음)이면 그대로 둠
+			await Counter.updateOne({ _id: ROLLUP_MARKER }, { $set: { value: 0 } });
+		} else {
+			const plannerIds = new Set((scope.plannerAccountIds || []).filter(Boolean).map(String));
+			if (scope.userIds?.length > 0) {
+				const userPlannerIds = await User.distinct('plannerAccountId', { _id: { $in: scope.userIds } });
+				userPlannerIds.filter(Boolean).forEach((id) => plannerIds.add(id.toString()));
+			}
+			if (plannerIds.size === 0) return;
+
+			const markedAt = Date.now();
+			await Counter.bulkWrite(
+				[...plannerIds].map((id) => ({
+					updateOne: {
+						filter: { _id: `${DIRTY_PREFIX}${id}` },
+						update: { $set: { value: markedAt } },
+						upsert: true
+					}
+				})),
+				{ ordered: false }
+			);
+		}
+		scheduleRollupTask(REBUILD_DEBOUNCE_MS);
+	} catch (error) {
+		console.error('[PlannerRollup] 재집계 표시 실패:', error);
+	}
+}
+
+/**
+ * 조회 전 집계 최신화
+ * - 최초 집계와 변경된 설계사 재집계만 기다림
+ * - 전체 재집계 요청/금요일 이월은 백그라운드로 예약 (기존 집계로 응답)
+ */
+export async function ensurePlannerRollups() {
+	const marker = await Counter.findById(ROLLUP_MARKER).lean();
+	if (!marker) {
+		await runRollupTask(true);
+		return;
+	}
+
+	await runRollupTask(false);
+
+	if (marker.value === 0 || marker.value < getLastFriday().getTime()) {
+		if (!state.running && !state.timer) {
+			scheduleRollupTask(0);
+		}
+	}
+}
+
+const EXPORT_BATCH_SIZE = 500;
+
+function escapeRegex(text) {
+	return text.replace(/[.*+?^${}()|[\]\\]/g, '\\$&');
+}
+
+/**
+ * 설계사 지급명부 스트리밍 내보내기
+ * - 설계사 커서를 배치 단위로 읽고, 배치별 집계(Rollup)만 조회하여 행 단위로 기록
+ * - 행 구성: 순번 / 설계사 / 연락처 / 은행 / 계좌번호 / 기간별(용역비, 수당, 합계) / 기간 합계
+ * - 집계가 없는 설계사는 제외 (목록 API와 동일)
+ *
+ * @param {Object} writer - createSheetWriter() 결과
+ * @param {Object} options
+ * @param {Array<string>} options.periods - getRollupPeriods() 결과
+ * @param {'monthly'|'weekly'} options.viewMode
+ * @param {string|null} options.searchType - name | grade
+ * @param {string|null} options.searchTerm
+ * @param {string} options.sortBy - name | createdAt (amount는 전체 합계가 필요하므로 name으로 대체)
+ * @returns {Promise<{ rowCount: number }>}
+ */
+export async function streamPlannerCommissionExport(writer, { periods, viewMode, searchType = null, searchTerm = null, sortBy = 'name' }) {
+	await ensurePlannerRollups();
+
+	const header = ['순번', '설계사', '연락처', '은행', '계좌번호'];
+	for (const period of periods) {
+		header.push(`${period} 용역비`, `${period} 수당`, `${period} 합계`);
+	}
+	header.push('기간 용역비', '기간 수당', '기간 합계');
+	await writer.addRow(header, { bold: true });
+
+	const plannerQuery = {};
+	if (searchType === 'name' && searchTerm) {
+		plannerQuery.name = { $regex: escapeRegex(searchTerm) };
+	}
+	if (searchType === 'grade' && searchTerm) {
+		// 해당 등급 용역자를 담당하는 설계사
+		plannerQuery._id = { $in: await User.distinct('plannerAccountId', { grade: searchTerm.toUpperCase() }) };
+	}
+
+	const cursor = PlannerAccount.find(plannerQuery)
+		.select('name phone bank accountNumber')
+		.sort(sortBy === 'createdAt' ? { createdAt: 1, _id: 1 } : { name: 1, _id: 1 })
+		.lean()
+		.cursor({ batchSize: EXPORT_BATCH_SIZE });
+
+	const periodTotals = periods.map(() => ({ service: 0, commission: 0 }));
+	let rowCount = 0;
+
+	const writeBatch = async (planners) => {
+		const rollups = await PlannerCommissionRollup.find({
+			periodType: viewMode === 'weekly' ? 'week' : 'month',
+			period: { $in: periods },
+			plannerAccountId: { $in: planners.map((p) => p._id) }
+		})
+			.select('plannerAccountId period serviceAmount commissionAmount')
+			.lean();
+		const rollupMap = new Map(rollups.map((r) => [`${r.plannerAccountId}_${r.period}`, r]));
+
+		for (const planner of planners) {
+			const row = [rowCount + 1, planner.name, planner.phone || '', planner.bank || '', planner.accountNumber || ''];
+			const total = { service: 0, commission: 0 };
+			let hasRollup = false;
+
+			periods.forEach((period, index) => {
+				const rollup = rollupMap.get(`${planner._id}_${period}`);
+				const service = rollup?.serviceAmount || 0;
+				const commission = rollup?.commissionAmount || 0;
+				if (rollup) hasRollup = true;
+
+				row.push(service, commission, service + commission);
+				total.service += service;
+				total.commission += commission;
+				periodTotals[index].service += service;
+				periodTotals[index].commission += commission;
+			});
+
+			if (!hasRollup) continue;
+
+			row.push(total.service, total.commission, total.service + total.commission);
+			await writer.addRow(row);
+			rowCount++;
+		}
+	};
+
+	let batch = [];
+	for await (const planner of cursor) {
+		batch.push(planner);
+		if (batch.length >= EXPORT_BATCH_SIZE) {
+			await writeBatch(batch);
+			batch = [];
+		}
+	}
+	if (batch.length > 0) {
+		await writeBatch(batch);
+	}
+
+	// 합계 행
+	const totalRow = ['합계', '', '', '', ''];
+	const grandTotal = { service: 0, commission: 0 };
+	for (const total of periodTotals) {
+		totalRow.push(total.service, total.commission, total.service + total.commission);
+		grandTotal.service += total.service;
+		grandTotal.commission += total.commission;
+	}
+	totalRow.push(grandTotal.service, grandTotal.commission, grandTotal.service + grandTotal.commission);
+	await writer.addRow(totalRow, { bold: true });
+
+	return { rowCount };
+}
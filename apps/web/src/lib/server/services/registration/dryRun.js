@@ -0,0 +1,241 @@
+/**
+ * Registration Dry-run: 월별 지급 계획 재처리 미리보기
+ *
+ * 역할:
+ * - reprocessMonthPayments(Step 3~4)와 동일한 규칙으로 해당 월 계획을 메모리에서 재구성
+ * - 현재 DB 계획과 비교하여 사용자별 총액 / 주차별 지급액 변화만 반환
+ * - ⚠️ DB 쓰기 없음 (monthlyReg도 저장하지 않음)
+ *
+ * 전제:
+ * - 등급(gradeHistory)은 Step 2 결과가 이미 반영된 현재 상태를 사용
+ *   (Step 2 등급 재계산은 User 문서를 직접 갱신하므로 미리보기 대상에서 제외)
+ */
+
+import User from '../../models/User.js';
+import MonthlyRegistrations from '../../models/MonthlyRegistrations.js';
+import WeeklyPaymentPlans from '../../models/WeeklyPaymentPlans.js';
+import { buildInitialPaymentPlan, buildPromotionPaymentPlan } from '../paymentPlanService.js';
+import { diffPlans } from '../planDiffService.js';
+import { resolvePaymentTargets } from './step3_paymentTargets.js';
+import { buildAdditionalPaymentPlan } from './step4_createPlans.js';
+
+/**
+ * 월별 지급 계획 재처리 미리보기
+ *
+ * @param {string} monthKey - 귀속월 (YYYY-MM)
+ * @returns {Promise<Object|null>} 등록 데이터가 없으면 null
+ */
+export async function previewRegistration(monthKey) {
+	const monthlyReg = await MonthlyRegistrations.findOne({ monthKey });
+	if (!monthlyReg || !monthlyReg.registrations?.length) {
+		return null;
+	}
+
+	const snapshot = monthlyReg.toObject();
+	const before = {
+		revenue: monthlyReg.getEffectiveRevenue(),
+		gradeDistribution: snapshot.gradeDistribution || {},
+		gradePayments: snapshot.gradePayments || {}
+	};
+
+	// 1. 이번 달 승급자 (gradeHistory 기반, Step 4-2와 동일)
+	const promotedUsers = await User.find({
+		gradeHistory: { $elemMatch: { type: 'promotion', revenueMonth: monthKey } }
+	}).lean();
+
+	const promoted = promotedUsers.map((u) => {
+		const histories = getPromotionHistories(u, monthKey);
+		return {
+			userId: u._id.toString(),
+			userName: u.name,
+			oldGrade: histories[0].fromGrade,
+			newGrade: histories[histories.length - 1].toGrade
+		};
+	});
+
+	// 2. 지급 대상자/등급별 지급액 (메모리에서만 갱신)
+	const targets = await resolvePaymentTargets(promoted, monthlyReg, monthKey, {
+		ignoreExistingPlans: true
+	});
+
+	// 3. 등록자 사용자 정보 일괄 조회
+	const registrantIds = monthlyReg.registrations.map((r) => r.userId);
+	const registrants = await User.find({ _id: { $in: registrantIds } }).lean();
+	const registrantMap = new Map(registrants.map((u) => [u._id.toString(), u]));
+
+	// 4. 영향받는 다른 월 계획 (승급자의 기존 계획 → 승급 시 부분 종료 대상)
+	const promotedIds = promoted.map((p) => p.userId);
+	const [currentPlans, otherPlans] = await Promise.all([
+		WeeklyPaymentPlans.find({ revenueMonth: monthKey }).lean(),
+		WeeklyPaymentPlans.find({
+			userId: { $in: promotedIds },
+			revenueMonth: { $ne: monthKey }
+		}).lean()
+	]);
+
+	// 재처리 시 이번 달에 의해 종료된 계획은 먼저 복원됨
+	const restoredPlans = otherPlans.map((plan) => restoreTerminatedPlan(plan, monthKey));
+	const plansByUser = new Map();
+	for (const plan of restoredPlans) {
+		getUserPlans(plansByUser, plan.userId).push(plan);
+	}
+
+	const newPlans = [];
+	const addPlan = (plan) => {
+		newPlans.push(plan);
+		getUserPlans(plansByUser, plan.userId).push(plan);
+	};
+	const addPromotionPlan = (plan) => {
+		const firstPayment = plan.installments[0]?.scheduledDate;
+		if (firstPayment) {
+			terminatePlansFromDate(getUserPlans(plansByUser, plan.userId), firstPayment);
+		}
+		addPlan(plan);
+	};
+
+	// 4-1. 이번 달 등록자
+	const processedPromotionIds = new Set();
+	for (const registration of monthlyReg.registrations) {
+		const user = registrantMap.get(registration.userId?.toString());
+		const registrationHistory = user?.gradeHistory?.find(
+			(h) => h.type === 'registration' && h.revenueMonth === monthKey
+		);
+		if (!registrationHistory) continue;
+
+		const promotionHistories = getPromotionHistories(user, monthKey);
+		if (promotionHistories.length > 0) {
+			addPlan(
+				await buildInitialPaymentPlan(
+					registration.userId,
+					registration.userName,
+					registrationHistory.toGrade,
+					registrationHistory.date || registration.registrationDate,
+					monthlyReg
+				)
+			);
+			for (const history of promotionHistories) {
+				addPromotionPlan(
+					await buildPromotionPaymentPlan(
+						registration.userId,
+						registration.userName,
+						history.toGrade,
+						history.date,
+						monthlyReg
+					)
+				);
+			}
+			processedPromotionIds.add(registration.userId?.toString());
+		} else {
+			addPlan(
+				await buildInitialPaymentPlan(
+					registration.userId,
+					registration.userName,
+					user.grade || 'F1',
+					registration.registrationDate,
+					monthlyReg
+				)
+			);
+		}
+	}
+
+	// 4-2. 기존 사용자 중 승급자
+	for (const user of promotedUsers) {
+		const userId = user._id.toString();
+		if (processedPromotionIds.has(userId)) continue;
+
+		for (const history of getPromotionHistories(user, monthKey)) {
+			addPromotionPlan(
+				await buildPromotionPaymentPlan(
+					userId,
+					user.name,
+					history.toGrade,
+					history.date || new Date(),
+					monthlyReg
+				)
+			);
+		}
+	}
+
+	// 4-3. 추가지급 대상자
+	for (const target of targets.additionalTargets) {
+		const plan = await buildAdditionalPaymentPlan(
+			target.userId,
+			target.userName,
+			target.grade,
+			target.추가지급단계,
+			monthKey,
+			targets.gradePayments,
+			{ excludeRevenueMonth: monthKey }
+		);
+		if (plan) addPlan(plan);
+	}
+
+	return {
+		monthKey,
+		before,
+		after: {
+			revenue: monthlyReg.getEffectiveRevenue(),
+			gradeDistribution: targets.gradeDistribution,
+			gradePayments: targets.gradePayments
+		},
+		targets: {
+			promoted: targets.promotedTargets.length,
+			registrants: targets.registrantF1Targets.length,
+			additional: targets.additionalTargets.length
+		},
+		diff: diffPlans([...currentPlans, ...otherPlans], [...newPlans, ...restoredPlans])
+	};
+}
+
+/**
+ * 이번 달 승급 기록 (발생 순)
+ */
+function getPromotionHistories(user, monthKey) {
+	return (user?.gradeHistory || []).filter(
+		(h) => h.type === 'promotion' && h.revenueMonth === monthKey
+	);
+}
+
+function getUserPlans(plansByUser, userId) {
+	const key = userId?.toString();
+	if (!plansByUser.has(key)) {
+		plansByUser.set(key, []);
+	}
+	return plansByUser.get(key);
+}
+
+/**
+ * 해당 월에 의해 종료된 계획 복원 (복사본, reprocessMonthPayments 4단계와 동일)
+ */
+function restoreTerminatedPlan(plan, monthKey) {
+	const restored = plan.planStatus === 'terminated' && plan.terminatedByRevenueMonth === monthKey;
+
+	return {
+		...plan,
+		planStatus: restored ? 'active' : plan.planStatus,
+		installments: (plan.installments || []).map((inst) => ({
+			...inst,
+			status: restored && inst.status === 'terminated' ? 'pending' : inst.status
+		}))
+	};
+}
+
+/**
+ * 승급 첫 지급일 이후 pending installment 종료 (메모리, terminateActivePlansFromDate와 동일)
+ */
+function terminatePlansFromDate(plans, firstPaymentDate) {
+	for (const plan of plans) {
+		if (plan.planStatus !== 'active') continue;
+
+		let terminated = false;
+		for (const inst of plan.installments) {
+			if (inst.status === 'pending' && new Date(inst.scheduledDate) >= firstPaymentDate) {
+				inst.status = 'terminated';
+				terminated = true;
+			}
+		}
+		if (terminated) {
+			plan.planStatus = 'terminated';
+		}
+	}
+}
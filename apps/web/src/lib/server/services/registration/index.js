@@ -15,3 +15,6 @@ export { executeStep4 } from './step4_createPlans.js';
 
 // Step 5: 주별/월별 총계 업데이트
 export { executeStep5 } from './step5_updateSummary.js';
+
+// Dry-run: 월별 지급 계획 재처리 미리보기 (DB 쓰기 없음)
+export { previewRegistration } from './dryRun.js';
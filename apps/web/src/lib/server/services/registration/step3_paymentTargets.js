@@ -26,6 +26,49 @@ import { GRADE_LIMITS, MAX_ADDITIONAL_PAYMENTS } from '../../utils/constants.js'
  * @returns {Promise<Object>}
  */
 export async function executeStep3(promoted, monthlyReg, registrationMonth) {
+	const { promotedTargets, registrantF1Targets, additionalTargets, gradeDistribution, gradePayments } =
+		await resolvePaymentTargets(promoted, monthlyReg, registrationMonth);
+
+	await monthlyReg.save();
+
+	// ========================================
+	// Step 3 결과 로그 출력
+	// ========================================
+	logStep3Result(registrationMonth, {
+		promotedTargets,
+		registrantF1Targets,
+		additionalTargets,
+		gradeDistribution,
+		gradePayments
+	});
+
+	return {
+		promotedTargets,
+		registrantF1Targets,
+		additionalTargets,
+		gradeDistribution,
+		gradePayments
+	};
+}
+
+/**
+ * 지급 대상자/등급별 지급액 산출 (DB 저장 없음)
+ * - monthlyReg의 paymentTargets/gradeDistribution/gradePayments는 메모리에서만 갱신
+ * - executeStep3 및 dry-run 미리보기에서 공통 사용
+ *
+ * @param {Array} promoted - 승급자 배열
+ * @param {Object} monthlyReg - MonthlyRegistrations 문서
+ * @param {string} registrationMonth - 귀속월 (YYYY-MM)
+ * @param {Object} options
+ * @param {boolean} options.ignoreExistingPlans - true면 이미 생성된 추가지급 계획도 대상으로 포함 (재처리 미리보기용)
+ * @returns {Promise<Object>}
+ */
+export async function resolvePaymentTargets(
+	promoted,
+	monthlyReg,
+	registrationMonth,
+	{ ignoreExistingPlans = false } = {}
+) {
 	// A. 승급자 (이번 달 전체 승급자 = 기존 + 신규)
 	// ⚠️ 이번 배치의 승급자를 기존 승급자 목록에 누적
 	const existingPromoted = monthlyReg.paymentTargets?.promoted || [];
@@ -65,7 +108,9 @@ export async function executeStep3(promoted, monthlyReg, registrationMonth) {
 		}));
 
 	// C. 추가지급 대상자
-	const additionalTargets = await findAdditionalPaymentTargets(promotedTargets, registrationMonth);
+	const additionalTargets = await findAdditionalPaymentTargets(promotedTargets, registrationMonth, {
+		ignoreExistingPlans
+	});
 
 	// 등급별 인원 집계
 	const gradeDistribution = {
@@ -135,11 +180,22 @@ export async function executeStep3(promoted, monthlyReg, registrationMonth) {
 	monthlyReg.gradeDistribution = gradeDistribution;
 	monthlyReg.gradePayments = gradePayments;
 
-	await monthlyReg.save();
+	return {
+		promotedTargets,
+		registrantF1Targets,
+		additionalTargets,
+		gradeDistribution,
+		gradePayments
+	};
+}
 
-	// ========================================
-	// Step 3 결과 로그 출력
-	// ========================================
+/**
+ * Step 3 결과 로그 출력
+ */
+function logStep3Result(
+	registrationMonth,
+	{ promotedTargets, registrantF1Targets, additionalTargets, gradeDistribution, gradePayments }
+) {
 	console.log(`\nSTEP3  [${registrationMonth} 지급 대상자 분류]`);
 	// A. 승급자
 	console.log(`  - 승급자: ${promotedTargets.length}명`);
@@ -170,14 +226,6 @@ export async function executeStep3(promoted, monthlyReg, registrationMonth) {
 		}
 	});
 	console.log('='.repeat(80));
-
-	return {
-		promotedTargets,
-		registrantF1Targets,
-		additionalTargets,
-		gradeDistribution,
-		gradePayments
-	};
 }
 
 /**
@@ -197,9 +245,15 @@ export async function executeStep3(promoted, monthlyReg, registrationMonth) {
  *
  * @param {Array} promoted - 이번 달 승급자 배열
  * @param {string} registrationMonth - 현재 귀속월 (YYYY-MM)
+ * @param {Object} options
+ * @param {boolean} options.ignoreExistingPlans - true면 중복 확인(이미 생성된 추가지급) 생략
  * @returns {Promise<Array>}
  */
-async function findAdditionalPaymentTargets(promoted, registrationMonth) {
+async function findAdditionalPaymentTargets(
+	promoted,
+	registrationMonth,
+	{ ignoreExistingPlans = false } = {}
+) {
 	const additionalTargets = [];
 
 	// 1. 현재 월 등록 데이터 조회 (등록자 제외용)
@@ -239,12 +293,14 @@ async function findAdditionalPaymentTargets(promoted, registrationMonth) {
 		// - 1개월 이상 & 최대 차수 이하 = 추가지급 대상
 		if (monthsInGrade > 0 && monthsInGrade <= maxMonths) {
 			// 중복 확인: 이번 달에 이미 이 등급으로 추가지급 생성됨?
-			const alreadyCreated = await WeeklyPaymentPlans.findOne({
-				userId: user._id,
-				baseGrade: user.grade,
-				revenueMonth: registrationMonth,
-				installmentType: 'additional'
-			});
+			const alreadyCreated = ignoreExistingPlans
+				? null
+				: await WeeklyPaymentPlans.findOne({
+						userId: user._id,
+						baseGrade: user.grade,
+						revenueMonth: registrationMonth,
+						installmentType: 'additional'
+					});
 
 			if (!alreadyCreated) {
 				additionalTargets.push({
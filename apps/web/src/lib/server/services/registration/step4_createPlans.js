@@ -14,7 +14,9 @@
 
 import User from '../../models/User.js';
 import WeeklyPaymentPlans from '../../models/WeeklyPaymentPlans.js';
-import { createInitialPaymentPlan, createPromotionPaymentPlan } from '../paymentPlanService.js';
+import MonthlyRegistrations from '../../models/MonthlyRegistrations.js';
+import { buildInitialPaymentPlan, buildPromotionPaymentPlan } from '../paymentPlanService.js';
+import { terminateFromDateOp, applyPlanMutations } from '../planMutationService.js';
 import { calculateNextFriday } from '../../utils/dateUtils.js';
 
 /**
@@ -39,6 +41,58 @@ export async function executeStep4(promoted, targets, gradePayments, monthlyReg,
   const promotionPlans = [];
   const additionalPlans = [];
 
+  // ⭐ v9.5: 관련 사용자/계획 일괄 조회 → 메모리에서 생성/종료 → insertMany + bulkWrite
+  // - 사용자: 이번 배치 등록자 + 이번 달 승급 기록 보유자 ($in 1회)
+  // - 계획: 위 사용자 + 추가지급 대상자의 모든 계획 ($in 1회)
+  // - 중복 체크/보험 승계/이전 계획 조회는 메모리 계획 목록 기준 (이번 단계에서 생성·종료된 계획 포함)
+  const registrationUserIds = monthlyReg.registrations.map(r => r.userId);
+  const users = await User.find({
+    $or: [
+      { _id: { $in: registrationUserIds } },
+      {
+        gradeHistory: {
+          $elemMatch: {
+            type: 'promotion',
+            revenueMonth: registrationMonth
+          }
+        }
+      }
+    ]
+  });
+  const userMap = new Map(users.map(u => [u._id.toString(), u]));
+
+  const planUserIds = new Set([
+    ...users.map(u => u._id.toString()),
+    ...additionalTargets.map(t => String(t.userId))
+  ]);
+  const existingPlans = await WeeklyPaymentPlans.find({
+    userId: { $in: [...planUserIds] }
+  }).lean();
+
+  const plansByUser = new Map();
+  const getUserPlans = (userId) => {
+    const key = String(userId);
+    if (!plansByUser.has(key)) {
+      plansByUser.set(key, []);
+    }
+    return plansByUser.get(key);
+  };
+  for (const plan of existingPlans) {
+    getUserPlans(plan.userId).push(plan);
+  }
+
+  const newPlanDocs = [];
+  const dirtyPlans = new Map();  // planId → { _id, fromDate, ... } (종료 처리된 계획)
+
+  // 신규 계획 등록 (저장은 마지막에 insertMany)
+  const addNewPlan = (planData) => {
+    const doc = new WeeklyPaymentPlans(planData);
+    newPlanDocs.push(doc);
+    const plan = doc.toObject();
+    getUserPlans(planData.userId).push(plan);
+    return plan;
+  };
+
   // 4-1. 이번 배치 등록자 계획 생성
 
   // ⭐ monthlyReg.registrations 사용 (users 파라미터 제거)
@@ -48,7 +102,8 @@ export async function executeStep4(promoted, targets, gradePayments, monthlyReg,
     const registrationDate = registration.registrationDate;
 
     // ⭐ v8.0 FIX: gradeHistory에서 이번 달(registrationMonth) 기록만 확인
-    const user = await User.findById(userId);
+    const user = userMap.get(String(userId));
+    const userPlans = getUserPlans(userId);
 
     // ⭐ 이번 달 등록 기록 확인
     const registrationHistory = user?.gradeHistory?.find(h =>
@@ -85,25 +140,23 @@ export async function executeStep4(promoted, targets, gradePayments, monthlyReg,
       console.log(`[Step4] ${userName}: 승급 ${promotionHistories.length}건 - ${promotionHistories.map(h => `${h.fromGrade}→${h.toGrade}`).join(', ')}`);
 
       // ⭐ v9.3: 이미 등록등급 Initial 계획이 있는지 확인 (중복 방지)
-      const existingInitialPlan = await WeeklyPaymentPlans.findOne({
-        userId: userId,
-        baseGrade: registrationGrade,
-        planType: 'initial',
-        revenueMonth: registrationMonth
-      });
+      const existingInitialPlan = userPlans.find(p =>
+        p.baseGrade === registrationGrade &&
+        p.planType === 'initial' &&
+        p.revenueMonth === registrationMonth
+      );
 
       // 1. 등록등급 Initial 계획 생성 (등록일 기준) - 없는 경우만
-      let initialPlan;
       if (existingInitialPlan) {
         console.log(`[Step4] ${userName}: ${registrationGrade} Initial 이미 존재 → 스킵`);
-        initialPlan = existingInitialPlan;
       } else {
-        initialPlan = await createInitialPaymentPlan(
+        const initialPlan = addNewPlan(await buildInitialPaymentPlan(
           userId,
           userName,
           registrationGrade,  // ⭐ v9.3: 등록 등급 (F1)
-          actualRegistrationDate  // 등록일 기준
-        );
+          actualRegistrationDate,  // 등록일 기준
+          getMonthlyRegFor(actualRegistrationDate, monthlyReg)
+        ));
         registrantPlans.push({
           userId,
           type: 'initial',
@@ -119,12 +172,11 @@ export async function executeStep4(promoted, targets, gradePayments, monthlyReg,
         const promDate = promHistory.date;
 
         // 이미 해당 등급 Promotion 계획이 있는지 확인 (중복 방지)
-        const existingPromotionPlan = await WeeklyPaymentPlans.findOne({
-          userId: userId,
-          baseGrade: promGrade,
-          planType: 'promotion',
-          revenueMonth: registrationMonth
-        });
+        const existingPromotionPlan = userPlans.find(p =>
+          p.baseGrade === promGrade &&
+          p.planType === 'promotion' &&
+          p.revenueMonth === registrationMonth
+        );
 
         if (existingPromotionPlan) {
           console.log(`[Step4] ${userName}: ${promGrade} Promotion 이미 존재 → 스킵`);
@@ -132,18 +184,19 @@ export async function executeStep4(promoted, targets, gradePayments, monthlyReg,
         }
 
         // Promotion 계획 생성 (승급일 기준)
-        const promotionPlan = await createPromotionPaymentPlan(
+        const promotionPlan = addNewPlan(await buildPromotionPaymentPlan(
           userId,
           userName,
           promGrade,  // 승급 등급
           promDate,   // 승급일 기준
-          monthlyReg
-        );
+          monthlyReg,
+          { user, plans: userPlans }
+        ));
 
         // 이전 플랜을 새 플랜 첫 지급일부터 terminate
         const newPlanFirstPayment = promotionPlan.installments[0]?.scheduledDate;
         if (newPlanFirstPayment) {
-          const terminatedCount = await terminateActivePlansFromDate(userId, newPlanFirstPayment, promotionPlan._id, registrationMonth);
+          const terminatedCount = terminateActivePlansFromDate(userPlans, userId, newPlanFirstPayment, promotionPlan._id, registrationMonth, dirtyPlans);
           if (terminatedCount > 0) {
             console.log(`[Step4] ${userName}: ${terminatedCount}개 기존 플랜 부분종료 (기준일: ${newPlanFirstPayment.toISOString().split('T')[0]})`);
           }
@@ -162,27 +215,26 @@ export async function executeStep4(promoted, targets, gradePayments, monthlyReg,
       // 미승급 경우: 현재 등급으로 Initial 계획 생성
 
       // ⭐ User 모델에서 실제 등급 확인
-      const user = await User.findById(userId);
       const currentGrade = user?.grade || 'F1';
 
       // ⭐ v8.0: 이미 해당 등급의 어떤 계획이든 있으면 스킵 (중복 방지)
       // - initial이든 promotion이든 해당 등급으로 플랜이 있으면 스킵
-      const existingPlan = await WeeklyPaymentPlans.findOne({
-        userId: userId,
-        baseGrade: currentGrade,
-        revenueMonth: registrationMonth
-      });
+      const existingPlan = userPlans.find(p =>
+        p.baseGrade === currentGrade &&
+        p.revenueMonth === registrationMonth
+      );
       if (existingPlan) {
         console.log(`[Step4] ${userName}: ${currentGrade} 계획 이미 존재 (${existingPlan.planType}, ${registrationMonth}) → 스킵`);
         continue;
       }
 
-      const initialPlan = await createInitialPaymentPlan(
+      const initialPlan = addNewPlan(await buildInitialPaymentPlan(
         userId,
         userName,
         currentGrade,  // ⭐ 실제 등급 사용
-        registrationDate
-      );
+        registrationDate,
+        getMonthlyRegFor(registrationDate, monthlyReg)
+      ));
       registrantPlans.push({
         userId,
         type: 'initial',
@@ -197,24 +249,19 @@ export async function executeStep4(promoted, targets, gradePayments, monthlyReg,
 
   // ⭐ v8.0 FIX: 4-1에서 실제로 승급 처리된 사용자 ID 수집
   // (이번 달 등록 + 승급이 동시에 일어난 경우만)
-  const processedPromotionIds = promotionPlans.map(p => p.userId?.toString());
+  const processedPromotionIds = new Set(promotionPlans.map(p => p.userId?.toString()));
 
   // ⭐ v8.0 FIX: promotedTargets 대신 gradeHistory에서 이번 달 승급자 직접 조회
-  // ⚠️ $elemMatch 사용: 같은 배열 요소에서 type과 revenueMonth가 모두 일치해야 함
-  const allUsers = await User.find({
-    gradeHistory: {
-      $elemMatch: {
-        type: 'promotion',
-        revenueMonth: registrationMonth
-      }
-    }
-  });
+  // ⭐ v9.5: 일괄 조회한 사용자 중 이번 달 승급 기록 보유자 (같은 기록에서 type과 revenueMonth 모두 일치)
+  const allUsers = users.filter(u =>
+    u.gradeHistory?.some(h => h.type === 'promotion' && h.revenueMonth === registrationMonth)
+  );
 
   // 이번 달 승급 기록이 있는 기존 사용자 (4-1에서 이미 처리된 승급자 제외)
   const existingPromoted = allUsers.filter(u => {
     const userIdStr = u._id.toString();
     // ⭐ v8.0 FIX: 4-1에서 이미 승급 플랜이 생성된 사용자만 제외
-    return !processedPromotionIds.includes(userIdStr);
+    return !processedPromotionIds.has(userIdStr);
   });
 
   console.log(`[Step4] 4-2 기존 승급자: ${existingPromoted.length}명`);
@@ -238,6 +285,8 @@ export async function executeStep4(promoted, targets, gradePayments, monthlyReg,
 
       console.log(`[기존 승급자] ${user.name}: 승급 ${promotionHistories.length}건 - ${promotionHistories.map(h => `${h.fromGrade}→${h.toGrade}`).join(', ')}`);
 
+      const userPlans = getUserPlans(user._id);
+
       // ⭐ v9.3: 모든 승급 기록에 대해 Promotion 계획 생성
       for (const promotionHistory of promotionHistories) {
         const prom = {
@@ -248,12 +297,11 @@ export async function executeStep4(promoted, targets, gradePayments, monthlyReg,
         };
 
         // ⭐ v8.0: 이미 해당 등급+월의 promotion 계획이 있으면 스킵 (중복 방지)
-        const existingPlan = await WeeklyPaymentPlans.findOne({
-          userId: prom.userId,
-          baseGrade: prom.grade,
-          revenueMonth: registrationMonth,
-          planType: 'promotion'
-        });
+        const existingPlan = userPlans.find(p =>
+          p.baseGrade === prom.grade &&
+          p.revenueMonth === registrationMonth &&
+          p.planType === 'promotion'
+        );
         if (existingPlan) {
           console.log(`[기존 승급자] ${prom.userName}: ${prom.grade} promotion 계획 이미 존재 (${registrationMonth}) → 스킵`);
           continue;
@@ -265,18 +313,19 @@ export async function executeStep4(promoted, targets, gradePayments, monthlyReg,
         console.log(`[기존 승급자] ${prom.userName}: ${prom.oldGrade}→${prom.grade} (승급일: ${promotionDate.toISOString().split('T')[0]})`);
 
         // ⭐ v8.0: 새 플랜 생성
-        const promotionPlan = await createPromotionPaymentPlan(
+        const promotionPlan = addNewPlan(await buildPromotionPaymentPlan(
           prom.userId,
           prom.userName,
           prom.grade,
           promotionDate,
-          monthlyReg
-        );
+          monthlyReg,
+          { user, plans: userPlans }
+        ));
 
         // ⭐ v8.0: 새 플랜의 첫 지급일 기준으로 기존 플랜 terminate
         const newPlanFirstPayment = promotionPlan.installments[0]?.scheduledDate;
         if (newPlanFirstPayment) {
-          const terminatedCount = await terminateActivePlansFromDate(prom.userId, newPlanFirstPayment, promotionPlan._id, registrationMonth);
+          const terminatedCount = terminateActivePlansFromDate(userPlans, prom.userId, newPlanFirstPayment, promotionPlan._id, registrationMonth, dirtyPlans);
           if (terminatedCount > 0) {
             console.log(`[Step4] ${prom.userName}: ${terminatedCount}개 기존 플랜 종료 (기준일: ${newPlanFirstPayment.toISOString().split('T')[0]})`);
           }
@@ -295,33 +344,48 @@ export async function executeStep4(promoted, targets, gradePayments, monthlyReg,
 
   // 4-3. 추가지급 대상자 계획 생성
 
-  if (additionalTargets.length > 0) {
-
-    for (const target of additionalTargets) {
-
-      const additionalPlan = await createAdditionalPaymentPlan(
+  for (const target of additionalTargets) {
+    let planData = null;
+    try {
+      console.log(`[createAdditionalPaymentPlan] ${target.userName} - grade:${target.grade}, 단계:${target.추가지급단계}, 매출월:${registrationMonth}`);
+      planData = await buildAdditionalPaymentPlan(
         target.userId,
         target.userName,
         target.grade,
         target.추가지급단계,  // ⭐ Step 3에서 계산된 값
         registrationMonth,
-        gradePayments
+        gradePayments,
+        { previousPlans: getUserPlans(target.userId) }
       );
+    } catch (error) {
+      console.error(`[createAdditionalPaymentPlan] ${target.userName} - 오류:`, error);
+    }
 
-      if (additionalPlan) {
-        additionalPlans.push({
-          userId: target.userId,
-          type: 'additional',
-          grade: target.grade,
-          추가지급단계: target.추가지급단계,
-          plan: additionalPlan._id
-        });
-      } else {
-      }
+    if (planData) {
+      const additionalPlan = addNewPlan(planData);
+      additionalPlans.push({
+        userId: target.userId,
+        type: 'additional',
+        grade: target.grade,
+        추가지급단계: target.추가지급단계,
+        plan: additionalPlan._id
+      });
     }
-  } else {
   }
 
+  // 4-4. 일괄 저장: 신규 계획 insertMany → 종료 처리 bulkWrite (신규 계획 종료 포함)
+  if (newPlanDocs.length > 0) {
+    await WeeklyPaymentPlans.insertMany(newPlanDocs);
+  }
+
+  // ⭐ v9.6: 종료는 installment 단위 arrayFilters 업데이트 (배열 전체 재저장 없음)
+  await applyPlanMutations(
+    [...dirtyPlans.values()].map(({ _id, fromDate, terminatedByRevenueMonth, terminatedAt }) =>
+      terminateFromDateOp({ _id }, fromDate, { terminatedByRevenueMonth, terminatedAt })
+    )
+  );
+
+  console.log(`[Step4] 저장 완료: 신규 계획 ${newPlanDocs.length}개, 종료 처리 ${dirtyPlans.size}개`);
 
   return {
     registrantPlans,
@@ -330,6 +394,13 @@ export async function executeStep4(promoted, targets, gradePayments, monthlyReg,
   };
 }
 
+/**
+ * 등록일이 이번 귀속월이면 Step 2에서 저장한 monthlyReg 재사용 (아니면 null → DB 조회)
+ */
+function getMonthlyRegFor(date, monthlyReg) {
+  return MonthlyRegistrations.generateMonthKey(date) === monthlyReg.monthKey ? monthlyReg : null;
+}
+
 /**
  * 추가지급 계획 생성
  *
@@ -345,114 +416,137 @@ export async function createAdditionalPaymentPlan(userId, userName, grade, 추
   try {
     console.log(`[createAdditionalPaymentPlan] ${userName} - grade:${grade}, 단계:${추가지급단계}, 매출월:${revenueMonth}`);
 
-    // 1. 지급액 계산 (10분할)
-    // ⭐ v8.0: ratio는 매출 계산 시 적용됨 (step2), 지급액에는 적용 안 함
-    const baseAmount = gradePayments[grade] || 0;
-    if (baseAmount === 0) {
-      console.log(`[createAdditionalPaymentPlan] ${userName} - baseAmount가 0이라 계획 생성 안 함`);
+    const planData = await buildAdditionalPaymentPlan(userId, userName, grade, 추가지급단계, revenueMonth, gradePayments);
+    if (!planData) {
       return null;
     }
 
-    const installmentAmount = Math.floor(baseAmount / 10 / 100) * 100;  // 100원 단위 절삭
-    const withholdingTax = Math.round(installmentAmount * 0.033);
-    const netAmount = installmentAmount - withholdingTax;
+    const newPlan = new WeeklyPaymentPlans(planData);
+    await newPlan.save();
 
+    console.log(`[createAdditionalPaymentPlan] ${userName} - 계획 생성 완료`);
+    return newPlan;
 
-    // 2. 이전 계획 조회 (v8.0: additionalPaymentBaseDate 참조용)
-    const previousPlans = await WeeklyPaymentPlans.find({
+  } catch (error) {
+    console.error(`[createAdditionalPaymentPlan] ${userName} - 오류:`, error);
+    return null;
+  }
+}
+
+/**
+ * 추가지급 계획 데이터 구성 (DB 저장 없음)
+ * - 이전 계획 조회만 수행, createAdditionalPaymentPlan 및 dry-run 미리보기에서 공통 사용
+ *
+ * @param {Object} options
+ * @param {string} options.excludeRevenueMonth - 이전 계획 조회 시 제외할 귀속월 (재처리 미리보기: 삭제될 월)
+ * @param {Array} options.previousPlans - 사용자의 계획 목록 (전달 시 DB 조회 생략)
+ * @returns {Promise<Object|null>} WeeklyPaymentPlans 생성용 plain object (지급액 0이면 null)
+ */
+export async function buildAdditionalPaymentPlan(userId, userName, grade, 추가지급단계, revenueMonth, gradePayments, options = {}) {
+  // 1. 지급액 계산 (10분할)
+  // ⭐ v8.0: ratio는 매출 계산 시 적용됨 (step2), 지급액에는 적용 안 함
+  const baseAmount = gradePayments[grade] || 0;
+  if (baseAmount === 0) {
+    console.log(`[createAdditionalPaymentPlan] ${userName} - baseAmount가 0이라 계획 생성 안 함`);
+    return null;
+  }
+
+  const installmentAmount = Math.floor(baseAmount / 10 / 100) * 100;  // 100원 단위 절삭
+  const withholdingTax = Math.round(installmentAmount * 0.033);
+  const netAmount = installmentAmount - withholdingTax;
+
+
+  // 2. 이전 계획 조회 (v8.0: additionalPaymentBaseDate 참조용)
+  // ⭐ v9.5: options.previousPlans가 전달되면 DB 조회 대신 메모리 목록 사용 (Step 4 일괄 처리)
+  const previousPlans = options.previousPlans
+    ? options.previousPlans
+      .filter(p => p.baseGrade === grade)
+      .sort((a, b) => (b.추가지급단계 || 0) - (a.추가지급단계 || 0))
+    : await WeeklyPaymentPlans.find({
       userId: userId,
-      baseGrade: grade
+      baseGrade: grade,
+      ...(options.excludeRevenueMonth && { revenueMonth: { $ne: options.excludeRevenueMonth } })
     }).sort({ 추가지급단계: -1 });
 
-    const latestPlan = previousPlans[0];
-
-    // 3. v8.0: 지급 시작일 계산
-    // - 추가1차 (단계=1): 등록/승급일 + 2개월 후 첫 금요일
-    // - 추가2차+ (단계>=2): 이전 추가지급 시작일 + 1개월 후 첫 금요일
-    let firstPaymentDate;
-    let additionalPaymentBaseDate;
-
-    if (추가지급단계 === 1) {
-      // 추가1차: 등록/승급일 + 2개월 후 첫 금요일
-      // ⭐ v8.0 마이그레이션: additionalPaymentBaseDate가 없으면 startDate에서 역계산
-      if (latestPlan?.additionalPaymentBaseDate) {
-        additionalPaymentBaseDate = latestPlan.additionalPaymentBaseDate;
-      } else if (latestPlan?.startDate) {
-        // startDate = baseDate + 1개월 → 첫 금요일
-        // 역계산: startDate에서 약 1개월 전으로 추정
-        const estimatedBaseDate = new Date(latestPlan.startDate);
-        estimatedBaseDate.setMonth(estimatedBaseDate.getMonth() - 1);
-        additionalPaymentBaseDate = estimatedBaseDate;
-        console.log(`[createAdditionalPaymentPlan] additionalPaymentBaseDate 역계산: startDate=${latestPlan.startDate.toISOString().split('T')[0]} → baseDate=${estimatedBaseDate.toISOString().split('T')[0]}`);
-      } else {
-        additionalPaymentBaseDate = new Date();
-        console.warn(`[createAdditionalPaymentPlan] ${userName} - 기준일 없음, 오늘 날짜 사용`);
-      }
-      const baseDate = new Date(additionalPaymentBaseDate);
-      baseDate.setMonth(baseDate.getMonth() + 2);
-      firstPaymentDate = WeeklyPaymentPlans.getNextFriday(baseDate);
-      console.log(`[createAdditionalPaymentPlan] 추가1차: 기준일=${new Date(additionalPaymentBaseDate).toISOString().split('T')[0]}, +2개월 후 시작=${firstPaymentDate.toISOString().split('T')[0]}`);
+  const latestPlan = previousPlans[0];
+
+  // 3. v8.0: 지급 시작일 계산
+  // - 추가1차 (단계=1): 등록/승급일 + 2개월 후 첫 금요일
+  // - 추가2차+ (단계>=2): 이전 추가지급 시작일 + 1개월 후 첫 금요일
+  let firstPaymentDate;
+  let additionalPaymentBaseDate;
+
+  if (추가지급단계 === 1) {
+    // 추가1차: 등록/승급일 + 2개월 후 첫 금요일
+    // ⭐ v8.0 마이그레이션: additionalPaymentBaseDate가 없으면 startDate에서 역계산
+    if (latestPlan?.additionalPaymentBaseDate) {
+      additionalPaymentBaseDate = latestPlan.additionalPaymentBaseDate;
+    } else if (latestPlan?.startDate) {
+      // startDate = baseDate + 1개월 → 첫 금요일
+      // 역계산: startDate에서 약 1개월 전으로 추정
+      const estimatedBaseDate = new Date(latestPlan.startDate);
+      estimatedBaseDate.setMonth(estimatedBaseDate.getMonth() - 1);
+      additionalPaymentBaseDate = estimatedBaseDate;
+      console.log(`[createAdditionalPaymentPlan] additionalPaymentBaseDate 역계산: startDate=${latestPlan.startDate.toISOString().split('T')[0]} → baseDate=${estimatedBaseDate.toISOString().split('T')[0]}`);
     } else {
-      // 추가2차+: 이전 추가지급 시작일 + 1개월 후 첫 금요일
-      additionalPaymentBaseDate = latestPlan?.startDate || new Date();
-      const baseDate = new Date(additionalPaymentBaseDate);
-      baseDate.setMonth(baseDate.getMonth() + 1);
-      firstPaymentDate = WeeklyPaymentPlans.getNextFriday(baseDate);
-      console.log(`[createAdditionalPaymentPlan] 추가${추가지급단계}차: 이전 시작일=${additionalPaymentBaseDate.toISOString().split('T')[0]}, +1개월 후 시작=${firstPaymentDate.toISOString().split('T')[0]}`);
+      additionalPaymentBaseDate = new Date();
+      console.warn(`[createAdditionalPaymentPlan] ${userName} - 기준일 없음, 오늘 날짜 사용`);
     }
+    const baseDate = new Date(additionalPaymentBaseDate);
+    baseDate.setMonth(baseDate.getMonth() + 2);
+    firstPaymentDate = WeeklyPaymentPlans.getNextFriday(baseDate);
+    console.log(`[createAdditionalPaymentPlan] 추가1차: 기준일=${new Date(additionalPaymentBaseDate).toISOString().split('T')[0]}, +2개월 후 시작=${firstPaymentDate.toISOString().split('T')[0]}`);
+  } else {
+    // 추가2차+: 이전 추가지급 시작일 + 1개월 후 첫 금요일
+    additionalPaymentBaseDate = latestPlan?.startDate || new Date();
+    const baseDate = new Date(additionalPaymentBaseDate);
+    baseDate.setMonth(baseDate.getMonth() + 1);
+    firstPaymentDate = WeeklyPaymentPlans.getNextFriday(baseDate);
+    console.log(`[createAdditionalPaymentPlan] 추가${추가지급단계}차: 이전 시작일=${additionalPaymentBaseDate.toISOString().split('T')[0]}, +1개월 후 시작=${firstPaymentDate.toISOString().split('T')[0]}`);
+  }
 
 
-    // 4. 10회 installments 생성
-    const installments = [];
-    for (let i = 0; i < 10; i++) {
-      const paymentDate = new Date(firstPaymentDate);
-      // ⭐ UTC 메소드 사용 (타임존 문제 방지)
-      paymentDate.setUTCDate(paymentDate.getUTCDate() + (i * 7));  // 매주 금요일
-
-      installments.push({
-        week: i + 1,
-        weekNumber: WeeklyPaymentPlans.getISOWeek(paymentDate),
-        scheduledDate: paymentDate,
-        revenueMonth: revenueMonth,
-        gradeAtPayment: null,
-        baseAmount: baseAmount,
-        installmentAmount: installmentAmount,
-        withholdingTax: withholdingTax,
-        netAmount: netAmount,
-        status: 'pending'
-      });
-    }
+  // 4. 10회 installments 생성
+  const installments = [];
+  for (let i = 0; i < 10; i++) {
+    const paymentDate = new Date(firstPaymentDate);
+    // ⭐ UTC 메소드 사용 (타임존 문제 방지)
+    paymentDate.setUTCDate(paymentDate.getUTCDate() + (i * 7));  // 매주 금요일
 
-    // 5. 계획 생성 (v8.0: additionalPaymentBaseDate 포함)
-    const newPlan = new WeeklyPaymentPlans({
-      userId: userId,
-      userName: userName,
-      planType: latestPlan?.planType || 'initial',  // 이전 계획 타입 유지
-      generation: (latestPlan?.generation || 0) + 1,
-      installmentType: 'additional',  // ⭐ 추가지급
-      추가지급단계: 추가지급단계,  // ⭐ Step 3에서 계산된 값 사용
-      baseGrade: grade,
+    installments.push({
+      week: i + 1,
+      weekNumber: WeeklyPaymentPlans.getISOWeek(paymentDate),
+      scheduledDate: paymentDate,
       revenueMonth: revenueMonth,
-      additionalPaymentBaseDate: additionalPaymentBaseDate,  // v8.0: 위에서 계산된 값 사용
-      startDate: firstPaymentDate,
-      totalInstallments: 10,
-      completedInstallments: 0,
-      planStatus: 'active',
-      installments: installments,
-      parentPlanId: latestPlan?._id || null,
-      createdBy: 'monthly_check',
-      createdAt: new Date()
+      gradeAtPayment: null,
+      baseAmount: baseAmount,
+      installmentAmount: installmentAmount,
+      withholdingTax: withholdingTax,
+      netAmount: netAmount,
+      status: 'pending'
     });
-
-    await newPlan.save();
-
-    console.log(`[createAdditionalPaymentPlan] ${userName} - 계획 생성 완료`);
-    return newPlan;
-
-  } catch (error) {
-    console.error(`[createAdditionalPaymentPlan] ${userName} - 오류:`, error);
-    return null;
   }
+
+  // 5. 계획 데이터 (v8.0: additionalPaymentBaseDate 포함)
+  return {
+    userId: userId,
+    userName: userName,
+    planType: latestPlan?.planType || 'initial',  // 이전 계획 타입 유지
+    generation: (latestPlan?.generation || 0) + 1,
+    installmentType: 'additional',  // ⭐ 추가지급
+    추가지급단계: 추가지급단계,  // ⭐ Step 3에서 계산된 값 사용
+    baseGrade: grade,
+    revenueMonth: revenueMonth,
+    additionalPaymentBaseDate: additionalPaymentBaseDate,  // v8.0: 위에서 계산된 값 사용
+    startDate: firstPaymentDate,
+    totalInstallments: 10,
+    completedInstallments: 0,
+    planStatus: 'active',
+    installments: installments,
+    parentPlanId: latestPlan?._id || null,
+    createdBy: 'monthly_check',
+    createdAt: new Date()
+  };
 }
 
 /**
@@ -534,91 +628,80 @@ async function terminateAdditionalPaymentPlans(userId, promotionDate) {
  * ⭐ v8.0: 특정 날짜부터 기존 플랜 부분 종료
  * - 새 플랜의 첫 지급일 기준으로 기존 플랜 terminate
  * - excludePlanId: 새로 생성된 플랜은 제외
+ * ⭐ v9.5: 메모리 계획 목록에 적용 후 dirtyPlans에 기록 (저장은 executeStep4에서 terminateFromDateOp로 일괄)
  *
+ * @param {Array} userPlans - 사용자의 계획 목록 (기존 + 이번 단계 신규)
  * @param {string} userId - 사용자 ID
  * @param {Date} firstPaymentDate - 새 플랜의 첫 지급일
  * @param {ObjectId} excludePlanId - 제외할 플랜 ID (새로 생성된 플랜)
  * @param {string} terminatedByRevenueMonth - 종료를 발생시킨 매출월 (재처리 시 복원 기준)
- * @returns {Promise<number>} 처리된 플랜 수
+ * @param {Map} dirtyPlans - planId → { _id, fromDate, terminatedByRevenueMonth, terminatedAt } (종료 계획 수집)
+ * @returns {number} 처리된 플랜 수
  */
-async function terminateActivePlansFromDate(userId, firstPaymentDate, excludePlanId, terminatedByRevenueMonth = null) {
-  try {
-    console.log(`[승급 처리] userId=${userId}: 첫 지급일=${firstPaymentDate.toISOString().split('T')[0]} 기준으로 기존 플랜 종료`);
+function terminateActivePlansFromDate(userPlans, userId, firstPaymentDate, excludePlanId, terminatedByRevenueMonth, dirtyPlans) {
+  console.log(`[승급 처리] userId=${userId}: 첫 지급일=${firstPaymentDate.toISOString().split('T')[0]} 기준으로 기존 플랜 종료`);
 
-    // 모든 active 플랜 조회 (새로 생성된 플랜 제외)
-    // ⭐ 승급 시 기본지급, 승급지급, 추가지급 모두 terminate
-    const plans = await WeeklyPaymentPlans.find({
-      userId: userId,
-      planStatus: 'active',
-      _id: { $ne: excludePlanId }
-    });
+  // 모든 active 플랜 (새로 생성된 플랜 제외)
+  // ⭐ 승급 시 기본지급, 승급지급, 추가지급 모두 terminate
+  const plans = userPlans.filter(p =>
+    p.planStatus === 'active' && p._id.toString() !== excludePlanId.toString()
+  );
 
-    if (plans.length === 0) {
-      return 0;
-    }
+  if (plans.length === 0) {
+    return 0;
+  }
 
-    console.log(`[승급 처리] userId=${userId}: ${plans.length}개 active 플랜 확인`);
+  console.log(`[승급 처리] userId=${userId}: ${plans.length}개 active 플랜 확인`);
 
-    let terminatedCount = 0;
+  let terminatedCount = 0;
 
-    for (const plan of plans) {
-      // ⭐ v8.0: 승급 첫 지급일 이후의 pending installments만 terminated로 변경
-      let hasRemainingPending = false;
-      let terminatedInstallments = 0;
+  for (const plan of plans) {
+    // ⭐ v8.0: 승급 첫 지급일 이후의 pending installments만 terminated로 변경
+    let hasRemainingPending = false;
+    let terminatedInstallments = 0;
 
-      for (const inst of plan.installments) {
-        if (inst.status === 'pending') {
-          const instDate = new Date(inst.scheduledDate);
-          if (instDate >= firstPaymentDate) {
-            // 승급 첫 지급일 이후 → terminated
-            inst.status = 'terminated';
-            inst.terminatedReason = 'promotion';
-            terminatedInstallments++;
-          } else {
-            // 승급 첫 지급일 이전 → 유지 (정상 지급)
-            hasRemainingPending = true;
-          }
+    for (const inst of plan.installments) {
+      if (inst.status === 'pending') {
+        const instDate = new Date(inst.scheduledDate);
+        if (instDate >= firstPaymentDate) {
+          // 승급 첫 지급일 이후 → terminated
+          inst.status = 'terminated';
+          inst.terminatedReason = 'promotion';
+          terminatedInstallments++;
+        } else {
+          // 승급 첫 지급일 이전 → 유지 (정상 지급)
+          hasRemainingPending = true;
         }
       }
+    }
 
-      // ⭐ v8.0 FIX: 승급으로 인해 terminated installment가 있으면 planStatus도 terminated
-      // 남은 pending은 정상 지급하되, 계획 자체는 종료 상태로 표시
-      let newPlanStatus = plan.planStatus;
-      if (terminatedInstallments > 0) {
-        newPlanStatus = 'terminated';
-      }
-
-      const updateFields = {
-        installments: plan.installments,
-        planStatus: newPlanStatus,
-        ...(newPlanStatus === 'terminated' && {
-          terminatedAt: new Date(),
-          terminationReason: 'promotion',
-          terminatedBy: 'promotion_additional_stop',
-          ...(terminatedByRevenueMonth && { terminatedByRevenueMonth })
-        })
-      };
-
-      await WeeklyPaymentPlans.updateOne(
-        { _id: plan._id },
-        { $set: updateFields },
-        { strict: false }
-      );
-
-      if (terminatedInstallments > 0) {
-        terminatedCount++;
-        const statusLabel = newPlanStatus === 'terminated' ? '종료' : '부분종료';
-        console.log(`  - [${statusLabel}] ${plan.planType} ${plan.baseGrade} (${plan.revenueMonth}): ${terminatedInstallments}개 installment terminated, 남은 pending: ${hasRemainingPending}, terminatedByRevenueMonth: ${terminatedByRevenueMonth || 'N/A'}`);
-      }
+    // ⭐ v8.0 FIX: 승급으로 인해 terminated installment가 있으면 planStatus도 terminated
+    // 남은 pending은 정상 지급하되, 계획 자체는 종료 상태로 표시
+    if (terminatedInstallments === 0) {
+      continue;
     }
 
-    console.log(`[승급 처리] userId=${userId}: ${terminatedCount}개 플랜 처리 완료`);
-    return terminatedCount;
+    const terminatedAt = new Date();
+    Object.assign(plan, {
+      planStatus: 'terminated',
+      terminatedAt,
+      terminationReason: 'promotion',
+      terminatedBy: 'promotion_additional_stop',
+      ...(terminatedByRevenueMonth && { terminatedByRevenueMonth })
+    });
+    dirtyPlans.set(plan._id.toString(), {
+      _id: plan._id,
+      fromDate: firstPaymentDate,
+      terminatedByRevenueMonth,
+      terminatedAt
+    });
 
-  } catch (error) {
-    console.error(`[terminateActivePlansFromDate] ${userId} 오류:`, error);
-    return 0;
+    terminatedCount++;
+    console.log(`  - [종료] ${plan.planType} ${plan.baseGrade} (${plan.revenueMonth}): ${terminatedInstallments}개 installment terminated, 남은 pending: ${hasRemainingPending}, terminatedByRevenueMonth: ${terminatedByRevenueMonth || 'N/A'}`);
   }
+
+  console.log(`[승급 처리] userId=${userId}: ${terminatedCount}개 플랜 처리 완료`);
+  return terminatedCount;
 }
 
 
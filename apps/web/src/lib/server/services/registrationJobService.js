@@ -0,0 +1,355 @@
+/**
+ * 용역자 일괄 등록 작업 큐 서비스
+ *
+ * 역할:
+ * - 엑셀 업로드 데이터를 RegistrationJob(queued)으로 저장하고 즉시 반환
+ * - 프로세스 내 워커가 등록순(queuedAt)으로 1건씩 꺼내 registerUsers 실행
+ * - 단계별 진행 상황(검증 → 생성 → 트리 → 배치)을 작업 문서에 기록 (상태 조회 API에서 폴링)
+ *
+ * 동시 실행 제한:
+ * - running 상태는 부분 unique 인덱스로 전체 1건만 허용 (여러 프로세스에서도 보장)
+ * - 선점 실패(E11000) 시 잠시 후 다시 시도
+ *
+ * 중단 작업 처리:
+ * - 실행 중 워커는 heartbeatAt을 주기적으로 갱신
+ * - 생존 신호가 끊긴 running 작업은 failed로 전환 (서버 재시작 등)
+ * - queued 작업은 보존되며 다음 조회/등록 시 워커가 이어서 처리
+ */
+
+import os from 'os';
+import mongoose from 'mongoose';
+import RegistrationJob from '../models/RegistrationJob.js';
+import { registerUsers } from './userRegistrationService.js';
+
+export const REGISTRATION_STEPS = [
+	{ name: 'validate', label: '사전 검증' },
+	{ name: 'create', label: '사용자 생성' },
+	{ name: 'tree', label: '트리 재구성' },
+	{ name: 'batch', label: '등급/지급 계획 처리' }
+];
+
+const WORKER_ID = `${os.hostname()}:${process.pid}`;
+const HEARTBEAT_INTERVAL_MS = 15 * 1000;
+const STALE_AFTER_MS = 2 * 60 * 1000;
+const CLAIM_RETRY_MS = 5 * 1000;
+const WAIT_POLL_MS = 500;
+
+let workerActive = false;
+let retryTimer = null;
+
+/**
+ * 생존 신호가 끊긴 running 작업을 실패 처리
+ */
+async function failStaleJobs() {
+	const staleBefore = new Date(Date.now() - STALE_AFTER_MS);
+	const now = new Date();
+
+	const result = await RegistrationJob.updateMany(
+		{
+			status: 'running',
+			$or: [{ heartbeatAt: { $lt: staleBefore } }, { heartbeatAt: { $exists: false } }]
+		},
+		{
+			$set: {
+				status: 'failed',
+				finishedAt: now,
+				'error.message': '작업이 중단되었습니다. (서버 재시작 또는 응답 없음)'
+			},
+			$unset: { users: 1 }
+		}
+	);
+
+	if (result.modifiedCount > 0) {
+		console.warn(`⚠️ [등록 작업] 중단된 작업 ${result.modifiedCount}건 실패 처리`);
+	}
+}
+
+/**
+ * 대기 작업 1건 선점 (running 작업이 이미 있으면 null)
+ */
+async function claimNextJob() {
+	const now = new Date();
+
+	try {
+		return await RegistrationJob.findOneAndUpdate(
+			{ status: 'queued' },
+			{
+				$set: {
+					status: 'running',
+					startedAt: now,
+					heartbeatAt: now,
+					workerId: WORKER_ID,
+					steps: REGISTRATION_STEPS.map((step) => ({ ...step, status: 'pending' }))
+				}
+			},
+			{ sort: { queuedAt: 1 }, new: true }
+		);
+	} catch (error) {
+		if (error.code === 11000) {
+			return null;
+		}
+		throw error;
+	}
+}
+
+/**
+ * 응답/저장용 결과 요약 (지급 계획 배열 등 대용량 필드 제외)
+ */
+function summarizeResult(results) {
+	const batch = results.batchProcessing;
+
+	return {
+		created: results.created,
+		failed: results.failed,
+		errors: results.errors,
+		alerts: results.alerts,
+		treeStructure: results.treeStructure,
+		batchProcessing: batch
+			? {
+					revenue: batch.revenue,
+					scheduleCount: batch.schedules?.length || 0,
+					planCount: batch.plans?.length || 0
+				}
+			: null
+	};
+}
+
+/**
+ * 작업 1건 실행
+ */
+async function runJob(job) {
+	const jobId = job._id;
+	const startedAt = job.startedAt;
+	let activeStep = null;
+	let activeStepStartedAt = null;
+
+	const heartbeat = setInterval(() => {
+		RegistrationJob.updateOne({ _id: jobId }, { $set: { heartbeatAt: new Date() } }).catch((error) =>
+			console.error('[등록 작업] heartbeat 실패:', error.message)
+		);
+	}, HEARTBEAT_INTERVAL_MS);
+
+	// 이전 단계 종료 기록
+	const closeActiveStep = (set, status) => {
+		if (!activeStep) return;
+		const index = REGISTRATION_STEPS.findIndex((step) => step.name === activeStep);
+		const now = new Date();
+		set[`steps.${index}.status`] = status;
+		set[`steps.${index}.finishedAt`] = now;
+		set[`steps.${index}.durationMs`] = now - activeStepStartedAt;
+	};
+
+	const onProgress = async ({ step, current, total, message }) => {
+		const now = new Date();
+		const set = {
+			currentStep: step,
+			progress: { current, total, message },
+			heartbeatAt: now
+		};
+
+		if (step !== activeStep) {
+			closeActiveStep(set, 'completed');
+			const index = REGISTRATION_STEPS.findIndex((s) => s.name === step);
+			if (index >= 0) {
+				set[`steps.${index}.status`] = 'running';
+				set[`steps.${index}.startedAt`] = now;
+			}
+			activeStep = index >= 0 ? step : null;
+			activeStepStartedAt = now;
+		}
+
+		await RegistrationJob.updateOne({ _id: jobId }, { $set: set });
+	};
+
+	console.log(`🚀 [등록 작업] 시작: ${job.fileName || jobId} (${job.userCount}명)`);
+
+	try {
+		const results = await registerUsers(job.users, {
+			source: job.source,
+			admin: { id: job.requestedBy?.userId, name: job.requestedBy?.userName },
+			fileName: job.fileName,
+			onProgress
+		});
+
+		const finishedAt = new Date();
+		const set = {
+			status: 'completed',
+			currentStep: null,
+			result: summarizeResult(results),
+			finishedAt,
+			durationMs: finishedAt - startedAt,
+			'progress.current': results.created,
+			'progress.total': job.userCount,
+			'progress.message': `${results.created}명 등록 완료, ${results.failed}명 실패`
+		};
+		closeActiveStep(set, 'completed');
+
+		await RegistrationJob.updateOne({ _id: jobId }, { $set: set, $unset: { users: 1 } });
+		console.log(`✅ [등록 작업] 완료: ${job.fileName || jobId} (${set.durationMs}ms)`);
+	} catch (error) {
+		const finishedAt = new Date();
+		const set = {
+			status: 'failed',
+			finishedAt,
+			durationMs: finishedAt - startedAt,
+			'error.message': error.message,
+			'error.details': error.details || null
+		};
+		closeActiveStep(set, 'failed');
+
+		await RegistrationJob.updateOne({ _id: jobId }, { $set: set, $unset: { users: 1 } });
+		console.error(`❌ [등록 작업] 실패: ${job.fileName || jobId}`, error.message);
+	} finally {
+		clearInterval(heartbeat);
+	}
+}
+
+/**
+ * 대기 작업을 순서대로 처리 (프로세스당 워커 1개)
+ */
+async function processQueue() {
+	if (workerActive) return;
+	workerActive = true;
+
+	try {
+		await failStaleJobs();
+
+		while (true) {
+			const job = await claimNextJob();
+			if (!job) break;
+			await runJob(job);
+		}
+
+		// 다른 프로세스가 실행 중이라 선점하지 못한 대기 작업이 남아 있으면 재시도
+		if (!retryTimer && (await RegistrationJob.exists({ status: 'queued' }))) {
+			retryTimer = setTimeout(() => {
+				retryTimer = null;
+				startRegistrationWorker();
+			}, CLAIM_RETRY_MS);
+		}
+	} finally {
+		workerActive = false;
+	}
+}
+
+/**
+ * 워커 실행 (비동기, 호출자는 기다리지 않음)
+ */
+export function startRegistrationWorker() {
+	processQueue().catch((error) => {
+		console.error('[등록 작업] 워커 오류:', error);
+	});
+}
+
+/**
+ * 등록 작업 생성
+ *
+ * @param {Array} users - 정렬된 등록 데이터
+ * @param {Object} options - { source, fileName, admin }
+ * @returns {Promise<Object>} 생성된 작업 (users 제외)
+ */
+export async function enqueueRegistrationJob(users, { source = 'bulk', fileName, admin } = {}) {
+	const job = await RegistrationJob.create({
+		status: 'queued',
+		source,
+		fileName,
+		userCount: users.length,
+		users,
+		requestedBy: {
+			userId: admin?.id,
+			userName: admin?.name || admin?.loginId
+		},
+		steps: REGISTRATION_STEPS.map((step) => ({ ...step, status: 'pending' })),
+		progress: { current: 0, total: users.length, message: '대기 중' },
+		queuedAt: new Date()
+	});
+
+	startRegistrationWorker();
+
+	const { users: _users, ...rest } = job.toObject();
+	return rest;
+}
+
+/**
+ * 작업 상태 조회
+ * - queued: 앞선 대기 작업 수(queuePosition) 포함
+ * - 처리 중인 워커가 없으면 워커 재개 (서버 재시작 후 대기 작업 처리)
+ *
+ * @returns {Promise<Object|null>}
+ */
+export async function getRegistrationJob(jobId) {
+	const job = await RegistrationJob.findById(jobId).select('-users').lean();
+	if (!job) return null;
+
+	if (job.status === 'queued') {
+		job.queuePosition = await RegistrationJob.countDocuments({
+			status: 'queued',
+			queuedAt: { $lt: job.queuedAt }
+		});
+		startRegistrationWorker();
+	} else if (job.status === 'running') {
+		startRegistrationWorker();
+	}
+
+	return job;
+}
+
+/**
+ * 작업 완료/실패까지 대기 (동기 응답 모드, ?wait=1)
+ * - 테스트/운영 스크립트가 월별 업로드를 순서대로 실행할 때 사용
+ *
+ * @param {string} jobId
+ * @param {Object} options
+ * @param {number} options.timeoutMs - 최대 대기 시간 (초과 시 마지막 상태 반환)
+ * @returns {Promise<Object|null>}
+ */
+export async function waitForRegistrationJob(jobId, { timeoutMs = 30 * 60 * 1000 } = {}) {
+	const deadline = Date.now() + timeoutMs;
+
+	while (true) {
+		const job = await getRegistrationJob(jobId);
+		if (!job || job.status === 'completed' || job.status === 'failed' || Date.now() >= deadline) {
+			return job;
+		}
+		await new Promise((resolve) => setTimeout(resolve, WAIT_POLL_MS));
+	}
+}
+
+/**
+ * 최근 작업 목록
+ */
+export async function listRegistrationJobs({ status = null, limit = 20 } = {}) {
+	const query = status ? { status } : {};
+	return RegistrationJob.find(query)
+		.select('-users -result.errors -result.alerts')
+		.sort({ createdAt: -1 })
+		.limit(limit)
+		.lean();
+}
+
+/**
+ * 작업들의 대기/처리 시간 합계 (업로드 히스토리 기록용)
+ *
+ * @param {Array<string>} jobIds
+ * @returns {Promise<{ jobIds: Array, queuedMs: number, durationMs: number }>}
+ */
+export async function getRegistrationJobDurations(jobIds = []) {
+	// 형식이 잘못된 id는 제외 (CastError 방지)
+	const validIds = jobIds.filter((id) => mongoose.Types.ObjectId.isValid(id));
+	if (validIds.length === 0) {
+		return { jobIds: [], queuedMs: 0, durationMs: 0 };
+	}
+
+	const jobs = await RegistrationJob.find({ _id: { $in: validIds } })
+		.select('queuedAt startedAt durationMs')
+		.lean();
+
+	return {
+		jobIds: jobs.map((job) => job._id),
+		queuedMs: jobs.reduce(
+			(sum, job) => sum + (job.startedAt && job.queuedAt ? job.startedAt - job.queuedAt : 0),
+			0
+		),
+		durationMs: jobs.reduce((sum, job) => sum + (job.durationMs || 0), 0)
+	};
+}
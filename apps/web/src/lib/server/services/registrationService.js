@@ -16,6 +16,8 @@
 
 import User from '../models/User.js';
 import { excelLogger as logger } from '../logger.js';
+import { markPlannerRollupsStale } from './plannerRollupService.js';
+import { refreshGradeInfoSnapshot } from './gradeInfoSnapshotService.js';
 
 // Step 모듈 import
 import {
@@ -29,9 +31,15 @@ import {
  * 용역자 등록 시 전체 프로세스 처리 (v7.0 모듈화)
  *
  * @param {Array} userIds - 등록할 사용자 ID 배열 (MongoDB ObjectId)
+ * @param {Object} options
+ * @param {Function} options.onStep - ⭐ v9.7: 단계 시작 알림 (stepName) => void (등록 작업 진행률)
  * @returns {Promise<Object>} 처리 결과
  */
-export async function processUserRegistration(userIds) {
+export async function processUserRegistration(userIds, { onStep } = {}) {
+  const reportStep = async (stepName) => {
+    if (onStep) await onStep(stepName);
+  };
+
   try {
     // ========================================
     // Step 1: 사용자 정보 조회
@@ -45,12 +53,14 @@ export async function processUserRegistration(userIds) {
     // ========================================
     // Step 2: 등급 재계산 및 월별 인원 관리 ⭐ 핵심
     // ========================================
+    await reportStep('step2');
     const step2Result = await executeStep2(users);
     const { promoted, monthlyReg, registrationMonth } = step2Result;
 
     // ========================================
     // Step 3: 지급 대상자 확정 및 등급별 인원 구성
     // ========================================
+    await reportStep('step3');
     const step3Result = await executeStep3(promoted, monthlyReg, registrationMonth);
     const {
       promotedTargets,
@@ -63,6 +73,7 @@ export async function processUserRegistration(userIds) {
     // ========================================
     // Step 4: 지급 계획 생성 (3가지 유형) + paymentTargets 저장
     // ========================================
+    await reportStep('step4');
     const step4Result = await executeStep4(
       promoted,
       { promotedTargets, registrantF1Targets, additionalTargets },
@@ -75,6 +86,7 @@ export async function processUserRegistration(userIds) {
     // ========================================
     // Step 5: 주별/월별 총계 업데이트
     // ========================================
+    await reportStep('step5');
     const step5Result = await executeStep5(
       { registrantPlans, promotionPlans, additionalPlans },
       registrationMonth
@@ -90,6 +102,13 @@ export async function processUserRegistration(userIds) {
       ...additionalPlans
     ];
 
+    // 설계사 지급 집계 재생성 예약 (등록자 수당 + 계획이 생성/종료된 용역자의 설계사)
+    await markPlannerRollupsStale({
+      userIds: [...new Set([...users.map(u => u._id.toString()), ...allPlans.map(p => String(p.userId))])]
+    });
+
+    // ⭐ v9.7: 등급별 지급 정보 스냅샷 갱신 (월 등록 처리 완료 시점)
+    await refreshGradeInfoSnapshot(registrationMonth);
 
     return {
       success: true,
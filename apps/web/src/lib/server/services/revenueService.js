@@ -1,12 +1,16 @@
 /**
  * 매출 관리 서비스 (v7.1)
  * - 월별 매출 수동 조정
- * - 지급 계획 재생성
+ * - 지급 계획 금액 갱신 (매출 조정 반영)
  * - 지급 상태 확인
  */
 
 import MonthlyRegistrations from '../models/MonthlyRegistrations.js';
 import WeeklyPaymentPlans from '../models/WeeklyPaymentPlans.js';
+import { diffPlans } from './planDiffService.js';
+import { refreshGradeInfoSnapshot } from './gradeInfoSnapshotService.js';
+import { setInstallmentAmountsOp, applyPlanMutations } from './planMutationService.js';
+import { markPlannerRollupsStale } from './plannerRollupService.js';
 
 /**
  * 등급별 누적 지급액 계산 (paymentPlanService.js와 동일)
@@ -48,34 +52,6 @@ function calculateGradePayments(totalRevenue, gradeDistribution) {
   return payments;
 }
 
-/**
- * 금요일 시작 날짜 계산
- */
-function startOfWeek(date) {
-  const d = new Date(date);
-  const day = d.getDay();
-  const diff = d.getDate() - day + (day === 0 ? -6 : 1); // Monday
-  const monday = new Date(d.setDate(diff));
-  monday.setHours(0, 0, 0, 0);
-
-  // 금요일 찾기 (월요일 + 4일)
-  const friday = new Date(monday);
-  friday.setDate(monday.getDate() + 4);
-  return friday;
-}
-
-/**
- * 주차 번호 계산 (ISO week number)
- */
-function getWeekNumber(date) {
-  const d = new Date(Date.UTC(date.getFullYear(), date.getMonth(), date.getDate()));
-  const dayNum = d.getUTCDay() || 7;
-  d.setUTCDate(d.getUTCDate() + 4 - dayNum);
-  const yearStart = new Date(Date.UTC(d.getUTCFullYear(), 0, 1));
-  const weekNo = Math.ceil((((d - yearStart) / 86400000) + 1) / 7);
-  return parseInt(`${d.getUTCFullYear()}${String(weekNo).padStart(2, '0')}`);
-}
-
 /**
  * 지급 상태 확인
  * @param {string} monthKey - 월 키 (YYYY-MM)
@@ -115,20 +91,57 @@ export async function checkPaymentStatus(monthKey) {
 }
 
 /**
- * 지급 계획 재생성
+ * 등급별 지급 총액 (매출 기준 계산 → 조정값 우선)
+ * ⭐ v9.7: 미리보기와 실제 반영이 같은 금액을 쓰도록 공통화
+ */
+function resolveGradePayments(monthlyReg, revenue, adjustedGradePayments = null) {
+  const gradePayments = calculateGradePayments(revenue, monthlyReg.gradeDistribution || {});
+  const adjustments = adjustedGradePayments || monthlyReg.toObject().adjustedGradePayments || {};
+  for (const [grade, adjustment] of Object.entries(adjustments)) {
+    if (adjustment && adjustment.totalAmount !== null && adjustment.totalAmount !== undefined) {
+      gradePayments[grade] = adjustment.totalAmount;
+    }
+  }
+  return gradePayments;
+}
+
+/**
+ * 등급 총액 → 회차 금액 (10회 분할, 100원 단위 절삭, 원천징수 3.3%)
+ */
+function toInstallmentAmounts(baseAmount) {
+  const installmentAmount = Math.floor(baseAmount / 10 / 100) * 100;
+  const withholdingTax = Math.round(installmentAmount * 0.033);
+  return {
+    baseAmount,
+    installmentAmount,
+    withholdingTax,
+    netAmount: installmentAmount - withholdingTax
+  };
+}
+
+/**
+ * 지급 계획 금액 갱신 (매출 조정 반영)
+ *
+ * ⭐ v9.7: 삭제/재생성 대신 기존 계획 금액을 제자리 갱신 (계획 _id 유지)
+ * - 회차 금액(baseAmount/installmentAmount/withholdingTax/netAmount)만 갱신
+ * - 계획 구조는 변경하지 않음: 대상자 추가/삭제, 등급 변경, 회차 수·지급일은 등록 처리(step3/step4) 결과 유지
+ * - 등급별 회차 금액을 1회 계산 → 등급마다 updateMany 1회 (arrayFilters로 대상 회차만)
+ * - 대상: active 계획의 pending 회차 중 오늘 이후 (force면 지난 회차 포함, 미리보기와 동일)
+ *   (압축 저장은 completed/terminated 계획만 대상이라 active 계획은 항상 full 저장)
+ *
  * @param {string} monthKey - 월 키 (YYYY-MM)
  * @param {number} newRevenue - 새 매출액
  * @param {Object} adminUser - 관리자 정보
  * @param {string} reason - 변경 사유
  * @param {boolean} force - paid 있어도 강제 실행
- * @returns {Promise<{deletedPlans: number, recreatedPlans: number, affectedUsers: number}>}
+ * @returns {Promise<{updatedPlans: number, affectedUsers: number, paidInstallments: number}>}
  */
-export async function regeneratePaymentPlans(monthKey, newRevenue, adminUser, reason, force = false) {
-  console.log(`\n🔄 [regeneratePaymentPlans] Starting for ${monthKey} with revenue ${newRevenue}`);
+export async function updatePaymentPlanAmounts(monthKey, newRevenue, adminUser, reason, force = false) {
+  console.log(`\n🔄 [updatePaymentPlanAmounts] Starting for ${monthKey} with revenue ${newRevenue}`);
 
   try {
-    // Step 1: MonthlyRegistrations 조회
-    const monthlyReg = await MonthlyRegistrations.findOne({ monthKey });
+    // Step 1: MonthlyRegistrations 조회 (지급 대상자 목록은 금액 갱신에 쓰지 않으므로 제외)
+    const monthlyReg = await MonthlyRegistrations.findOne({ monthKey }).select('-paymentTargets -registrations');
     if (!monthlyReg) {
       throw new Error(`MonthlyRegistrations not found for ${monthKey}`);
     }
@@ -142,159 +155,35 @@ export async function regeneratePaymentPlans(monthKey, newRevenue, adminUser, re
       );
     }
 
-    // Step 3: 기존 지급 계획 삭제 (해당 월 귀속만)
-    const plansToDelete = await WeeklyPaymentPlans.find({
-      revenueMonth: monthKey
-    });
-
-    const deletedCount = plansToDelete.length;
-    const affectedUserIds = [...new Set(plansToDelete.map(p => p.userId))];
-
-    console.log(`📋 Deleting ${deletedCount} payment plans for ${affectedUserIds.length} users`);
-
-    // 실제 삭제
-    await WeeklyPaymentPlans.deleteMany({
-      revenueMonth: monthKey
-    });
-
-    // Step 4: 새 매출 기준으로 금액 재계산
-    const { paymentTargets, gradeDistribution } = monthlyReg;
-
-    // 등급별 배분율 계산
-    const totalTargets =
-      (paymentTargets.registrants?.length || 0) +
-      (paymentTargets.promoted?.length || 0) +
-      (paymentTargets.additionalPayments?.length || 0);
-
-    console.log(`👥 Total payment targets: ${totalTargets}`);
-    console.log(`📊 Grade distribution:`, gradeDistribution);
-
-    // 등급별 지급액 계산
-    const gradePayments = {};
-    for (const grade of ['F1', 'F2', 'F3', 'F4', 'F5', 'F6', 'F7', 'F8']) {
-      const count = gradeDistribution[grade] || 0;
-      if (count > 0) {
-        const baseAmount = calculateBasePaymentForGrade(grade);
-        const totalBaseAmount = baseAmount * count;
-        const percentage = totalBaseAmount / (newRevenue || 1);
-        const allocatedAmount = Math.floor(newRevenue * percentage / 100) * 100; // 100원 단위
-        gradePayments[grade] = Math.floor(allocatedAmount / 10 / 100) * 100; // 10회 분할, 100원 단위
-      } else {
-        gradePayments[grade] = 0;
-      }
-    }
-
-    console.log(`💰 Grade payments (per installment):`, gradePayments);
-
-    // Step 5: paymentTargets 기준으로 계획 재생성
-    let recreatedCount = 0;
-    const allTargets = [];
-
-    // 5-1. 등록자 (기본지급)
-    if (paymentTargets.registrants) {
-      for (const registrant of paymentTargets.registrants) {
-        allTargets.push({
-          userId: registrant.userId,
-          userName: registrant.userName,
-          grade: registrant.grade,
-          planType: 'initial',
-          추가지급단계: 0,
-          installmentType: 'basic',
-          createdBy: 'registration'
-        });
-      }
-    }
-
-    // 5-2. 승급자 (기본지급)
-    if (paymentTargets.promoted) {
-      for (const promoted of paymentTargets.promoted) {
-        allTargets.push({
-          userId: promoted.userId,
-          userName: promoted.userName,
-          grade: promoted.newGrade,
-          planType: 'promotion',
-          추가지급단계: 0,
-          installmentType: 'basic',
-          createdBy: 'promotion'
-        });
-      }
-    }
-
-    // 5-3. 추가지급 대상자
-    if (paymentTargets.additionalPayments) {
-      for (const additional of paymentTargets.additionalPayments) {
-        allTargets.push({
-          userId: additional.userId,
-          userName: additional.userName,
-          grade: additional.grade,
-          planType: 'initial', // 원래 계획 타입 유지
-          추가지급단계: additional.추가지급단계,
-          installmentType: 'additional',
-          createdBy: 'monthly_check'
-        });
-      }
-    }
-
-    // 금요일 시작 날짜 계산 (다음 금요일부터)
-    const today = new Date();
-    let firstFriday = startOfWeek(today);
-    if (firstFriday <= today) {
-      firstFriday = new Date(firstFriday.getTime() + 7 * 24 * 60 * 60 * 1000);
-    }
-
-    // 각 대상자별로 지급 계획 생성
-    for (const target of allTargets) {
-      const installmentAmount = gradePayments[target.grade];
-      if (!installmentAmount || installmentAmount === 0) {
-        console.warn(`⚠️ No payment amount for ${target.userName} (${target.grade})`);
-        continue;
-      }
-
-      // 10회 installments 생성
-      const installments = [];
-      let currentDate = new Date(firstFriday);
-
-      for (let i = 0; i < 10; i++) {
-        const weekNum = getWeekNumber(currentDate);
-        installments.push({
-          installmentNumber: i + 1,
-          paymentDate: new Date(currentDate),
-          weekNumber: weekNum,
-          installmentAmount,
-          paymentStatus: 'pending',
-          taxAmount: 0,
-          netAmount: installmentAmount,
-          createdAt: new Date()
-        });
-
-        // 다음 금요일
-        currentDate = new Date(currentDate.getTime() + 7 * 24 * 60 * 60 * 1000);
-      }
+    // Step 3: 등급별 회차 금액 계산 (1회)
+    const gradePayments = resolveGradePayments(monthlyReg, newRevenue);
+    console.log(`💰 Grade payments (total):`, gradePayments);
+
+    const planFilter = { revenueMonth: monthKey, planStatus: 'active' };
+    const fromDate = force ? null : new Date();
+
+    const [grades, affectedUserIds] = await Promise.all([
+      WeeklyPaymentPlans.distinct('baseGrade', planFilter),
+      WeeklyPaymentPlans.distinct('userId', planFilter)
+    ]);
+
+    // Step 4: 등급별 updateMany
+    const ops = grades.map(grade =>
+      setInstallmentAmountsOp(
+        { ...planFilter, baseGrade: grade },
+        toInstallmentAmounts(gradePayments[grade] || 0),
+        fromDate
+      )
+    );
+    const { modified: updatedCount } = await applyPlanMutations(ops);
 
-      // WeeklyPaymentPlans 생성
-      const newPlan = new WeeklyPaymentPlans({
-        userId: target.userId,
-        userName: target.userName,
-        planType: target.planType,
-        추가지급단계: target.추가지급단계,
-        installmentType: target.installmentType,
-        baseGrade: target.grade,
-        revenueMonth: monthKey,
-        totalInstallments: 10,
-        completedInstallments: 0,
-        planStatus: 'active',
-        installments,
-        createdBy: target.createdBy,
-        createdAt: new Date()
-      });
+    console.log(`✅ Updated ${updatedCount} plans (${grades.length} grades)`);
 
-      await newPlan.save();
-      recreatedCount++;
+    if (updatedCount > 0) {
+      await markPlannerRollupsStale();
     }
 
-    console.log(`✅ Recreated ${recreatedCount} payment plans`);
-
-        // Step 7: MonthlyRegistrations 업데이트
+    // Step 5: MonthlyRegistrations 업데이트
     monthlyReg.adjustedRevenue = newRevenue;
     monthlyReg.isManualRevenue = true;
     monthlyReg.revenueModifiedBy = adminUser._id;
@@ -315,21 +204,80 @@ export async function regeneratePaymentPlans(monthKey, newRevenue, adminUser, re
 
     await monthlyReg.save();
 
-    console.log(`✅ [regeneratePaymentPlans] Completed successfully`);
+    console.log(`✅ [updatePaymentPlanAmounts] Completed successfully`);
 
     return {
-      deletedPlans: deletedCount,
-      recreatedPlans: recreatedCount,
+      updatedPlans: updatedCount,
       affectedUsers: affectedUserIds.length,
       paidInstallments: paymentStatus.paidCount
     };
   } catch (error) {
-    console.error(`❌ [regeneratePaymentPlans] Error:`, error);
+    console.error(`❌ [updatePaymentPlanAmounts] Error:`, error);
     throw error;
   }
 }
 
 
+/**
+ * 매출/등급별 지급액 조정 미리보기 (dry-run, DB 쓰기 없음)
+ * - 해당 월 귀속 계획의 installment 금액을 메모리에서 재계산 후 현재 계획과 비교
+ *
+ * @param {string} monthKey - 월 키 (YYYY-MM)
+ * @param {Object} options
+ * @param {number} options.adjustedRevenue - 새 매출액 (없으면 현재 유효 매출)
+ * @param {Object} options.adjustedGradePayments - 등급별 조정값 { F1: { totalAmount }, ... } (없으면 현재 조정값)
+ * @param {boolean} options.includePast - true면 지난 날짜의 pending(지급 완료 간주)도 재계산
+ * @param {boolean} options.includeAllStatuses - true면 active 외 계획/installment도 재계산 (forceUpdate)
+ * @returns {Promise<Object>} { monthKey, revenue, gradePayments, paymentStatus, diff }
+ */
+export async function previewRevenueAdjustment(monthKey, options = {}) {
+  const {
+    adjustedRevenue = null,
+    adjustedGradePayments = null,
+    includePast = false,
+    includeAllStatuses = false
+  } = options;
+
+  const monthlyReg = await MonthlyRegistrations.findOne({ monthKey });
+  if (!monthlyReg) {
+    throw new Error(`MonthlyRegistrations not found for ${monthKey}`);
+  }
+
+  const previousRevenue = monthlyReg.getEffectiveRevenue();
+  const newRevenue = adjustedRevenue ?? previousRevenue;
+
+  // 등급별 지급액: 매출 기준 계산 → 조정값 우선
+  const gradePayments = resolveGradePayments(monthlyReg, newRevenue, adjustedGradePayments);
+
+  const plans = await WeeklyPaymentPlans.find({ revenueMonth: monthKey }).lean();
+  const now = new Date();
+
+  const afterPlans = plans.map(plan => {
+    const planTargeted = includeAllStatuses || plan.planStatus === 'active';
+    const amounts = toInstallmentAmounts(gradePayments[plan.baseGrade] || 0);
+
+    return {
+      ...plan,
+      installments: plan.installments.map(inst => {
+        const statusTargeted = includeAllStatuses || inst.status === 'pending';
+        const dateTargeted = includePast || new Date(inst.scheduledDate) >= now;
+        if (!planTargeted || !statusTargeted || !dateTargeted) {
+          return inst;
+        }
+        return { ...inst, ...amounts };
+      })
+    };
+  });
+
+  return {
+    monthKey,
+    revenue: { before: previousRevenue, after: newRevenue },
+    gradePayments,
+    paymentStatus: await checkPaymentStatus(monthKey),
+    diff: diffPlans(plans, afterPlans)
+  };
+}
+
 /**
  * 매출 수동 조정 (메인 함수)
  * @param {string} monthKey - 월 키 (YYYY-MM)
@@ -337,25 +285,41 @@ export async function regeneratePaymentPlans(monthKey, newRevenue, adminUser, re
  * @param {Object} adminUser - 관리자 정보
  * @param {string} reason - 변경 사유
  * @param {boolean} force - paid 있어도 강제 실행
+ * @param {boolean} dryRun - true면 변경 내용만 계산하여 반환 (DB 쓰기 없음)
  * @returns {Promise<{success: boolean, message: string, details: Object}>}
  */
-export async function adjustRevenue(monthKey, adjustedRevenue, adminUser, reason, force = false) {
+export async function adjustRevenue(monthKey, adjustedRevenue, adminUser, reason, force = false, dryRun = false) {
   console.log(`\n💰 [adjustRevenue] Starting for ${monthKey}`);
   console.log(`   New revenue: ${adjustedRevenue}`);
   console.log(`   Reason: ${reason}`);
   console.log(`   Force: ${force}`);
+  console.log(`   Dry-run: ${dryRun}`);
 
   try {
-    // MonthlyRegistrations 조회
-    const monthlyReg = await MonthlyRegistrations.findOne({ monthKey });
+    if (dryRun) {
+      const preview = await previewRevenueAdjustment(monthKey, {
+        adjustedRevenue,
+        includePast: force
+      });
+
+      return {
+        success: true,
+        message: `[미리보기] 변경 시 총 지급액 ${preview.diff.totals.delta.toLocaleString()}원 변동, ` +
+          `${preview.diff.users.length}명 영향`,
+        details: preview
+      };
+    }
+
+    // MonthlyRegistrations 조회 (이전 매출만 필요)
+    const monthlyReg = await MonthlyRegistrations.findOne({ monthKey }).select('totalRevenue adjustedRevenue');
     if (!monthlyReg) {
       throw new Error(`MonthlyRegistrations not found for ${monthKey}`);
     }
 
     const previousRevenue = monthlyReg.getEffectiveRevenue();
 
-    // 지급 계획 재생성
-    const details = await regeneratePaymentPlans(
+    // 지급 계획 금액 갱신 (계획 구조는 유지)
+    const details = await updatePaymentPlanAmounts(
       monthKey,
       adjustedRevenue,
       adminUser,
@@ -364,10 +328,13 @@ export async function adjustRevenue(monthKey, adjustedRevenue, adminUser, reason
     );
 
     const message = `매출이 ${previousRevenue.toLocaleString()}원에서 ${adjustedRevenue.toLocaleString()}원으로 변경되고 ` +
-      `${details.recreatedPlans}개의 지급 계획이 재생성되었습니다`;
+      `${details.updatedPlans}개의 지급 계획 금액이 갱신되었습니다`;
 
     console.log(`✅ [adjustRevenue] ${message}`);
 
+    // ⭐ v9.7: 등급별 지급 정보 스냅샷 갱신
+    await refreshGradeInfoSnapshot(monthKey);
+
     return {
       success: true,
       message,
@@ -0,0 +1,94 @@
+/**
+ * 용역자 등록 순번(sequence) 발급 서비스
+ *
+ * - Counter 컬렉션의 userSequence 문서에서 연속 블록을 원자적으로 예약
+ *   (개별 등록과 일괄 등록이 동시에 실행되어도 번호가 겹치지 않음)
+ * - 예약 시 현재 최대 sequence와 비교하여 카운터가 뒤처져 있으면 자동 보정
+ *   (백업 복원, 카운터 도입 이전 데이터)
+ * - 데이터 삭제(초기화, 월별 삭제) 후에는 syncUserSequenceCounter로 최대값에 맞춤
+ * - 예약 후 저장에 실패한 행이 있으면 releaseUnusedSequences로 번호를 당기고 남은 블록 반환
+ */
+
+import Counter from '../models/Counter.js';
+import User from '../models/User.js';
+
+const USER_SEQUENCE = 'userSequence';
+
+async function getMaxUserSequence() {
+	const lastUser = await User.findOne().sort({ sequence: -1 }).select('sequence').lean();
+	return lastUser?.sequence || 0;
+}
+
+/**
+ * 연속된 sequence 블록 예약
+ * @param {number} count - 필요한 개수
+ * @returns {Promise<number>} 블록의 첫 번호 (first ~ first + count - 1)
+ */
+export async function allocateUserSequences(count) {
+	if (count <= 0) return 0;
+
+	const maxSequence = await getMaxUserSequence();
+
+	// value = max(value, 현재 최대 sequence) + count (파이프라인 업데이트로 원자적 처리)
+	const counter = await Counter.findOneAndUpdate(
+		{ _id: USER_SEQUENCE },
+		[
+			{
+				$set: {
+					value: { $add: [{ $max: [{ $ifNull: ['$value', 0] }, maxSequence] }, count] }
+				}
+			}
+		],
+		{ upsert: true, new: true }
+	).lean();
+
+	return counter.value - count + 1;
+}
+
+/**
+ * 예약 블록 중 저장되지 않은 번호 정리 (저장 실패 행)
+ * - 저장된 사용자를 블록 앞쪽부터 연속 번호로 재배정 (순서 유지, 빈 번호 제거)
+ * - 블록 이후 다른 예약이 없으면 카운터를 되돌려 남은 번호 반환
+ *
+ * @param {number} firstSequence - 블록의 첫 번호
+ * @param {number} count - 예약한 개수
+ * @param {Array<Object>} savedUsers - 저장된 User 문서 (sequence 갱신됨)
+ * @returns {Promise<number>} 반환된 번호 수
+ */
+export async function releaseUnusedSequences(firstSequence, count, savedUsers) {
+	const unused = count - savedUsers.length;
+	if (unused <= 0) return 0;
+
+	// 오름차순으로 당김 → 대상 번호는 항상 비어 있음
+	const ordered = [...savedUsers].sort((a, b) => a.sequence - b.sequence);
+	const ops = [];
+	ordered.forEach((user, index) => {
+		const sequence = firstSequence + index;
+		if (user.sequence !== sequence) {
+			ops.push({ updateOne: { filter: { _id: user._id }, update: { $set: { sequence } } } });
+			user.sequence = sequence;
+		}
+	});
+	if (ops.length > 0) {
+		await User.bulkWrite(ops, { ordered: true });
+	}
+
+	const result = await Counter.updateOne(
+		{ _id: USER_SEQUENCE, value: firstSequence + count - 1 },
+		{ $set: { value: firstSequence + savedUsers.length - 1 } }
+	);
+	if (result.modifiedCount === 0) {
+		console.warn(`[sequence] 이후 예약이 있어 미사용 번호 ${unused}개를 반환하지 못했습니다.`);
+		return 0;
+	}
+	return unused;
+}
+
+/**
+ * 카운터를 현재 최대 sequence로 맞춤 (사용자 삭제 후 번호 재사용)
+ */
+export async function syncUserSequenceCounter() {
+	const maxSequence = await getMaxUserSequence();
+	await Counter.updateOne({ _id: USER_SEQUENCE }, { $set: { value: maxSequence } }, { upsert: true });
+	return maxSequence;
+}
@@ -0,0 +1,89 @@
+/**
+ * 용역자 이름 인덱스 (엑셀 등록 전 중복 검사용)
+ *
+ * - 이름 → 등록 건수 Map을 프로세스 메모리에 유지
+ *   → 중복 검사는 DB 조회 없이 Set 교집합으로 처리 (같은 파일을 여러 번 검사해도 1회 적재)
+ * - 일괄 등록 시 addUserNames로 즉시 반영, 수정/삭제/초기화 시 invalidateUserNameIndex
+ * - 다른 경로(스크립트 등)의 변경에 대비해 TTL(5분) 경과 시 다시 적재
+ * - 등록 직전 검증(ValidationService)은 여전히 DB 기준으로 확인
+ */
+
+import User from '../models/User.js';
+
+const INDEX_TTL_MS = 5 * 60 * 1000;
+
+const state = {
+	counts: null, // Map<name, count>
+	loadedAt: 0,
+	loading: null, // 진행 중인 적재 Promise
+	version: 0 // 무효화 시 증가 (적재 중 무효화되면 결과 폐기)
+};
+
+async function loadIndex() {
+	const version = state.version;
+	const groups = await User.aggregate([{ $group: { _id: '$name', count: { $sum: 1 } } }]);
+
+	if (version !== state.version) {
+		// 적재 중 무효화됨 → 다음 조회에서 다시 적재
+		return new Map(groups.map((group) => [group._id, group.count]));
+	}
+
+	state.counts = new Map(groups.map((group) => [group._id, group.count]));
+	state.loadedAt = Date.now();
+	return state.counts;
+}
+
+/**
+ * 이름 인덱스 조회 (없거나 만료 시 적재)
+ * @returns {Promise<Map<string, number>>}
+ */
+export async function getUserNameIndex() {
+	if (state.counts && Date.now() - state.loadedAt < INDEX_TTL_MS) {
+		return state.counts;
+	}
+
+	if (!state.loading) {
+		state.loading = loadIndex().finally(() => {
+			state.loading = null;
+		});
+	}
+	return state.loading;
+}
+
+/**
+ * 등록된 이름 반영 (일괄 등록 후)
+ * @param {Array<string>} names
+ */
+export function addUserNames(names) {
+	if (!state.counts) {
+		// 적재 중이면 등록 이전 결과일 수 있으므로 폐기
+		state.version++;
+		return;
+	}
+	for (const name of names) {
+		state.counts.set(name, (state.counts.get(name) || 0) + 1);
+	}
+}
+
+/**
+ * 이름 인덱스 무효화 (이름 변경, 삭제, 초기화)
+ */
+export function invalidateUserNameIndex() {
+	state.counts = null;
+	state.loadedAt = 0;
+	state.version++;
+}
+
+/**
+ * 이미 등록된 이름 찾기
+ * @param {Iterable<string>} names
+ * @returns {Promise<Set<string>>}
+ */
+export async function findExistingNames(names) {
+	const index = await getUserNameIndex();
+	const existing = new Set();
+	for (const name of names) {
+		if (index.has(name)) existing.add(name);
+	}
+	return existing;
+}
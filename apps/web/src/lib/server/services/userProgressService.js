@@ -0,0 +1,69 @@
+/**
+ * 용역자 지급 진행률 서비스
+ *
+ * 역할:
+ * - 용역자별 지급 완료 회차 합계(WeeklyPaymentPlans.completedInstallments 합)를 User.completedInstallments에 유지
+ * - 회원 목록 API는 페이지마다 계획을 집계하지 않고 사용자 문서의 값을 그대로 사용
+ *
+ * 갱신 시점:
+ * - 주간 지급 처리 후 (지급된 계획의 용역자)
+ * - 계획 삭제 후 (월별 재처리, 월별 삭제)
+ * - 값이 없는 기존 사용자는 목록 조회 시 동기화
+ */
+
+import WeeklyPaymentPlans from '../models/WeeklyPaymentPlans.js';
+import User from '../models/User.js';
+
+/**
+ * 용역자 지급 진행률 재계산
+ *
+ * @param {Array<string>|null} userIds - 대상 용역자 ID (null이면 전체)
+ * @returns {Promise<Map<string, number>>} userId → 완료 회차 합계
+ */
+export async function syncUserPaymentProgress(userIds = null) {
+	const ids = userIds ? [...new Set(userIds.map((id) => id.toString()))] : null;
+	if (ids && ids.length === 0) {
+		return new Map();
+	}
+
+	const pipeline = [];
+	if (ids) {
+		pipeline.push({ $match: { userId: { $in: ids } } });
+	}
+	pipeline.push({
+		$group: {
+			_id: '$userId',
+			completedInstallments: { $sum: '$completedInstallments' }
+		}
+	});
+
+	const rows = await WeeklyPaymentPlans.aggregate(pipeline);
+	const progress = new Map(rows.map((r) => [r._id, r.completedInstallments]));
+
+	const ops = [...progress].map(([userId, completedInstallments]) => ({
+		updateOne: {
+			filter: { _id: userId },
+			update: { $set: { completedInstallments } }
+		}
+	}));
+
+	// 계획이 없는 용역자는 0
+	const withPlans = [...progress.keys()];
+	ops.push({
+		updateMany: {
+			filter: ids
+				? { _id: { $in: ids.filter((id) => !progress.has(id)) } }
+				: { _id: { $nin: withPlans } },
+			update: { $set: { completedInstallments: 0 } }
+		}
+	});
+
+	await User.bulkWrite(ops, { ordered: false });
+
+	if (ids) {
+		for (const id of ids) {
+			if (!progress.has(id)) progress.set(id, 0);
+		}
+	}
+	return progress;
+}
@@ -1,11 +1,75 @@
 import User from '../models/User.js';
 import UserAccount from '../models/UserAccount.js'; // v8.0
 import PlannerAccount from '../models/PlannerAccount.js'; // v8.0
-import bcrypt from 'bcryptjs';
+import { hashPassword } from '../utils/passwordHasher.js';
+import { allocateUserSequences, releaseUnusedSequences } from './sequenceService.js';
+import { refreshUserSearchKeys } from './userSearchService.js';
+import { addUserNames } from './userNameIndexService.js';
 import { smartTreeRestructure } from './treeRestructure.js';
 import ValidationService from './validationService.js';
 import { processUserRegistration } from './registrationService.js';
 
+/**
+ * 초기 비밀번호: 연락처 뒤 4자리 (없으면 기본값)
+ */
+function getInitialUserPassword(phone) {
+	const phoneDigits = phone.replace(/[^0-9]/g, '');
+	return phoneDigits.length >= 4 ? phoneDigits.slice(-4) : '1234';
+}
+
+function getInitialPlannerPassword(plannerPhone) {
+	const plannerPhoneDigits = plannerPhone.replace(/[^0-9]/g, '');
+	return plannerPhoneDigits.length >= 4 ? plannerPhoneDigits.slice(-4) : '9999';
+}
+
+const INSERT_BATCH_SIZE = 500;
+
+/**
+ * ⭐ v9.7: 문서 일괄 저장 (순서 유지 insertMany 배치)
+ * - 배치 중 오류가 나면 해당 배치만 저장 여부를 확인 후 남은 문서를 개별 저장 (행별 오류 보고)
+ *
+ * @param {mongoose.Model} Model
+ * @param {Array<mongoose.Document>} docs - new Model(...) 문서 (_id 사전 생성)
+ * @param {Function} onBatch - 배치 완료 시 (저장된 누적 개수) => void
+ * @returns {Promise<{ saved: Map<string, mongoose.Document>, failures: Map<string, Error> }>}
+ */
+async function insertInBatches(Model, docs, onBatch) {
+	const saved = new Map();
+	const failures = new Map();
+
+	for (let i = 0; i < docs.length; i += INSERT_BATCH_SIZE) {
+		const batch = docs.slice(i, i + INSERT_BATCH_SIZE);
+
+		try {
+			const inserted = await Model.insertMany(batch, { ordered: true });
+			for (const doc of inserted) {
+				saved.set(doc._id.toString(), doc);
+			}
+		} catch (batchError) {
+			// 오류 지점 이전 문서는 이미 저장됨 → 조회 후 나머지만 개별 저장
+			const batchIds = batch.map((doc) => doc._id);
+			const alreadySaved = await Model.find({ _id: { $in: batchIds } });
+			for (const doc of alreadySaved) {
+				saved.set(doc._id.toString(), doc);
+			}
+
+			for (const doc of batch) {
+				const id = doc._id.toString();
+				if (saved.has(id)) continue;
+				try {
+					saved.set(id, await doc.save());
+				} catch (error) {
+					failures.set(id, error);
+				}
+			}
+		}
+
+		if (onBatch) await onBatch(saved.size);
+	}
+
+	return { saved, failures };
+}
+
 /**
  * 사용자 등록 공통 서비스
  * - bulk (일괄 등록)와 register (개별 등록) 공통 로직
@@ -22,10 +86,12 @@ export class UserRegistrationService {
 	/**
 	 * 메인 등록 함수
 	 * @param {Array} users - 등록할 사용자 배열 (1명 이상)
-	 * @param {Object} options - { source: 'bulk' | 'register', admin: 사용자 }
+	 * @param {Object} options - { source: 'bulk' | 'register', admin: 사용자, onProgress }
+	 *   - onProgress: ⭐ v9.7 단계별 진행 알림 ({ step, current, total, message }) => void
 	 */
 	async registerUsers(users, options = {}) {
-		const { source = 'bulk', admin } = options;
+		const { source = 'bulk', admin, onProgress } = options;
+		this.onProgress = onProgress;
 
 		const results = {
 			created: 0,
@@ -37,6 +103,7 @@ export class UserRegistrationService {
 
 		try {
 			// 1단계: 사전 검증
+			await this.reportProgress('validate', 0, users.length, '사전 검증');
 			const validation = await this.validateUsers(users);
 			if (!validation.isValid) {
 				console.error('검증 실패:', validation.error);
@@ -44,12 +111,18 @@ export class UserRegistrationService {
 			}
 
 			// 2단계: 사용자 생성
+			await this.reportProgress('create', 0, users.length, '사용자 생성');
 			const createResults = await this.createUsers(users);
 			results.created = createResults.created;
 			results.failed = createResults.failed;
 			results.errors = createResults.errors;
 
+			// ⭐ v9.7: 자동완성 검색 키 생성, 중복 검사용 이름 인덱스 반영
+			await refreshUserSearchKeys(Array.from(this.registeredUsers.keys()));
+			addUserNames(Array.from(this.registeredUsers.values(), (info) => info.name));
+
 			// 3단계: 트리 재구성
+			await this.reportProgress('tree', 0, results.created, '트리 재구성');
 			const treeResults = await this.restructureTree();
 			if (treeResults.warnings && treeResults.warnings.length > 0) {
 				treeResults.warnings.forEach((warning) => {
@@ -92,10 +165,19 @@ export class UserRegistrationService {
 		}
 	}
 
+	/**
+	 * 진행 상황 알림 (onProgress 미지정 시 무시)
+	 */
+	async reportProgress(step, current, total, message) {
+		if (this.onProgress) {
+			await this.onProgress({ step, current, total, message });
+		}
+	}
+
 	/**
 	 * 1단계: 사전 검증 (⭐ 전체 검증 - 하나라도 실패하면 전체 중단)
 	 * - 필수 필드 검증
-	 * - 이름 중복 검증 (DB 조회)
+	 * - 이름 중복 검증 (DB 일괄 조회)
 	 * - 판매인 검증
 	 * - 최상위 루트 1개 제한
 	 * - 순서 검증 (엑셀 내)
@@ -105,19 +187,8 @@ export class UserRegistrationService {
 		this.excelUserNames.clear();
 		let rootCount = 0;
 
-		// 헬퍼 함수: 엑셀 셀 값 읽기
-		const getValue = (obj, keys) => {
-			for (const key of keys) {
-				const value = obj[key];
-				if (value !== undefined && value !== null && value !== '') {
-					return String(value).trim();
-				}
-			}
-			return '';
-		};
-
-		// 1차 패스: 모든 사용자 이름 수집 + 필수 필드 검증
-		const validUsers = [];
+		// 1차 패스: 행 데이터 수집 (DB 조회 없음)
+		const rows = [];
 		for (let i = 0; i < users.length; i++) {
 			const userData = users[i];
 
@@ -127,21 +198,47 @@ export class UserRegistrationService {
 			}
 
 			// ⭐ v8.1: 고정 헤더명으로만 값 읽기 (빈값이면 빈값 그대로)
-			const loginId = String(userData['ID'] ?? '').trim();
 			const name = String(userData['성명'] ?? '').trim();
-			const phone = String(userData['연락처'] ?? '').trim();
-			const bank = String(userData['은행'] ?? '').trim();
-			const accountNumber = String(userData['계좌번호'] ?? '').trim();
-			const plannerName = String(userData['설계사'] ?? '').trim();
-			const salesperson = String(userData['판매인'] ?? '').trim();
-
 			if (!name) continue; // 빈 행 건너뛰기
 
+			rows.push({
+				userData,
+				row: i + 1,
+				name,
+				loginId: String(userData['ID'] ?? '').trim(),
+				phone: String(userData['연락처'] ?? '').trim(),
+				bank: String(userData['은행'] ?? '').trim(),
+				accountNumber: String(userData['계좌번호'] ?? '').trim(),
+				plannerName: String(userData['설계사'] ?? '').trim(),
+				salesperson: String(userData['판매인'] ?? '').trim()
+			});
+		}
+
+		// ⭐ v9.7: 이름 중복 / 판매인 / 검증용 DB 조회를 $in 일괄 조회로 처리 (행 수와 무관)
+		const names = [...new Set(rows.map((r) => r.name))];
+		const sellers = [...new Set(rows.map((r) => r.salesperson).filter((s) => s && s !== '-'))];
+
+		const [sameNameUsers, sellerUsers, validationContext] = await Promise.all([
+			names.length > 0 ? User.find({ name: { $in: names } }).select('name').lean() : [],
+			sellers.length > 0
+				? User.find({ $or: [{ name: { $in: sellers } }, { loginId: { $in: sellers } }] })
+						.select('name loginId')
+						.lean()
+				: [],
+			ValidationService.loadRegistrationContext(rows)
+		]);
+
+		const existingNames = new Set(sameNameUsers.map((u) => u.name));
+		const existingSellers = new Set(sellerUsers.flatMap((u) => [u.name, u.loginId].filter(Boolean)));
+
+		// 2차 패스: 필수 필드 / 형식 / 이름 중복 검증 (행 순서대로, 메모리 내)
+		const validUsers = [];
+		for (const { userData, row, name, loginId, phone, bank, accountNumber, plannerName, salesperson } of rows) {
 			// ⭐ 필수 필드 검증
 			if (!loginId) {
 				return {
 					isValid: false,
-					error: `등록 실패: 행 ${i + 1} (${name})에 ID가 없습니다.`,
+					error: `등록 실패: 행 ${row} (${name})에 ID가 없습니다.`,
 					details: 'ID는 필수 항목입니다.'
 				};
 			}
@@ -149,19 +246,16 @@ export class UserRegistrationService {
 			if (!plannerName) {
 				return {
 					isValid: false,
-					error: `등록 실패: 행 ${i + 1} (${name})에 설계사가 없습니다.`,
+					error: `등록 실패: 행 ${row} (${name})에 설계사가 없습니다.`,
 					details: '설계사는 필수 항목입니다.'
 				};
 			}
 
 			// ⭐ ValidationService로 기본 검증 (연락처, 은행, 계좌번호 등)
-			const validation = await ValidationService.validateRegistration({
-				name,
-				phone,
-				bank,
-				accountNumber,
-				salesperson
-			});
+			const validation = ValidationService.validateRegistrationWithContext(
+				{ name, phone, bank, accountNumber, salesperson },
+				validationContext
+			);
 
 			if (!validation.isValid) {
 				const errorMessages = validation.errors
@@ -169,18 +263,17 @@ export class UserRegistrationService {
 					.join(', ');
 				return {
 					isValid: false,
-					error: `등록 실패: 행 ${i + 1} (${name}) 검증 실패 - ${errorMessages}`,
+					error: `등록 실패: 행 ${row} (${name}) 검증 실패 - ${errorMessages}`,
 					details: '모든 필수 항목을 올바르게 입력해주세요.'
 				};
 			}
 
-			// ⭐ 이름 중복 체크 (DB 조회)
-			const existingUserWithSameName = await User.findOne({ name: name });
-			if (existingUserWithSameName) {
+			// ⭐ 이름 중복 체크 (DB 조회 결과)
+			if (existingNames.has(name)) {
 				// 개별 등록(1명)일 때는 행 번호 생략
 				const errorMsg = users.length === 1
 					? `등록 실패: 이미 등록된 이름 "${name}"이(가) 있습니다.`
-					: `등록 실패: 행 ${i + 1}에서 이미 시스템에 등록된 이름 "${name}"이(가) 발견되었습니다.`;
+					: `등록 실패: 행 ${row}에서 이미 시스템에 등록된 이름 "${name}"이(가) 발견되었습니다.`;
 				return {
 					isValid: false,
 					error: errorMsg,
@@ -189,14 +282,18 @@ export class UserRegistrationService {
 			}
 
 			this.excelUserNames.add(name);
-			validUsers.push({ userData, name, loginId, row: i + 1 });
+			validUsers.push({ userData, name, loginId, salesperson, row });
 		}
 
-		// 2차 패스: 판매인 검증
-		for (let i = 0; i < validUsers.length; i++) {
-			const { userData, name, row } = validUsers[i];
+		// 엑셀 내 이름 → 첫 등장 위치
+		const firstIndexByName = new Map();
+		validUsers.forEach(({ name }, index) => {
+			if (!firstIndexByName.has(name)) firstIndexByName.set(name, index);
+		});
 
-			const salesperson = String(userData['판매인'] ?? '').trim();
+		// 3차 패스: 판매인 검증
+		for (let i = 0; i < validUsers.length; i++) {
+			const { userData, name, salesperson, row } = validUsers[i];
 
 			// 판매인 검증
 			if (!salesperson || salesperson === '-') {
@@ -215,9 +312,7 @@ export class UserRegistrationService {
 				const isInExcel = this.excelUserNames.has(salesperson);
 
 				// 2) 이미 DB에 등록된 사용자인지 확인
-				const existingSeller = await User.findOne({
-					$or: [{ name: salesperson }, { loginId: salesperson }]
-				});
+				const existingSeller = existingSellers.has(salesperson);
 
 				// 엑셀에도 없고 DB에도 없으면 에러
 				if (!isInExcel && !existingSeller) {
@@ -230,24 +325,12 @@ export class UserRegistrationService {
 				}
 
 				// 엑셀 내에 있는 경우, 순서 확인 (판매인이 현재 사용자보다 앞에 있어야 함)
-				if (isInExcel) {
-					let sellerRowIndex = -1;
-					let currentRowIndex = i;
-
-					for (let j = 0; j < validUsers.length; j++) {
-						if (validUsers[j].name === salesperson) {
-							sellerRowIndex = j;
-							break;
-						}
-					}
-
-					if (sellerRowIndex >= currentRowIndex) {
-						return {
-							isValid: false,
-							error: `등록 실패: 행 ${row} (${name})의 판매인 "${salesperson}"이(가) 현재 행보다 뒤에 위치하거나 같은 행에 있습니다.`,
-							details: '판매인은 엑셀 파일에서 현재 사용자보다 앞쪽에 위치해야 합니다.'
-						};
-					}
+				if (isInExcel && firstIndexByName.get(salesperson) >= i) {
+					return {
+						isValid: false,
+						error: `등록 실패: 행 ${row} (${name})의 판매인 "${salesperson}"이(가) 현재 행보다 뒤에 위치하거나 같은 행에 있습니다.`,
+						details: '판매인은 엑셀 파일에서 현재 사용자보다 앞쪽에 위치해야 합니다.'
+					};
 				}
 			}
 
@@ -264,8 +347,8 @@ export class UserRegistrationService {
 	/**
 	 * 2단계: 사용자 생성
 	 * - loginId 자동 생성
-	 * - sequence 할당 (⭐ 날짜순 정렬 후 할당)
-	 * - User.save()
+	 * - sequence 할당 (⭐ 날짜순 정렬 후 할당, v9.7: 카운터 블록 예약)
+	 * - User insertMany (v9.7: 순서 유지 배치)
 	 */
 	async createUsers(users) {
 		const results = {
@@ -275,11 +358,6 @@ export class UserRegistrationService {
 		};
 
 		this.registeredUsers.clear();
-		const usersByOrder = [];
-
-		// 현재 최대 시퀀스 번호 가져오기
-		const lastUser = await User.findOne().sort({ sequence: -1 }).select('sequence');
-		let currentSequence = lastUser ? lastUser.sequence : 0;
 
 		// 헬퍼 함수: 엑셀 셀 값 읽기
 		const getValue = (obj, keys) => {
@@ -420,161 +498,264 @@ export class UserRegistrationService {
 			console.log(`  ${idx + 1}. ${p.name} - ${p.createdAt.toISOString().split('T')[0]} (엑셀행: ${p.row})`);
 		});
 
-		// ⭐ 3단계: 정렬된 순서대로 sequence 할당 및 저장
-		for (const parsed of parsedUsers) {
+		// ⭐ v9.7: 기존 계정 / 등록번호 일괄 조회 (행별 findOne 제거)
+		const { accountsByLoginId, plannersByName, lastRegistrationNumbers } =
+			await this.loadExistingAccounts(parsedUsers);
+
+		// ⭐ v9.7: 신규 계정 생성 (비밀번호 해시는 워커 풀에서 병렬, 계정은 insertMany)
+		const accountErrors = await this.createMissingAccounts(parsedUsers, accountsByLoginId, plannersByName);
+
+		// ⭐ 3단계: 정렬된 순서대로 User 문서 구성
+		const pendingUsers = [];
+		parsedUsers.forEach((parsed) => {
 			const {
 				row,
 				createdAt,
 				loginId,
 				name,
-				phone,
-				idNumber,
-				bank,
 				ratio,
-				accountNumber,
 				salesperson,
 				salespersonPhone,
 				plannerName,
-				plannerPhone,
-				plannerAccountNumber,
-				plannerBank,
 				insuranceProduct,
 				insuranceCompany,
 				branch
 			} = parsed;
 
-			try {
-				// v8.0: UserAccount 생성 또는 조회
-				let userAccount = await UserAccount.findOne({ loginId: loginId.toLowerCase() });
-
-				if (!userAccount) {
-					// 신규: UserAccount 생성
-					const phoneDigits = phone.replace(/[^0-9]/g, '');
-					const password = phoneDigits.length >= 4 ? phoneDigits.slice(-4) : '1234';
-					const passwordHash = await bcrypt.hash(password, 10);
-
-					userAccount = new UserAccount({
-						loginId: loginId.toLowerCase(),
-						passwordHash,
-						name,
-						phone,
-						idNumber,
-						bank,
-						accountNumber,
-						email: null,
-						status: 'active',
-						createdAt: createdAt
-					});
-					await userAccount.save();
-					console.log(`✅ UserAccount 생성: ${loginId}`);
-				} else {
-					// 재등록: 개인정보 업데이트 안 함 (v8.0 설계 원칙)
-					console.log(`✅ UserAccount 재사용: ${loginId} (registrationNumber will be incremented)`);
-				}
+			const userAccount = accountsByLoginId.get(loginId.toLowerCase());
+			const plannerAccount = plannersByName.get(plannerName);
+			const accountError =
+				accountErrors.get(`user:${loginId.toLowerCase()}`) || accountErrors.get(`planner:${plannerName}`);
 
-				// v8.0: PlannerAccount 생성 또는 조회 (자동 생성)
-				let plannerAccount = await PlannerAccount.findOne({ loginId: plannerName });
-
-				if (!plannerAccount) {
-					// 엑셀의 설계사 전화번호 사용 (없으면 기본값)
-					const plannerPhoneFinal = plannerPhone || '010-0000-0000';
-					const plannerPhoneDigits = plannerPhoneFinal.replace(/[^0-9]/g, '');
-					const plannerPassword = plannerPhoneDigits.length >= 4 ? plannerPhoneDigits.slice(-4) : '9999';
-					const plannerPasswordHash = await bcrypt.hash(plannerPassword, 10);
-
-					plannerAccount = new PlannerAccount({
-						loginId: plannerName,
-						passwordHash: plannerPasswordHash,
-						name: plannerName,
-						phone: plannerPhoneFinal,
-					// ⭐ v8.0: 설계사 계좌 정보
-					bank: plannerBank || '',
-					accountNumber: plannerAccountNumber || '',
-						status: 'active',
-						createdAt: createdAt
-					});
-					await plannerAccount.save();
-					console.log(`✅ PlannerAccount 자동 생성: ${plannerName} (초기 비밀번호: ${plannerPassword}, 전화번호: ${plannerPhoneFinal})`);
-				}
+			if (accountError || !userAccount || !plannerAccount) {
+				this.recordRowFailure(results, accountError || new Error('계정 생성 실패'), row, name);
+				return;
+			}
 
-				// v8.0: registrationNumber 계산 (같은 UserAccount의 재등록 순번)
-				const existingUsers = await User.find({ userAccountId: userAccount._id })
-					.sort({ registrationNumber: -1 })
-					.limit(1);
-
-				const registrationNumber = existingUsers.length > 0
-					? existingUsers[0].registrationNumber + 1
-					: 1;
-
-				// 이름은 그대로 사용 (숫자 붙이지 않음)
-				const displayName = name;
-
-				// 초기 등급 설정
-				const grade = 'F1';
-
-				// ⭐ 시퀀스 번호 할당 (정렬된 순서대로)
-				currentSequence++;
-
-				// v8.0: User 생성 (FK 연결)
-				const newUser = new User({
-					userAccountId: userAccount._id, // FK
-					registrationNumber, // 1, 2, 3...
-					plannerAccountId: plannerAccount._id, // FK (required)
-					name: displayName, // 홍길동, 홍길동2, 홍길동3
-					branch,
-					grade,
-					gradePaymentCount: 0,
-					// ⭐ v8.0: lastGradeChangeDate 제거 (gradeHistory virtual로 제공)
-					consecutiveGradeWeeks: 0,
-					insuranceActive: false,
-					insuranceAmount: 0,
-					// ⭐ v8.0: 비율 (지급액 계산에 사용)
-					ratio: ratio,
-					salesperson,
-					salespersonPhone,
-					insuranceProduct,
-					insuranceCompany,
-					status: 'active',
-					type: 'user',
-					sequence: currentSequence,
-					createdAt: createdAt
-				});
+			// v8.0: registrationNumber 계산 (같은 UserAccount의 재등록 순번)
+			const accountKey = userAccount._id.toString();
+			const registrationNumber = (lastRegistrationNumbers.get(accountKey) || 0) + 1;
+			lastRegistrationNumbers.set(accountKey, registrationNumber);
+
+			// 이름은 그대로 사용 (숫자 붙이지 않음)
+			const displayName = name;
+
+			// v8.0: User 생성 (FK 연결)
+			const newUser = new User({
+				userAccountId: userAccount._id, // FK
+				registrationNumber, // 1, 2, 3...
+				plannerAccountId: plannerAccount._id, // FK (required)
+				name: displayName, // 홍길동, 홍길동2, 홍길동3
+				branch,
+				grade: 'F1', // 초기 등급
+				gradePaymentCount: 0,
+				// ⭐ v8.0: lastGradeChangeDate 제거 (gradeHistory virtual로 제공)
+				consecutiveGradeWeeks: 0,
+				insuranceActive: false,
+				insuranceAmount: 0,
+				// ⭐ v8.0: 비율 (지급액 계산에 사용)
+				ratio: ratio,
+				salesperson,
+				salespersonPhone,
+				insuranceProduct,
+				insuranceCompany,
+				status: 'active',
+				type: 'user',
+				createdAt: createdAt
+			});
 
-				const savedUser = await newUser.save();
-				// v8.0: registeredUsers는 User._id 기준 (내부 트리 처리용)
-				this.registeredUsers.set(savedUser._id.toString(), { user: savedUser, salesperson, name: displayName, row });
-				usersByOrder.push({ userId: savedUser._id.toString(), salesperson, name: displayName, row });
+			pendingUsers.push({ doc: newUser, salesperson, name: displayName, row });
+		});
 
-				results.created++;
-			} catch (error) {
-				results.failed++;
+		// ⭐ v9.7: sequence 블록 예약 (검증 통과 행만, 정렬된 순서대로 연속 번호)
+		const firstSequence = await allocateUserSequences(pendingUsers.length);
+		pendingUsers.forEach((p, index) => {
+			p.doc.sequence = firstSequence + index;
+		});
 
-				let userFriendlyMsg = `행 ${row}: `;
+		// ⭐ v9.7: User 일괄 저장 (순서 유지 배치)
+		const { saved, failures } = await insertInBatches(
+			User,
+			pendingUsers.map((p) => p.doc),
+			async (insertedCount) => {
+				await this.reportProgress('create', insertedCount, parsedUsers.length, '사용자 생성');
+			}
+		);
 
-				if (error.message.includes('Cast to ObjectId')) {
-					userFriendlyMsg += `데이터 형식 오류 (${name || '이름 없음'})`;
-				} else if (error.code === 11000 || error.message.includes('duplicate')) {
-					userFriendlyMsg += `이미 등록된 사용자 (${name || '이름 없음'})`;
-				} else if (error.name === 'ValidationError') {
-					userFriendlyMsg += `필수 항목 누락 (${name || '이름 없음'})`;
-				} else {
-					userFriendlyMsg += `등록 실패 (${name || '이름 없음'})`;
-				}
+		// 저장 실패 행의 번호 정리 (빈 번호 없이 재배정, 남은 번호 반환)
+		if (saved.size < pendingUsers.length) {
+			await releaseUnusedSequences(firstSequence, pendingUsers.length, [...saved.values()]);
+		}
 
-				results.errors.push(userFriendlyMsg);
+		for (const { doc, salesperson, name, row } of pendingUsers) {
+			const id = doc._id.toString();
+			const savedUser = saved.get(id);
 
-				console.error('사용자 등록 실패', {
-					row,
-					name: name || 'unknown',
-					error: error.message,
-					stack: error.stack
-				});
+			if (!savedUser) {
+				this.recordRowFailure(results, failures.get(id) || new Error('저장 실패'), row, name);
+				continue;
 			}
+
+			// v8.0: registeredUsers는 User._id 기준 (내부 트리 처리용)
+			this.registeredUsers.set(id, { user: savedUser, salesperson, name, row });
+			results.created++;
 		}
 
 		return results;
 	}
 
+	/**
+	 * 기존 계정 조회 ($in 조회, 행 수와 무관)
+	 * - UserAccount: loginId(소문자) → 계정
+	 * - PlannerAccount: 설계사명 → 계정
+	 * - 기존 UserAccount별 마지막 registrationNumber
+	 */
+	async loadExistingAccounts(parsedUsers) {
+		const loginIds = [...new Set(parsedUsers.map((p) => p.loginId.toLowerCase()))];
+		const plannerNames = [...new Set(parsedUsers.map((p) => p.plannerName))];
+
+		const [existingAccounts, existingPlanners] = await Promise.all([
+			UserAccount.find({ loginId: { $in: loginIds } }).select('_id loginId').lean(),
+			PlannerAccount.find({ loginId: { $in: plannerNames } }).select('_id loginId').lean()
+		]);
+
+		const registrationRows = existingAccounts.length > 0
+			? await User.aggregate([
+					{ $match: { userAccountId: { $in: existingAccounts.map((a) => a._id) } } },
+					{ $group: { _id: '$userAccountId', last: { $max: '$registrationNumber' } } }
+				])
+			: [];
+
+		return {
+			accountsByLoginId: new Map(existingAccounts.map((a) => [a.loginId, a])),
+			plannersByName: new Map(existingPlanners.map((p) => [p.loginId, p])),
+			lastRegistrationNumbers: new Map(registrationRows.map((r) => [r._id.toString(), r.last || 0]))
+		};
+	}
+
+	/**
+	 * 신규 UserAccount / PlannerAccount 생성
+	 * - 같은 ID / 설계사명이 여러 행에 있으면 첫 행(날짜순) 기준 1회만 생성
+	 * - 비밀번호 해시는 워커 풀에서 병렬 처리, 저장은 insertMany
+	 * - 생성된 계정은 accountsByLoginId / plannersByName에 추가
+	 *
+	 * @returns {Promise<Map<string, Error>>} 실패한 계정 (key: user:{loginId} | planner:{설계사명})
+	 */
+	async createMissingAccounts(parsedUsers, accountsByLoginId, plannersByName) {
+		const newUserRows = new Map(); // loginId(소문자) -> 첫 행
+		const newPlannerRows = new Map(); // 설계사명 -> 첫 행
+
+		for (const parsed of parsedUsers) {
+			const loginId = parsed.loginId.toLowerCase();
+			if (!accountsByLoginId.has(loginId) && !newUserRows.has(loginId)) {
+				newUserRows.set(loginId, parsed);
+			}
+			if (!plannersByName.has(parsed.plannerName) && !newPlannerRows.has(parsed.plannerName)) {
+				newPlannerRows.set(parsed.plannerName, parsed);
+			}
+		}
+
+		const startTime = Date.now();
+		const [userHashes, plannerHashes] = await Promise.all([
+			Promise.all(Array.from(newUserRows.values(), (p) => hashPassword(getInitialUserPassword(p.phone), 10))),
+			Promise.all(
+				Array.from(newPlannerRows.values(), (p) =>
+					hashPassword(getInitialPlannerPassword(p.plannerPhone || '010-0000-0000'), 10)
+				)
+			)
+		]);
+		console.log(
+			`🔐 비밀번호 해시: 용역자 ${userHashes.length}건, 설계사 ${plannerHashes.length}건 (${Date.now() - startTime}ms)`
+		);
+
+		// 신규: UserAccount (재등록은 개인정보 업데이트 안 함 - v8.0 설계 원칙)
+		const userAccountDocs = Array.from(newUserRows.entries(), ([loginId, p], i) => new UserAccount({
+			loginId,
+			passwordHash: userHashes[i],
+			name: p.name,
+			phone: p.phone,
+			idNumber: p.idNumber,
+			bank: p.bank,
+			accountNumber: p.accountNumber,
+			email: null,
+			status: 'active',
+			createdAt: p.createdAt
+		}));
+
+		// v8.0: PlannerAccount 자동 생성 (엑셀의 설계사 전화번호 사용, 없으면 기본값)
+		const plannerDocs = Array.from(newPlannerRows.entries(), ([plannerName, p], i) => new PlannerAccount({
+			loginId: plannerName,
+			passwordHash: plannerHashes[i],
+			name: plannerName,
+			phone: p.plannerPhone || '010-0000-0000',
+			// ⭐ v8.0: 설계사 계좌 정보
+			bank: p.plannerBank || '',
+			accountNumber: p.plannerAccountNumber || '',
+			status: 'active',
+			createdAt: p.createdAt
+		}));
+
+		const [userResult, plannerResult] = await Promise.all([
+			insertInBatches(UserAccount, userAccountDocs),
+			insertInBatches(PlannerAccount, plannerDocs)
+		]);
+
+		const errors = new Map();
+		for (const doc of userAccountDocs) {
+			const id = doc._id.toString();
+			if (userResult.saved.has(id)) {
+				accountsByLoginId.set(doc.loginId, userResult.saved.get(id));
+			} else {
+				errors.set(`user:${doc.loginId}`, userResult.failures.get(id));
+			}
+		}
+		for (const doc of plannerDocs) {
+			const id = doc._id.toString();
+			if (plannerResult.saved.has(id)) {
+				plannersByName.set(doc.loginId, plannerResult.saved.get(id));
+			} else {
+				errors.set(`planner:${doc.loginId}`, plannerResult.failures.get(id));
+			}
+		}
+
+		console.log(
+			`✅ 계정 생성: UserAccount ${userResult.saved.size}건, PlannerAccount ${plannerResult.saved.size}건 (실패 ${errors.size}건)`
+		);
+		if (plannerResult.saved.size > 0) {
+			console.log(`✅ PlannerAccount 자동 생성: ${Array.from(newPlannerRows.keys()).join(', ')} (초기 비밀번호: 설계사 연락처 뒤 4자리)`);
+		}
+
+		return errors;
+	}
+
+	/**
+	 * 행 등록 실패 기록
+	 */
+	recordRowFailure(results, error, row, name) {
+		results.failed++;
+
+		let userFriendlyMsg = `행 ${row}: `;
+
+		if (error.message.includes('Cast to ObjectId')) {
+			userFriendlyMsg += `데이터 형식 오류 (${name || '이름 없음'})`;
+		} else if (error.code === 11000 || error.message.includes('duplicate')) {
+			userFriendlyMsg += `이미 등록된 사용자 (${name || '이름 없음'})`;
+		} else if (error.name === 'ValidationError') {
+			userFriendlyMsg += `필수 항목 누락 (${name || '이름 없음'})`;
+		} else {
+			userFriendlyMsg += `등록 실패 (${name || '이름 없음'})`;
+		}
+
+		results.errors.push(userFriendlyMsg);
+
+		console.error('사용자 등록 실패', {
+			row,
+			name: name || 'unknown',
+			error: error.message,
+			stack: error.stack
+		});
+	}
+
 	/**
 	 * 3단계: 트리 재구성
 	 * - smartTreeRestructure 호출
@@ -649,7 +830,7 @@ export class UserRegistrationService {
 				plans: []
 			};
 
-			for (const monthKey of sortedMonths) {
+			for (const [monthIndex, monthKey] of sortedMonths.entries()) {
 				const users = usersByMonth.get(monthKey);
 				const userIds = users.map((u) => u._id);
 
@@ -657,7 +838,10 @@ export class UserRegistrationService {
 🔄 [${monthKey}] 월별 배치 처리 시작: ${users.length}명`);
 
 				// registrationService로 등급 재계산 및 지급 계획 생성
-				const monthResult = await processUserRegistration(userIds);
+				const monthResult = await processUserRegistration(userIds, {
+					onStep: (stepName) =>
+						this.reportProgress('batch', monthIndex, sortedMonths.length, `${monthKey} ${stepName}`)
+				});
 
 				// 결과 병합
 				allResults.revenue.totalRevenue += monthResult.revenue?.totalRevenue || 0;
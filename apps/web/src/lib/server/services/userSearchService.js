@@ -0,0 +1,291 @@
+/**
+ * 용역자 자동완성 검색 서비스
+ *
+ * - User.searchKeys(이름/초성 접미사, 아이디, 연락처)에 대한 접두사(^) 검색 → 인덱스 범위 조회
+ * - 검색 결과는 검색어 접두사 트라이에 짧은 TTL로 캐시
+ *   → 결과가 잘리지 않은(전체) 상위 접두사가 있으면 DB 조회 없이 메모리에서 걸러냄
+ * - 검색 키는 등록/수정 시 refreshUserSearchKeys로 갱신, 삭제 시 캐시만 무효화
+ * - 검색 키가 없는 기존 데이터는 프로세스 시작 후 첫 검색 시 백그라운드로 채움
+ *   (채우는 동안은 기존 이름 정규식 검색 사용)
+ */
+
+import mongoose from 'mongoose';
+import User from '../models/User.js';
+import { buildSearchKeys, toSearchPrefix } from '../utils/searchKeys.js';
+import { registerCounter } from '../metrics.js';
+
+const RESULT_LIMIT = 10;
+const FETCH_LIMIT = 50; // 이 개수 미만이면 "전체 결과"로 보고 하위 검색어를 메모리에서 처리
+const CACHE_TTL_MS = 30 * 1000;
+const MAX_CACHE_ENTRIES = 2000;
+const REFRESH_BATCH_SIZE = 1000;
+
+const cacheCounter = registerCounter(
+	'nanumpay_user_search_cache_total',
+	'Member autocomplete prefix cache lookups',
+	['result']
+);
+
+// 접두사 트라이: 노드 = { children: Map<char, node>, entry: { users, complete, expiresAt } | null }
+let root = createNode();
+let cacheSize = 0;
+
+// 'pending' | 'running' | 'ready'
+let backfillState = 'pending';
+
+function createNode() {
+	return { children: new Map(), entry: null };
+}
+
+function escapeRegex(text) {
+	return text.replace(/[.*+?^${}()|[\]\\]/g, '\\$&');
+}
+
+/**
+ * 캐시 조회: 정확히 일치하는 항목 또는 전체 결과를 가진 가장 가까운 상위 접두사
+ */
+function lookupCache(prefix, now) {
+	let node = root;
+	let ancestor = null;
+
+	for (const char of prefix) {
+		if (node.entry && node.entry.complete && node.entry.expiresAt > now) {
+			ancestor = node.entry;
+		}
+		node = node.children.get(char);
+		if (!node) break;
+	}
+
+	if (node?.entry && node.entry.expiresAt > now) {
+		return { entry: node.entry, exact: true };
+	}
+	if (ancestor) {
+		return { entry: ancestor, exact: false };
+	}
+	return null;
+}
+
+function storeCache(prefix, users, complete, now) {
+	if (cacheSize >= MAX_CACHE_ENTRIES) {
+		invalidateUserSearchCache();
+	}
+
+	let node = root;
+	for (const char of prefix) {
+		let child = node.children.get(char);
+		if (!child) {
+			child = createNode();
+			node.children.set(char, child);
+		}
+		node = child;
+	}
+
+	if (!node.entry) cacheSize++;
+	node.entry = { users, complete, expiresAt: now + CACHE_TTL_MS };
+}
+
+/**
+ * 검색 캐시 전체 무효화 (용역자 추가/수정/삭제 시)
+ */
+export function invalidateUserSearchCache() {
+	root = createNode();
+	cacheSize = 0;
+}
+
+function toResult(user) {
+	return {
+		_id: user._id,
+		name: user.name,
+		phone: user.phone,
+		branch: user.branch
+	};
+}
+
+/**
+ * 검색 키 갱신
+ * @param {Array<string|ObjectId>|null} userIds - null이면 검색 키가 없는 전체 용역자
+ * @returns {Promise<number>} 갱신 건수
+ */
+export async function refreshUserSearchKeys(userIds = null) {
+	if (userIds && userIds.length === 0) return 0;
+
+	// aggregate $match는 자동 캐스팅이 없으므로 ObjectId로 변환
+	const match = userIds
+		? { _id: { $in: userIds.map((id) => new mongoose.Types.ObjectId(String(id))) } }
+		: { searchKeys: { $exists: false } };
+
+	let updated = 0;
+	let lastId = null;
+
+	// _id 순 커서 방식으로 배치 처리
+	while (true) {
+		const batchMatch = lastId ? { $and: [match, { _id: { $gt: lastId } }] } : match;
+		const rows = await User.aggregate([
+			{ $match: batchMatch },
+			{ $sort: { _id: 1 } },
+			{ $limit: REFRESH_BATCH_SIZE },
+			{
+				$lookup: {
+					from: 'useraccounts',
+					localField: 'userAccountId',
+					foreignField: '_id',
+					as: 'account'
+				}
+			},
+			{
+				$project: {
+					name: 1,
+					loginId: { $arrayElemAt: ['$account.loginId', 0] },
+					phone: { $arrayElemAt: ['$account.phone', 0] }
+				}
+			}
+		]);
+
+		if (rows.length === 0) break;
+
+		await User.bulkWrite(
+			rows.map((row) => ({
+				updateOne: {
+					filter: { _id: row._id },
+					update: { $set: { searchKeys: buildSearchKeys(row) } }
+				}
+			})),
+			{ ordered: false }
+		);
+
+		updated += rows.length;
+		lastId = rows[rows.length - 1]._id;
+		if (rows.length < REFRESH_BATCH_SIZE) break;
+	}
+
+	invalidateUserSearchCache();
+	return updated;
+}
+
+/**
+ * 특정 계정에 연결된 용역자 검색 키 갱신 (아이디/연락처 변경 시)
+ * @param {string|ObjectId} userAccountId
+ */
+export async function refreshAccountSearchKeys(userAccountId) {
+	// 계정 없음 → { userAccountId: undefined } 조건이 제거되어 전체 조회되지 않도록
+	if (!userAccountId) return 0;
+	const users = await User.find({ userAccountId }).select('_id').lean();
+	if (users.length === 0) return 0;
+	return refreshUserSearchKeys(users.map((user) => user._id));
+}
+
+/**
+ * 검색 키가 없는 기존 데이터 채우기 (프로세스당 1회, 백그라운드)
+ */
+function ensureBackfill() {
+	if (backfillState !== 'pending') return;
+	backfillState = 'running';
+
+	(async () => {
+		const started = Date.now();
+		const updated = await refreshUserSearchKeys(null);
+		backfillState = 'ready';
+		if (updated > 0) {
+			console.log(`[UserSearch] 검색 키 생성 ${updated}건 (${Date.now() - started}ms)`);
+		}
+	})().catch((error) => {
+		console.error('[UserSearch] 검색 키 생성 실패:', error);
+		backfillState = 'pending';
+	});
+}
+
+/**
+ * 기존 방식 (이름 부분 일치) - 검색 키 생성 중에만 사용
+ */
+async function searchByNameRegex(query) {
+	return User.aggregate([
+		{
+			$match: {
+				name: { $regex: escapeRegex(query), $options: 'i' },
+				status: 'active'
+			}
+		},
+		{ $limit: RESULT_LIMIT },
+		{
+			$lookup: {
+				from: 'useraccounts',
+				localField: 'userAccountId',
+				foreignField: '_id',
+				as: 'account'
+			}
+		},
+		{
+			$project: {
+				_id: 1,
+				name: 1,
+				phone: { $arrayElemAt: ['$account.phone', 0] },
+				branch: 1
+			}
+		}
+	]);
+}
+
+/**
+ * 용역자 자동완성 검색
+ * - 이름(부분 일치), 초성(예: ㅎㄱㄷ), 아이디(앞부분), 연락처(앞부분/뒤 4자리)
+ * @param {string} query
+ * @returns {Promise<Array<{ _id, name, phone, branch }>>}
+ */
+export async function searchUsers(query) {
+	const prefix = toSearchPrefix(query);
+	if (!prefix) return [];
+
+	ensureBackfill();
+	if (backfillState !== 'ready') {
+		return searchByNameRegex(query.trim());
+	}
+
+	const now = Date.now();
+	const cached = lookupCache(prefix, now);
+
+	if (cached?.exact) {
+		cacheCounter.inc(['hit']);
+		return cached.entry.users.slice(0, RESULT_LIMIT).map(toResult);
+	}
+
+	if (cached) {
+		// 상위 접두사의 전체 결과에서 걸러냄
+		cacheCounter.inc(['prefix']);
+		const users = cached.entry.users.filter((user) =>
+			user.searchKeys.some((key) => key.startsWith(prefix))
+		);
+		storeCache(prefix, users, true, now);
+		return users.slice(0, RESULT_LIMIT).map(toResult);
+	}
+
+	cacheCounter.inc(['miss']);
+	const users = await User.aggregate([
+		{
+			$match: {
+				searchKeys: { $regex: `^${escapeRegex(prefix)}` },
+				status: 'active'
+			}
+		},
+		{ $limit: FETCH_LIMIT },
+		{
+			$lookup: {
+				from: 'useraccounts',
+				localField: 'userAccountId',
+				foreignField: '_id',
+				as: 'account'
+			}
+		},
+		{
+			$project: {
+				_id: 1,
+				name: 1,
+				phone: { $arrayElemAt: ['$account.phone', 0] },
+				branch: 1,
+				searchKeys: 1
+			}
+		}
+	]);
+
+	storeCache(prefix, users, users.length < FETCH_LIMIT, now);
+	return users.slice(0, RESULT_LIMIT).map(toResult);
+}
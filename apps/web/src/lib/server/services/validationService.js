@@ -29,86 +29,120 @@ class ValidationService {
 	 * @returns {Object} { isValid, errors }
 	 */
 	static async validateRegistration(userData) {
+		try {
+			const context = await this.loadRegistrationContext([userData]);
+			return this.validateRegistrationWithContext(userData, context);
+		} catch (error) {
+			logger.error('검증 중 오류:', error);
+			return {
+				isValid: false,
+				errors: [{ field: 'system', message: '검증 중 시스템 오류가 발생했습니다' }]
+			};
+		}
+	}
+
+	/**
+	 * ⭐ v9.7: 일괄 검증용 DB 조회 (행 수와 무관하게 쿼리 2회)
+	 * - 루트 노드 존재 여부
+	 * - 판매인(이름) → 좌우 자리 정보
+	 *
+	 * @param {Array<Object>} rows - { salesperson } 포함 데이터 배열
+	 * @returns {Promise<{ rootUser: Object|null, sponsorsByName: Map<string, Object> }>}
+	 */
+	static async loadRegistrationContext(rows) {
+		const sponsorNames = [
+			...new Set(rows.map((row) => row.salesperson).filter((name) => name && name !== '-'))
+		];
+		const needsRoot = rows.some((row) => !row.salesperson || row.salesperson === '-');
+
+		const [rootUser, sponsors] = await Promise.all([
+			needsRoot
+				? User.findOne({ parentId: null, type: 'user' }).select('name').lean()
+				: null,
+			sponsorNames.length > 0
+				? User.find({ name: { $in: sponsorNames }, type: 'user' })
+						.select('name leftChildId rightChildId')
+						.lean()
+				: []
+		]);
+
+		const sponsorsByName = new Map();
+		for (const sponsor of sponsors) {
+			if (!sponsorsByName.has(sponsor.name)) sponsorsByName.set(sponsor.name, sponsor);
+		}
+
+		return { rootUser, sponsorsByName };
+	}
+
+	/**
+	 * 용역자 등록 전 검증 (조회 결과 사용, DB 접근 없음)
+	 * @param {Object} userData - 등록할 용역자 데이터
+	 * @param {Object} context - loadRegistrationContext() 결과
+	 * @returns {Object} { isValid, errors }
+	 */
+	static validateRegistrationWithContext(userData, { rootUser, sponsorsByName }) {
 		const errors = [];
 
-		try {
-			// 1. 자기 자신을 판매인으로 등록 방지
-			if (userData.salesperson === userData.name) {
+		// 1. 자기 자신을 판매인으로 등록 방지
+		if (userData.salesperson === userData.name) {
+			errors.push({
+				field: 'salesperson',
+				message: '자기 자신을 판매인으로 등록할 수 없습니다'
+			});
+		}
+
+		// 2. 루트 노드 단일성 보장
+		if (!userData.salesperson || userData.salesperson === '-' || userData.salesperson === '') {
+			if (rootUser) {
 				errors.push({
 					field: 'salesperson',
-					message: '자기 자신을 판매인으로 등록할 수 없습니다'
+					message: `루트 노드는 이미 존재합니다 (${rootUser.name})`
 				});
 			}
+		}
 
-			// 2. 루트 노드 단일성 보장
-			if (!userData.salesperson || userData.salesperson === '-' || userData.salesperson === '') {
-				const rootExists = await User.findOne({
-					parentId: null,
-					type: 'user'
-				});
+		// 3. 판매인의 좌우 자리 확인
+		if (userData.salesperson && userData.salesperson !== '-') {
+			const sponsor = sponsorsByName.get(userData.salesperson);
 
-				if (rootExists) {
+			if (sponsor) {
+				// 좌우 자리 모두 차있는지 확인 (cascade 삭제로 필드가 항상 정확)
+				if (sponsor.leftChildId && sponsor.rightChildId) {
 					errors.push({
 						field: 'salesperson',
-						message: `루트 노드는 이미 존재합니다 (${rootExists.name})`
-					});
-				}
-			}
-
-			// 3. 판매인의 좌우 자리 확인
-			if (userData.salesperson && userData.salesperson !== '-') {
-				// 판매인 찾기 (이름으로 검색)
-				const sponsor = await User.findOne({
-					name: userData.salesperson,
-					type: 'user'
-				});
-
-				if (sponsor) {
-					// 좌우 자리 모두 차있는지 확인 (cascade 삭제로 필드가 항상 정확)
-					if (sponsor.leftChildId && sponsor.rightChildId) {
-						errors.push({
-							field: 'salesperson',
-							message: `${sponsor.name}님의 좌우 자리가 모두 차있어 추가할 수 없습니다`
-						});
-					}
-				} else if (userData.salesperson !== '-') {
-					// 판매인을 찾을 수 없는 경우 (나중에 처리될 수 있음)
-					logger.warn(`판매인 '${userData.salesperson}'을(를) 찾을 수 없습니다. 일괄 처리 중일 수 있습니다.`);
-				}
-			}
-
-			// 4. 필수 필드 검증
-			const requiredFields = ['name', 'phone', 'bank', 'accountNumber'];
-			for (const field of requiredFields) {
-				if (!userData[field]) {
-					errors.push({
-						field,
-						message: `${field}은(는) 필수 항목입니다`
+						message: `${sponsor.name}님의 좌우 자리가 모두 차있어 추가할 수 없습니다`
 					});
 				}
+			} else {
+				// 판매인을 찾을 수 없는 경우 (나중에 처리될 수 있음)
+				logger.warn(`판매인 '${userData.salesperson}'을(를) 찾을 수 없습니다. 일괄 처리 중일 수 있습니다.`);
 			}
+		}
 
-			// 5. 전화번호 형식 검증
-			if (userData.phone && !this.isValidPhoneNumber(userData.phone)) {
+		// 4. 필수 필드 검증
+		const requiredFields = ['name', 'phone', 'bank', 'accountNumber'];
+		for (const field of requiredFields) {
+			if (!userData[field]) {
 				errors.push({
-					field: 'phone',
-					message: '올바른 전화번호 형식이 아닙니다'
+					field,
+					message: `${field}은(는) 필수 항목입니다`
 				});
 			}
+		}
 
-			// 6. 계좌번호 형식 검증
-			if (userData.accountNumber && !this.isValidAccountNumber(userData.accountNumber)) {
-				errors.push({
-					field: 'accountNumber',
-					message: '올바른 계좌번호 형식이 아닙니다'
-				});
-			}
+		// 5. 전화번호 형식 검증
+		if (userData.phone && !this.isValidPhoneNumber(userData.phone)) {
+			errors.push({
+				field: 'phone',
+				message: '올바른 전화번호 형식이 아닙니다'
+			});
+		}
 
-		} catch (error) {
-			logger.error('검증 중 오류:', error);
+		// 6. 계좌번호 형식 검증
+		if (userData.accountNumber && !this.isValidAccountNumber(userData.accountNumber)) {
 			errors.push({
-				field: 'system',
-				message: '검증 중 시스템 오류가 발생했습니다'
+				field: 'accountNumber',
+				message: '올바른 계좌번호 형식이 아닙니다'
 			});
 		}
 
@@ -7,6 +7,10 @@ import WeeklyPaymentPlans from '../models/WeeklyPaymentPlans.js';
 import MonthlyRegistrations from '../models/MonthlyRegistrations.js';
 import User from '../models/User.js';
 import { GRADE_LIMITS } from '../utils/constants.js';
+import { markPlannerRollupsStale } from './plannerRollupService.js';
+import { installmentUpdateOp, applyPlanMutations } from './planMutationService.js';
+import { syncUserPaymentProgress } from './userProgressService.js';
+import { findWeekInstallments } from './paymentWeekBucketService.js';
 
 /**
  * 매주 금요일 지급 처리 메인 함수
@@ -26,27 +30,36 @@ export async function processWeeklyPayments(date = new Date()) {
     const paymentDate = new Date(date);
     paymentDate.setHours(0, 0, 0, 0);
 
-    // 1. 오늘 지급 대상 조회
-    const pendingPlans = await WeeklyPaymentPlans.find({
+    // 1. 주차 번호 계산
+    const weekNumber = WeeklyPaymentPlans.getISOWeek(paymentDate);
+
+    // 2. 오늘 지급 대상 조회
+    // ⭐ v9.7: 주차 버킷에서 오늘 회차가 있는 계획만 _id로 조회 (전체 스캔 없음)
+    // - 버킷 정합성은 재구성/완료 표시에서 보장, 완료 표시 전에는 계획 컬렉션 조회 결과
+    const nextDay = new Date(paymentDate.getTime() + 24 * 60 * 60 * 1000);
+    const planFilter = {
       'installments': {
         $elemMatch: {
-          scheduledDate: {
-            $gte: paymentDate,
-            $lt: new Date(paymentDate.getTime() + 24 * 60 * 60 * 1000)
-          },
+          scheduledDate: { $gte: paymentDate, $lt: nextDay },
           status: 'pending'
         }
       },
       planStatus: 'active'
+    };
+    const weekInstallments = await findWeekInstallments(weekNumber, {
+      planFilter,
+      from: paymentDate,
+      to: nextDay,
+      lean: false
     });
+    const pendingPlans = [...new Set(weekInstallments.map(({ plan }) => plan))];
 
     console.log(`처리 대상 계획: ${pendingPlans.length}개`);
 
-    // 2. 주차 번호 계산
-    const weekNumber = WeeklyPaymentPlans.getISOWeek(paymentDate);
-
     // 3. 각 계획별 지급 처리
     const processedPayments = [];
+    const mutationOps = [];
+    const progressUserIds = [];
 
     for (const plan of pendingPlans) {
       const installment = plan.getInstallmentByDate(paymentDate);
@@ -63,10 +76,15 @@ export async function processWeeklyPayments(date = new Date()) {
       const skipPayment = await checkInsuranceCondition(user, plan, installment);
       if (skipPayment) {
         // F4+ 보험 미가입 + 유예기간 외 → skip + 횟수 증가
-        installment.status = 'skipped';
-        installment.skipReason = skipPayment.reason;
+        // ⭐ v9.6: 해당 회차만 변경 (배열 전체 재저장 없음)
         plan.completedInstallments += 1;  // 회차는 증가 (지급한 것으로 인정)
-        await plan.save();
+        progressUserIds.push(plan.userId);
+        mutationOps.push(installmentUpdateOp(
+          plan._id,
+          installment.week,
+          { status: 'skipped', skipReason: skipPayment.reason },
+          { $inc: { completedInstallments: 1 } }
+        ));
         console.log(`⚠️ ${user.name}(${plan.baseGrade}) 지급 건너뜀 (보험 부족): 회차 ${plan.completedInstallments}/${plan.totalInstallments}`);
         continue;
       }
@@ -89,22 +107,30 @@ export async function processWeeklyPayments(date = new Date()) {
       );
 
       // 할부 정보 업데이트
-      installment.gradeAtPayment = confirmedGrade || plan.baseGrade;
-      installment.baseAmount = paymentAmounts.baseAmount;
-      installment.installmentAmount = paymentAmounts.installmentAmount;
-      installment.withholdingTax = paymentAmounts.withholdingTax;
-      installment.netAmount = paymentAmounts.netAmount;
       // ⭐ v8.0: status는 pending 유지 (과거 날짜 = 지급 완료로 간주)
       // installment.paidAt는 scheduledDate로 대체
-
+      // ⭐ v9.6: 해당 회차 필드만 변경 + 완료 횟수 $inc (배열 전체 재저장 없음)
       plan.completedInstallments += 1;
+      progressUserIds.push(plan.userId);
 
       // 계획 완료 체크
+      const planUpdate = { $inc: { completedInstallments: 1 } };
       if (plan.completedInstallments >= plan.totalInstallments) {
-        plan.planStatus = 'completed';
+        planUpdate.$set = { planStatus: 'completed' };
       }
 
-      await plan.save();
+      mutationOps.push(installmentUpdateOp(
+        plan._id,
+        installment.week,
+        {
+          gradeAtPayment: confirmedGrade || plan.baseGrade,
+          baseAmount: paymentAmounts.baseAmount,
+          installmentAmount: paymentAmounts.installmentAmount,
+          withholdingTax: paymentAmounts.withholdingTax,
+          netAmount: paymentAmounts.netAmount
+        },
+        planUpdate
+      ));
 
       processedPayments.push({
         userId: user._id.toString(),
@@ -116,6 +142,12 @@ export async function processWeeklyPayments(date = new Date()) {
       });
     }
 
+    // 변경 사항 일괄 저장
+    await applyPlanMutations(mutationOps);
+
+    // ⭐ v9.7: 회차가 증가한 용역자의 지급 진행률 갱신
+    await syncUserPaymentProgress(progressUserIds);
+
     // 4. 총액 계산
     const totalAmount = processedPayments.reduce((sum, p) => sum + p.amount, 0);
     const totalTax = processedPayments.reduce((sum, p) => sum + p.tax, 0);
@@ -123,6 +155,7 @@ export async function processWeeklyPayments(date = new Date()) {
 
     // 5. 처리 완료
     console.log(`=== 지급 처리 완료: ${processedPayments.length}건 ===`);
+    await markPlannerRollupsStale({ userIds: progressUserIds });
 
     return {
       success: true,
@@ -317,16 +350,14 @@ export async function getWeeklyPaymentReport(date) {
 
     const weekNumber = WeeklyPaymentPlans.getISOWeek(paymentDate);
 
-    // 개별 지급 내역 조회
-    const plans = await WeeklyPaymentPlans.find({
-      'installments': {
-        $elemMatch: {
-          weekNumber: weekNumber,
-          status: { $nin: ['skipped', 'terminated'] }  // ⭐ v8.0: paid 제거
-        }
-      }
-      // planStatus 조건 제거 - inst.status로 충분
-    });
+    // 개별 지급 내역 조회 (⭐ v9.7: 주차 버킷 → 해당 계획만)
+    // planStatus 조건 제거 - inst.status로 충분
+    const weekInstallments = await findWeekInstallments(weekNumber);
+    const plans = [...new Set(
+      weekInstallments
+        .filter(({ installment }) => !['skipped', 'terminated'].includes(installment.status))  // ⭐ v8.0: paid 제거
+        .map(({ plan }) => plan)
+    )];
 
     if (plans.length === 0) {
       return {
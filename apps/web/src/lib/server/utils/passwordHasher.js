@@ -0,0 +1,161 @@
+/**
+ * 비밀번호 해시 워커 풀 (bcrypt)
+ *
+ * - bcryptjs는 순수 JS라 해시 1건(~70ms) 동안 이벤트 루프를 점유함
+ * - worker_threads 풀(코어 수 - 1, 최대 8)로 분산 → 일괄 등록 시 코어 수에 비례해 처리
+ * - 워커에서 bcryptjs를 불러올 수 없는 실행 환경(단일 실행파일 번들 등)에서는
+ *   메인 스레드의 비동기 bcrypt.hash로 대체 (이벤트 루프는 양보하지만 병렬 처리 안 됨)
+ * - 유휴 상태가 지속되면 워커 종료
+ */
+
+import os from 'os';
+import { Worker } from 'worker_threads';
+import { createRequire } from 'module';
+import bcrypt from 'bcryptjs';
+
+const POOL_SIZE = Math.max(1, Math.min(8, (os.availableParallelism?.() ?? os.cpus().length) - 1));
+const IDLE_TIMEOUT_MS = 30 * 1000;
+
+const WORKER_SOURCE = `
+const { parentPort, workerData } = require('worker_threads');
+const bcrypt = require(workerData.bcryptPath);
+parentPort.on('message', ({ id, password, rounds }) => {
+  try {
+    parentPort.postMessage({ id, hash: bcrypt.hashSync(password, rounds) });
+  } catch (error) {
+    parentPort.postMessage({ id, error: error.message });
+  }
+});
+`;
+
+// 워커용 bcryptjs 경로 (해석 불가 시 null → 메인 스레드 대체)
+let bcryptPath = null;
+try {
+  bcryptPath = createRequire(import.meta.url).resolve('bcryptjs');
+} catch {
+  bcryptPath = null;
+}
+
+const workers = []; // { worker, busy }
+const queue = []; // { id, password, rounds, resolve, reject }
+const pending = new Map(); // id -> { resolve, reject, slot }
+let nextId = 0;
+let idleTimer = null;
+let poolDisabled = !bcryptPath;
+
+function disablePool(error) {
+  if (poolDisabled) return;
+  poolDisabled = true;
+  console.warn('[passwordHasher] 워커 풀 사용 불가, 메인 스레드로 처리:', error?.message);
+
+  // 대기/진행 중 작업은 메인 스레드에서 다시 처리
+  const retry = [...queue.splice(0), ...Array.from(pending.values(), (p) => p.task)];
+  pending.clear();
+  for (const slot of workers.splice(0)) {
+    slot.worker.terminate();
+  }
+  for (const task of retry) {
+    bcrypt.hash(task.password, task.rounds).then(task.resolve, task.reject);
+  }
+}
+
+function createWorker() {
+  const worker = new Worker(WORKER_SOURCE, { eval: true, workerData: { bcryptPath } });
+  worker.unref();
+
+  const slot = { worker, busy: false };
+
+  worker.on('message', ({ id, hash, error }) => {
+    const entry = pending.get(id);
+    if (!entry) return;
+    pending.delete(id);
+    slot.busy = false;
+
+    if (error) {
+      entry.task.reject(new Error(error));
+    } else {
+      entry.task.resolve(hash);
+    }
+    dispatch();
+  });
+
+  worker.on('error', (error) => {
+    disablePool(error);
+  });
+
+  // 'error' 없이 종료된 경우 (강제 종료, 메모리 부족 등)
+  // - 슬롯 제거, 진행 중 작업은 1회 재시도 후 실패 처리
+  worker.on('exit', (code) => {
+    const index = workers.indexOf(slot);
+    if (index === -1) return; // 유휴 종료/풀 비활성화로 이미 제거됨
+    workers.splice(index, 1);
+
+    for (const [id, entry] of pending) {
+      if (entry.slot !== slot) continue;
+      pending.delete(id);
+      if (entry.task.retried) {
+        entry.task.reject(new Error(`비밀번호 해시 워커 비정상 종료 (code ${code})`));
+      } else {
+        entry.task.retried = true;
+        queue.unshift(entry.task);
+      }
+    }
+    dispatch();
+  });
+
+  workers.push(slot);
+  return slot;
+}
+
+function scheduleIdleShutdown() {
+  if (idleTimer) clearTimeout(idleTimer);
+  idleTimer = setTimeout(() => {
+    idleTimer = null;
+    if (queue.length > 0 || pending.size > 0) return;
+    for (const slot of workers.splice(0)) {
+      slot.worker.terminate();
+    }
+  }, IDLE_TIMEOUT_MS);
+  idleTimer.unref();
+}
+
+function dispatch() {
+  while (queue.length > 0 && !poolDisabled) {
+    let slot = workers.find((w) => !w.busy);
+    if (!slot) {
+      if (workers.length >= POOL_SIZE) break;
+      try {
+        slot = createWorker();
+      } catch (error) {
+        disablePool(error);
+        return;
+      }
+    }
+
+    const task = queue.shift();
+    slot.busy = true;
+    pending.set(task.id, { task, slot });
+    slot.worker.postMessage({ id: task.id, password: task.password, rounds: task.rounds });
+  }
+
+  if (queue.length === 0 && pending.size === 0) {
+    scheduleIdleShutdown();
+  }
+}
+
+/**
+ * 비밀번호 해시 (워커 풀)
+ * @param {string} password
+ * @param {number} rounds - bcrypt cost (기본 10)
+ * @returns {Promise<string>}
+ */
+export function hashPassword(password, rounds = 10) {
+  if (poolDisabled) {
+    return bcrypt.hash(password, rounds);
+  }
+
+  return new Promise((resolve, reject) => {
+    queue.push({ id: nextId++, password, rounds, resolve, reject });
+    dispatch();
+  });
+}
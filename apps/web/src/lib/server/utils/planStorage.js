@@ -0,0 +1,233 @@
+/**
+ * 지급 계획 압축 저장 (compact storage) 유틸리티
+ *
+ * 압축 모드:
+ * - installments 배열 대신 일정 파라미터(schedule) + 예외 목록(exceptions) 저장
+ * - n회차 지급일 = startDate + (n-1)주, 주차/금액/귀속월은 schedule에서 계산
+ * - 기본값(pending, 동일 금액)과 다른 회차만 exceptions에 { week, ...변경 필드 } 로 저장
+ *
+ * 읽기:
+ * - expandInstallments(): JS에서 installments 복원 (find/findOne 결과)
+ * - expandInstallmentsStage(): aggregate 파이프라인에서 installments 복원
+ */
+
+const WEEK_MS = 7 * 24 * 60 * 60 * 1000;
+
+// 회차별 기본값 (schedule 외 필드)
+const INSTALLMENT_DEFAULTS = {
+  gradeAtPayment: null,
+  status: 'pending',
+  insuranceSkipped: false
+};
+
+// exceptions로 보존하는 필드 (지급일/회차 제외)
+const OVERRIDE_FIELDS = [
+  'weekNumber',
+  'revenueMonth',
+  'gradeAtPayment',
+  'baseAmount',
+  'installmentAmount',
+  'withholdingTax',
+  'netAmount',
+  'status',
+  'paidAt',
+  'skipReason',
+  'insuranceSkipped',
+  'terminatedReason'
+];
+
+const SCHEDULE_FIELDS = ['revenueMonth', 'baseAmount', 'installmentAmount', 'withholdingTax', 'netAmount'];
+
+/**
+ * ISO 주차 계산 (로컬 시간 기준, "2025-W41")
+ */
+export function getISOWeek(date) {
+  const d = new Date(date);
+  d.setHours(0, 0, 0, 0);
+  d.setDate(d.getDate() + 4 - (d.getDay() || 7));
+  const yearStart = new Date(d.getFullYear(), 0, 1);
+  const weekNo = Math.ceil((((d - yearStart) / 86400000) + 1) / 7);
+  return `${d.getFullYear()}-W${String(weekNo).padStart(2, '0')}`;
+}
+
+function sameValue(a, b) {
+  if (a instanceof Date || b instanceof Date) {
+    return a != null && b != null && new Date(a).getTime() === new Date(b).getTime();
+  }
+  // null/undefined 동일 취급
+  return (a ?? null) === (b ?? null);
+}
+
+/**
+ * n회차 기본 installment (예외 적용 전)
+ */
+function defaultInstallment(startDate, schedule, week) {
+  const scheduledDate = new Date(new Date(startDate).getTime() + (week - 1) * WEEK_MS);
+  return {
+    week,
+    weekNumber: getISOWeek(scheduledDate),
+    scheduledDate,
+    revenueMonth: schedule.revenueMonth,
+    baseAmount: schedule.baseAmount,
+    installmentAmount: schedule.installmentAmount,
+    withholdingTax: schedule.withholdingTax,
+    netAmount: schedule.netAmount,
+    ...INSTALLMENT_DEFAULTS
+  };
+}
+
+/**
+ * 계획을 압축 형식으로 변환
+ * - 회차가 1..totalInstallments 연속 + 지급일이 startDate부터 매주인 경우만 압축
+ *
+ * @param {Object} plan - plain object (lean)
+ * @returns {{ schedule: Object, exceptions: Array }|null} 압축 불가 시 null
+ */
+export function compactInstallments(plan) {
+  const installments = [...(plan.installments || [])].sort((a, b) => a.week - b.week);
+  if (!plan.startDate || installments.length === 0 || installments.length !== plan.totalInstallments) {
+    return null;
+  }
+
+  const first = installments[0];
+  const schedule = {};
+  for (const field of SCHEDULE_FIELDS) {
+    schedule[field] = first[field];
+  }
+
+  const exceptions = [];
+  for (let i = 0; i < installments.length; i++) {
+    const inst = installments[i];
+    const expected = defaultInstallment(plan.startDate, schedule, i + 1);
+
+    if (inst.week !== i + 1 || !sameValue(inst.scheduledDate, expected.scheduledDate)) {
+      return null;
+    }
+
+    const override = {};
+    for (const field of OVERRIDE_FIELDS) {
+      if (!sameValue(inst[field], expected[field])) {
+        override[field] = inst[field];
+      }
+    }
+    if (Object.keys(override).length > 0) {
+      exceptions.push({ week: i + 1, ...override });
+    }
+  }
+
+  return { schedule, exceptions };
+}
+
+/**
+ * 압축 계획의 installments 복원
+ *
+ * @param {Object} plan - startDate, totalInstallments, schedule, exceptions 포함
+ * @returns {Array|null} schedule이 없으면 null (projection으로 제외된 경우 등)
+ */
+export function expandInstallments(plan) {
+  if (!plan.schedule || !plan.startDate) {
+    return null;
+  }
+
+  const overrides = new Map((plan.exceptions || []).map(e => [e.week, e]));
+  const installments = [];
+  for (let week = 1; week <= plan.totalInstallments; week++) {
+    installments.push({
+      ...defaultInstallment(plan.startDate, plan.schedule, week),
+      ...(overrides.get(week) || {})
+    });
+  }
+  return installments;
+}
+
+/**
+ * aggregate용 installments 복원 단계
+ * - storageMode=compact 문서만 schedule/exceptions로 installments 재구성, 나머지는 그대로
+ * - weekNumber는 서버 타임존 기준 ISO 주차 (%G-W%V, getISOWeek와 동일)
+ */
+export function expandInstallmentsStage() {
+  const timezone = Intl.DateTimeFormat().resolvedOptions().timeZone;
+
+  return {
+    $addFields: {
+      installments: {
+        $cond: [
+          { $eq: ['$storageMode', 'compact'] },
+          {
+            $map: {
+              input: { $range: [0, '$totalInstallments'] },
+              as: 'i',
+              in: {
+                $let: {
+                  vars: {
+                    date: { $add: ['$startDate', { $multiply: ['$$i', WEEK_MS] }] },
+                    override: {
+                      $arrayElemAt: [
+                        {
+                          $filter: {
+                            input: { $ifNull: ['$exceptions', []] },
+                            as: 'e',
+                            cond: { $eq: ['$$e.week', { $add: ['$$i', 1] }] }
+                          }
+                        },
+                        0
+                      ]
+                    }
+                  },
+                  in: {
+                    $mergeObjects: [
+                      {
+                        week: { $add: ['$$i', 1] },
+                        weekNumber: { $dateToString: { format: '%G-W%V', date: '$$date', timezone } },
+                        scheduledDate: '$$date',
+                        revenueMonth: '$schedule.revenueMonth',
+                        baseAmount: '$schedule.baseAmount',
+                        installmentAmount: '$schedule.installmentAmount',
+                        withholdingTax: '$schedule.withholdingTax',
+                        netAmount: '$schedule.netAmount',
+                        ...INSTALLMENT_DEFAULTS
+                      },
+                      { $ifNull: ['$$override', {}] }
+                    ]
+                  }
+                }
+              }
+            }
+          },
+          '$installments'
+        ]
+      }
+    }
+  };
+}
+
+/**
+ * aggregate 파이프라인에 복원 단계 삽입
+ * - installments를 처음 참조하는 단계 앞에 삽입 (그 이전 $match는 인덱스 그대로 사용)
+ * - 해당 단계가 $match면 압축 문서도 통과하도록 $or로 넓힌 뒤 복원 후 원래 조건 재적용
+ *
+ * @param {Array} pipeline - 수정할 파이프라인 (in-place)
+ */
+export function injectExpandStage(pipeline) {
+  if (pipeline.some(stage => stage.$addFields?.installments?.$cond)) {
+    return;
+  }
+
+  const index = pipeline.findIndex(stage => JSON.stringify(stage).includes('installments'));
+  if (index === -1) {
+    return;
+  }
+
+  const stage = pipeline[index];
+  if (stage.$match) {
+    pipeline.splice(
+      index,
+      1,
+      { $match: { $or: [stage.$match, { storageMode: 'compact' }] } },
+      expandInstallmentsStage(),
+      stage
+    );
+  } else {
+    pipeline.splice(index, 0, expandInstallmentsStage());
+  }
+}
@@ -0,0 +1,94 @@
+/**
+ * 용역자 검색 키 생성 (자동완성용)
+ *
+ * - 이름: 소문자/공백 제거 후 모든 접미사 (예: 홍길동 → 홍길동, 길동, 동)
+ *   → 접두사(^) 검색만으로 기존 부분 일치 검색과 같은 결과
+ * - 초성: 이름의 초성 문자열 접미사 (예: ㅎㄱㄷ, ㄱㄷ, ㄷ)
+ * - 아이디: 소문자
+ * - 연락처: 숫자 전체, 뒤 4자리
+ */
+
+const CHOSEONG = [
+  'ㄱ', 'ㄲ', 'ㄴ', 'ㄷ', 'ㄸ', 'ㄹ', 'ㅁ', 'ㅂ', 'ㅃ', 'ㅅ',
+  'ㅆ', 'ㅇ', 'ㅈ', 'ㅉ', 'ㅊ', 'ㅋ', 'ㅌ', 'ㅍ', 'ㅎ'
+];
+const HANGUL_START = 0xac00;
+const HANGUL_END = 0xd7a3;
+const SYLLABLES_PER_CHOSEONG = 588; // 21 중성 × 28 종성
+
+const MAX_SUFFIX_LENGTH = 20;
+
+/**
+ * 검색용 정규화 (소문자, 공백 제거, NFC)
+ */
+export function normalizeSearchText(text) {
+  return String(text ?? '')
+    .normalize('NFC')
+    .toLowerCase()
+    .replace(/\s+/g, '');
+}
+
+/**
+ * 한글 음절 → 초성 (그 외 문자는 그대로)
+ */
+export function toChoseong(text) {
+  let result = '';
+  for (const char of text) {
+    const code = char.charCodeAt(0);
+    if (code >= HANGUL_START && code <= HANGUL_END) {
+      result += CHOSEONG[Math.floor((code - HANGUL_START) / SYLLABLES_PER_CHOSEONG)];
+    } else {
+      result += char;
+    }
+  }
+  return result;
+}
+
+function suffixes(text) {
+  const chars = Array.from(text).slice(0, MAX_SUFFIX_LENGTH);
+  return chars.map((_, i) => chars.slice(i).join(''));
+}
+
+/**
+ * 검색 키 배열 생성
+ * @param {Object} params
+ * @param {string} params.name
+ * @param {string} params.loginId
+ * @param {string} params.phone
+ * @returns {Array<string>}
+ */
+export function buildSearchKeys({ name, loginId, phone }) {
+  const keys = new Set();
+
+  const normalizedName = normalizeSearchText(name);
+  if (normalizedName) {
+    suffixes(normalizedName).forEach((key) => keys.add(key));
+    const choseong = toChoseong(normalizedName);
+    if (choseong !== normalizedName) {
+      suffixes(choseong).forEach((key) => keys.add(key));
+    }
+  }
+
+  const normalizedLoginId = normalizeSearchText(loginId);
+  if (normalizedLoginId) keys.add(normalizedLoginId);
+
+  const phoneDigits = String(phone ?? '').replace(/\D/g, '');
+  if (phoneDigits.length >= 4) {
+    keys.add(phoneDigits);
+    keys.add(phoneDigits.slice(-4));
+  }
+
+  return Array.from(keys);
+}
+
+/**
+ * 검색어 → 검색 키 접두사
+ * - 숫자/하이픈만 있으면 연락처로 보고 숫자만 사용
+ */
+export function toSearchPrefix(query) {
+  const normalized = normalizeSearchText(query);
+  if (/^[\d-]+$/.test(normalized)) {
+    return normalized.replace(/-/g, '');
+  }
+  return normalized;
+}
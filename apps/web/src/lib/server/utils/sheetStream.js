@@ -0,0 +1,77 @@
+/**
+ * 스프레드시트 스트리밍 작성 유틸리티
+ *
+ * - xlsx: ExcelJS 스트리밍 WorkbookWriter (행 단위 commit → 메모리에 시트 전체를 유지하지 않음)
+ * - csv: UTF-8 BOM + RFC 4180 이스케이프 (Excel 한글 호환)
+ * - 출력 스트림의 backpressure를 따름 (write가 false면 drain까지 대기)
+ */
+
+import ExcelJS from 'exceljs';
+import { once } from 'events';
+
+export const SHEET_FORMATS = {
+  xlsx: {
+    contentType: 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
+    extension: 'xlsx'
+  },
+  csv: {
+    contentType: 'text/csv; charset=utf-8',
+    extension: 'csv'
+  }
+};
+
+function toCsvCell(value) {
+  if (value === null || value === undefined) return '';
+  const text = String(value);
+  return /[",\r\n]/.test(text) ? `"${text.replace(/"/g, '""')}"` : text;
+}
+
+/**
+ * 시트 작성기 생성
+ *
+ * @param {'xlsx'|'csv'} format
+ * @param {import('stream').Writable} output - HTTP 응답 스트림 등
+ * @param {Object} options
+ * @param {string} options.sheetName - 시트 이름 (xlsx)
+ * @param {Array<number>} options.columnWidths - 컬럼 너비 (xlsx)
+ * @returns {{ addRow: (values: Array, options?: { bold?: boolean }) => Promise<void>, end: () => Promise<void> }}
+ */
+export function createSheetWriter(format, output, { sheetName = 'Sheet1', columnWidths = [] } = {}) {
+  const waitForDrain = async () => {
+    if (output.writableNeedDrain) {
+      await once(output, 'drain');
+    }
+  };
+
+  if (format === 'csv') {
+    output.write('\uFEFF');
+    return {
+      async addRow(values) {
+        output.write(values.map(toCsvCell).join(',') + '\r\n');
+        await waitForDrain();
+      },
+      async end() {
+        output.end();
+      }
+    };
+  }
+
+  const workbook = new ExcelJS.stream.xlsx.WorkbookWriter({ stream: output, useStyles: true });
+  const worksheet = workbook.addWorksheet(sheetName);
+  worksheet.columns = columnWidths.map((width) => ({ width }));
+
+  return {
+    async addRow(values, { bold = false } = {}) {
+      const row = worksheet.addRow(values);
+      if (bold) {
+        row.font = { bold: true };
+      }
+      row.commit();
+      await waitForDrain();
+    },
+    async end() {
+      worksheet.commit();
+      await workbook.commit();
+    }
+  };
+}
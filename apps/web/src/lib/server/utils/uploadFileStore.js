@@ -0,0 +1,142 @@
+/**
+ * 업로드 원본 파일 저장소 (GridFS, 내용 해시 기반)
+ *
+ * - 파일 내용의 sha256을 GridFS filename으로 사용 → 같은 파일을 다시 올려도 1번만 저장
+ * - gzip 압축 후 청크 단위로 저장 (UploadHistory 문서에는 fileHash만 보관)
+ * - 다운로드는 GridFS 스트림 → gunzip 스트림으로 전달 (전체 파일을 메모리에 올리지 않음)
+ * - 기존 인라인 저장(fileData), 파일 시스템 저장(filePath) 레코드도 같은 방식으로 읽음
+ * - 기존 레코드 이전: scripts/migrate-upload-files.js
+ * - 참조 수(metadata.refCount)를 GridFS 파일 문서에서 원자적으로 증감
+ *   → 중복 재사용(+1)과 삭제(-1 → 0이면 파일 삭제)가 동시에 일어나도 사용 중인 파일을 지우지 않음
+ *   (0이 된 파일은 재사용 대상에서 제외, 같은 내용을 다시 올리면 새로 저장)
+ * - refCount가 없는 파일(참조 수 도입 이전 저장분)은 재사용만 하고 삭제하지 않음
+ */
+
+import crypto from 'crypto';
+import fs from 'fs';
+import zlib from 'zlib';
+import { Readable, pipeline } from 'stream';
+import { pipeline as pipelineAsync } from 'stream/promises';
+import mongoose from 'mongoose';
+
+const BUCKET_NAME = 'uploadFiles';
+
+function getBucket() {
+  return new mongoose.mongo.GridFSBucket(mongoose.connection.db, { bucketName: BUCKET_NAME });
+}
+
+function getFilesCollection() {
+  return mongoose.connection.db.collection(`${BUCKET_NAME}.files`);
+}
+
+// 삭제 중(refCount 0)인 파일 제외
+async function findStoredFile(bucket, fileHash) {
+  return bucket
+    .find({ filename: fileHash, 'metadata.refCount': { $ne: 0 } })
+    .sort({ uploadDate: 1 })
+    .limit(1)
+    .next();
+}
+
+/**
+ * 파일 내용 해시 (sha256 hex)
+ */
+export function hashFileContent(buffer) {
+  return crypto.createHash('sha256').update(buffer).digest('hex');
+}
+
+/**
+ * 원본 파일 저장 (같은 내용이 이미 있으면 재사용, 참조 수 +1)
+ * - 업로드 기록 저장에 실패하면 releaseUploadFile로 참조를 되돌림
+ * @param {Buffer} buffer - 원본 파일 내용
+ * @returns {Promise<{ fileHash: string, compressedSize: number, deduplicated: boolean }>}
+ */
+export async function storeUploadFile(buffer) {
+  const fileHash = hashFileContent(buffer);
+  const bucket = getBucket();
+
+  // 사용 중인 파일만 재사용 (0이면 삭제 진행 중)
+  const existing =
+    (await getFilesCollection().findOneAndUpdate(
+      { filename: fileHash, 'metadata.refCount': { $gt: 0 } },
+      { $inc: { 'metadata.refCount': 1 } }
+    )) ||
+    (await bucket.find({ filename: fileHash, 'metadata.refCount': { $exists: false } }).limit(1).next());
+  if (existing) {
+    return { fileHash, compressedSize: existing.length, deduplicated: true };
+  }
+
+  const upload = bucket.openUploadStream(fileHash, {
+    metadata: { encoding: 'gzip', originalSize: buffer.length, refCount: 1 }
+  });
+  await pipelineAsync(Readable.from([buffer]), zlib.createGzip(), upload);
+
+  const stored = await bucket.find({ _id: upload.id }).limit(1).next();
+  return { fileHash, compressedSize: stored?.length || 0, deduplicated: false };
+}
+
+/**
+ * 원본 파일 읽기 스트림 (gunzip 적용)
+ * @param {Object} record - UploadHistory (fileHash | fileData | filePath)
+ * @returns {Promise<import('stream').Readable|null>} 데이터가 없으면 null
+ */
+export async function openUploadFileStream(record) {
+  let source = null;
+
+  if (record.fileHash) {
+    const bucket = getBucket();
+    const file = await findStoredFile(bucket, record.fileHash);
+    if (file) {
+      source = bucket.openDownloadStream(file._id);
+    }
+  } else if (record.fileData) {
+    // 레거시: 문서 내 gzip Buffer
+    source = Readable.from([Buffer.from(record.fileData.buffer ?? record.fileData)]);
+  } else if (record.filePath) {
+    // 레거시: 파일 시스템 gzip 파일
+    try {
+      await fs.promises.access(record.filePath);
+    } catch {
+      return null;
+    }
+    source = fs.createReadStream(record.filePath);
+  }
+
+  if (!source) return null;
+
+  return pipeline(source, zlib.createGunzip(), (error) => {
+    if (error) {
+      console.error('[uploadFileStore] 파일 읽기 실패:', error.message);
+    }
+  });
+}
+
+/**
+ * 파일 참조 해제 (업로드 기록 삭제 시, 참조 수 -1)
+ * - 0이 되면 파일 삭제 (감소와 재사용이 같은 문서의 원자적 갱신이라 경합 없음)
+ * @param {string} fileHash
+ * @returns {Promise<boolean>} 파일 삭제 여부
+ */
+export async function releaseUploadFile(fileHash) {
+  const file = await getFilesCollection().findOneAndUpdate(
+    { filename: fileHash, 'metadata.refCount': { $gt: 0 } },
+    { $inc: { 'metadata.refCount': -1 } },
+    { returnDocument: 'after' }
+  );
+  if (!file || file.metadata.refCount > 0) return false;
+
+  await getBucket().delete(file._id);
+  return true;
+}
+
+/**
+ * 저장소 전체 삭제 (DB 초기화)
+ */
+export async function dropUploadFiles() {
+  try {
+    await getBucket().drop();
+  } catch (error) {
+    // 컬렉션이 없으면 무시
+    if (error.codeName !== 'NamespaceNotFound') throw error;
+  }
+}
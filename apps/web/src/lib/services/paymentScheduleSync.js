@@ -0,0 +1,99 @@
+import { buildPaymentScheduleView } from '$lib/utils/paymentScheduleView.js';
+
+/**
+ * 내 지급 계획 로컬 캐시 + 변경분 동기화
+ * ⭐ v9.7
+ *
+ * - 지급 계획을 localStorage에 보관 → 앱/페이지를 열면 캐시로 즉시 표시
+ * - 이후 /api/user/payments/sync?since=<버전>으로 변경된 계획만 받아 병합
+ * - 이번 주 범위는 서버가 보낸 weekRange 사용 (기기 시계 무관, 오프라인이면 마지막 동기화 기준)
+ * - 로그아웃 시 localStorage.clear()로 함께 삭제됨
+ * - 모바일 앱(Capacitor)은 같은 사이트를 WebView로 열기 때문에 앱 저장소에 그대로 유지
+ */
+
+const CACHE_KEY = 'nanumpay.paymentSchedule.v1';
+
+function readCache() {
+	try {
+		const raw = localStorage.getItem(CACHE_KEY);
+		return raw ? JSON.parse(raw) : null;
+	} catch {
+		return null;
+	}
+}
+
+function writeCache(cache) {
+	try {
+		localStorage.setItem(CACHE_KEY, JSON.stringify(cache));
+	} catch (error) {
+		// 저장 공간 부족 등 → 캐시 없이 계속 사용
+		console.warn('[PaymentSchedule] 캐시 저장 실패:', error.message);
+	}
+}
+
+function toView(cache) {
+	const { summary, payments } = buildPaymentScheduleView(
+		Object.values(cache.plans),
+		cache.allRegistrations,
+		cache.weekRange
+	);
+	return {
+		user: cache.user,
+		allRegistrations: cache.allRegistrations,
+		summary,
+		payments
+	};
+}
+
+/**
+ * 캐시된 지급 내역 (없으면 null)
+ * @returns {{ user, allRegistrations, summary, payments } | null}
+ */
+export function loadCachedPaymentSchedule() {
+	const cache = readCache();
+	return cache?.weekRange ? toView(cache) : null;
+}
+
+/**
+ * 서버와 동기화 후 최신 지급 내역 반환
+ * @returns {Promise<{ user, allRegistrations, summary, payments }>}
+ */
+export async function syncPaymentSchedule() {
+	const cache = readCache();
+	const query = cache?.version ? `?since=${encodeURIComponent(cache.version)}` : '';
+
+	const response = await fetch(`/api/user/payments/sync${query}`);
+	const data = await response.json();
+
+	if (!response.ok || !data.success) {
+		throw new Error(data.message || '지원비 정보를 불러오는데 실패했습니다.');
+	}
+
+	const plans = data.full ? {} : { ...cache.plans };
+	for (const plan of data.plans) {
+		plans[plan.id] = plan;
+	}
+
+	// 다른 계정의 캐시이거나 캐시에 없는 계획이 있으면 전체 다시 받기
+	if (!data.full && (cache.user?.id !== data.user.id || data.planIds.some(id => !plans[id]))) {
+		localStorage.removeItem(CACHE_KEY);
+		return syncPaymentSchedule();
+	}
+
+	// 삭제된 계획 제거
+	const currentIds = new Set(data.planIds);
+	for (const id of Object.keys(plans)) {
+		if (!currentIds.has(id)) delete plans[id];
+	}
+
+	const next = {
+		version: data.version,
+		weekRange: data.weekRange,
+		user: data.user,
+		allRegistrations: data.allRegistrations,
+		plans
+	};
+	writeCache(next);
+
+	return toView(next);
+}
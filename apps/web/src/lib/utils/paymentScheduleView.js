@@ -0,0 +1,182 @@
+/**
+ * 내 지급 내역 화면 데이터 계산
+ *
+ * /api/user/payments(서버 집계)와 대시보드 로컬 캐시(paymentScheduleSync)가 같은 규칙으로 계산:
+ * - terminated/skipped 회차 제외
+ * - 주차 × 용역자별 합계, 같은 주차의 같은 이름은 한 행으로 합산 (최신 계획의 용역자 정보 사용)
+ * - 이번 주(일~토, 토요일은 다음 주) / 누적(이전) / 예정(이후) 합계
+ * - 이번 주 범위는 서버가 계산해 전달 (기기 시계/시간대와 무관)
+ * - 행 병합(mergePaymentRows)은 서버 집계 결과와 로컬 계산 결과가 같은 함수 사용
+ */
+
+const EXCLUDED_STATUSES = ['terminated', 'skipped'];
+
+function formatLocalDate(date) {
+  const year = date.getFullYear();
+  const month = String(date.getMonth() + 1).padStart(2, '0');
+  const day = String(date.getDate()).padStart(2, '0');
+  return `${year}-${month}-${day}`;
+}
+
+/**
+ * 주차번호(2025-W48)의 금요일 (ISO 8601 week date)
+ */
+function getFridayFromWeekNumber(weekNumberStr) {
+  const [year, week] = weekNumberStr.split('-W').map(Number);
+
+  // ISO 8601: 1월 4일이 포함된 주가 1주차
+  const jan4 = new Date(year, 0, 4);
+  const jan4Day = jan4.getDay() || 7;
+  const firstMonday = new Date(jan4);
+  firstMonday.setDate(jan4.getDate() - jan4Day + 1);
+
+  const friday = new Date(firstMonday);
+  friday.setDate(firstMonday.getDate() + (week - 1) * 7 + 4);
+  return friday;
+}
+
+/**
+ * 이번 주 범위 (토요일은 "금요일 지급 완료" → 다음 주)
+ * - 서버에서 호출 (서버 시각 기준), 결과는 JSON으로 전달 가능한 형태
+ * @param {Date} now
+ * @returns {{ start: string, end: string, date: string }} start/end ISO 문자열, date = 금요일 (YYYY-MM-DD)
+ */
+export function getPaymentWeekRange(now = new Date()) {
+  const dayOfWeek = now.getDay();
+  const weekOffset = dayOfWeek === 6 ? 7 : 0;
+
+  const start = new Date(now);
+  start.setDate(now.getDate() - dayOfWeek + weekOffset);
+  start.setHours(0, 0, 0, 0);
+
+  const end = new Date(start);
+  end.setDate(start.getDate() + 6);
+  end.setHours(23, 59, 59, 999);
+
+  const friday = new Date(start);
+  friday.setDate(start.getDate() + 5);
+
+  return { start: start.toISOString(), end: end.toISOString(), date: formatLocalDate(friday) };
+}
+
+function emptyTotals() {
+  return { amount: 0, tax: 0, net: 0 };
+}
+
+/**
+ * 주차 × 용역자별 합계 행 → 화면 행 (같은 주차의 같은 이름은 한 행으로 합산)
+ * - /api/user/payments는 서버 집계($facet rows) 결과를, buildPaymentScheduleView는 로컬 계산 결과를 전달
+ * @param {Array<{ weekNumber: string, userId: string, latestPlanAt: number, grades: Array<string>, amount: number, tax: number, netAmount: number }>} rows
+ * @param {Array<Object>} registrations - allRegistrations
+ * @returns {Array<Object>} 날짜순(최신순) 지급 행
+ */
+export function mergePaymentRows(rows, registrations) {
+  const userMap = new Map(registrations.map((reg) => [reg.id, reg]));
+
+  // 최신 계획 순으로 먼저 만든 행 기준 (용역자 정보)
+  const sortedRows = [...rows].sort((a, b) => b.latestPlanAt - a.latestPlanAt);
+  const weekUserMap = new Map();
+  for (const row of sortedRows) {
+    const user = userMap.get(row.userId);
+    if (!user) continue;
+
+    const groupKey = `${row.weekNumber}_${user.name}`;
+    let group = weekUserMap.get(groupKey);
+    if (!group) {
+      group = {
+        weekDate: getFridayFromWeekNumber(row.weekNumber),
+        weekNumber: row.weekNumber,
+        userId: row.userId,
+        userName: user.name,
+        registrationNumber: user.registrationNumber,
+        insuranceActive: user.insuranceActive || false,
+        gradeCount: {},
+        amount: 0,
+        tax: 0,
+        netAmount: 0
+      };
+      weekUserMap.set(groupKey, group);
+    }
+
+    for (const grade of row.grades) {
+      group.gradeCount[grade] = (group.gradeCount[grade] || 0) + 1;
+      if (!group.grade || grade > group.grade) {
+        group.grade = grade;
+      }
+    }
+    group.amount += row.amount;
+    group.tax += row.tax;
+    group.netAmount += row.netAmount;
+  }
+
+  // 날짜순 정렬 (최신순), weekDate는 API 응답과 같은 ISO 문자열 (화면에서 주차 그룹 키로 사용)
+  return [...weekUserMap.values()]
+    .sort((a, b) => b.weekDate - a.weekDate)
+    .map((payment) => ({ ...payment, weekDate: payment.weekDate.toISOString() }));
+}
+
+/**
+ * 지급 계획 목록 → 요약 + 주차별 지급 행
+ * @param {Array<Object>} plans - /api/user/payments/sync 의 plans 형식
+ * @param {Array<Object>} registrations - allRegistrations
+ * @param {{ start: string, end: string, date: string }} weekRange - getPaymentWeekRange (서버 계산)
+ * @returns {{ summary: Object, payments: Array<Object> }}
+ */
+export function buildPaymentScheduleView(plans, registrations, weekRange) {
+  const start = new Date(weekRange.start);
+  const end = new Date(weekRange.end);
+  const totals = {
+    thisWeek: emptyTotals(),
+    totalPaid: emptyTotals(),
+    upcoming: emptyTotals()
+  };
+
+  // 1. 주차 × 용역자별 합계
+  const rowMap = new Map();
+  for (const plan of plans) {
+    const planCreatedAt = new Date(plan.createdAt).getTime();
+
+    for (const inst of plan.installments) {
+      if (EXCLUDED_STATUSES.includes(inst.status)) continue;
+
+      const scheduledDate = new Date(inst.scheduledDate);
+      const bucket =
+        scheduledDate < start ? totals.totalPaid : scheduledDate > end ? totals.upcoming : totals.thisWeek;
+      bucket.amount += inst.installmentAmount;
+      bucket.tax += inst.withholdingTax;
+      bucket.net += inst.netAmount;
+
+      const key = `${inst.weekNumber}_${plan.userId}`;
+      let row = rowMap.get(key);
+      if (!row) {
+        row = {
+          weekNumber: inst.weekNumber,
+          userId: plan.userId,
+          latestPlanAt: 0,
+          grades: [],
+          amount: 0,
+          tax: 0,
+          netAmount: 0
+        };
+        rowMap.set(key, row);
+      }
+      row.latestPlanAt = Math.max(row.latestPlanAt, planCreatedAt);
+      row.grades.push(plan.baseGrade);
+      row.amount += inst.installmentAmount;
+      row.tax += inst.withholdingTax;
+      row.netAmount += inst.netAmount;
+    }
+  }
+
+  // 2. 같은 주차의 같은 이름 병합
+  const payments = mergePaymentRows([...rowMap.values()], registrations);
+
+  return {
+    summary: {
+      thisWeek: { date: weekRange.date, ...totals.thisWeek },
+      totalPaid: totals.totalPaid,
+      upcoming: totals.upcoming
+    },
+    payments
+  };
+}
@@ -21,8 +21,8 @@ export async function GET({ locals, url }) {
 		throw error(400, '잘못된 파일명입니다.');
 	}
 
-	// 백업 파일만 허용 (nanumpay-backup-YYYY-MM-DDTHH-MM-SS.tar.gz 형식)
-	if (!/^nanumpay-backup-.+\.tar\.gz$/.test(filename)) {
+	// 백업 파일만 허용 (nanumpay-backup-YYYY-MM-DDTHH-MM-SS.tar.gz / .archive.gz 형식)
+	if (!/^nanumpay-backup-.+\.(tar|archive)\.gz$/.test(filename)) {
 		throw error(400, '잘못된 백업 파일 형식입니다.');
 	}
 
@@ -82,13 +82,13 @@ export async function POST({ locals }) {
 		console.log(`[backup-execute] stdout:`, stdout);
 
 		// stdout에서 백업 파일 경로 추출
-		// 예: "✅ 압축 완료: nanumpay-backup-2025-10-26T03-55-12.tar.gz"
-		const backupFileMatch = stdout.match(/압축 완료:\s*(.+\.tar\.gz)/);
+		// 예: "✅ 압축 완료: nanumpay-backup-2025-10-26T03-55-12.tar.gz" (스트리밍 모드: .archive.gz)
+		const backupFileMatch = stdout.match(/압축 완료:\s*(.+\.(?:tar|archive)\.gz)/);
 
 		if (!backupFileMatch) {
 			console.error('[backup-execute] 백업 파일 경로를 찾을 수 없습니다:', stdout);
 			// FTP 업로드 실패는 무시하고, 압축 파일 자체만 확인
-			const altMatch = stdout.match(/nanumpay-backup-\d{4}-\d{2}-\d{2}T\d{2}-\d{2}-\d{2}\.tar\.gz/);
+			const altMatch = stdout.match(/nanumpay-backup-\d{4}-\d{2}-\d{2}T\d{2}-\d{2}-\d{2}\.(?:tar|archive)\.gz/);
 			if (altMatch) {
 				const filename = altMatch[0];
 				const backupFilePath = path.join(backupDir, filename);
@@ -133,7 +133,7 @@ export async function POST({ locals }) {
 		try {
 			const files = await fs.readdir(backupDir);
 			const backupFiles = files
-				.filter(f => f.startsWith('nanumpay-backup-') && f.endsWith('.tar.gz'))
+				.filter(f => /^nanumpay-backup-.+\.(tar|archive)\.gz$/.test(f))
 				.map(f => ({
 					name: f,
 					path: path.join(backupDir, f),
@@ -167,7 +167,7 @@ export async function POST({ locals }) {
 			}
 
 			// 압축 해제된 임시 디렉토리 정리
-			const dirs = files.filter(f => f.startsWith('nanumpay-backup-') && !f.endsWith('.tar.gz'));
+			const dirs = files.filter(f => f.startsWith('nanumpay-backup-') && !f.endsWith('.gz') && !f.endsWith('.partial'));
 			for (const dir of dirs) {
 				try {
 					const dirPath = path.join(backupDir, dir);
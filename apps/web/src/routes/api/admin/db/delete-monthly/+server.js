@@ -5,6 +5,12 @@ import WeeklyPaymentPlans from '$lib/server/models/WeeklyPaymentPlans.js';
 import User from '$lib/server/models/User.js';
 import PlannerAccount from '$lib/server/models/PlannerAccount.js';
 import PlannerCommissionPlan from '$lib/server/models/PlannerCommissionPlan.js';
+import { markPlannerRollupsStale } from '$lib/server/services/plannerRollupService.js';
+import { syncUserPaymentProgress } from '$lib/server/services/userProgressService.js';
+import { removeGradeInfoSnapshots } from '$lib/server/services/gradeInfoSnapshotService.js';
+import { syncUserSequenceCounter } from '$lib/server/services/sequenceService.js';
+import { invalidateUserSearchCache } from '$lib/server/services/userSearchService.js';
+import { invalidateUserNameIndex } from '$lib/server/services/userNameIndexService.js';
 
 export async function POST({ request, locals }) {
 	try {
@@ -190,6 +196,15 @@ export async function POST({ request, locals }) {
 			- 재처리 월: ${reprocessedMonth || '없음'}
 		`);
 
+		await markPlannerRollupsStale();
+		// ⭐ v9.7: 남은 용역자 지급 진행률 재계산
+		await syncUserPaymentProgress();
+		await removeGradeInfoSnapshots(monthKey);
+		// 삭제된 용역자의 등록 순번 재사용
+		await syncUserSequenceCounter();
+		invalidateUserSearchCache();
+		invalidateUserNameIndex();
+
 		return json({
 			success: true,
 			deletedUsers: deletedUsersCount,
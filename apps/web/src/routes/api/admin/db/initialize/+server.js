@@ -8,6 +8,12 @@ import PlannerCommissionPlan from '$lib/server/models/PlannerCommissionPlan.js';
 import MonthlyRegistrations from '$lib/server/models/MonthlyRegistrations.js';
 import WeeklyPaymentPlans from '$lib/server/models/WeeklyPaymentPlans.js';
 import UploadHistory from '$lib/server/models/UploadHistory.js';
+import { markPlannerRollupsStale } from '$lib/server/services/plannerRollupService.js';
+import { removeGradeInfoSnapshots } from '$lib/server/services/gradeInfoSnapshotService.js';
+import { syncUserSequenceCounter } from '$lib/server/services/sequenceService.js';
+import { invalidateUserSearchCache } from '$lib/server/services/userSearchService.js';
+import { invalidateUserNameIndex } from '$lib/server/services/userNameIndexService.js';
+import { dropUploadFiles } from '$lib/server/utils/uploadFileStore.js';
 import bcrypt from 'bcryptjs';
 import fs from 'fs/promises';
 import path from 'path';
@@ -37,6 +43,12 @@ export async function POST({ request, locals }) {
 		await MonthlyRegistrations.deleteMany({});
 		await WeeklyPaymentPlans.deleteMany({});
 		await UploadHistory.deleteMany({});
+		await dropUploadFiles();
+		await removeGradeInfoSnapshots();
+		await syncUserSequenceCounter();
+		invalidateUserSearchCache();
+		invalidateUserNameIndex();
+		await markPlannerRollupsStale();
 
 		console.log('[DB Initialize] 모든 데이터 삭제 완료');
 
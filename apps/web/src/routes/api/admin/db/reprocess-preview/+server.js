@@ -0,0 +1,41 @@
+/**
+ * GET /api/admin/db/reprocess-preview?monthKey=2025-10
+ * 월별 지급 계획 재처리 미리보기 (dry-run)
+ *
+ * - reprocessMonthPayments 실행 시 변경될 지급 계획을 메모리에서 계산
+ * - 사용자별 총액 / 주차별 지급액 diff만 반환 (DB 쓰기 없음)
+ */
+
+import { json } from '@sveltejs/kit';
+import { db } from '$lib/server/db.js';
+import { previewRegistration } from '$lib/server/services/registration/index.js';
+
+export async function GET({ url, locals }) {
+	// 관리자 권한 확인
+	if (!locals.user || locals.user.type !== 'admin') {
+		return json({ error: '관리자 권한이 필요합니다.' }, { status: 401 });
+	}
+
+	await db();
+
+	try {
+		const monthKey = url.searchParams.get('monthKey');
+
+		// monthKey 형식 검증 (YYYY-MM)
+		if (!monthKey || !/^\d{4}-(0[1-9]|1[0-2])$/.test(monthKey)) {
+			return json({ error: 'monthKey must be in YYYY-MM format' }, { status: 400 });
+		}
+
+		console.log(`\n🔍 [GET /api/admin/db/reprocess-preview] ${monthKey}`);
+
+		const preview = await previewRegistration(monthKey);
+		if (!preview) {
+			return json({ error: '해당 월의 등록 데이터가 없습니다.' }, { status: 404 });
+		}
+
+		return json({ success: true, dryRun: true, ...preview });
+	} catch (error) {
+		console.error('❌ [GET /api/admin/db/reprocess-preview] Error:', error);
+		return json({ error: '재처리 미리보기 중 오류가 발생했습니다.' }, { status: 500 });
+	}
+}
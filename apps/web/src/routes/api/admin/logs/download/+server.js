@@ -0,0 +1,124 @@
+/**
+ * 로그 파일 다운로드 API
+ * 로그 폴더의 모든 파일(.log, .log.gz)을 zip으로 압축하여 다운로드
+ * 기간 선택 지원: today, 1week, 1month, 2months, 3months, 6months, all
+ * ⭐ 서버 측 필터 지원 (스트리밍 중 적용)
+ *   - level: 로그 레벨 (쉼표 구분, 예: error,warn)
+ *   - q: 포함 문자열 (API 경로 등, 예: /api/admin/users)
+ */
+
+import fs from 'fs';
+import { Readable } from 'stream';
+import { logDir, getLogFiles, createLogArchive } from '$lib/server/services/logArchiveService.js';
+
+const LOG_LEVELS = ['error', 'warn', 'info', 'debug'];
+
+/**
+ * 기간에 따른 시작 날짜 키 계산
+ * @param {string} period - 기간 (today, 1week, 1month, 2months, 3months, 6months, all)
+ * @returns {string|null} - 시작 날짜 (YYYY-MM-DD, 로컬) 또는 null (전체)
+ */
+function getStartDateKey(period) {
+	const days = {
+		today: 0,
+		'1week': 7,
+		'1month': 30,
+		'2months': 60,
+		'3months': 90,
+		'6months': 180
+	}[period];
+
+	if (days === undefined) return null;
+
+	const start = new Date();
+	start.setHours(0, 0, 0, 0);
+	start.setDate(start.getDate() - days);
+
+	const year = start.getFullYear();
+	const month = String(start.getMonth() + 1).padStart(2, '0');
+	const day = String(start.getDate()).padStart(2, '0');
+	return `${year}-${month}-${day}`;
+}
+
+export async function GET({ locals, url }) {
+	// 인증 확인
+	if (!locals.user || locals.user.type !== 'admin') {
+		return new Response(JSON.stringify({ success: false, message: '인증이 필요합니다.' }), {
+			status: 401,
+			headers: { 'Content-Type': 'application/json' }
+		});
+	}
+
+	try {
+		// 기간 파라미터 가져오기 (기본값: all)
+		const period = url.searchParams.get('period') || 'all';
+		const startDateKey = getStartDateKey(period);
+
+		// 필터 파라미터
+		const levelParam = (url.searchParams.get('level') || '').toLowerCase();
+		const levelList = levelParam
+			.split(',')
+			.map((l) => l.trim())
+			.filter((l) => LOG_LEVELS.includes(l));
+		const contains = url.searchParams.get('q') || null;
+		const filter = {
+			levels: levelList.length > 0 ? new Set(levelList.map((l) => l.toUpperCase())) : null,
+			contains
+		};
+
+		// 로그 디렉토리 존재 확인
+		if (!fs.existsSync(logDir)) {
+			return new Response(JSON.stringify({ success: false, message: '로그 디렉토리가 존재하지 않습니다.' }), {
+				status: 404,
+				headers: { 'Content-Type': 'application/json' }
+			});
+		}
+
+		// ⭐ 날짜 인덱스에서 기간 내 파일 조회 (디렉토리 변경 시에만 재스캔)
+		const files = await getLogFiles(startDateKey);
+
+		if (files.length === 0) {
+			return new Response(JSON.stringify({ success: false, message: '해당 기간에 다운로드할 로그 파일이 없습니다.' }), {
+				status: 404,
+				headers: { 'Content-Type': 'application/json' }
+			});
+		}
+
+		// ⭐ zip 스트림을 응답으로 직접 연결 (클라이언트 속도에 맞춰 읽음, 메모리 버퍼링 없음)
+		const archive = createLogArchive(files, filter);
+		archive.on('error', (err) => {
+			console.error('Archive error:', err);
+		});
+		archive.on('warning', (err) => {
+			console.warn('Archive warning:', err.message);
+		});
+		const stream = Readable.toWeb(archive);
+
+		// 파일명에 날짜와 기간 추가
+		const now = new Date();
+		const dateStr = now.toISOString().slice(0, 10).replace(/-/g, '');
+		const timeStr = now.toTimeString().slice(0, 5).replace(':', '');
+		const periodLabel = period === 'all' ? 'all' : period;
+		const filterLabel = levelList.length > 0 ? `-${levelList.join('_')}` : '';
+		const filename = `nanumpay-logs-${periodLabel}${filterLabel}${contains ? '-filtered' : ''}-${dateStr}-${timeStr}.zip`;
+
+		return new Response(stream, {
+			status: 200,
+			headers: {
+				'Content-Type': 'application/zip',
+				'Content-Disposition': `attachment; filename="${filename}"`,
+				'Cache-Control': 'no-cache'
+			}
+		});
+	} catch (error) {
+		console.error('로그 다운로드 오류:', error);
+		return new Response(JSON.stringify({
+			success: false,
+			message: '로그 다운로드 중 오류가 발생했습니다.',
+			error: error.message
+		}), {
+			status: 500,
+			headers: { 'Content-Type': 'application/json' }
+		});
+	}
+}
@@ -0,0 +1,24 @@
+import { json } from '@sveltejs/kit';
+import { renderMetrics } from '$lib/server/metrics.js';
+
+/**
+ * GET: 서버 지표 (Prometheus 텍스트 형식, 관리자 전용)
+ * - nanumpay_http_request_duration_seconds: 라우트별 응답 시간
+ * - nanumpay_mongo_command_duration_seconds: 컬렉션/명령별 소요 시간
+ * - nanumpay_mongo_command_errors_total, nanumpay_mongo_slow_commands_total
+ * - 느린 쿼리 상세(쿼리 형태)는 서버 로그의 [SlowQuery] 항목 참고
+ */
+export async function GET({ locals }) {
+	// 관리자 권한 확인
+	if (!locals.user || !locals.user.isAdmin) {
+		return json({ error: 'Unauthorized' }, { status: 401 });
+	}
+
+	return new Response(renderMetrics(), {
+		status: 200,
+		headers: {
+			'Content-Type': 'text/plain; version=0.0.4; charset=utf-8',
+			'Cache-Control': 'no-store'
+		}
+	});
+}
@@ -0,0 +1,97 @@
+/**
+ * 용역비 지급명부 내보내기 API (스트리밍)
+ * - 용역자 커서에서 배치 단위로 읽어 행 단위로 응답에 기록 (전체 결과를 메모리에 모으지 않음)
+ * - format: xlsx (기본) | csv
+ * - 조회 조건은 /api/admin/payment/weekly와 동일
+ *   - 단일 주차: year, month, week
+ *   - 기간: startYear, startMonth, endYear, endMonth (+ startDate, endDate)
+ *   - search, searchCategory, sortByName, plannerAccountId
+ * - 컬럼: showGradeInfo, showTax, showNet (false로 숨김)
+ */
+
+import { json } from '@sveltejs/kit';
+import { PassThrough, Readable } from 'stream';
+import { connectDB } from '$lib/server/db.js';
+import { getFridaysInMonth } from '$lib/utils/fridayWeekCalculator.js';
+import { streamPaymentExport, getFridaysInRange } from '$lib/server/services/paymentListService.js';
+import { createSheetWriter, SHEET_FORMATS } from '$lib/server/utils/sheetStream.js';
+
+export async function GET({ url, locals }) {
+	if (!locals.user || !['admin', 'planner'].includes(locals.user.accountType)) {
+		return json({ success: false, error: '권한이 없습니다.' }, { status: 401 });
+	}
+
+	await connectDB();
+
+	const params = url.searchParams;
+	const format = SHEET_FORMATS[params.get('format')] ? params.get('format') : 'xlsx';
+
+	const year = parseInt(params.get('year')) || new Date().getFullYear();
+	const month = parseInt(params.get('month'));
+	const week = parseInt(params.get('week'));
+	const startYear = parseInt(params.get('startYear'));
+	const startMonth = parseInt(params.get('startMonth'));
+	const endYear = parseInt(params.get('endYear'));
+	const endMonth = parseInt(params.get('endMonth'));
+
+	// 내보낼 주차 (weekly API와 동일한 우선순위: 단일 주차 → 기간 → 현재 월)
+	let fridays;
+	let periodLabel;
+	if (month && week) {
+		fridays = getFridaysInMonth(year, month).filter(f => f.weekNumber === week);
+		periodLabel = `${year}${String(month).padStart(2, '0')}-${week}주차`;
+	} else if (startYear && startMonth && endYear && endMonth) {
+		fridays = getFridaysInRange(startYear, startMonth, endYear, endMonth, params.get('startDate'), params.get('endDate'));
+		periodLabel = `${startYear}${String(startMonth).padStart(2, '0')}-${endYear}${String(endMonth).padStart(2, '0')}`;
+	} else {
+		const currentMonth = month || new Date().getMonth() + 1;
+		fridays = getFridaysInMonth(year, currentMonth);
+		periodLabel = `${year}${String(currentMonth).padStart(2, '0')}`;
+	}
+
+	if (fridays.length === 0) {
+		return json({ success: false, error: '내보낼 주차가 없습니다.' }, { status: 400 });
+	}
+
+	// ⭐ 설계사는 자신의 용역자만 내보내기
+	const plannerAccountId = locals.user.accountType === 'planner'
+		? locals.user.id
+		: params.get('plannerAccountId');
+
+	const output = new PassThrough();
+	const writer = createSheetWriter(format, output, {
+		sheetName: '용역비 지급명부',
+		columnWidths: [6, 12, 12, 12, 20]
+	});
+
+	// 응답을 먼저 반환하고 행은 생성되는 대로 스트림에 기록 (다운로드 즉시 시작)
+	streamPaymentExport(writer, {
+		fridays,
+		search: params.get('search') || '',
+		searchCategory: params.get('searchCategory') || 'name',
+		plannerAccountId,
+		sortByName: params.get('sortByName') !== 'false',
+		showGradeInfoColumn: params.get('showGradeInfo') !== 'false',
+		showTaxColumn: params.get('showTax') !== 'false',
+		showNetColumn: params.get('showNet') !== 'false'
+	})
+		.then(({ rowCount }) => {
+			console.log(`[지급명부 내보내기] ${periodLabel} ${format}: ${rowCount}행`);
+			return writer.end();
+		})
+		.catch((error) => {
+			console.error('[지급명부 내보내기] 오류:', error);
+			output.destroy(error);
+		});
+
+	const filename = encodeURIComponent(`용역비_지급명부_${periodLabel}.${SHEET_FORMATS[format].extension}`);
+
+	return new Response(Readable.toWeb(output), {
+		status: 200,
+		headers: {
+			'Content-Type': SHEET_FORMATS[format].contentType,
+			'Content-Disposition': `attachment; filename*=UTF-8''${filename}`,
+			'Cache-Control': 'no-cache'
+		}
+	});
+}
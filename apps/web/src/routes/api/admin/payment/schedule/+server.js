@@ -1,6 +1,8 @@
 import { json } from '@sveltejs/kit';
 import { connectDB } from '$lib/server/db.js';
 import WeeklyPaymentPlans from '$lib/server/models/WeeklyPaymentPlans.js';
+import User from '$lib/server/models/User.js';
+import { findWeekInstallments } from '$lib/server/services/paymentWeekBucketService.js';
 import { GRADE_LIMITS } from '$lib/server/utils/constants.js';
 
 /**
@@ -25,54 +27,43 @@ export async function GET({ url }) {
 			}, { status: 400 });
 		}
 
-		// v5.0: ISO 주차 계산
+		// ⭐ v9.7: ISO 주차 (계획 installments.weekNumber와 같은 형식, 예: 2025-W41)
 		const date = new Date(year, month - 1, 1 + (week - 1) * 7);
-		const startOfYear = new Date(year, 0, 1);
-		const dayOfYear = Math.floor((date - startOfYear) / (1000 * 60 * 60 * 24));
-		const weekNumber = Math.ceil((dayOfYear + startOfYear.getDay() + 1) / 7);
+		const weekNumber = WeeklyPaymentPlans.getISOWeek(date);
 
 		console.log(`[API] 계산된 weekNumber: ${weekNumber}`);
 
-		// v5.0: 해당 주차의 분할금 조회
+		// ⭐ v9.7: 주차 버킷 → 해당 주차 계획만 조회 (전체 $unwind 제거)
 		// ⭐ v7.0: terminated 상태 제외 (승급으로 중단된 추가지급 제외)
-		const installments = await WeeklyPaymentPlans.aggregate([
-			{
-				$unwind: '$installments'
-			},
-			{
-				$match: {
-					'installments.weekNumber': weekNumber,
-					'installments.status': { $ne: 'terminated' }  // ⭐ v7.0: 중단된 할부 제외
-				}
-			},
-			{
-				$lookup: {
-					from: 'users',
-					localField: 'userId',
-					foreignField: '_id',
-					as: 'user'
-				}
-			},
-			{
-				$unwind: '$user'
-			},
-			{
-				$project: {
-					userId: '$user._id',
-					userName: '$user.name',
-					userGrade: '$user.grade',
-					userInsuranceAmount: '$user.insuranceAmount',  // ⭐ v8.0: 보험금액 추가
-					amount: '$installments.amount',
-					installmentAmount: '$installments.installmentAmount',
-					status: '$installments.status',
-					scheduledDate: '$installments.scheduledDate',
-					paidDate: '$installments.paidDate',
-					planType: '$planType',
-					baseGrade: '$baseGrade',  // ⭐ v8.0: 계획 등급 추가
-					installmentNumber: '$installments.installmentNumber'
-				}
-			}
-		]);
+		const weekInstallments = (await findWeekInstallments(weekNumber))
+			.filter(({ installment }) => installment.status !== 'terminated');
+
+		const userIds = [...new Set(weekInstallments.map(({ plan }) => plan.userId))];
+		const users = await User.find({ _id: { $in: userIds } })
+			.select('name grade insuranceAmount')
+			.lean();
+		const usersById = new Map(users.map(user => [user._id.toString(), user]));
+
+		const installments = [];
+		for (const { plan, installment } of weekInstallments) {
+			const user = usersById.get(plan.userId);
+			if (!user) continue;
+
+			installments.push({
+				userId: user._id,
+				userName: user.name,
+				userGrade: user.grade,
+				userInsuranceAmount: user.insuranceAmount,  // ⭐ v8.0: 보험금액 추가
+				amount: installment.installmentAmount,
+				installmentAmount: installment.installmentAmount,
+				status: installment.status,
+				scheduledDate: installment.scheduledDate,
+				paidDate: installment.paidAt,
+				planType: plan.planType,
+				baseGrade: plan.baseGrade,  // ⭐ v8.0: 계획 등급 추가
+				installmentNumber: installment.week
+			});
+		}
 
 		console.log(`[API] 조회된 분할금 수: ${installments.length}`);
 
@@ -0,0 +1,74 @@
+/**
+ * 설계사 지급명부 내보내기 API (스트리밍)
+ * - 설계사 커서에서 배치 단위로 집계(Rollup)를 읽어 행 단위로 응답에 기록
+ * - format: xlsx (기본) | csv
+ * - 조회 조건은 /api/admin/planner-commission과 동일
+ *   (paymentMonth 또는 startYear/startMonth/endYear/endMonth, viewMode, searchType, searchTerm, sortBy)
+ * - sortBy=amount는 전체 합계가 필요해 스트리밍할 수 없으므로 이름순으로 내보냄
+ */
+
+import { json } from '@sveltejs/kit';
+import { PassThrough, Readable } from 'stream';
+import { connectDB } from '$lib/server/db.js';
+import { getRollupPeriods, streamPlannerCommissionExport } from '$lib/server/services/plannerRollupService.js';
+import { createSheetWriter, SHEET_FORMATS } from '$lib/server/utils/sheetStream.js';
+
+export async function GET({ url, locals }) {
+	// 관리자 권한 확인
+	if (locals.user?.accountType !== 'admin') {
+		return json({ success: false, error: '관리자 권한이 필요합니다.' }, { status: 403 });
+	}
+
+	await connectDB();
+
+	const params = url.searchParams;
+	const format = SHEET_FORMATS[params.get('format')] ? params.get('format') : 'xlsx';
+	const viewMode = params.get('viewMode') || 'monthly';
+
+	const periods = getRollupPeriods(viewMode, {
+		paymentMonth: params.get('paymentMonth'),
+		startYear: params.get('startYear'),
+		startMonth: params.get('startMonth'),
+		endYear: params.get('endYear'),
+		endMonth: params.get('endMonth')
+	});
+
+	if (periods.length === 0) {
+		return json({ success: false, error: '내보낼 기간이 없습니다.' }, { status: 400 });
+	}
+
+	const output = new PassThrough();
+	const writer = createSheetWriter(format, output, {
+		sheetName: '설계사 지급명부',
+		columnWidths: [6, 12, 15, 12, 20]
+	});
+
+	// 응답을 먼저 반환하고 행은 생성되는 대로 스트림에 기록 (다운로드 즉시 시작)
+	streamPlannerCommissionExport(writer, {
+		periods,
+		viewMode,
+		searchType: params.get('searchType'),
+		searchTerm: params.get('searchTerm'),
+		sortBy: params.get('sortBy') || 'name'
+	})
+		.then(({ rowCount }) => {
+			console.log(`[설계사 지급명부 내보내기] ${periods[0]}~${periods[periods.length - 1]} ${format}: ${rowCount}행`);
+			return writer.end();
+		})
+		.catch((error) => {
+			console.error('[설계사 지급명부 내보내기] 오류:', error);
+			output.destroy(error);
+		});
+
+	const periodLabel = periods.length === 1 ? periods[0] : `${periods[0]}_${periods[periods.length - 1]}`;
+	const filename = encodeURIComponent(`설계사_지급명부_${periodLabel}.${SHEET_FORMATS[format].extension}`);
+
+	return new Response(Readable.toWeb(output), {
+		status: 200,
+		headers: {
+			'Content-Type': SHEET_FORMATS[format].contentType,
+			'Content-Disposition': `attachment; filename*=UTF-8''${filename}`,
+			'Cache-Control': 'no-cache'
+		}
+	});
+}
@@ -2,6 +2,8 @@ import { json } from '@sveltejs/kit';
 import { db } from '$lib/server/db.js';
 import MonthlyRegistrations from '$lib/server/models/MonthlyRegistrations.js';
 import WeeklyPaymentPlans from '$lib/server/models/WeeklyPaymentPlans.js';
+import { previewRevenueAdjustment } from '$lib/server/services/revenueService.js';
+import { markPlannerRollupsStale } from '$lib/server/services/plannerRollupService.js';
 
 export async function POST({ request, locals }) {
 	try {
@@ -12,7 +14,7 @@ export async function POST({ request, locals }) {
 
 		await db();
 
-		const { monthKey, adjustments, forceUpdate = false } = await request.json();
+		const { monthKey, adjustments, forceUpdate = false, dryRun = false } = await request.json();
 
 		if (!monthKey) {
 			return json({ error: '월 정보가 필요합니다.' }, { status: 400 });
@@ -54,6 +56,16 @@ export async function POST({ request, locals }) {
 			}
 		}
 
+		// ⭐ dry-run: 변경될 지급 계획 diff만 반환 (DB 쓰기 없음)
+		if (dryRun) {
+			const preview = await previewRevenueAdjustment(monthKey, {
+				adjustedGradePayments,
+				includePast: true,
+				includeAllStatuses: forceUpdate
+			});
+			return json({ success: true, dryRun: true, ...preview });
+		}
+
 		// MonthlyRegistrations 업데이트
 		monthlyData.adjustedGradePayments = adjustedGradePayments;
 		await monthlyData.save();
@@ -179,6 +191,9 @@ export async function POST({ request, locals }) {
 
 		console.log(`[등급별 지급액 조정] 총 ${updatedPlans.length}개 지급 계획 업데이트 완료`);
 
+		// 설계사 지급 집계 재생성 예약 (귀속월 전체 계획 → 전체 재집계)
+		await markPlannerRollupsStale();
+
 		return json({
 			success: true,
 			message: '등급별 지급액이 성공적으로 조정되었습니다.',
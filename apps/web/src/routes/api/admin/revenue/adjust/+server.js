@@ -1,6 +1,7 @@
 /**
  * POST /api/admin/revenue/adjust
  * 월별 매출 수동 조정 API (v7.1)
+ * - dryRun: true면 변경될 지급 계획 diff만 반환 (DB 쓰기 없음)
  */
 
 import { json } from '@sveltejs/kit';
@@ -13,7 +14,7 @@ export async function POST({ request, locals }) {
       return json({ error: 'Unauthorized' }, { status: 401 });
     }
 
-    const { monthKey, adjustedRevenue, reason, force } = await request.json();
+    const { monthKey, adjustedRevenue, reason, force, dryRun } = await request.json();
 
     // 입력 검증
     if (!monthKey || typeof adjustedRevenue !== 'number') {
@@ -34,6 +35,7 @@ export async function POST({ request, locals }) {
       adjustedRevenue,
       reason,
       force,
+      dryRun,
       admin: locals.user.name
     });
 
@@ -43,7 +45,8 @@ export async function POST({ request, locals }) {
       adjustedRevenue,
       locals.user,
       reason || '사유 미기재',
-      force || false
+      force || false,
+      dryRun || false
     );
 
     if (!result.success) {
@@ -52,6 +55,7 @@ export async function POST({ request, locals }) {
 
     return json({
       success: true,
+      dryRun: !!dryRun,
       message: result.message,
       details: result.details
     });
@@ -1,9 +1,11 @@
 import { json } from '@sveltejs/kit';
 import bcrypt from 'bcryptjs';
 import { Admin } from '$lib/server/models/Admin.js';
+import { invalidateAccountTokens, reissueSessionTokens } from '$lib/server/authCache.js';
+import { JWT_SECRET, JWT_EXPIRES, JWT_REFRESH_EXPIRES } from '$env/static/private';
 
 // PUT: 관리자 암호 변경
-export async function PUT({ request, locals }) {
+export async function PUT({ request, locals, cookies }) {
 	try {
 		// 관리자 권한 확인
 		if (!locals.user || !locals.user.isAdmin) {
@@ -68,6 +70,12 @@ export async function PUT({ request, locals }) {
 		// 암호 업데이트
 		admin.passwordHash = newPasswordHash;
 		await admin.save();
+		// 다른 세션의 기존 토큰 무효화, 현재 세션은 새 토큰으로 유지
+		await invalidateAccountTokens(admin._id);
+		reissueSessionTokens(cookies, locals.user, JWT_SECRET, {
+			expiresIn: JWT_EXPIRES,
+			refreshExpiresIn: JWT_REFRESH_EXPIRES
+		});
 
 		return json({
 			success: true,
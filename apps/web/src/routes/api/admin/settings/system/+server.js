@@ -1,5 +1,6 @@
 import { json } from '@sveltejs/kit';
 import { Admin } from '$lib/server/models/Admin.js';
+import { invalidateSystemStatus } from '$lib/server/authCache.js';
 
 // PUT: 시스템 설정 저장
 export async function PUT({ request, locals }) {
@@ -47,6 +48,9 @@ export async function PUT({ request, locals }) {
 			return json({ success: false, message: '관리자를 찾을 수 없습니다.' }, { status: 404 });
 		}
 
+		// 유지보수 모드 캐시 즉시 반영
+		invalidateSystemStatus();
+
 		return json({
 			success: true,
 			message: '시스템 설정이 저장되었습니다.',
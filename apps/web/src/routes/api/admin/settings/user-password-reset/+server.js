@@ -2,6 +2,7 @@ import { json } from '@sveltejs/kit';
 import bcrypt from 'bcryptjs';
 import { db } from '$lib/server/db.js';
 import UserAccount from '$lib/server/models/UserAccount.js';
+import { invalidateAccountTokens } from '$lib/server/authCache.js';
 
 export async function POST({ request, locals }) {
 	// 관리자 권한 확인
@@ -45,6 +46,8 @@ export async function POST({ request, locals }) {
 			}
 		);
 
+		await invalidateAccountTokens(user._id);
+
 		console.log(`[관리자] 사용자 암호 초기화: ${loginId} → ${newPassword}`);
 
 		return json({
@@ -1,11 +1,9 @@
 import { json } from '@sveltejs/kit';
 import { db } from '$lib/server/db.js';
 import UploadHistory from '$lib/server/models/UploadHistory.js';
-import zlib from 'zlib';
-import { promisify } from 'util';
-
-const gzip = promisify(zlib.gzip);
-const gunzip = promisify(zlib.gunzip);
+import { getRegistrationJobDurations } from '$lib/server/services/registrationJobService.js';
+import { storeUploadFile, openUploadFileStream, releaseUploadFile } from '$lib/server/utils/uploadFileStore.js';
+import { Readable } from 'stream';
 
 /**
  * GET: 업로드 히스토리 목록 조회 또는 파일 다운로드
@@ -23,44 +21,32 @@ export async function GET({ url, locals }) {
 	try {
 		const downloadId = url.searchParams.get('downloadId');
 
-		// ⭐ v8.1: 파일 다운로드 (DB 또는 파일 시스템)
+		// ⭐ v9.7: 파일 다운로드 (GridFS 스트림, 레거시 fileData/filePath 포함)
 		if (downloadId) {
-			const record = await UploadHistory.findById(downloadId);
+			let record = await UploadHistory.findById(downloadId).select('-fileData').lean();
 			if (!record) {
 				return json({ error: '파일을 찾을 수 없습니다.' }, { status: 404 });
 			}
 
-			let fileBuffer;
-
-			// 1. DB에 fileData가 있으면 사용
-			if (record.fileData) {
-				fileBuffer = await gunzip(record.fileData);
-			}
-			// 2. fileData가 없으면 filePath에서 읽기 (레거시)
-			else if (record.filePath) {
-				try {
-					const fs = await import('fs/promises');
-					const compressedData = await fs.readFile(record.filePath);
-					fileBuffer = await gunzip(compressedData);
-				} catch (error) {
-					console.error('파일 읽기 실패:', error);
-					return json({ error: '파일을 읽을 수 없습니다.' }, { status: 404 });
-				}
+			// 레거시 인라인 저장 레코드만 fileData 조회
+			if (!record.fileHash && !record.filePath) {
+				record = await UploadHistory.findById(downloadId).lean();
 			}
-			// 3. 둘 다 없으면 에러
-			else {
+
+			const stream = await openUploadFileStream(record);
+			if (!stream) {
 				return json({ error: '파일 데이터가 없습니다.' }, { status: 404 });
 			}
 
-			// 파일 다운로드 응답
-			return new Response(fileBuffer, {
-				status: 200,
-				headers: {
-					'Content-Type': 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
-					'Content-Disposition': `attachment; filename="${encodeURIComponent(record.originalFileName)}"`,
-					'Content-Length': fileBuffer.length.toString()
-				}
-			});
+			// 파일 다운로드 응답 (스트리밍)
+			const headers = {
+				'Content-Type': 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
+				'Content-Disposition': `attachment; filename="${encodeURIComponent(record.originalFileName)}"`
+			};
+			if (record.fileSize > 0) {
+				headers['Content-Length'] = record.fileSize.toString();
+			}
+			return new Response(Readable.toWeb(stream), { status: 200, headers });
 		}
 
 		// 히스토리 목록 조회
@@ -85,8 +71,8 @@ export async function GET({ url, locals }) {
 }
 
 /**
- * POST: 엑셀 파일 저장 (DB에 gzip 압축하여 저장)
- * ⭐ v8.1: 파일 시스템 대신 DB Buffer로 저장
+ * POST: 엑셀 파일 저장 (gzip 압축하여 저장)
+ * ⭐ v9.7: GridFS 내용 해시 저장 (같은 파일은 1번만 저장)
  * Body: FormData with 'file' field
  */
 export async function POST({ request, locals }) {
@@ -111,19 +97,18 @@ export async function POST({ request, locals }) {
 		const ext = file.name.split('.').pop() || 'xlsx';
 		const savedFileName = `${timestamp}_${random}.${ext}`;
 
-		// 파일을 gzip으로 압축
+		// ⭐ v9.7: GridFS에 gzip 압축 저장 (내용 해시로 중복 제거)
 		const arrayBuffer = await file.arrayBuffer();
 		const originalBuffer = Buffer.from(arrayBuffer);
-		const compressedBuffer = await gzip(originalBuffer);
+		const { fileHash, compressedSize, deduplicated } = await storeUploadFile(originalBuffer);
 
-		// ⭐ v8.1: DB에 직접 저장
 		const uploadRecord = new UploadHistory({
 			originalFileName: file.name,
 			savedFileName,
-			fileData: compressedBuffer,  // DB에 압축 데이터 저장
+			fileHash,  // 파일 내용은 GridFS에 저장
 			filePath: null,  // 파일 시스템 사용 안 함
 			fileSize: file.size,  // 원본 크기
-			compressedSize: compressedBuffer.length,  // 압축 크기
+			compressedSize,  // 압축 크기
 			uploadedBy: {
 				userId: locals.user._id,
 				userName: locals.user.name || locals.user.loginId
@@ -131,10 +116,20 @@ export async function POST({ request, locals }) {
 			uploadedAt: new Date()
 		});
 
-		await uploadRecord.save();
+		try {
+			await uploadRecord.save();
+		} catch (error) {
+			// 기록이 없으면 파일 참조도 되돌림
+			await releaseUploadFile(fileHash);
+			throw error;
+		}
 
-		const compressionRatio = ((1 - compressedBuffer.length / file.size) * 100).toFixed(1);
-		console.log(`📁 파일 DB 저장 완료: ${file.name} (${file.size.toLocaleString()} → ${compressedBuffer.length.toLocaleString()} bytes, 압축률: ${compressionRatio}%)`);
+		if (deduplicated) {
+			console.log(`📁 파일 저장 완료: ${file.name} (동일 파일 재사용, ${fileHash.slice(0, 12)})`);
+		} else {
+			const compressionRatio = ((1 - compressedSize / file.size) * 100).toFixed(1);
+			console.log(`📁 파일 저장 완료: ${file.name} (${file.size.toLocaleString()} → ${compressedSize.toLocaleString()} bytes, 압축률: ${compressionRatio}%)`);
+		}
 
 		return json({
 			success: true,
@@ -149,6 +144,7 @@ export async function POST({ request, locals }) {
 
 /**
  * PUT: 업로드 결과 업데이트 (등록 완료 후)
+ * - ⭐ v9.7: jobIds 전달 시 등록 작업 대기/처리 시간 기록
  */
 export async function PUT({ request, locals }) {
 	// 관리자 권한 확인
@@ -159,22 +155,26 @@ export async function PUT({ request, locals }) {
 	await db();
 
 	try {
-		const { uploadId, created, failed, total, monthKey } = await request.json();
+		const { uploadId, created, failed, total, monthKey, jobIds } = await request.json();
 
 		if (!uploadId) {
 			return json({ error: 'uploadId가 필요합니다.' }, { status: 400 });
 		}
 
+		const update = {
+			'registrationResult.created': created || 0,
+			'registrationResult.failed': failed || 0,
+			'registrationResult.total': total || 0,
+			monthKey: monthKey || null
+		};
+
+		if (Array.isArray(jobIds) && jobIds.length > 0) {
+			update.registrationJobs = await getRegistrationJobDurations(jobIds);
+		}
+
 		const updated = await UploadHistory.findByIdAndUpdate(
 			uploadId,
-			{
-				$set: {
-					'registrationResult.created': created || 0,
-					'registrationResult.failed': failed || 0,
-					'registrationResult.total': total || 0,
-					monthKey: monthKey || null
-				}
-			},
+			{ $set: update },
 			{ new: true }
 		);
 
@@ -1,15 +1,13 @@
 import { json } from '@sveltejs/kit';
 import { db } from '$lib/server/db.js';
 import UploadHistory from '$lib/server/models/UploadHistory.js';
-import zlib from 'zlib';
-import { promisify } from 'util';
-
-const gunzip = promisify(zlib.gunzip);
+import { openUploadFileStream, releaseUploadFile } from '$lib/server/utils/uploadFileStore.js';
+import { Readable } from 'stream';
 
 /**
  * GET: 파일 다운로드 (특정 업로드 ID)
- * - DB에서 fileData 우선 조회
- * - fileData 없으면 filePath에서 읽기 (레거시)
+ * - ⭐ v9.7: GridFS에서 스트리밍 (gunzip 스트림, 메모리에 전체 파일 적재 안 함)
+ * - fileHash 없으면 fileData 또는 filePath에서 읽기 (레거시)
  */
 export async function GET({ params, locals }) {
 	// 관리자 권한 확인
@@ -20,42 +18,30 @@ export async function GET({ params, locals }) {
 	await db();
 
 	try {
-		const record = await UploadHistory.findById(params.id);
+		let record = await UploadHistory.findById(params.id).select('-fileData').lean();
 		if (!record) {
 			return json({ error: '파일을 찾을 수 없습니다.' }, { status: 404 });
 		}
 
-		let fileBuffer;
-
-		// 1. DB에 fileData가 있으면 사용
-		if (record.fileData) {
-			fileBuffer = await gunzip(record.fileData);
-		}
-		// 2. fileData가 없으면 filePath에서 읽기 (레거시)
-		else if (record.filePath) {
-			try {
-				const fs = await import('fs/promises');
-				const compressedData = await fs.readFile(record.filePath);
-				fileBuffer = await gunzip(compressedData);
-			} catch (error) {
-				console.error('파일 읽기 실패:', error);
-				return json({ error: '파일을 읽을 수 없습니다.' }, { status: 404 });
-			}
+		// 레거시 인라인 저장 레코드만 fileData 조회
+		if (!record.fileHash && !record.filePath) {
+			record = await UploadHistory.findById(params.id).lean();
 		}
-		// 3. 둘 다 없으면 에러
-		else {
+
+		const stream = await openUploadFileStream(record);
+		if (!stream) {
 			return json({ error: '파일 데이터가 없습니다.' }, { status: 404 });
 		}
 
-		// 파일 다운로드 응답
-		return new Response(fileBuffer, {
-			status: 200,
-			headers: {
-				'Content-Type': 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
-				'Content-Disposition': `attachment; filename="${encodeURIComponent(record.originalFileName)}"`,
-				'Content-Length': fileBuffer.length.toString()
-			}
-		});
+		// 파일 다운로드 응답 (스트리밍)
+		const headers = {
+			'Content-Type': 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
+			'Content-Disposition': `attachment; filename="${encodeURIComponent(record.originalFileName)}"`
+		};
+		if (record.fileSize > 0) {
+			headers['Content-Length'] = record.fileSize.toString();
+		}
+		return new Response(Readable.toWeb(stream), { status: 200, headers });
 	} catch (error) {
 		console.error('Download error:', error);
 		return json({ error: '다운로드 중 오류가 발생했습니다.' }, { status: 500 });
@@ -74,7 +60,7 @@ export async function DELETE({ params, locals }) {
 	await db();
 
 	try {
-		const record = await UploadHistory.findById(params.id);
+		const record = await UploadHistory.findById(params.id).select('-fileData');
 		if (!record) {
 			return json({ error: '파일을 찾을 수 없습니다.' }, { status: 404 });
 		}
@@ -94,6 +80,11 @@ export async function DELETE({ params, locals }) {
 		// DB 레코드 삭제
 		await UploadHistory.findByIdAndDelete(params.id);
 
+		// ⭐ v9.7: GridFS 파일 참조 해제 (참조 수가 0이 되면 파일 삭제)
+		if (record.fileHash) {
+			await releaseUploadFile(record.fileHash);
+		}
+
 		console.log(`🗑️  업로드 히스토리 삭제: ${record.originalFileName} (ID: ${params.id})`);
 
 		return json({ success: true });
@@ -1,4 +1,5 @@
 import { json } from '@sveltejs/kit';
+import mongoose from 'mongoose';
 import { db } from '$lib/server/db.js';
 import User from '$lib/server/models/User.js';
 import PlannerAccount from '$lib/server/models/PlannerAccount.js';
@@ -6,6 +7,53 @@ import WeeklyPaymentPlans from '$lib/server/models/WeeklyPaymentPlans.js';
 import MonthlyRegistrations from '$lib/server/models/MonthlyRegistrations.js';
 import { GRADE_LIMITS } from '$lib/server/utils/constants.js';
 import { reprocessMonthPayments, getLatestRegistrationMonth } from '$lib/server/services/monthProcessWithDbService.js';
+import { markPlannerRollupsStale } from '$lib/server/services/plannerRollupService.js';
+import { syncUserPaymentProgress } from '$lib/server/services/userProgressService.js';
+import { refreshAccountSearchKeys, invalidateUserSearchCache } from '$lib/server/services/userSearchService.js';
+import { invalidateUserNameIndex } from '$lib/server/services/userNameIndexService.js';
+
+// 커서 페이지네이션 지원 정렬 키 ({ key: 1, _id: 1 } 인덱스 존재)
+const CURSOR_SORT_KEYS = new Set(['sequence', 'name', 'createdAt']);
+
+/**
+ * 커서 생성 (마지막 행의 정렬 키 값 + _id, base64url JSON)
+ */
+function encodeCursor(row, sortBy) {
+	const value = row[sortBy];
+	if (value == null) return null;
+
+	const payload = value instanceof Date
+		? { v: value.toISOString(), d: 1, id: row._id.toString() }
+		: { v: value, id: row._id.toString() };
+	return Buffer.from(JSON.stringify(payload)).toString('base64url');
+}
+
+/**
+ * 커서 해석 (형식이 잘못되면 null)
+ */
+function decodeCursor(cursor) {
+	if (!cursor) return null;
+	try {
+		const { v, d, id } = JSON.parse(Buffer.from(cursor, 'base64url').toString('utf8'));
+		if (v == null || !mongoose.Types.ObjectId.isValid(id)) return null;
+		return { value: d ? new Date(v) : v, id: new mongoose.Types.ObjectId(id) };
+	} catch {
+		return null;
+	}
+}
+
+/**
+ * 커서 이후 행 조건: (key > v) OR (key = v AND _id > id), 내림차순이면 <
+ */
+function cursorCondition(sortBy, direction, cursor) {
+	const op = direction === 1 ? '$gt' : '$lt';
+	return {
+		$or: [
+			{ [sortBy]: { [op]: cursor.value } },
+			{ [sortBy]: cursor.value, _id: { [op]: cursor.id } }
+		]
+	};
+}
 
 export async function GET({ url, locals }) {
 	// 관리자 권한 확인
@@ -51,43 +99,48 @@ export async function GET({ url, locals }) {
 			}
 		}
 
-		// 전체 개수 조회
-		const total = await User.countDocuments(query);
+		// ⭐ v9.7: 전체 개수 - 검색 조건이 없으면 컬렉션 메타데이터 기반 추정치 사용
+		const filtered = Object.keys(query).length > 0;
+		const total = filtered
+			? await User.countDocuments(query)
+			: await User.estimatedDocumentCount();
 
 		// 페이지네이션 계산
 		const skip = (page - 1) * limit;
 		const totalPages = Math.ceil(total / limit);
 
-		// 정렬 옵션
-		const sortOptions = {};
-		sortOptions[sortBy] = sortOrder === 'desc' ? -1 : 1;
+		// 정렬 옵션 (_id를 보조 키로 사용해 순서 고정)
+		const direction = sortOrder === 'desc' ? -1 : 1;
+		const sortOptions = { [sortBy]: direction, _id: direction };
+
+		// ⭐ v9.7: 커서(keyset) 페이지네이션 - 이전 페이지 마지막 행 이후부터 조회 (skip 없음)
+		// 커서가 없거나 정렬 키가 커서 미지원이면 기존 page/skip 방식
+		const cursor = CURSOR_SORT_KEYS.has(sortBy) ? decodeCursor(url.searchParams.get('cursor')) : null;
+		const pageQuery = cursor
+			? { $and: [query, cursorCondition(sortBy, direction, cursor)] }
+			: query;
 
 		// ⭐ v8.0: 사용자 목록 조회 + UserAccount, PlannerAccount populate
-		const users = await User.find(query)
+		const users = await User.find(pageQuery)
 			.populate('userAccountId', 'loginId canViewSubordinates phone bank accountNumber idNumber')
 			.populate('plannerAccountId', 'name phone bank accountNumber')  // ⭐ 설계사 계좌정보 추가
 			.select('-passwordHash')
 			.sort(sortOptions)
-			.skip(skip)
+			.skip(cursor ? 0 : skip)
 			.limit(limit)
 			.lean();
 
-		// 사용자들의 지급 진행률 조회 (completedInstallments 합계)
-		const userIds = users.map(u => u._id.toString());
-		const paymentProgress = await WeeklyPaymentPlans.aggregate([
-			{ $match: { userId: { $in: userIds } } },
-			{ $group: {
-				_id: '$userId',
-				completedInstallments: { $sum: '$completedInstallments' }
-			}}
-		]);
-		const progressMap = new Map(paymentProgress.map(p => [p._id, p.completedInstallments]));
+		// ⭐ v9.7: 지급 진행률은 User.completedInstallments 사용 (값이 없는 기존 사용자만 동기화)
+		const missingIds = users
+			.filter(u => u.completedInstallments == null)
+			.map(u => u._id.toString());
+		const progressMap = await syncUserPaymentProgress(missingIds);
 
 		// 각 사용자의 등급 정보 추가 + UserAccount, PlannerAccount 필드 병합
 		const usersWithGrade = users.map((user) => {
 			const grade = user.grade || 'F1';
 			const maxInstallments = GRADE_LIMITS[grade]?.maxInstallments || 20;
-			const completed = progressMap.get(user._id.toString()) || 0;
+			const completed = user.completedInstallments ?? progressMap.get(user._id.toString()) ?? 0;
 			// ⭐ v8.0: 비율은 User 모델에서 가져옴 (엑셀 업로드 시 저장된 값)
 			const paymentRatio = user.ratio ?? 1;
 
@@ -131,7 +184,11 @@ export async function GET({ url, locals }) {
 				total,
 				totalPages,
 				hasNext: page < totalPages,
-				hasPrev: page > 1
+				hasPrev: page > 1,
+				// 다음 페이지 커서 (정렬 키 값이 없으면 null → page 방식)
+				nextCursor: users.length === limit && CURSOR_SORT_KEYS.has(sortBy)
+					? encodeCursor(users[users.length - 1], sortBy)
+					: null
 			}
 		});
 	} catch (error) {
@@ -160,10 +217,10 @@ export async function PUT({ request, locals }) {
 		let oldName = null;
 		let existingUser = null;
 		if (newName) {
-			existingUser = await User.findById(userId).select('name createdAt').lean();
+			existingUser = await User.findById(userId).select('name createdAt plannerAccountId').lean();
 			oldName = existingUser?.name;
 		} else {
-			existingUser = await User.findById(userId).select('createdAt').lean();
+			existingUser = await User.findById(userId).select('createdAt plannerAccountId').lean();
 		}
 
 		// ⭐ v8.0: canViewSubordinates는 UserAccount에 저장
@@ -389,6 +446,18 @@ export async function PUT({ request, locals }) {
 			}
 		}
 
+		// 설계사 집계: 재처리 시 전체, 아니면 변경 전/후 담당 설계사만
+		await markPlannerRollupsStale(
+			reprocessed ? null : { userIds: [userId], plannerAccountIds: [existingUser?.plannerAccountId] }
+		);
+		// ⭐ v9.7: 자동완성 검색 키 갱신 (이름/연락처 변경, 같은 계정의 다른 용역자 포함)
+		if (user.userAccountId?._id) {
+			await refreshAccountSearchKeys(user.userAccountId._id);
+		}
+		if (newName && newName !== oldName) {
+			invalidateUserNameIndex();
+		}
+
 		return json({ user, reprocessed });
 	} catch (error) {
 		console.error('Failed to update user:', error);
@@ -465,6 +534,13 @@ export async function DELETE({ request, locals }) {
 			reprocessed = true;
 		}
 
+		// 설계사 집계: 재처리 시 전체, 아니면 삭제된 용역자의 담당 설계사만
+		await markPlannerRollupsStale(
+			reprocessed ? null : { plannerAccountIds: [userToDelete.plannerAccountId] }
+		);
+		invalidateUserSearchCache();
+		invalidateUserNameIndex();
+
 		return json({ success: true, reprocessed });
 	} catch (error) {
 		console.error('Failed to delete user:', error);
@@ -1,12 +1,57 @@
 import { json } from '@sveltejs/kit';
 import { db } from '$lib/server/db.js';
-import { registerUsers } from '$lib/server/services/userRegistrationService.js';
+import {
+	enqueueRegistrationJob,
+	waitForRegistrationJob
+} from '$lib/server/services/registrationJobService.js';
+
+/**
+ * 완료된 작업 → 동기 응답 (?wait=1)
+ */
+function toSyncResponse(job) {
+	if (job.status === 'completed') {
+		return json({
+			success: true,
+			jobId: job._id.toString(),
+			...job.result,
+			message: job.progress?.message
+		});
+	}
+
+	if (job.status === 'failed') {
+		// 검증 오류인 경우 상세 정보 전달
+		if (job.error?.message?.includes('엑셀 업로드 실패')) {
+			return json(
+				{
+					jobId: job._id.toString(),
+					error: job.error.message,
+					details: job.error.details || '사전 검증 실패'
+				},
+				{ status: 400 }
+			);
+		}
+		return json(
+			{ jobId: job._id.toString(), error: job.error?.message || '일괄 등록 중 오류가 발생했습니다.' },
+			{ status: 500 }
+		);
+	}
+
+	// 대기 시간 초과: 작업은 계속 진행, 상태 조회 API로 확인
+	return json(
+		{ success: true, jobId: job._id.toString(), status: job.status, message: '등록 작업이 아직 진행 중입니다.' },
+		{ status: 202 }
+	);
+}
 
 /**
  * 엑셀 파일을 통한 사용자 일괄 등록 (v7.0)
  * - userRegistrationService로 공통 로직 처리
+ * - ⭐ v9.7: 등록 작업 큐에 등록 후 즉시 응답 (202, jobId)
+ *   진행 상황/결과는 GET /api/admin/users/bulk/jobs/[id]로 조회
+ * - ?wait=1: 작업 완료까지 기다린 뒤 기존 동기 응답 형식으로 반환 (스크립트용)
+ *   (완료 200 { created, failed, errors, alerts, treeStructure }, 검증 실패 400 { error, details })
  */
-export async function POST({ request, locals }) {
+export async function POST({ request, url, locals }) {
 	// 관리자 권한 확인
 	if (!locals.user || !locals.user.isAdmin) {
 		return json({ error: 'Unauthorized' }, { status: 401 });
@@ -45,35 +90,28 @@ export async function POST({ request, locals }) {
 
 		console.log(`📋 정렬 완료: ${sortedUsers.map(u => u.name || u['성명']).join(', ')}`);
 
-		// 공통 등록 함수 호출
-		const results = await registerUsers(sortedUsers, {
+		// 등록 작업 큐에 추가 (백그라운드 워커가 순서대로 처리)
+		const job = await enqueueRegistrationJob(sortedUsers, {
 			source: 'bulk',
 			admin: locals.user,
-			fileName: fileName  // 파일명 전달
+			fileName: fileName
 		});
 
-		return json({
-			success: true,
-			created: results.created,
-			failed: results.failed,
-			errors: results.errors,
-			alerts: results.alerts,
-			treeStructure: results.treeStructure,
-			batchProcessing: results.batchProcessing,
-			message: `${results.created}명 등록 완료, ${results.failed}명 실패`
-		});
-	} catch (error) {
-		// 검증 오류인 경우 상세 정보 전달
-		if (error.message.includes('엑셀 업로드 실패')) {
-			return json(
-				{
-					error: error.message,
-					details: error.details || '사전 검증 실패'
-				},
-				{ status: 400 }
-			);
+		if (url.searchParams.get('wait') === '1') {
+			return toSyncResponse(await waitForRegistrationJob(job._id.toString()));
 		}
 
-		return json({ error: '일괄 등록 중 오류가 발생했습니다.' }, { status: 500 });
+		return json(
+			{
+				success: true,
+				jobId: job._id.toString(),
+				status: job.status,
+				message: `${sortedUsers.length}명 등록 작업이 대기열에 추가되었습니다.`
+			},
+			{ status: 202 }
+		);
+	} catch (error) {
+		console.error('일괄 등록 작업 생성 오류:', error);
+		return json({ error: '일괄 등록 작업 생성 중 오류가 발생했습니다.' }, { status: 500 });
 	}
 }
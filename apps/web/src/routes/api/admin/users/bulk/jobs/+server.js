@@ -0,0 +1,34 @@
+import { json } from '@sveltejs/kit';
+import { db } from '$lib/server/db.js';
+import { listRegistrationJobs } from '$lib/server/services/registrationJobService.js';
+
+const JOB_STATUSES = ['queued', 'running', 'completed', 'failed'];
+
+/**
+ * GET: 최근 일괄 등록 작업 목록
+ * - status: 상태 필터 (선택)
+ * - limit: 최대 개수 (기본 20, 최대 100)
+ */
+export async function GET({ url, locals }) {
+	// 관리자 권한 확인
+	if (!locals.user || !locals.user.isAdmin) {
+		return json({ error: 'Unauthorized' }, { status: 401 });
+	}
+
+	await db();
+
+	try {
+		const status = url.searchParams.get('status');
+		const limit = Math.min(parseInt(url.searchParams.get('limit')) || 20, 100);
+
+		const jobs = await listRegistrationJobs({
+			status: JOB_STATUSES.includes(status) ? status : null,
+			limit
+		});
+
+		return json({ success: true, jobs });
+	} catch (error) {
+		console.error('List registration jobs error:', error);
+		return json({ error: '작업 목록 조회 중 오류가 발생했습니다.' }, { status: 500 });
+	}
+}
@@ -0,0 +1,39 @@
+import { json } from '@sveltejs/kit';
+import mongoose from 'mongoose';
+import { db } from '$lib/server/db.js';
+import { getRegistrationJob } from '$lib/server/services/registrationJobService.js';
+
+/**
+ * GET: 일괄 등록 작업 상태 조회 (폴링)
+ * - status: queued | running | completed | failed
+ * - steps: 단계별 상태/소요 시간, progress: 현재 단계 진행 상황
+ * - completed: result (created, failed, errors, alerts, treeStructure, batchProcessing)
+ * - failed: error (message, details)
+ */
+export async function GET({ params, locals }) {
+	// 관리자 권한 확인
+	if (!locals.user || !locals.user.isAdmin) {
+		return json({ error: 'Unauthorized' }, { status: 401 });
+	}
+
+	if (!mongoose.isValidObjectId(params.id)) {
+		return json({ error: '작업을 찾을 수 없습니다.' }, { status: 404 });
+	}
+
+	await db();
+
+	try {
+		const job = await getRegistrationJob(params.id);
+		if (!job) {
+			return json({ error: '작업을 찾을 수 없습니다.' }, { status: 404 });
+		}
+
+		return json(
+			{ success: true, job },
+			{ headers: { 'Cache-Control': 'no-store' } }
+		);
+	} catch (error) {
+		console.error('Get registration job error:', error);
+		return json({ error: '작업 조회 중 오류가 발생했습니다.' }, { status: 500 });
+	}
+}
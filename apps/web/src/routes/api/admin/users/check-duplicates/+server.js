@@ -1,11 +1,12 @@
 import { json } from '@sveltejs/kit';
 import { db } from '$lib/server/db.js';
-import User from '$lib/server/models/User.js';
+import { findExistingNames } from '$lib/server/services/userNameIndexService.js';
 
 /**
  * 엑셀 등록 전 중복 검사 API
  * - 이름 중복 검사만 (User 테이블)
  * - ID는 중복 허용 (같은 ID에 여러 사람 가능)
+ * - ⭐ v9.7: 이름 인덱스(메모리) 사용, 구간(파일)별 결과 함께 반환
  */
 export async function POST({ request, locals }) {
 	// 관리자 권한 확인
@@ -16,17 +17,28 @@ export async function POST({ request, locals }) {
 	await db();
 
 	try {
-		const { users } = await request.json();
+		const { users, sections } = await request.json();
 
 		if (!users || !Array.isArray(users)) {
 			return json({ error: '올바른 데이터 형식이 아닙니다.' }, { status: 400 });
 		}
 
-		// 이름 수집
-		const allNames = [];
-		const nameToRow = new Map();
+		// ⭐ v9.7: 구간(파일) 정보 - [{ name, count }] 순서대로 users를 나눔 (없으면 전체 1구간)
+		const sectionList = Array.isArray(sections) && sections.length > 0
+			? sections.map((section) => ({ name: String(section.name ?? ''), count: Number(section.count) || 0 }))
+			: [{ name: '', count: users.length }];
+
+		// 이름 수집 (행 번호, 구간, 구간 내 행 번호)
+		const rows = [];
+		let sectionIndex = 0;
+		let sectionStart = 0;
 
 		for (let i = 0; i < users.length; i++) {
+			while (sectionIndex < sectionList.length - 1 && i >= sectionStart + sectionList[sectionIndex].count) {
+				sectionStart += sectionList[sectionIndex].count;
+				sectionIndex++;
+			}
+
 			const userData = users[i];
 
 			// 헤더 행 건너뛰기
@@ -37,28 +49,40 @@ export async function POST({ request, locals }) {
 			const name = String(userData['성명'] ?? '').trim();
 			if (!name) continue;
 
-			allNames.push(name);
-			nameToRow.set(name, i + 1);
+			rows.push({ row: i + 1, sectionIndex, sectionRow: i - sectionStart + 1, name });
 		}
 
+		// ⭐ v9.7: 이름 인덱스(메모리)와 교집합
+		const existingNames = await findExistingNames(rows.map((r) => r.name));
+
 		const duplicates = [];
+		const sectionResults = sectionList.map((section) => ({
+			name: section.name,
+			total: 0,
+			duplicates: []
+		}));
 
-		// 이름 중복 검사
-		if (allNames.length > 0) {
-			const existingUsers = await User.find({ name: { $in: allNames } }).select('name');
-			for (const user of existingUsers) {
-				const row = nameToRow.get(user.name);
-				duplicates.push({
-					row,
-					name: user.name
-				});
-			}
+		for (const r of rows) {
+			const sectionResult = sectionResults[r.sectionIndex];
+			sectionResult.total++;
+
+			if (!existingNames.has(r.name)) continue;
+
+			const duplicate = {
+				row: r.row,
+				name: r.name,
+				section: sectionResult.name,
+				sectionRow: r.sectionRow
+			};
+			duplicates.push(duplicate);
+			sectionResult.duplicates.push(duplicate);
 		}
 
 		return json({
 			success: true,
 			hasDuplicates: duplicates.length > 0,
-			duplicates
+			duplicates,
+			sections: sectionResults
 		});
 
 	} catch (error) {
@@ -1,11 +1,11 @@
 import { json } from '@sveltejs/kit';
-import User from '$lib/server/models/User.js';
 import { db } from '$lib/server/db.js';
+import { searchUsers } from '$lib/server/services/userSearchService.js';
 
 /**
  * 판매인 검색 API
  * GET /api/admin/users/search?q=검색어
- * User를 검색하고 UserAccount를 lookup하여 phone 가져옴
+ * 이름(부분 일치), 초성, 아이디, 연락처로 검색 (phone은 UserAccount에서 가져옴)
  */
 export async function GET({ url, locals }) {
 	// 관리자 권한 확인
@@ -22,38 +22,8 @@ export async function GET({ url, locals }) {
 			return json({ users: [] });
 		}
 
-		// User를 검색하고 UserAccount에서 phone을 lookup
-		const users = await User.aggregate([
-			{
-				$match: {
-					name: { $regex: query, $options: 'i' },
-					status: 'active'
-				}
-			},
-			{
-				$lookup: {
-					from: 'useraccounts',
-					localField: 'userAccountId',
-					foreignField: '_id',
-					as: 'account'
-				}
-			},
-			{
-				$unwind: {
-					path: '$account',
-					preserveNullAndEmptyArrays: true
-				}
-			},
-			{
-				$project: {
-					_id: 1,
-					name: 1,
-					phone: '$account.phone',
-					branch: 1
-				}
-			},
-			{ $limit: 10 }
-		]);
+		// ⭐ v9.7: 검색 키 접두사 검색 + 트라이 캐시 (이름/초성/아이디/연락처)
+		const users = await searchUsers(query);
 
 		return json({ users });
 	} catch (error) {
@@ -2,6 +2,7 @@ import { json } from '@sveltejs/kit';
 import { db } from '$lib/server/db.js';
 import WeeklyPaymentPlans from '$lib/server/models/WeeklyPaymentPlans.js';
 import MonthlyRegistrations from '$lib/server/models/MonthlyRegistrations.js';
+import { findWeekInstallments } from '$lib/server/services/paymentWeekBucketService.js';
 
 export async function GET({ locals }) {
 	if (!locals.user || locals.user.type !== 'admin') {
@@ -16,10 +17,8 @@ export async function GET({ locals }) {
 		const currentYear = currentDate.getFullYear();
 		const currentMonth = currentDate.getMonth() + 1;
 
-		// v5.0: getWeekNumber 계산 (ISO 주차)
-		const startOfYear = new Date(currentYear, 0, 1);
-		const dayOfYear = Math.floor((currentDate - startOfYear) / (1000 * 60 * 60 * 24));
-		const weekNumber = Math.ceil((dayOfYear + startOfYear.getDay() + 1) / 7);
+		// ⭐ v9.7: ISO 주차 (계획 installments.weekNumber와 같은 계산)
+		const weeklyISOWeek = WeeklyPaymentPlans.getISOWeek(currentDate);
 
 		// 현재 주차 계산 (월 기준)
 		const dayOfWeek = currentDate.getDay();
@@ -28,27 +27,10 @@ export async function GET({ locals }) {
 		weekStart.setHours(0, 0, 0, 0);
 		const weekOfMonth = Math.ceil(weekStart.getDate() / 7);
 
-		// ⭐ v8.0: WeeklyPaymentPlans에서 직접 집계
-		const weeklyISOWeek = `${currentYear}-W${String(weekNumber).padStart(2, '0')}`;
-		
 		// 병렬로 데이터 조회
 		const [weeklyInstallments, monthlyRevenues] = await Promise.all([
-			// v8.0: 이번 주 지급 데이터 조회 (WeeklyPaymentPlans에서)
-			WeeklyPaymentPlans.aggregate([
-				{ $unwind: '$installments' },
-				{ $match: {
-					'installments.weekNumber': weeklyISOWeek,
-					'installments.status': { $nin: ['skipped', 'terminated'] }  // ⭐ v8.0: canceled 제거
-					// planStatus 조건 제거 - inst.status로 충분
-				}},
-				{ $group: {
-					_id: null,
-					totalAmount: { $sum: '$installments.installmentAmount' },
-					totalTax: { $sum: '$installments.withholdingTax' },
-					totalNet: { $sum: '$installments.netAmount' },
-					userIds: { $addToSet: '$userId' }
-				}}
-			]),
+			// ⭐ v9.7: 이번 주 지급 회차 (주차 버킷 → 해당 계획만 조회)
+			findWeekInstallments(weeklyISOWeek),
 
 			// v5.0: 최근 3개월 매출 데이터 (지급 구성 표시용)
 			MonthlyRegistrations.find({
@@ -62,21 +44,23 @@ export async function GET({ locals }) {
 			}).sort({ monthKey: -1 }).limit(3)
 		]);
 
-		// ⭐ v8.0: 주간 지급 정보 정리 (WeeklyPaymentPlans aggregation 기반)
-		const weeklyData = weeklyInstallments[0];
-		const weeklyPayment = weeklyData ? {
-			totalAmount: weeklyData.totalAmount || 0,
-			totalTax: weeklyData.totalTax || 0,
-			totalNet: weeklyData.totalNet || 0,
-			userCount: weeklyData.userIds?.length || 0,
-			period: `${currentYear}년 ${currentMonth}월 ${weekOfMonth}주차`
-		} : {
+		// ⭐ v8.0: 주간 지급 정보 정리 (skipped/terminated 회차 제외)
+		const weeklyPayment = {
 			totalAmount: 0,
 			totalTax: 0,
 			totalNet: 0,
 			userCount: 0,
 			period: `${currentYear}년 ${currentMonth}월 ${weekOfMonth}주차`
 		};
+		const userIds = new Set();
+		for (const { plan, installment } of weeklyInstallments) {
+			if (installment.status === 'skipped' || installment.status === 'terminated') continue;
+			weeklyPayment.totalAmount += installment.installmentAmount || 0;
+			weeklyPayment.totalTax += installment.withholdingTax || 0;
+			weeklyPayment.totalNet += installment.netAmount || 0;
+			userIds.add(plan.userId);
+		}
+		weeklyPayment.userCount = userIds.size;
 
 		// v5.0: 월별 매출 데이터 정리 (MonthlyRegistrations에서 조회)
 		const formattedRevenues = monthlyRevenues.map(reg => {
@@ -7,6 +7,7 @@ import User from '$lib/server/models/User.js';
 import UserAccount from '$lib/server/models/UserAccount.js'; // v8.0
 import PlannerAccount from '$lib/server/models/PlannerAccount.js'; // v8.0
 import { JWT_SECRET, JWT_EXPIRES, JWT_REFRESH_EXPIRES } from '$env/static/private';
+import { getMaintenanceMode } from '$lib/server/authCache.js';
 
 export async function POST({ request, cookies }) {
 	const { loginId, password, userType } = await request.json();
@@ -179,8 +180,7 @@ export async function POST({ request, cookies }) {
 	// 유지보수 모드 확인
 	let isMaintenanceMode = false;
 	if (accountType !== 'admin') {
-		const adminAccount = await Admin.findOne().select('systemSettings.maintenanceMode');
-		isMaintenanceMode = adminAccount?.systemSettings?.maintenanceMode || false;
+		isMaintenanceMode = await getMaintenanceMode();
 	}
 
 	// v8.0: 응답 데이터
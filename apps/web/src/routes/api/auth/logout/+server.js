@@ -1,6 +1,11 @@
 import { json } from '@sveltejs/kit';
+import { revokeToken } from '$lib/server/authCache.js';
 
 export async function POST({ cookies }) {
+	// ⭐ v9.7: 서버 측 토큰 폐기 (인증 캐시에서 제거, 만료 시각까지 거부)
+	revokeToken(cookies.get('token'));
+	revokeToken(cookies.get('refreshToken'));
+
 	// 모든 인증 관련 쿠키 삭제 (로그인 시 설정한 옵션과 동일하게)
 	cookies.delete('token', {
 		path: '/',
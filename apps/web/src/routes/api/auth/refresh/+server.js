@@ -3,6 +3,7 @@ import jwt from 'jsonwebtoken';
 import { db } from '$lib/server/db.js';
 import { Admin } from '$lib/server/models/Admin.js';
 import User from '$lib/server/models/User.js';
+import { verifyToken } from '$lib/server/authCache.js';
 import { JWT_SECRET, JWT_EXPIRES } from '$env/static/private';
 
 export async function POST({ cookies }) {
@@ -13,11 +14,11 @@ export async function POST({ cookies }) {
 	}
 
 	try {
-		// 리프레시 토큰 검증
-		const decoded = jwt.verify(refreshToken, JWT_SECRET);
-
 		await db();
 
+		// 리프레시 토큰 검증 (암호 변경으로 무효화된 토큰 거부)
+		const decoded = await verifyToken(refreshToken, JWT_SECRET);
+
 		// 사용자 정보 다시 조회
 		let account;
 		if (decoded.type === 'admin') {
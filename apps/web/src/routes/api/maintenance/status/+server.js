@@ -1,6 +1,6 @@
 import { json } from '@sveltejs/kit';
-import { Admin } from '$lib/server/models/Admin.js';
 import { connectDB } from '$lib/server/db.js';
+import { getMaintenanceMode } from '$lib/server/authCache.js';
 
 /**
  * 유지보수 모드 상태 조회 (공개 API)
@@ -9,11 +9,9 @@ export async function GET() {
 	try {
 		await connectDB();
 
-		// 첫 번째 관리자 계정의 시스템 설정 조회
-		const admin = await Admin.findOne().select('systemSettings.maintenanceMode');
-
+		// 첫 번째 관리자 계정의 시스템 설정 조회 (캐시)
 		return json({
-			maintenanceMode: admin?.systemSettings?.maintenanceMode || false
+			maintenanceMode: await getMaintenanceMode()
 		});
 	} catch (error) {
 		console.error('[Maintenance] 상태 조회 오류:', error);
@@ -1,9 +1,10 @@
 import { json } from '@sveltejs/kit';
-import PlannerCommissionPlan from '$lib/server/models/PlannerCommissionPlan.js';
+import PlannerCommissionRollup from '$lib/server/models/PlannerCommissionRollup.js';
+import { ensurePlannerRollups } from '$lib/server/services/plannerRollupService.js';
 import mongoose from 'mongoose';
 
 /**
- * 설계사 수당 요약 정보 조회 (PlannerCommissionPlan 사용)
+ * 설계사 수당 요약 정보 조회 (PlannerCommissionRollup 사용)
  * GET /api/planner/commission-summary
  */
 export async function GET({ locals, url }) {
@@ -27,50 +28,32 @@ export async function GET({ locals, url }) {
 		const startDate = new Date(Date.UTC(startYear, startMonth - 1, 1));
 		const endDate = new Date(Date.UTC(endYear, endMonth, 1)); // 다음 달 1일
 
-		console.log(`🔍 설계사 수당 조회 (PlannerCommissionPlan): plannerAccountId=${plannerAccountId}, 기간=${startDate.toISOString().split('T')[0]} ~ ${endDate.toISOString().split('T')[0]}, groupBy=${groupBy}`);
+		console.log(`🔍 설계사 수당 조회 (PlannerCommissionRollup): plannerAccountId=${plannerAccountId}, 기간=${startDate.toISOString().split('T')[0]} ~ ${endDate.toISOString().split('T')[0]}, groupBy=${groupBy}`);
 
-		// 그룹핑 형식 결정
-		const groupFormat = groupBy === 'week' ? '%Y-%m-%d' : '%Y-%m';
+		// ⭐ 설계사 집계(Rollup)에서 조회 (월/주 단위 사전 집계, 단일 인덱스 조회)
+		await ensurePlannerRollups();
 
-		// PlannerCommissionPlan에서 집계
-		const commissionPlans = await PlannerCommissionPlan.aggregate([
-			// 설계사 및 기간 필터링
-			{
-				$match: {
-					plannerAccountId,
-					paymentDate: {
-						$gte: startDate,
-						$lt: endDate
-					}
-				}
+		const rollups = await PlannerCommissionRollup.find({
+			plannerAccountId,
+			periodType: groupBy === 'week' ? 'week' : 'month',
+			periodStart: {
+				$gte: startDate,
+				$lt: endDate
 			},
+			commissionCountAll: { $gt: 0 }
+		})
+			.sort({ periodStart: 1 })
+			.lean();
 
-			// 월별 또는 주별(날짜별) 그룹핑
-			{
-				$group: {
-					_id: {
-						$dateToString: { format: groupFormat, date: '$paymentDate' }
-					},
-					totalCommission: { $sum: '$commissionAmount' },
-					totalUsers: { $sum: 1 },
-					totalRevenue: { $sum: '$revenue' }
-				}
-			},
-
-			// 정렬
-			{
-				$sort: { _id: 1 }
-			}
-		]);
-
-		console.log(`📊 조회 결과: ${commissionPlans.length}건`, commissionPlans.map(c => ({ period: c._id, amount: c.totalCommission })));
+		console.log(`📊 조회 결과: ${rollups.length}건`, rollups.map(r => ({ period: r.period, amount: r.commissionAmountAll })));
 
-		// 요약 데이터 생성
-		const summary = commissionPlans.map(plan => ({
-			period: plan._id,
-			totalCommission: plan.totalCommission || 0,
-			totalUsers: plan.totalUsers || 0,
-			totalRevenue: plan.totalRevenue || 0
+		// 요약 데이터 생성 (주별: 지급일 YYYY-MM-DD, 월별: YYYY-MM)
+		// - 수당 상태 구분 없이 전체 합계 (지급명부의 paid/pending 합계와 다름)
+		const summary = rollups.map(rollup => ({
+			period: groupBy === 'week' ? rollup.periodStart.toISOString().split('T')[0] : rollup.period,
+			totalCommission: rollup.commissionAmountAll || 0,
+			totalUsers: rollup.commissionCountAll || 0,
+			totalRevenue: rollup.commissionRevenueAll || 0
 		}));
 
 		// 총계 계산
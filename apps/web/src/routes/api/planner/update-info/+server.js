@@ -2,13 +2,15 @@ import { json } from '@sveltejs/kit';
 import { db } from '$lib/server/db.js';
 import PlannerAccount from '$lib/server/models/PlannerAccount.js';
 import bcrypt from 'bcryptjs';
+import { invalidateAccountTokens, reissueSessionTokens } from '$lib/server/authCache.js';
+import { JWT_SECRET, JWT_EXPIRES, JWT_REFRESH_EXPIRES } from '$env/static/private';
 
 /**
  * 설계사 정보 수정 API
  * - 전화번호, 이메일, 주소, 근무지 변경
  * - 암호 변경 (이전 암호 확인 필수)
  */
-export async function POST({ locals, request }) {
+export async function POST({ locals, request, cookies }) {
 	if (!locals.user || locals.user.accountType !== 'planner') {
 		return json({ error: 'Unauthorized' }, { status: 401 });
 	}
@@ -83,6 +85,15 @@ export async function POST({ locals, request }) {
 		planner.updatedAt = new Date();
 		await planner.save();
 
+		if (currentPassword && newPassword && confirmPassword) {
+			// 다른 세션의 기존 토큰 무효화, 현재 세션은 새 토큰으로 유지
+			await invalidateAccountTokens(planner._id);
+			reissueSessionTokens(cookies, locals.user, JWT_SECRET, {
+				expiresIn: JWT_EXPIRES,
+				refreshExpiresIn: JWT_REFRESH_EXPIRES
+			});
+		}
+
 		return json({ 
 			success: true,
 			message: '정보가 수정되었습니다.',
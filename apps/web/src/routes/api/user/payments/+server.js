@@ -1,10 +1,17 @@
 import { json } from '@sveltejs/kit';
+import crypto from 'crypto';
 import { db } from '$lib/server/db.js';
-import User from '$lib/server/models/User.js';
-import UserAccount from '$lib/server/models/UserAccount.js';
 import WeeklyPaymentPlans from '$lib/server/models/WeeklyPaymentPlans.js';
-
-export async function GET({ locals, url }) {
+import { findScheduleAccount, toScheduleAccount } from '$lib/server/services/paymentScheduleService.js';
+import { getPaymentWeekRange, mergePaymentRows } from '$lib/utils/paymentScheduleView.js';
+
+/**
+ * GET: 내 지급 내역 (요약 + 주차별 지급 행)
+ * - ⭐ v9.7: 주차별 합계/요약은 서버 집계 1회, 행 병합은 대시보드 로컬 캐시와 같은 함수(mergePaymentRows)
+ *   (대시보드는 /api/user/payments/sync + 로컬 캐시 사용, 이 API는 필터 조회/캐시 없는 클라이언트용)
+ * - startMonth / endMonth / grade 필터
+ */
+export async function GET({ locals, url, request }) {
 	if (!locals.user || locals.user.type !== 'user') {
 		return json({ message: '권한이 없습니다.' }, { status: 401 });
 	}
@@ -19,180 +26,133 @@ export async function GET({ locals, url }) {
 	// ⭐ v8.0: JWT에서 primaryUserId 사용 (locals.user.id는 UserAccount._id)
 	const primaryUserId = locals.user.primaryUserId || locals.user.id;
 
-	// ⭐ v8.0: primaryUser 정보 조회 + UserAccount populate
-	const primaryUser = await User.findById(primaryUserId)
-		.populate('userAccountId', 'canViewSubordinates')
-		.select('name grade insuranceActive userAccountId registrationNumber')
-		.lean();
-
-	if (!primaryUser) {
+	// ⭐ v8.0: primaryUser + 같은 계정의 모든 User
+	const account = await findScheduleAccount(primaryUserId);
+	if (!account) {
 		return json({ message: '사용자를 찾을 수 없습니다.' }, { status: 404 });
 	}
 
-	// ⭐ v8.0: 같은 계정의 모든 User 조회
-	const allUsers = await User.find({ userAccountId: primaryUser.userAccountId })
-		.select('_id name grade registrationNumber createdAt insuranceActive gradeHistory')
-		.sort({ registrationNumber: 1 })
-		.lean();
-
-	// ⭐ v8.0: 모든 User의 userId 목록
+	const { primaryUser, allUsers } = account;
 	const allUserIds = allUsers.map(u => u._id.toString());
 
-	// ⭐ v8.0: 모든 User의 용역비 지급 계획 조회 (최신순)
-	// ⭐ v8.1: planStatus 필터 제거 - 개별 installment.status로 필터링
-	//         terminated 계획이라도 pending 회차는 표시해야 함
-	const paymentPlans = await WeeklyPaymentPlans.find({
-		userId: { $in: allUserIds }
-	})
-		.sort({ createdAt: -1 })
-		.lean();
-
-	// 이번주 금요일 계산 (지급일)
-	// ⭐ 토요일만 "금요일 지급 완료"로 처리 (일요일은 새 주의 시작)
-	const now = new Date();
-	const dayOfWeek = now.getDay(); // 0(일) ~ 6(토)
-	const isFridayPassed = dayOfWeek === 6; // 토요일(6)만 금요일 지남 처리
-
-	// ⭐ 토요일이면 다음 주 금요일, 그 외는 이번 주 금요일
-	const weekOffset = isFridayPassed ? 7 : 0;
-
-	const thisWeekStart = new Date(now);
-	thisWeekStart.setDate(now.getDate() - dayOfWeek + weekOffset); // 이번 주 일요일 (또는 다음 주)
-	thisWeekStart.setHours(0, 0, 0, 0);
-
-	const thisWeekEnd = new Date(thisWeekStart);
-	thisWeekEnd.setDate(thisWeekStart.getDate() + 6); // 이번 주 토요일
-	thisWeekEnd.setHours(23, 59, 59, 999);
-
-	// 이번 주 금요일 날짜 (용역자가 받을 날짜)
-	const thisWeekFriday = new Date(thisWeekStart);
-	thisWeekFriday.setDate(thisWeekStart.getDate() + 5); // 금요일
-
-	// 로컬 시간 기준 날짜 포맷 (YYYY-MM-DD)
-	const formatLocalDate = (date) => {
-		const year = date.getFullYear();
-		const month = String(date.getMonth() + 1).padStart(2, '0');
-		const day = String(date.getDate()).padStart(2, '0');
-		return `${year}-${month}-${day}`;
+	// 이번 주 범위 (⭐ 토요일만 "금요일 지급 완료" → 다음 주)
+	const weekRange = getPaymentWeekRange();
+	const thisWeekStart = new Date(weekRange.start);
+	const thisWeekEnd = new Date(weekRange.end);
+
+	// ⭐ v9.7: 조건부 GET - 계획 버전(개수 + 최종 수정 시각) + 계정 사용자 정보 + 기준 주 + 필터로 ETag 생성
+	// 변경이 없으면 지급 계획을 집계하지 않고 304 반환
+	const [planVersion] = await WeeklyPaymentPlans.aggregate([
+		{ $match: { userId: { $in: allUserIds } } },
+		{ $group: { _id: null, count: { $sum: 1 }, lastUpdated: { $max: '$updatedAt' } } }
+	]);
+	const lastModified = new Date(Math.max(
+		planVersion?.lastUpdated?.getTime() || 0,
+		thisWeekStart.getTime()
+	));
+	const etag = `W/"${crypto
+		.createHash('sha1')
+		.update(JSON.stringify({
+			users: allUsers,
+			canViewSubordinates: primaryUser.userAccountId?.canViewSubordinates || false,
+			plans: planVersion || null,
+			week: thisWeekStart.getTime(),
+			query: url.search
+		}))
+		.digest('base64url')}"`;
+	const cacheHeaders = {
+		ETag: etag,
+		'Last-Modified': lastModified.toUTCString(),
+		'Cache-Control': 'private, no-cache'
 	};
 
-	// ⭐ v8.0: 사용자별로 개별 행 생성 (합산하지 않음)
-	let paymentRows = [];
-	let thisWeekAmount = 0;
-	let thisWeekTax = 0;
-	let thisWeekNet = 0;
-	let totalPaidAmount = 0;  // ⭐ 지금까지 받은 총액
-	let totalPaidTax = 0;
-	let totalPaidNet = 0;
-	let upcomingAmount = 0;   // ⭐ 앞으로 받을 총액
-	let upcomingTax = 0;
-	let upcomingNet = 0;
-
-	// User 정보 맵 생성 (빠른 조회)
-	const userMap = new Map();
-	for (const user of allUsers) {
-		userMap.set(user._id.toString(), user);
-	}
-
-	// ⭐ 주차별로 그룹화하여 등급별 빈도수와 금액 합산
-	const weekUserMap = new Map(); // key: "주차번호_사용자명"
-
-	// 주차번호에서 금요일 날짜 계산 (ISO 8601 week date)
-	function getFridayFromWeekNumber(weekNumberStr) {
-		// weekNumberStr 형식: "2025-W48"
-		const [year, week] = weekNumberStr.split('-W').map(Number);
-
-		// ISO 8601: 1월 4일이 포함된 주가 1주차
-		const jan4 = new Date(year, 0, 4);
-		const jan4Day = jan4.getDay() || 7; // 일요일=7
-		const firstMonday = new Date(jan4);
-		firstMonday.setDate(jan4.getDate() - jan4Day + 1);
-
-		// 해당 주의 월요일
-		const targetMonday = new Date(firstMonday);
-		targetMonday.setDate(firstMonday.getDate() + (week - 1) * 7);
-
-		// 금요일 = 월요일 + 4일
-		const friday = new Date(targetMonday);
-		friday.setDate(targetMonday.getDate() + 4);
-
-		return friday;
+	const ifNoneMatch = request.headers.get('if-none-match');
+	if (ifNoneMatch && ifNoneMatch.split(',').some(tag => tag.trim() === etag)) {
+		return new Response(null, { status: 304, headers: cacheHeaders });
 	}
 
-	for (const plan of paymentPlans) {
-		const user = userMap.get(plan.userId);
-		if (!user) continue; // 사용자 정보 없으면 스킵
-
-		for (const installment of plan.installments) {
-			// ⭐ v8.0: terminated/skipped 상태만 확인 (canceled 제거)
-			if (['terminated', 'skipped'].includes(installment.status)) continue;
-
-			const weekNumber = installment.weekNumber; // "2025-W48"
-
-			// 그룹 키: 주차번호_사용자명
-			const groupKey = `${weekNumber}_${user.name}`;
-
-			if (!weekUserMap.has(groupKey)) {
-				// 해당 주의 금요일 날짜 계산
-				const fridayDate = getFridayFromWeekNumber(weekNumber);
-
-				weekUserMap.set(groupKey, {
-					weekDate: fridayDate,
-					weekNumber: weekNumber,
-					userId: plan.userId.toString(), // ⭐ 문자열로 변환
-					userName: user.name,
-					registrationNumber: user.registrationNumber,
-					insuranceActive: user.insuranceActive || false, // ⭐ 보험 유지 여부 추가
-					gradeCount: {}, // 등급별 빈도수
-					amount: 0,
-					tax: 0,
-					netAmount: 0
-				});
+	// ⭐ v9.7: 주차×용역자별 합계 + 이번 주/누적/예정 합계를 집계 1회로 계산
+	// - terminated/skipped 회차 제외 (⭐ v8.0: canceled 제거)
+	const [aggregated] = await WeeklyPaymentPlans.aggregate([
+		{ $match: { userId: { $in: allUserIds } } },
+		{
+			$project: {
+				userId: 1,
+				baseGrade: 1,
+				createdAt: 1,
+				installments: {
+					$filter: {
+						input: '$installments',
+						as: 'inst',
+						cond: { $not: { $in: ['$$inst.status', ['terminated', 'skipped']] } }
+					}
+				}
 			}
-
-			const group = weekUserMap.get(groupKey);
-
-			// 등급별 빈도수 증가
-			group.gradeCount[plan.baseGrade] = (group.gradeCount[plan.baseGrade] || 0) + 1;
-			
-			// ⭐ 등급 정보 추가 (필터링용 - 최고 등급 사용)
-			if (!group.grade || plan.baseGrade > group.grade) {
-				group.grade = plan.baseGrade;
-			}
-
-			// 금액 합산
-			group.amount += installment.installmentAmount || 0;
-			group.tax += installment.withholdingTax || 0;
-			group.netAmount += installment.netAmount || 0;
-
-			// 날짜 기준 계산
-			const installmentDate = installment.scheduledDate || installment.weekDate;
-
-			// ⭐ 1. 이번주 금요일 받을 금액 (이번주만, 상태 무관)
-			if (installmentDate >= thisWeekStart && installmentDate <= thisWeekEnd) {
-				thisWeekAmount += installment.installmentAmount || 0;
-				thisWeekTax += installment.withholdingTax || 0;
-				thisWeekNet += installment.netAmount || 0;
-			}
-
-			// ⭐ 2. 누적 수령액 (과거 전체, 상태 무관)
-			if (installmentDate < thisWeekStart) {
-				totalPaidAmount += installment.installmentAmount || 0;
-				totalPaidTax += installment.withholdingTax || 0;
-				totalPaidNet += installment.netAmount || 0;
-			}
-
-			// ⭐ 3. 남은 예정액 (미래만, 상태 무관)
-			if (installmentDate > thisWeekEnd) {
-				upcomingAmount += installment.installmentAmount || 0;
-				upcomingTax += installment.withholdingTax || 0;
-				upcomingNet += installment.netAmount || 0;
+		},
+		{ $unwind: '$installments' },
+		{
+			$facet: {
+				rows: [
+					{
+						$group: {
+							_id: { weekNumber: '$installments.weekNumber', userId: '$userId' },
+							latestPlanAt: { $max: '$createdAt' },
+							grades: { $push: '$baseGrade' },
+							amount: { $sum: { $ifNull: ['$installments.installmentAmount', 0] } },
+							tax: { $sum: { $ifNull: ['$installments.withholdingTax', 0] } },
+							netAmount: { $sum: { $ifNull: ['$installments.netAmount', 0] } }
+						}
+					}
+				],
+				summary: [
+					{
+						$group: {
+							_id: {
+								$switch: {
+									branches: [
+										{ case: { $lt: ['$installments.scheduledDate', thisWeekStart] }, then: 'totalPaid' },
+										{ case: { $gt: ['$installments.scheduledDate', thisWeekEnd] }, then: 'upcoming' }
+									],
+									default: 'thisWeek'
+								}
+							},
+							amount: { $sum: { $ifNull: ['$installments.installmentAmount', 0] } },
+							tax: { $sum: { $ifNull: ['$installments.withholdingTax', 0] } },
+							net: { $sum: { $ifNull: ['$installments.netAmount', 0] } }
+						}
+					}
+				]
 			}
 		}
-	}
+	]);
+
+	// ⭐ 1. 이번주 금요일 받을 금액 / 2. 누적 수령액 (과거 전체) / 3. 남은 예정액 (미래만) - 상태 무관
+	const summaryTotals = new Map((aggregated?.summary || []).map(s => [s._id, s]));
+	const pickTotals = (key) => ({
+		amount: summaryTotals.get(key)?.amount || 0,
+		tax: summaryTotals.get(key)?.tax || 0,
+		net: summaryTotals.get(key)?.net || 0
+	});
+	const summary = {
+		thisWeek: { date: weekRange.date, ...pickTotals('thisWeek') },
+		totalPaid: pickTotals('totalPaid'),
+		upcoming: pickTotals('upcoming')
+	};
 
-	// Map을 배열로 변환
-	paymentRows = Array.from(weekUserMap.values());
+	// ⭐ 같은 주차의 같은 이름 병합 + 날짜순(최신순) 정렬 (대시보드 로컬 계산과 같은 함수)
+	const scheduleAccount = toScheduleAccount(primaryUser, allUsers);
+	let paymentRows = mergePaymentRows(
+		(aggregated?.rows || []).map(row => ({
+			weekNumber: row._id.weekNumber,
+			userId: row._id.userId,
+			latestPlanAt: row.latestPlanAt?.getTime() || 0,
+			grades: row.grades,
+			amount: row.amount,
+			tax: row.tax,
+			netAmount: row.netAmount
+		})),
+		scheduleAccount.allRegistrations
+	);
 
 	// ⭐ 필터 적용
 	if (startMonth || endMonth || gradeFilter) {
@@ -219,50 +179,10 @@ export async function GET({ locals, url }) {
 		});
 	}
 
-	// 날짜순 정렬 (최신순)
-	const paymentHistory = paymentRows.sort((a, b) => {
-		const dateA = new Date(a.weekDate);
-		const dateB = new Date(b.weekDate);
-		return dateB - dateA;
-	});
-
 	return json({
 		success: true,
-		user: {
-			id: primaryUser._id.toString(),
-			name: primaryUser.name,
-			grade: primaryUser.grade,
-			insuranceActive: primaryUser.insuranceActive,
-			registrationNumber: primaryUser.registrationNumber,
-			canViewSubordinates: primaryUser.userAccountId?.canViewSubordinates || false // ⭐ v8.0
-		},
-		allRegistrations: allUsers.map(reg => ({
-			id: reg._id.toString(),
-			name: reg.name,
-			grade: reg.grade,
-			registrationNumber: reg.registrationNumber,
-			createdAt: reg.createdAt, // ⭐ 등록일 추가
-			insuranceActive: reg.insuranceActive || false, // ⭐ 보험 유지 여부
-			gradeHistory: reg.gradeHistory || [] // ⭐ 보험 유지 만료일 계산용
-		})),
-		summary: {
-			thisWeek: {
-				date: formatLocalDate(thisWeekFriday), // ⭐ 이번 주 금요일 날짜 (로컬 시간 기준)
-				amount: thisWeekAmount,
-				tax: thisWeekTax,
-				net: thisWeekNet
-			},
-			totalPaid: {  // ⭐ 변경: thisMonth → totalPaid (지금까지 받은 총액)
-				amount: totalPaidAmount,
-				tax: totalPaidTax,
-				net: totalPaidNet
-			},
-			upcoming: {   // ⭐ 앞으로 받을 총액
-				amount: upcomingAmount,
-				tax: upcomingTax,
-				net: upcomingNet
-			}
-		},
-		payments: paymentHistory
-	});
+		...scheduleAccount,
+		summary,
+		payments: paymentRows
+	}, { headers: cacheHeaders });
 }
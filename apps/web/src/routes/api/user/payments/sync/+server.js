@@ -0,0 +1,79 @@
+import { json } from '@sveltejs/kit';
+import { db } from '$lib/server/db.js';
+import WeeklyPaymentPlans from '$lib/server/models/WeeklyPaymentPlans.js';
+import {
+	SCHEDULE_PLAN_FIELDS,
+	findScheduleAccount,
+	toScheduleAccount,
+	toSchedulePlan
+} from '$lib/server/services/paymentScheduleService.js';
+import { getPaymentWeekRange } from '$lib/utils/paymentScheduleView.js';
+
+// 버전 토큰 형식: v1.<최종 수정 시각 ms>
+const TOKEN_PREFIX = 'v1.';
+
+// 다른 서버/요청의 updatedAt이 늦게 반영될 수 있어 토큰 시각보다 조금 앞부터 다시 전달
+// (클라이언트는 계획 _id 기준으로 덮어쓰므로 중복 전달은 무해)
+const SYNC_SKEW_MS = 60 * 1000;
+
+function parseVersion(token) {
+	if (!token || !token.startsWith(TOKEN_PREFIX)) return null;
+	const time = Number(token.slice(TOKEN_PREFIX.length));
+	return Number.isFinite(time) && time > 0 ? time : null;
+}
+
+/**
+ * GET: 내 지급 계획 변경분 조회 (앱/브라우저 로컬 캐시 동기화용)
+ * ⭐ v9.7
+ * - since 없음(또는 잘못된 토큰): 전체 계획 전달 (full: true)
+ * - since 있음: 토큰 이후 수정된 계획만 전달
+ * - planIds: 현재 계정의 전체 계획 _id (삭제된 계획은 클라이언트가 제거)
+ * - weekRange: 서버 시각 기준 이번 주 범위 (클라이언트는 기기 시계 대신 이 값으로 집계)
+ * - 화면 집계(주차별 합계, 이번 주/누적/예정)는 클라이언트가 캐시에서 계산
+ *   ($lib/utils/paymentScheduleView.js, /api/user/payments와 같은 함수)
+ */
+export async function GET({ locals, url }) {
+	if (!locals.user || locals.user.type !== 'user') {
+		return json({ message: '권한이 없습니다.' }, { status: 401 });
+	}
+
+	await db();
+
+	const since = parseVersion(url.searchParams.get('since'));
+
+	// JWT의 primaryUserId 사용 (locals.user.id는 UserAccount._id)
+	const primaryUserId = locals.user.primaryUserId || locals.user.id;
+
+	const account = await findScheduleAccount(primaryUserId);
+	if (!account) {
+		return json({ message: '사용자를 찾을 수 없습니다.' }, { status: 404 });
+	}
+
+	const { primaryUser, allUsers } = account;
+	const allUserIds = allUsers.map(u => u._id.toString());
+
+	const planFilter = { userId: { $in: allUserIds } };
+	const changedFilter = since
+		? { ...planFilter, updatedAt: { $gt: new Date(since - SYNC_SKEW_MS) } }
+		: planFilter;
+
+	const [planIds, changedPlans] = await Promise.all([
+		WeeklyPaymentPlans.distinct('_id', planFilter),
+		WeeklyPaymentPlans.find(changedFilter).select(SCHEDULE_PLAN_FIELDS).lean()
+	]);
+
+	let version = since || 0;
+	for (const plan of changedPlans) {
+		version = Math.max(version, plan.updatedAt?.getTime() || 0);
+	}
+
+	return json({
+		success: true,
+		full: !since,
+		version: `${TOKEN_PREFIX}${version || Date.now()}`,
+		weekRange: getPaymentWeekRange(),
+		...toScheduleAccount(primaryUser, allUsers),
+		planIds: planIds.map(id => id.toString()),
+		plans: changedPlans.map(toSchedulePlan)
+	}, { headers: { 'Cache-Control': 'private, no-store' } });
+}
@@ -1,6 +1,10 @@
 import { json } from '@sveltejs/kit';
 import { db } from '$lib/server/db.js';
 import User from '$lib/server/models/User.js';
+import { invalidateAccountTokens, reissueSessionTokens } from '$lib/server/authCache.js';
+import { JWT_SECRET, JWT_EXPIRES, JWT_REFRESH_EXPIRES } from '$env/static/private';
+import { refreshAccountSearchKeys } from '$lib/server/services/userSearchService.js';
+import { invalidateUserNameIndex } from '$lib/server/services/userNameIndexService.js';
 
 export async function GET({ locals }) {
 	if (!locals.user || locals.user.type !== 'user') {
@@ -83,7 +87,7 @@ export async function GET({ locals }) {
 	}
 }
 
-export async function PUT({ locals, request }) {
+export async function PUT({ locals, request, cookies }) {
 	if (!locals.user || locals.user.type !== 'user') {
 		return json({ message: '권한이 없습니다.' }, { status: 401 });
 	}
@@ -137,6 +141,14 @@ export async function PUT({ locals, request }) {
 			);
 		}
 
+		// ⭐ v9.7: 자동완성 검색 키 갱신
+		if (body.name !== undefined || body.phone !== undefined) {
+			await refreshAccountSearchKeys(user.userAccountId._id);
+		}
+		if (body.name !== undefined) {
+			invalidateUserNameIndex();
+		}
+
 		// 비밀번호 변경 요청이 있는 경우
 		if (body.currentPassword && body.newPassword) {
 			// bcryptjs 동적 import
@@ -162,6 +174,12 @@ export async function PUT({ locals, request }) {
 				{ $set: { passwordHash: newPasswordHash } },
 				{ new: true }
 			);
+			// 다른 세션의 기존 토큰 무효화, 현재 세션은 새 토큰으로 유지
+			await invalidateAccountTokens(user.userAccountId._id);
+			reissueSessionTokens(cookies, locals.user, JWT_SECRET, {
+				expiresIn: JWT_EXPIRES,
+				refreshExpiresIn: JWT_REFRESH_EXPIRES
+			});
 		}
 
 		// ⭐ v8.0: User 다시 조회 (업데이트 후 정보 반환용)
@@ -0,0 +1,188 @@
+/**
+ * 지급 계획 저장 모드 전환 (full ↔ compact)
+ *
+ * compact: installments 배열 → schedule(회차 공통값) + exceptions(기본값과 다른 회차)
+ * - 대상: 종료된 계획(completed/terminated) 중 마지막 지급일이 기준일 이전인 계획
+ *   (진행 중 계획은 installment 단위 업데이트가 계속되므로 제외)
+ * - 압축 후 복원 결과가 원본과 같을 때만 저장
+ * - 웹 앱은 조회 시 installments를 자동 복원 (WeeklyPaymentPlans 모델 어댑터)
+ *
+ * 사용법:
+ *   node scripts/migrate-plan-storage.js --compact [--before=2025-06-01] [--dry-run]
+ *   node scripts/migrate-plan-storage.js --expand [--dry-run]
+ */
+import mongoose from 'mongoose';
+import dotenv from 'dotenv';
+import { compactInstallments, expandInstallments } from '../apps/web/src/lib/server/utils/planStorage.js';
+
+dotenv.config();
+
+const BATCH_SIZE = 500;
+const COMPARE_FIELDS = [
+  'week', 'weekNumber', 'scheduledDate', 'revenueMonth', 'gradeAtPayment',
+  'baseAmount', 'installmentAmount', 'withholdingTax', 'netAmount',
+  'status', 'paidAt', 'skipReason', 'insuranceSkipped', 'terminatedReason'
+];
+
+function parseArgs() {
+  const args = process.argv.slice(2);
+  const getValue = (name) => args.find(a => a.startsWith(`--${name}=`))?.split('=')[1];
+
+  // 기본 기준일: 3개월 전
+  const defaultBefore = new Date();
+  defaultBefore.setMonth(defaultBefore.getMonth() - 3);
+
+  return {
+    mode: args.includes('--expand') ? 'expand' : args.includes('--compact') ? 'compact' : null,
+    dryRun: args.includes('--dry-run'),
+    before: getValue('before') ? new Date(getValue('before')) : defaultBefore
+  };
+}
+
+function sameInstallments(original, expanded) {
+  const sorted = [...original].sort((a, b) => a.week - b.week);
+  if (sorted.length !== expanded.length) return false;
+
+  return sorted.every((inst, i) =>
+    COMPARE_FIELDS.every(field => {
+      const a = inst[field];
+      const b = expanded[i][field];
+      if (a instanceof Date || b instanceof Date) {
+        return a != null && b != null && new Date(a).getTime() === new Date(b).getTime();
+      }
+      return (a ?? null) === (b ?? null);
+    })
+  );
+}
+
+async function flush(collection, ops, dryRun) {
+  if (ops.length > 0 && !dryRun) {
+    await collection.bulkWrite(ops, { ordered: false });
+  }
+  ops.length = 0;
+}
+
+async function compactPlans(collection, { before, dryRun }) {
+  const { calculateObjectSize } = mongoose.mongo.BSON;
+  const cursor = collection.find({
+    storageMode: { $ne: 'compact' },
+    planStatus: { $in: ['completed', 'terminated'] },
+    'installments.0': { $exists: true },
+    installments: { $not: { $elemMatch: { scheduledDate: { $gte: before } } } }
+  });
+
+  const ops = [];
+  let compacted = 0;
+  let skipped = 0;
+  let bytesBefore = 0;
+  let bytesAfter = 0;
+
+  for await (const plan of cursor) {
+    const compact = compactInstallments(plan);
+    const expanded = compact && expandInstallments({ ...plan, ...compact });
+
+    if (!compact || !sameInstallments(plan.installments, expanded)) {
+      skipped++;
+      continue;
+    }
+
+    const { installments, ...rest } = plan;
+    bytesBefore += calculateObjectSize(plan);
+    bytesAfter += calculateObjectSize({
+      ...rest,
+      installments: [],
+      storageMode: 'compact',
+      ...compact
+    });
+
+    ops.push({
+      updateOne: {
+        // 조회 이후 변경된 계획은 건너뜀
+        filter: { _id: plan._id, updatedAt: plan.updatedAt },
+        update: {
+          $set: {
+            storageMode: 'compact',
+            schedule: compact.schedule,
+            exceptions: compact.exceptions,
+            installments: []
+          }
+        }
+      }
+    });
+    compacted++;
+
+    if (ops.length >= BATCH_SIZE) {
+      await flush(collection, ops, dryRun);
+    }
+  }
+  await flush(collection, ops, dryRun);
+
+  const toMB = (bytes) => (bytes / (1024 * 1024)).toFixed(2);
+  console.log(`  - 압축 대상: ${compacted}개, 압축 불가: ${skipped}개`);
+  console.log(`  - 문서 크기: ${toMB(bytesBefore)} MB → ${toMB(bytesAfter)} MB`);
+}
+
+async function expandPlans(collection, { dryRun }) {
+  const cursor = collection.find({ storageMode: 'compact' });
+
+  const ops = [];
+  let expandedCount = 0;
+
+  for await (const plan of cursor) {
+    const installments = expandInstallments(plan);
+    if (!installments) continue;
+
+    ops.push({
+      updateOne: {
+        filter: { _id: plan._id, storageMode: 'compact' },
+        update: {
+          $set: {
+            storageMode: 'full',
+            installments: installments.map(inst => ({ _id: new mongoose.Types.ObjectId(), ...inst }))
+          },
+          $unset: { schedule: '', exceptions: '' }
+        }
+      }
+    });
+    expandedCount++;
+
+    if (ops.length >= BATCH_SIZE) {
+      await flush(collection, ops, dryRun);
+    }
+  }
+  await flush(collection, ops, dryRun);
+
+  console.log(`  - 복원: ${expandedCount}개`);
+}
+
+async function migratePlanStorage() {
+  const options = parseArgs();
+  if (!options.mode) {
+    console.log('사용법: node scripts/migrate-plan-storage.js --compact [--before=YYYY-MM-DD] [--dry-run] | --expand [--dry-run]');
+    process.exit(1);
+  }
+
+  try {
+    await mongoose.connect(process.env.MONGODB_URI || 'mongodb://localhost:27017/nanumpay');
+    console.log('MongoDB 연결 완료');
+
+    const collection = mongoose.connection.db.collection('weeklypaymentplans');
+
+    if (options.mode === 'compact') {
+      console.log(`\n지급 계획 압축 (마지막 지급일 < ${options.before.toISOString().split('T')[0]})${options.dryRun ? ' [dry-run]' : ''}`);
+      await compactPlans(collection, options);
+    } else {
+      console.log(`\n지급 계획 복원 (compact → full)${options.dryRun ? ' [dry-run]' : ''}`);
+      await expandPlans(collection, options);
+    }
+
+    console.log('\n완료!');
+    await mongoose.disconnect();
+    process.exit(0);
+  } catch (error) {
+    console.error('오류:', error);
+    process.exit(1);
+  }
+}
+
+migratePlanStorage();
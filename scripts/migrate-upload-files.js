@@ -0,0 +1,90 @@
+/**
+ * 업로드 파일 저장소 이전 (UploadHistory.fileData → GridFS uploadFiles)
+ *
+ * - 문서 내 gzip Buffer(fileData)를 원본으로 복원해 내용 해시(sha256)로 GridFS에 저장
+ *   (같은 내용의 파일은 1번만 저장)
+ * - 저장 후 fileHash/compressedSize 설정, fileData 제거
+ * - 웹 앱은 fileData가 남아 있는 레코드도 다운로드 가능 (이전은 선택)
+ *
+ * 사용법:
+ *   node scripts/migrate-upload-files.js [--dry-run]
+ */
+import mongoose from 'mongoose';
+import dotenv from 'dotenv';
+import zlib from 'zlib';
+import { promisify } from 'util';
+import { storeUploadFile } from '../apps/web/src/lib/server/utils/uploadFileStore.js';
+
+dotenv.config();
+
+const gunzip = promisify(zlib.gunzip);
+
+function parseArgs() {
+  const args = process.argv.slice(2);
+  return {
+    dryRun: args.includes('--dry-run')
+  };
+}
+
+async function migrateUploadFiles() {
+  const { dryRun } = parseArgs();
+
+  try {
+    await mongoose.connect(process.env.MONGODB_URI || 'mongodb://localhost:27017/nanumpay');
+    console.log('MongoDB 연결 완료');
+    console.log(`\n업로드 파일 이전 (fileData → GridFS)${dryRun ? ' [dry-run]' : ''}`);
+
+    const collection = mongoose.connection.db.collection('uploadhistories');
+    const cursor = collection.find(
+      { fileData: { $exists: true, $ne: null } },
+      { projection: { originalFileName: 1, fileData: 1 } }
+    );
+
+    let migrated = 0;
+    let deduplicated = 0;
+    let failed = 0;
+    let bytesInline = 0;
+
+    for await (const record of cursor) {
+      const compressed = Buffer.from(record.fileData.buffer);
+      bytesInline += compressed.length;
+
+      if (dryRun) {
+        migrated++;
+        continue;
+      }
+
+      try {
+        const original = await gunzip(compressed);
+        const stored = await storeUploadFile(original);
+
+        await collection.updateOne(
+          { _id: record._id },
+          {
+            $set: { fileHash: stored.fileHash, compressedSize: stored.compressedSize },
+            $unset: { fileData: '' }
+          }
+        );
+
+        migrated++;
+        if (stored.deduplicated) deduplicated++;
+      } catch (error) {
+        failed++;
+        console.error(`  - 실패: ${record.originalFileName} (${record._id}): ${error.message}`);
+      }
+    }
+
+    const toMB = (bytes) => (bytes / (1024 * 1024)).toFixed(2);
+    console.log(`  - 이전: ${migrated}개 (중복 파일 재사용: ${deduplicated}개), 실패: ${failed}개`);
+    console.log(`  - 문서 내 파일 크기: ${toMB(bytesInline)} MB`);
+
+    console.log('\n완료!');
+    await mongoose.disconnect();
+    process.exit(0);
+  } catch (error) {
+    console.error('오류:', error);
+    process.exit(1);
+  }
+}
+
+migrateUploadFiles();
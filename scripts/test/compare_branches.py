@@ -119,7 +119,7 @@ def upload_excel(session, month_name, file_path):
 
     with open(full_path, 'rb') as f:
         files = {'file': (full_path.name, f, 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet')}
-        response = session.post(f"{BASE_URL}/api/admin/users/bulk", files=files)
+        response = session.post(f"{BASE_URL}/api/admin/users/bulk?wait=1", files=files)
 
     if response.status_code == 200:
         data = response.json()
@@ -127,7 +127,7 @@ def read_excel_to_json(file_path):
 
 def upload_excel(cookies, base_url, users_data, file_name):
     response = requests.post(
-        f"{base_url}/api/admin/users/bulk",
+        f"{base_url}/api/admin/users/bulk?wait=1",
         json={"users": users_data, "fileName": file_name},
         cookies=cookies
     )
@@ -91,7 +91,7 @@ def upload_month(session, month_name):
 
     users_data = read_excel_to_json(file_path)
     resp = session.post(
-        f"{BASE_URL}/api/admin/users/bulk",
+        f"{BASE_URL}/api/admin/users/bulk?wait=1",
         json={"users": users_data, "fileName": month_name}
     )
 
@@ -122,7 +122,7 @@ def upload_excel_data(cookies, users_data, file_name):
     print(f"\n📤 서버에 업로드 중: {file_name} ({len(users_data)}건)")
 
     response = requests.post(
-        f"{BASE_URL}/api/admin/users/bulk",
+        f"{BASE_URL}/api/admin/users/bulk?wait=1",
         json={"users": users_data, "fileName": file_name},
         cookies=cookies
     )
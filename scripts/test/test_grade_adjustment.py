@@ -223,7 +223,7 @@ def upload_excel(month):
     print(f"   📤 {month}: {len(data)}건...", end=" ")
 
     response = session.post(
-        f"{BASE_URL}/api/admin/users/bulk",
+        f"{BASE_URL}/api/admin/users/bulk?wait=1",
         json={"users": data, "fileName": f"{month}_용역자명단_간단.xlsx"}
     )
 
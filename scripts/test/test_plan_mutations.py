@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+"""
+지급 계획 회차 단위 업데이트 검증 (user-032)
+
+7월 ~ 11월 순차 업로드 후 회차 단위 업데이트(planMutationService)를 쓰는 API를 호출하고
+DB 계획 상태가 규칙대로 바뀌었는지 확인
+
+- 보험 변경 (/api/admin/users/insurance → updateInstallmentsOnInsuranceChange)
+  - 충족 금액 설정 → 해지: 오늘 이후 pending 회차만 skipped(insuranceSkipped)로 바뀜
+  - 다시 충족 금액 설정: 해지 전 회차 상태로 복원
+- 주간 지급 (/api/admin/payment/execute → processWeeklyPayments)
+  - 지급일에 pending 회차가 있던 active 계획만 completedInstallments + 1
+  - 완료 횟수가 총 회차에 도달한 계획은 completed
+- 승급 종료는 업로드(executeStep4) 결과로 확인 (test_step4_plans.py)
+
+사용법:
+  python3 scripts/test/test_plan_mutations.py [--users=5]
+"""
+
+import sys
+from datetime import datetime, timedelta, timezone
+
+import requests
+from bson import ObjectId
+from pymongo import MongoClient
+
+from verify_registration import (
+    BASE_URL,
+    MONTHS,
+    wait_for_server,
+    login_admin,
+    initialize_db,
+    upload_month
+)
+
+FULL_INSURANCE_AMOUNT = 110000  # F8 기준 (모든 등급 충족)
+
+
+def parse_users_arg():
+    for arg in sys.argv[1:]:
+        if arg.startswith('--users='):
+            return int(arg.split('=')[1])
+    return 5
+
+
+def installment_states(db, user_id):
+    """(계획 _id, 회차) → (상태, 보험 skip 여부, 지급일)"""
+    states = {}
+    for plan in db.weeklypaymentplans.find({'userId': user_id}):
+        for inst in plan.get('installments', []):
+            states[(plan['_id'], inst['week'])] = (
+                inst.get('status'),
+                bool(inst.get('insuranceSkipped')),
+                inst['scheduledDate']
+            )
+    return states
+
+
+def set_insurance(cookies, user_id, amount=None, cancel=False):
+    body = {'userId': user_id, 'cancel': True} if cancel else {
+        'userId': user_id,
+        'insuranceAmount': amount,
+        'insuranceDate': datetime.now(timezone.utc).isoformat()
+    }
+    response = requests.post(f"{BASE_URL}/api/admin/users/insurance", json=body, cookies=cookies)
+    if response.status_code != 200:
+        print(f"  ❌ 보험 변경 실패: HTTP {response.status_code} {response.text[:200]}")
+        return None
+    return response.json()
+
+
+def check_insurance(cookies, db, max_users):
+    print("\n🛡️ 보험 변경 검증")
+    today = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0, tzinfo=None)
+
+    user_ids = db.weeklypaymentplans.distinct('userId', {
+        'planStatus': 'active',
+        'insuranceRequired': {'$ne': None},
+        'installments': {'$elemMatch': {'status': {'$in': ['pending', 'skipped']}, 'scheduledDate': {'$gte': today}}}
+    })[:max_users]
+
+    if not user_ids:
+        print("  ⚠️ 보험 조건이 있는 진행 중 계획이 없습니다")
+        return True
+
+    results = []
+    total_skipped = 0
+    for user_id in user_ids:
+        user = db.users.find_one({'_id': ObjectId(user_id)}, {'name': 1})
+        name = user.get('name') if user else user_id
+
+        if not set_insurance(cookies, user_id, FULL_INSURANCE_AMOUNT):
+            results.append(False)
+            continue
+        covered = installment_states(db, user_id)
+
+        cancel = set_insurance(cookies, user_id, cancel=True)
+        if not cancel:
+            results.append(False)
+            continue
+        canceled = installment_states(db, user_id)
+
+        # 바뀐 회차: pending → skipped(insuranceSkipped), 오늘 이후만
+        changed = [key for key in covered if covered[key] != canceled.get(key)]
+        invalid = [
+            key for key in changed
+            if covered[key][0] != 'pending'
+            or canceled[key][:2] != ('skipped', True)
+            or covered[key][2] < today
+        ]
+        total_skipped += len(changed)
+
+        if not set_insurance(cookies, user_id, FULL_INSURANCE_AMOUNT):
+            results.append(False)
+            continue
+        restored = installment_states(db, user_id)
+        not_restored = [key for key in covered if covered[key] != restored.get(key)]
+
+        ok = not invalid and not not_restored and len(changed) == cancel.get('skippedPlans', len(changed))
+        results.append(ok)
+        mark = '✅' if ok else '❌'
+        print(f"  {mark} {name}: 해지 시 skip {len(changed)}건 (응답 {cancel.get('skippedPlans')}건), "
+              f"잘못된 변경 {len(invalid)}건, 복원 안 됨 {len(not_restored)}건")
+
+    print(f"  📊 {len(user_ids)}명, 해지 시 skip 합계 {total_skipped}건")
+    return all(results)
+
+
+def plan_progress(db):
+    return {
+        plan['_id']: (plan.get('completedInstallments', 0), plan.get('planStatus'), plan.get('totalInstallments'))
+        for plan in db.weeklypaymentplans.find({}, {'completedInstallments': 1, 'planStatus': 1, 'totalInstallments': 1})
+    }
+
+
+def check_weekly_payment(cookies, db):
+    print("\n💸 주간 지급 검증")
+
+    # 가장 이른 pending 지급일 (금요일)
+    first = list(db.weeklypaymentplans.aggregate([
+        {'$match': {'planStatus': 'active'}},
+        {'$unwind': '$installments'},
+        {'$match': {'installments.status': 'pending'}},
+        {'$group': {'_id': None, 'date': {'$min': '$installments.scheduledDate'}}}
+    ]))
+    if not first:
+        print("  ⚠️ pending 회차가 없습니다")
+        return True
+
+    payment_date = first[0]['date']
+    next_day = payment_date + timedelta(days=1)
+    targets = {
+        plan['_id'] for plan in db.weeklypaymentplans.find({
+            'planStatus': 'active',
+            'installments': {'$elemMatch': {'scheduledDate': {'$gte': payment_date, '$lt': next_day}, 'status': 'pending'}}
+        }, {'_id': 1})
+    }
+
+    before = plan_progress(db)
+    response = requests.post(
+        f"{BASE_URL}/api/admin/payment/execute",
+        json={'date': payment_date.strftime('%Y-%m-%dT00:00:00.000Z')},
+        cookies=cookies
+    )
+    if response.status_code != 200 or not response.json().get('result', {}).get('success'):
+        print(f"  ❌ 지급 실행 실패: HTTP {response.status_code} {response.text[:200]}")
+        return False
+    result = response.json()['result']
+    after = plan_progress(db)
+
+    wrong = []
+    for plan_id, (completed, status, total) in after.items():
+        prev_completed = before.get(plan_id, (0, None, None))[0]
+        expected = prev_completed + 1 if plan_id in targets else prev_completed
+        if completed != expected:
+            wrong.append((plan_id, 'completedInstallments', prev_completed, completed))
+        elif plan_id in targets and (status == 'completed') != (completed >= total):
+            wrong.append((plan_id, 'planStatus', before[plan_id][1], status))
+
+    ok = not wrong and result['processedCount'] <= len(targets)
+    print(f"  {'✅' if ok else '❌'} {payment_date.date()} 대상 {len(targets)}건, "
+          f"처리 {result['processedCount']}건, 불일치 {len(wrong)}건")
+    for item in wrong[:5]:
+        print(f"     - {item}")
+    return ok
+
+
+def main():
+    max_users = parse_users_arg()
+
+    print("=" * 60)
+    print("🚀 지급 계획 회차 단위 업데이트 검증")
+    print("=" * 60)
+
+    if not wait_for_server(timeout=5):
+        print("❌ 서버가 실행 중이 아닙니다 (pnpm dev:web)")
+        sys.exit(1)
+
+    initialize_db()
+    cookies = login_admin()
+    if not cookies:
+        sys.exit(1)
+
+    for month in MONTHS:
+        if not upload_month(cookies, month):
+            print(f"❌ {month} 업로드 실패로 테스트 중단")
+            sys.exit(1)
+
+    client = MongoClient("mongodb://localhost:27017")
+    db = client.nanumpay
+    try:
+        results = [
+            check_insurance(cookies, db, max_users),
+            check_weekly_payment(cookies, db)
+        ]
+    finally:
+        client.close()
+
+    passed = all(results)
+    print("\n" + "=" * 60)
+    print("✅ 회차 단위 업데이트 검증 통과" if passed else "❌ 회차 단위 업데이트 검증 실패")
+    print("=" * 60)
+    sys.exit(0 if passed else 1)
+
+
+if __name__ == "__main__":
+    main()
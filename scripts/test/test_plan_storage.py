@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+지급 계획 압축 저장 검증 (user-033)
+
+7월 ~ 11월 순차 업로드 후 조회 API 결과를 저장해 두고
+scripts/migrate-plan-storage.js --compact 로 종료/완료 계획을 압축 저장한 뒤
+같은 API 결과가 그대로인지 비교 (모델 어댑터의 installments 자동 복원 확인)
+
+- 주차별 지급 스케줄 (/api/admin/payment/schedule → 주차 버킷 + 계획 조회)
+- 월별 지급 계획 (/api/admin/payment/monthly → lean find)
+- 비교 후 --expand 로 원래 저장 모드로 복원, 복원 후에도 같은지 확인
+
+사용법:
+  python3 scripts/test/test_plan_storage.py
+"""
+
+import json
+import os
+import subprocess
+import sys
+
+import requests
+from pymongo import MongoClient
+
+from verify_registration import (
+    BASE_URL,
+    MONTHS,
+    wait_for_server,
+    login_admin,
+    initialize_db,
+    upload_month
+)
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+COMPACT_BEFORE = '2100-01-01'  # 종료/완료 계획 전체 압축
+
+
+def iter_months(db):
+    """지급일이 있는 (년, 월) 목록"""
+    bounds = list(db.weeklypaymentplans.aggregate([
+        {'$unwind': '$installments'},
+        {'$group': {
+            '_id': None,
+            'first': {'$min': '$installments.scheduledDate'},
+            'last': {'$max': '$installments.scheduledDate'}
+        }}
+    ]))
+    if not bounds:
+        return []
+
+    year, month = bounds[0]['first'].year, bounds[0]['first'].month
+    last = (bounds[0]['last'].year, bounds[0]['last'].month)
+    months = []
+    while (year, month) <= last:
+        months.append((year, month))
+        year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+    return months
+
+
+def sorted_rows(rows):
+    # 문서 저장 순서가 바뀌어도 같은 결과로 비교
+    return sorted(rows, key=lambda row: json.dumps(row, sort_keys=True, ensure_ascii=False))
+
+
+def snapshot(cookies, months):
+    """조회 API 결과 (요청 키 → 정렬된 응답)"""
+    result = {}
+    for year, month in months:
+        response = requests.get(
+            f"{BASE_URL}/api/admin/payment/monthly",
+            params={'year': year, 'month': month},
+            cookies=cookies
+        )
+        response.raise_for_status()
+        result[f"monthly {year}-{month:02d}"] = sorted_rows(response.json()['plans'])
+
+        for week in range(1, 6):
+            response = requests.get(
+                f"{BASE_URL}/api/admin/payment/schedule",
+                params={'year': year, 'month': month, 'week': week},
+                cookies=cookies
+            )
+            response.raise_for_status()
+            data = response.json()
+            result[f"schedule {year}-{month:02d} {week}주"] = {
+                'weekNumber': data['weekNumber'],
+                'summary': data['summary'],
+                'installments': sorted_rows(data['installments'])
+            }
+    return result
+
+
+def compare(label, expected, actual):
+    different = [key for key in expected if expected[key] != actual.get(key)]
+    if different:
+        print(f"  ❌ {label}: {len(different)}/{len(expected)}건 다름")
+        for key in different[:5]:
+            print(f"     - {key}")
+        return False
+    print(f"  ✅ {label}: {len(expected)}건 모두 같음")
+    return True
+
+
+def run_migration(*args):
+    print(f"\n🔧 node scripts/migrate-plan-storage.js {' '.join(args)}")
+    completed = subprocess.run(
+        ['node', 'scripts/migrate-plan-storage.js', *args],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True
+    )
+    for line in completed.stdout.strip().splitlines()[-5:]:
+        print(f"  {line}")
+    if completed.returncode != 0:
+        print(f"  ❌ 실패 (exit {completed.returncode}): {completed.stderr.strip()[-500:]}")
+        return False
+    return True
+
+
+def main():
+    print("=" * 60)
+    print("🚀 지급 계획 압축 저장 검증")
+    print("=" * 60)
+
+    if not wait_for_server(timeout=5):
+        print("❌ 서버가 실행 중이 아닙니다 (pnpm dev:web)")
+        sys.exit(1)
+
+    initialize_db()
+    cookies = login_admin()
+    if not cookies:
+        sys.exit(1)
+
+    for month in MONTHS:
+        if not upload_month(cookies, month):
+            print(f"❌ {month} 업로드 실패로 테스트 중단")
+            sys.exit(1)
+
+    client = MongoClient("mongodb://localhost:27017")
+    db = client.nanumpay
+    results = []
+
+    try:
+        months = iter_months(db)
+        print(f"\n📸 압축 전 조회 결과 저장 ({months[0][0]}-{months[0][1]:02d} ~ {months[-1][0]}-{months[-1][1]:02d})")
+        baseline = snapshot(cookies, months)
+
+        if not run_migration('--compact', f'--before={COMPACT_BEFORE}'):
+            sys.exit(1)
+        compact_count = db.weeklypaymentplans.count_documents({'storageMode': 'compact'})
+        print(f"  📦 압축 저장된 계획: {compact_count}건")
+        results.append(compact_count > 0)
+        if compact_count == 0:
+            print("  ❌ 압축 대상 계획이 없습니다 (승급 종료 계획이 있어야 함)")
+
+        results.append(compare('압축 후 조회', baseline, snapshot(cookies, months)))
+
+        if not run_migration('--expand'):
+            sys.exit(1)
+        remaining = db.weeklypaymentplans.count_documents({'storageMode': 'compact'})
+        results.append(remaining == 0)
+        print(f"  {'✅' if remaining == 0 else '❌'} 남은 압축 계획: {remaining}건")
+
+        results.append(compare('복원 후 조회', baseline, snapshot(cookies, months)))
+    finally:
+        client.close()
+
+    passed = all(results)
+    print("\n" + "=" * 60)
+    print("✅ 압축 저장 검증 통과" if passed else "❌ 압축 저장 검증 실패")
+    print("=" * 60)
+    sys.exit(0 if passed else 1)
+
+
+if __name__ == "__main__":
+    main()
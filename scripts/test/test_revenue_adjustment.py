@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+매출 조정 금액 갱신 검증 (user-047)
+
+7월 ~ 11월 순차 업로드 후 /api/admin/revenue/adjust 호출 결과를 DB와 비교
+
+- force 없이 지난 회차(지급 완료 간주)가 있는 월 조정 → 400 ('지급이 완료') + 계획 변경 없음
+- dryRun 미리보기(force) → 실제 조정(force) 후
+  - 해당 월 계획의 총액/사용자별 금액 = 미리보기 diff의 after
+  - monthlyregistrations.gradePayments = 미리보기 gradePayments
+  - 같은 매출로 다시 미리보기 → 변화 없음
+
+사용법:
+  python3 scripts/test/test_revenue_adjustment.py [--month=2025-07] [--rate=1.1]
+"""
+
+import sys
+
+import requests
+from pymongo import MongoClient
+
+from verify_registration import (
+    BASE_URL,
+    MONTHS,
+    wait_for_server,
+    login_admin,
+    initialize_db,
+    upload_month
+)
+
+# planDiffService와 같은 기준: 실제 지급 대상이 아닌 회차 제외
+EXCLUDED_STATUSES = {'skipped', 'terminated', 'canceled'}
+AMOUNT_FIELDS = ['baseAmount', 'installmentAmount', 'withholdingTax', 'netAmount']
+
+
+def parse_args():
+    options = {'month': None, 'rate': 1.1}
+    for arg in sys.argv[1:]:
+        if arg.startswith('--month='):
+            options['month'] = arg.split('=')[1]
+        elif arg.startswith('--rate='):
+            options['rate'] = float(arg.split('=')[1])
+    return options
+
+
+def adjust(cookies, month_key, revenue, force=False, dry_run=False):
+    return requests.post(
+        f"{BASE_URL}/api/admin/revenue/adjust",
+        json={
+            'monthKey': month_key,
+            'adjustedRevenue': revenue,
+            'reason': '매출 조정 검증',
+            'force': force,
+            'dryRun': dry_run
+        },
+        cookies=cookies
+    )
+
+
+def plan_amounts(db, month_key):
+    """계획 _id → 회차별 금액 (변경 여부 비교용)"""
+    return {
+        plan['_id']: [
+            (inst['week'], inst.get('status'), *[inst.get(field) for field in AMOUNT_FIELDS])
+            for inst in plan.get('installments', [])
+        ]
+        for plan in db.weeklypaymentplans.find({'revenueMonth': month_key})
+    }
+
+
+def user_totals(db, month_key):
+    """사용자별 지급 대상 회차 금액 합계"""
+    totals = {}
+    for plan in db.weeklypaymentplans.find({'revenueMonth': month_key}):
+        user_id = str(plan['userId'])
+        totals.setdefault(user_id, 0)
+        for inst in plan.get('installments', []):
+            if inst.get('status') not in EXCLUDED_STATUSES:
+                totals[user_id] += inst.get('installmentAmount') or 0
+    return totals
+
+
+def check_without_force(cookies, db, month_key, revenue):
+    print(f"\n🚫 {month_key} force 없이 조정")
+    before = plan_amounts(db, month_key)
+    response = adjust(cookies, month_key, revenue)
+    error = response.json().get('error', '') if response.status_code == 400 else ''
+
+    rejected = response.status_code == 400 and '지급이 완료' in error
+    unchanged = plan_amounts(db, month_key) == before
+    print(f"  {'✅' if rejected else '❌'} 응답: HTTP {response.status_code} {error or response.text[:200]}")
+    print(f"  {'✅' if unchanged else '❌'} 계획 변경 없음")
+    return rejected and unchanged
+
+
+def check_with_force(cookies, db, month_key, revenue):
+    print(f"\n💰 {month_key} force 조정 ({revenue:,}원)")
+
+    response = adjust(cookies, month_key, revenue, force=True, dry_run=True)
+    if response.status_code != 200:
+        print(f"  ❌ 미리보기 실패: HTTP {response.status_code} {response.text[:200]}")
+        return False
+    preview = response.json()['details']
+    diff = preview['diff']
+    print(f"  📋 미리보기: {diff['totals']['before']:,} → {diff['totals']['after']:,}원, {len(diff['users'])}명 영향")
+
+    response = adjust(cookies, month_key, revenue, force=True)
+    if response.status_code != 200:
+        print(f"  ❌ 조정 실패: HTTP {response.status_code} {response.text[:200]}")
+        return False
+    print(f"  🔧 {response.json()['message']}")
+
+    results = []
+
+    totals = user_totals(db, month_key)
+    total = sum(totals.values())
+    results.append(total == diff['totals']['after'])
+    print(f"  {'✅' if results[-1] else '❌'} 총액: DB {total:,} / 미리보기 {diff['totals']['after']:,}")
+
+    mismatched = [user for user in diff['users'] if totals.get(user['userId'], 0) != user['after']]
+    results.append(not mismatched)
+    print(f"  {'✅' if not mismatched else '❌'} 사용자별 금액: 불일치 {len(mismatched)}/{len(diff['users'])}명")
+    for user in mismatched[:5]:
+        print(f"     - {user['userName']}: DB {totals.get(user['userId'], 0):,} / 미리보기 {user['after']:,}")
+
+    monthly_reg = db.monthlyregistrations.find_one({'monthKey': month_key}, {'gradePayments': 1})
+    stored = monthly_reg.get('gradePayments', {})
+    grade_mismatch = [grade for grade, amount in preview['gradePayments'].items() if stored.get(grade) != amount]
+    results.append(not grade_mismatch)
+    print(f"  {'✅' if not grade_mismatch else '❌'} 등급별 지급액 저장: 불일치 {grade_mismatch or '없음'}")
+
+    response = adjust(cookies, month_key, revenue, force=True, dry_run=True)
+    again = response.json()['details']['diff'] if response.status_code == 200 else None
+    idempotent = again is not None and not again['users'] and again['totals']['delta'] == 0
+    results.append(idempotent)
+    print(f"  {'✅' if idempotent else '❌'} 같은 매출 재미리보기 변화 없음")
+
+    return all(results)
+
+
+def main():
+    options = parse_args()
+
+    print("=" * 60)
+    print("🚀 매출 조정 금액 갱신 검증")
+    print("=" * 60)
+
+    if not wait_for_server(timeout=5):
+        print("❌ 서버가 실행 중이 아닙니다 (pnpm dev:web)")
+        sys.exit(1)
+
+    initialize_db()
+    cookies = login_admin()
+    if not cookies:
+        sys.exit(1)
+
+    for month in MONTHS:
+        if not upload_month(cookies, month):
+            print(f"❌ {month} 업로드 실패로 테스트 중단")
+            sys.exit(1)
+
+    client = MongoClient("mongodb://localhost:27017")
+    db = client.nanumpay
+    results = []
+
+    try:
+        query = {'monthKey': options['month']} if options['month'] else {}
+        monthly_reg = db.monthlyregistrations.find_one(query, sort=[('monthKey', 1)])
+        if not monthly_reg:
+            print("❌ 조정할 월이 없습니다")
+            sys.exit(1)
+
+        month_key = monthly_reg['monthKey']
+        current = monthly_reg.get('adjustedRevenue') or monthly_reg.get('totalRevenue', 0)
+        revenue = int(current * options['rate'])
+
+        results.append(check_without_force(cookies, db, month_key, revenue))
+        results.append(check_with_force(cookies, db, month_key, revenue))
+    finally:
+        client.close()
+
+    passed = all(results)
+    print("\n" + "=" * 60)
+    print("✅ 매출 조정 검증 통과" if passed else "❌ 매출 조정 검증 실패")
+    print("=" * 60)
+    sys.exit(0 if passed else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Step 4 지급 계획 생성 검증 (user-031)
+
+7월 ~ 11월 순차 업로드(/api/admin/users/bulk?wait=1 → executeStep4 일괄 조회) 후
+매 월마다 재처리 미리보기(/api/admin/db/reprocess-preview)와 비교
+
+- 미리보기는 같은 규칙을 건별 조회(buildPromotionPaymentPlan / buildAdditionalPaymentPlan DB 조회)로
+  메모리에서 다시 계산 → 업로드 직후에는 사용자별/주차별 변화가 없어야 함
+- 중복 계획 없음 (사용자 + 계획유형 + 등급 + 귀속월 + 추가지급단계)
+- 승급 종료: 종료된 계획은 첫 종료 회차 이후 pending 회차가 남지 않음
+
+사용법:
+  python3 scripts/test/test_step4_plans.py
+"""
+
+import sys
+import requests
+from pymongo import MongoClient
+
+from verify_registration import (
+    BASE_URL,
+    MONTHS,
+    wait_for_server,
+    login_admin,
+    initialize_db,
+    upload_month
+)
+
+
+def get_month_keys(db):
+    return {reg['monthKey'] for reg in db.monthlyregistrations.find({}, {'monthKey': 1})}
+
+
+def check_preview(cookies, month_key):
+    """재처리 미리보기 diff가 비어 있는지 확인"""
+    response = requests.get(
+        f"{BASE_URL}/api/admin/db/reprocess-preview",
+        params={"monthKey": month_key},
+        cookies=cookies
+    )
+    if response.status_code != 200:
+        print(f"  ❌ {month_key} 미리보기 실패: HTTP {response.status_code}")
+        return False
+
+    diff = response.json()['diff']
+    totals = diff['totals']
+    ok = (
+        not diff['users']
+        and not diff['weeks']
+        and totals['planCountBefore'] == totals['planCountAfter']
+        and totals['delta'] == 0
+    )
+
+    if ok:
+        print(f"  ✅ {month_key} 미리보기 변화 없음 (계획 {totals['planCountAfter']}건, {totals['after']:,}원)")
+    else:
+        print(f"  ❌ {month_key} 미리보기 변화 있음: 계획 {totals['planCountBefore']} → {totals['planCountAfter']}, "
+              f"총액 {totals['before']:,} → {totals['after']:,}")
+        for user in diff['users'][:5]:
+            print(f"     - {user['userName']}: {user['before']:,} → {user['after']:,}")
+        for week in diff['weeks'][:5]:
+            print(f"     - {week['date']}: {week['countBefore']}건 → {week['countAfter']}건")
+    return ok
+
+
+def check_duplicates(db):
+    """같은 사용자/유형/등급/귀속월/단계 계획 중복 확인"""
+    duplicates = list(db.weeklypaymentplans.aggregate([
+        {'$group': {
+            '_id': {
+                'userId': '$userId',
+                'planType': '$planType',
+                'baseGrade': '$baseGrade',
+                'revenueMonth': '$revenueMonth',
+                '추가지급단계': '$추가지급단계'
+            },
+            'count': {'$sum': 1}
+        }},
+        {'$match': {'count': {'$gt': 1}}}
+    ]))
+
+    if duplicates:
+        print(f"  ❌ 중복 계획 {len(duplicates)}건")
+        for dup in duplicates[:5]:
+            print(f"     - {dup['_id']}: {dup['count']}건")
+        return False
+    print("  ✅ 중복 계획 없음")
+    return True
+
+
+def check_terminations(db):
+    """승급 종료 계획: 첫 종료 회차 이후 pending 회차 없음"""
+    broken = []
+    for plan in db.weeklypaymentplans.find({'terminationReason': 'promotion'}):
+        installments = plan.get('installments', [])
+        terminated = [i['scheduledDate'] for i in installments if i.get('status') == 'terminated']
+        if not terminated:
+            broken.append(plan)
+            continue
+        first = min(terminated)
+        if any(i.get('status') == 'pending' and i['scheduledDate'] >= first for i in installments):
+            broken.append(plan)
+
+    if broken:
+        print(f"  ❌ 종료 처리 불일치 {len(broken)}건")
+        for plan in broken[:5]:
+            print(f"     - {plan.get('userName')} {plan.get('baseGrade')} {plan.get('revenueMonth')}")
+        return False
+    print("  ✅ 승급 종료 계획 정상")
+    return True
+
+
+def main():
+    print("=" * 60)
+    print("🚀 Step 4 지급 계획 생성 검증")
+    print("=" * 60)
+
+    if not wait_for_server(timeout=5):
+        print("❌ 서버가 실행 중이 아닙니다 (pnpm dev:web)")
+        sys.exit(1)
+
+    initialize_db()
+    cookies = login_admin()
+    if not cookies:
+        sys.exit(1)
+
+    client = MongoClient("mongodb://localhost:27017")
+    db = client.nanumpay
+    results = []
+
+    try:
+        for month in MONTHS:
+            before_keys = get_month_keys(db)
+            if not upload_month(cookies, month):
+                print(f"❌ {month} 업로드 실패로 테스트 중단")
+                sys.exit(1)
+
+            for month_key in sorted(get_month_keys(db) - before_keys):
+                results.append(check_preview(cookies, month_key))
+
+        print("\n📊 전체 계획 검증")
+        results.append(check_duplicates(db))
+        results.append(check_terminations(db))
+    finally:
+        client.close()
+
+    passed = all(results)
+    print("\n" + "=" * 60)
+    print("✅ Step 4 검증 통과" if passed else "❌ Step 4 검증 실패")
+    print("=" * 60)
+    sys.exit(0 if passed else 1)
+
+
+if __name__ == "__main__":
+    main()
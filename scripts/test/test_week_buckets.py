@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+주차 버킷 조회 검증 (user-048)
+
+7월 ~ 11월 순차 업로드 후 주차별 지급 스케줄(/api/admin/payment/schedule → findWeekInstallments)이
+계획 컬렉션 기준($unwind + weekNumber 조건, terminated 제외)과 같은 회차를 반환하는지 비교
+
+1. 버킷 사용: 업로드 중 미들웨어가 유지한 버킷으로 조회
+2. 재구성 필요 표시(Counter paymentWeekBuckets = 0) + 버킷 삭제:
+   완료 표시 전에는 계획 컬렉션으로 조회 → 빈 버킷을 읽지 않음
+3. 백그라운드 재구성 완료(표시 = 1) 후 다시 버킷으로 조회
+
+사용법:
+  python3 scripts/test/test_week_buckets.py
+"""
+
+import sys
+import time
+from collections import Counter
+
+import requests
+from pymongo import MongoClient
+
+from verify_registration import (
+    BASE_URL,
+    MONTHS,
+    wait_for_server,
+    login_admin,
+    initialize_db,
+    upload_month
+)
+
+BUCKET_MARKER = 'paymentWeekBuckets'
+BUCKET_VERSION = 1
+MARKER_CHECK_SECONDS = 11  # 서버가 완료 표시를 다시 확인하는 주기(10초) 이후
+REBUILD_TIMEOUT_SECONDS = 120
+
+
+def to_iso(date):
+    return date.strftime('%Y-%m-%dT%H:%M:%S.') + f"{date.microsecond // 1000:03d}Z"
+
+
+def schedule_params(db):
+    """지급일이 있는 모든 (년, 월, 주차) 요청 파라미터"""
+    bounds = list(db.weeklypaymentplans.aggregate([
+        {'$unwind': '$installments'},
+        {'$group': {
+            '_id': None,
+            'first': {'$min': '$installments.scheduledDate'},
+            'last': {'$max': '$installments.scheduledDate'}
+        }}
+    ]))
+    if not bounds:
+        return []
+
+    year, month = bounds[0]['first'].year, bounds[0]['first'].month
+    last = (bounds[0]['last'].year, bounds[0]['last'].month)
+    params = []
+    while (year, month) <= last:
+        params.extend({'year': year, 'month': month, 'week': week} for week in range(1, 6))
+        year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+    return params
+
+
+def api_weeks(cookies, params):
+    """API 결과: weekNumber → 회차 multiset"""
+    weeks = {}
+    for param in params:
+        response = requests.get(f"{BASE_URL}/api/admin/payment/schedule", params=param, cookies=cookies)
+        response.raise_for_status()
+        data = response.json()
+        weeks[data['weekNumber']] = Counter(
+            (str(inst['userId']), inst['installmentNumber'], inst['baseGrade'], inst['status'], inst['scheduledDate'])
+            for inst in data['installments']
+        )
+    return weeks
+
+
+def baseline_weeks(db, week_numbers):
+    """계획 컬렉션 기준: weekNumber → 회차 multiset"""
+    weeks = {week_number: Counter() for week_number in week_numbers}
+    for row in db.weeklypaymentplans.aggregate([
+        {'$unwind': '$installments'},
+        {'$match': {
+            'installments.weekNumber': {'$in': list(week_numbers)},
+            'installments.status': {'$ne': 'terminated'}
+        }},
+        {'$project': {
+            'userId': 1,
+            'baseGrade': 1,
+            'weekNumber': '$installments.weekNumber',
+            'week': '$installments.week',
+            'status': '$installments.status',
+            'scheduledDate': '$installments.scheduledDate'
+        }}
+    ]):
+        weeks[row['weekNumber']][(
+            str(row['userId']), row['week'], row['baseGrade'], row['status'], to_iso(row['scheduledDate'])
+        )] += 1
+    return weeks
+
+
+def compare(label, cookies, db, params):
+    actual = api_weeks(cookies, params)
+    expected = baseline_weeks(db, actual.keys())
+
+    different = [week for week in expected if expected[week] != actual[week]]
+    count = sum(sum(rows.values()) for rows in expected.values())
+    if different:
+        print(f"  ❌ {label}: {len(different)}/{len(expected)}개 주차 불일치")
+        for week in different[:5]:
+            missing = sum((expected[week] - actual[week]).values())
+            extra = sum((actual[week] - expected[week]).values())
+            print(f"     - {week}: 누락 {missing}건, 추가 {extra}건")
+        return False
+    print(f"  ✅ {label}: {len(expected)}개 주차, 회차 {count}건 일치")
+    return True
+
+
+def marker_value(db):
+    marker = db.counters.find_one({'_id': BUCKET_MARKER})
+    return marker.get('value') if marker else None
+
+
+def main():
+    print("=" * 60)
+    print("🚀 주차 버킷 조회 검증")
+    print("=" * 60)
+
+    if not wait_for_server(timeout=5):
+        print("❌ 서버가 실행 중이 아닙니다 (pnpm dev:web)")
+        sys.exit(1)
+
+    initialize_db()
+    cookies = login_admin()
+    if not cookies:
+        sys.exit(1)
+
+    for month in MONTHS:
+        if not upload_month(cookies, month):
+            print(f"❌ {month} 업로드 실패로 테스트 중단")
+            sys.exit(1)
+
+    client = MongoClient("mongodb://localhost:27017")
+    db = client.nanumpay
+    results = []
+
+    try:
+        params = schedule_params(db)
+
+        print("\n📦 1. 버킷 조회")
+        results.append(compare('버킷 조회', cookies, db, params))
+        print(f"  📌 완료 표시: {marker_value(db)}")
+
+        print("\n🧹 2. 재구성 필요 표시 + 버킷 삭제")
+        db.counters.update_one({'_id': BUCKET_MARKER}, {'$set': {'value': 0}}, upsert=True)
+        deleted = db.paymentweekbuckets.delete_many({}).deleted_count
+        print(f"  🗑️ 버킷 항목 {deleted}건 삭제, {MARKER_CHECK_SECONDS}초 대기 (서버 표시 재확인)")
+        time.sleep(MARKER_CHECK_SECONDS)
+        results.append(compare('계획 컬렉션 조회', cookies, db, params))
+
+        print("\n🔁 3. 백그라운드 재구성")
+        deadline = time.time() + REBUILD_TIMEOUT_SECONDS
+        while marker_value(db) != BUCKET_VERSION and time.time() < deadline:
+            time.sleep(1)
+        rebuilt = marker_value(db) == BUCKET_VERSION
+        print(f"  {'✅' if rebuilt else '❌'} 완료 표시: {marker_value(db)}, "
+              f"버킷 항목 {db.paymentweekbuckets.count_documents({})}건")
+        results.append(rebuilt)
+        if rebuilt:
+            time.sleep(MARKER_CHECK_SECONDS)
+            results.append(compare('재구성 후 버킷 조회', cookies, db, params))
+    finally:
+        client.close()
+
+    passed = all(results)
+    print("\n" + "=" * 60)
+    print("✅ 주차 버킷 검증 통과" if passed else "❌ 주차 버킷 검증 실패")
+    print("=" * 60)
+    sys.exit(0 if passed else 1)
+
+
+if __name__ == "__main__":
+    main()
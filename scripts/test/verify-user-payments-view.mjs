@@ -0,0 +1,103 @@
+/**
+ * 내 지급 내역 화면 규칙 검증 (user-050)
+ *
+ * 같은 용역자 계정으로
+ * - /api/user/payments (서버 집계 $facet + mergePaymentRows)
+ * - /api/user/payments/sync 전체 계획 → buildPaymentScheduleView (대시보드 로컬 캐시 계산)
+ * 결과의 요약(이번 주/누적/예정)과 주차별 지급 행이 같은지 비교
+ *
+ * 사용법 (서버 실행 중):
+ *   node scripts/test/verify-user-payments-view.mjs --login=<용역자 아이디> --password=<비밀번호> [--server=http://localhost:3100]
+ */
+import { buildPaymentScheduleView } from '../../apps/web/src/lib/utils/paymentScheduleView.js';
+
+function parseArgs() {
+  const options = { server: 'http://localhost:3100', login: null, password: null };
+  for (const arg of process.argv.slice(2)) {
+    const [key, value] = arg.replace(/^--/, '').split('=');
+    if (key in options) options[key] = value;
+  }
+  if (!options.login || !options.password) {
+    console.error('사용법: node scripts/test/verify-user-payments-view.mjs --login=<아이디> --password=<비밀번호> [--server=URL]');
+    process.exit(1);
+  }
+  return options;
+}
+
+async function login(options) {
+  const response = await fetch(`${options.server}/api/auth/login`, {
+    method: 'POST',
+    headers: { 'Content-Type': 'application/json' },
+    body: JSON.stringify({ loginId: options.login, password: options.password, userType: 'user' })
+  });
+  if (!response.ok) {
+    throw new Error(`로그인 실패: HTTP ${response.status}`);
+  }
+  // 응답 쿠키를 다음 요청에 전달
+  return response.headers.getSetCookie().map(cookie => cookie.split(';')[0]).join('; ');
+}
+
+async function getJson(options, cookie, path) {
+  const response = await fetch(`${options.server}${path}`, { headers: { Cookie: cookie } });
+  if (!response.ok) {
+    throw new Error(`${path} 실패: HTTP ${response.status}`);
+  }
+  return response.json();
+}
+
+function compare(label, expected, actual) {
+  const same = JSON.stringify(expected) === JSON.stringify(actual);
+  console.log(`  ${same ? '✅' : '❌'} ${label}`);
+  if (!same) {
+    console.log(`     서버 집계: ${JSON.stringify(expected).slice(0, 500)}`);
+    console.log(`     로컬 계산: ${JSON.stringify(actual).slice(0, 500)}`);
+  }
+  return same;
+}
+
+// 같은 지급일 행의 순서와 등급 빈도 키 순서는 비교에서 제외
+function normalizeRows(rows) {
+  return rows
+    .map(row => ({
+      ...row,
+      gradeCount: Object.fromEntries(Object.entries(row.gradeCount).sort(([a], [b]) => a.localeCompare(b)))
+    }))
+    .sort((a, b) => `${a.weekNumber}_${a.userName}`.localeCompare(`${b.weekNumber}_${b.userName}`));
+}
+
+async function main() {
+  const options = parseArgs();
+
+  try {
+    console.log(`\n🔐 로그인: ${options.login}`);
+    const cookie = await login(options);
+
+    const [payments, sync] = await Promise.all([
+      getJson(options, cookie, '/api/user/payments'),
+      getJson(options, cookie, '/api/user/payments/sync')
+    ]);
+    console.log(`📡 지급 행 ${payments.payments.length}건, 동기화 계획 ${sync.plans.length}건`);
+
+    const view = buildPaymentScheduleView(sync.plans, sync.allRegistrations, sync.weekRange);
+
+    console.log('\n서버 집계 vs buildPaymentScheduleView');
+    const results = [
+      compare('요약 (이번 주/누적/예정)', payments.summary, view.summary),
+      compare('지급 행 수', payments.payments.length, view.payments.length),
+      compare(
+        '주차별 지급 행',
+        normalizeRows(payments.payments),
+        normalizeRows(view.payments)
+      )
+    ];
+
+    const passed = results.every(Boolean);
+    console.log(`\n${passed ? '✅ 일치' : '❌ 불일치'}`);
+    process.exit(passed ? 0 : 1);
+  } catch (error) {
+    console.error('오류:', error);
+    process.exit(1);
+  }
+}
+
+main();
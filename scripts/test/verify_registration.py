@@ -139,7 +139,7 @@ def upload_month(cookies, month):
     print(f"  📋 데이터: {len(users_data)}명")
 
     response = requests.post(
-        f"{BASE_URL}/api/admin/users/bulk",
+        f"{BASE_URL}/api/admin/users/bulk?wait=1",
         json={"users": users_data, "fileName": month},
         cookies=cookies
     )